@@ -0,0 +1,120 @@
+# Copyright(C) 2023 InfiniFlow, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Search QPS of an asyncio application at a fixed number of concurrent requests: with infinity.connect_async,
+# and with blocking connections called through run_in_executor, one connection per executor thread. Both run
+# the same match_dense queries against a table filled with random vectors on a running server.
+
+import argparse
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+import infinity
+from infinity.common import NetworkAddress, ConflictType
+
+TABLE_NAME = "async_benchmark"
+
+
+def fill_table(address, rows, dimension):
+    conn = infinity.connect(address)
+    db_obj = conn.get_database("default_db")
+    db_obj.drop_table(TABLE_NAME, ConflictType.Ignore)
+    table_obj = db_obj.create_table(TABLE_NAME, {
+        "id": {"type": "int"}, "vec": {"type": f"vector,{dimension},float"}}, ConflictType.Error)
+    for begin in range(0, rows, 8192):
+        end = min(begin + 8192, rows)
+        table_obj.insert_columns({"id": np.arange(begin, end, dtype=np.int32),
+                                  "vec": np.random.rand(end - begin, dimension).astype(np.float32)})
+    conn.disconnect()
+
+
+def report(name, latencies, cost):
+    latencies = np.array(latencies) * 1000
+    print(f"{name:<10} {len(latencies) / cost:>10.0f} QPS   p50 {np.percentile(latencies, 50):.3f} ms   "
+          f"p99 {np.percentile(latencies, 99):.3f} ms")
+
+
+async def run_async(address, queries, concurrency, topn):
+    conn = await infinity.connect_async(address, max_connections=concurrency)
+    table_obj = await (await conn.get_database("default_db")).get_table(TABLE_NAME)
+    latencies = []
+    next_query = iter(queries)
+
+    async def worker():
+        for query in next_query:
+            begin = time.perf_counter()
+            await table_obj.output(["id", "_distance"]).match_dense("vec", query, "float", "l2", topn).to_pl()
+            latencies.append(time.perf_counter() - begin)
+
+    begin = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    cost = time.perf_counter() - begin
+    await conn.disconnect()
+    return latencies, cost
+
+
+async def run_threads(address, queries, concurrency, topn):
+    local = threading.local()
+    conns = []
+
+    def search(query):
+        # every executor thread keeps its own blocking connection
+        if not hasattr(local, "table_obj"):
+            local.conn = infinity.connect(address)
+            conns.append(local.conn)
+            local.table_obj = local.conn.get_database("default_db").get_table(TABLE_NAME)
+        local.table_obj.output(["id", "_distance"]).match_dense("vec", query, "float", "l2", topn).to_pl()
+
+    loop = asyncio.get_running_loop()
+    latencies = []
+    next_query = iter(queries)
+
+    async def worker(executor):
+        for query in next_query:
+            begin = time.perf_counter()
+            await loop.run_in_executor(executor, search, query)
+            latencies.append(time.perf_counter() - begin)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        # connect every thread before measuring
+        await asyncio.gather(*(loop.run_in_executor(executor, search, query) for query in queries[:concurrency]))
+        begin = time.perf_counter()
+        await asyncio.gather(*(worker(executor) for _ in range(concurrency)))
+        cost = time.perf_counter() - begin
+    for conn in conns:
+        conn.disconnect()
+    return latencies, cost
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Async vs threaded search QPS benchmark")
+    parser.add_argument("--server", type=str, default="127.0.0.1:23817", dest="server", help="ip:port of the server")
+    parser.add_argument("--rows", type=int, default=100000, dest="rows")
+    parser.add_argument("--dimension", type=int, default=128, dest="dimension")
+    parser.add_argument("--topn", type=int, default=10, dest="topn")
+    parser.add_argument("--queries", type=int, default=10000, dest="queries")
+    parser.add_argument("--concurrency", type=int, default=16, dest="concurrency")
+    args = parser.parse_args()
+
+    ip, port = args.server.split(":")
+    server = NetworkAddress(ip, int(port))
+    fill_table(server, args.rows, args.dimension)
+    query_vectors = list(np.random.rand(args.queries, args.dimension).astype(np.float32))
+    print(f"{args.queries} searches, {args.concurrency} in flight")
+    report("threads", *asyncio.run(run_threads(server, query_vectors, args.concurrency, args.topn)))
+    report("async", *asyncio.run(run_async(server, query_vectors, args.concurrency, args.topn)))
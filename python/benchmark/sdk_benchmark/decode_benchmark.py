@@ -0,0 +1,120 @@
+# Copyright(C) 2023 InfiniFlow, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Micro-benchmark of the client side SelectResponse decoders. No server is needed, the column
+# buffers are generated locally in the same layout the thrift server sends them.
+
+import argparse
+import struct
+import time
+
+import numpy as np
+
+import infinity.remote_thrift.infinity_thrift_rpc.ttypes as ttypes
+from infinity.remote_thrift.types import column_vector_to_list, column_vector_to_numpy, column_vector_to_arrow
+
+
+def struct_unpack_embedding(column_vectors, dimension):
+    # the decoder used before the numpy path, kept here as the baseline
+    column_vector = b''.join(column_vectors)
+    all_list = list(struct.unpack('<{}f'.format(len(column_vector) // 4), column_vector))
+    return [all_list[i:i + dimension] for i in range(0, len(all_list), dimension)]
+
+
+def struct_unpack_varchar(column_vectors):
+    # the per-string loop used before the offset scan, kept here as the baseline
+    column_vector = b''.join(column_vectors)
+    results = []
+    offset = 0
+    while offset < len(column_vector):
+        length = struct.unpack('I', column_vector[offset:offset + 4])[0]
+        offset += 4
+        results.append(column_vector[offset:offset + length].decode('utf-8'))
+        offset += length
+    return results
+
+
+def embedding_data_type(dimension):
+    embedding_type = ttypes.EmbeddingType(dimension=dimension, element_type=ttypes.ElementType.ElementFloat32)
+    return ttypes.DataType(logic_type=ttypes.LogicType.Embedding,
+                           physical_type=ttypes.PhysicalType(embedding_type=embedding_type))
+
+
+def measure(name, func, rounds):
+    func()
+    begin = time.perf_counter()
+    for _ in range(rounds):
+        func()
+    cost = (time.perf_counter() - begin) / rounds
+    print(f"{name:<32} {cost * 1000:>10.3f} ms")
+    return cost
+
+
+def benchmark_embedding(rows, dimension, rounds):
+    print(f"embedding column: {rows} rows x {dimension} float32")
+    data = np.random.rand(rows, dimension).astype(np.float32).tobytes()
+    # the server sends one buffer per data block
+    block_size = 8192 * dimension * 4
+    column_vectors = [data[i:i + block_size] for i in range(0, len(data), block_size)]
+    data_type = embedding_data_type(dimension)
+
+    baseline = measure("struct.unpack + slicing", lambda: struct_unpack_embedding(column_vectors, dimension), rounds)
+    measure("column_vector_to_list", lambda: column_vector_to_list(
+        ttypes.ColumnType.ColumnEmbedding, data_type, column_vectors), rounds)
+    numpy_cost = measure("column_vector_to_numpy", lambda: column_vector_to_numpy(
+        ttypes.ColumnType.ColumnEmbedding, data_type, column_vectors), rounds)
+    print(f"numpy speedup: {baseline / numpy_cost:.1f}x")
+
+
+def benchmark_scalar(rows, rounds):
+    print(f"float32 column: {rows} rows")
+    column_vectors = [np.random.rand(rows).astype(np.float32).tobytes()]
+    baseline = measure("struct.unpack", lambda: list(
+        struct.unpack('<{}f'.format(rows), b''.join(column_vectors))), rounds)
+    numpy_cost = measure("column_vector_to_numpy", lambda: column_vector_to_numpy(
+        ttypes.ColumnType.ColumnFloat32, None, column_vectors), rounds)
+    print(f"numpy speedup: {baseline / numpy_cost:.1f}x")
+
+
+def benchmark_varchar(rows, rounds):
+    print(f"varchar column: {rows} rows")
+    words = ["infinity", "database", "vector", "full", "text", "search", "检索", "tensor"]
+    rng = np.random.default_rng(0)
+    column_vector = b''.join(
+        struct.pack('<I', len(document)) + document for document in
+        (" ".join(rng.choice(words, rng.integers(0, 64))).encode('utf-8') for _ in range(rows)))
+    column_vectors = [column_vector]
+    column_type = ttypes.ColumnType.ColumnVarchar
+
+    baseline = measure("struct.unpack + decode", lambda: struct_unpack_varchar(column_vectors), rounds)
+    list_cost = measure("column_vector_to_list", lambda: column_vector_to_list(
+        column_type, None, column_vectors), rounds)
+    arrow_cost = measure("column_vector_to_arrow", lambda: column_vector_to_arrow(
+        column_type, None, column_vectors), rounds)
+    print(f"list speedup: {baseline / list_cost:.1f}x, arrow speedup: {baseline / arrow_cost:.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="SelectResponse decoding benchmark")
+    parser.add_argument("--rows", type=int, default=10000, dest="rows")
+    parser.add_argument("--dimension", type=int, default=1024, dest="dimension")
+    parser.add_argument("--varchar_rows", type=int, default=100000, dest="varchar_rows")
+    parser.add_argument("--rounds", type=int, default=10, dest="rounds")
+    args = parser.parse_args()
+
+    benchmark_embedding(args.rows, args.dimension, args.rounds)
+    print()
+    benchmark_scalar(args.rows, args.rounds)
+    print()
+    benchmark_varchar(args.varchar_rows, args.rounds)
@@ -0,0 +1,128 @@
+# Copyright(C) 2023 InfiniFlow, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Micro-benchmark of the per call overhead of the SDK argument checks. No server is needed, the
+# thrift client is replaced by a stub that answers every call with an OK response.
+
+import argparse
+import functools
+import inspect
+import time
+
+import infinity.remote_thrift.infinity_thrift_rpc.ttypes as ttypes
+from infinity.remote_thrift.db import RemoteDatabase
+from infinity.remote_thrift.table import RemoteTable
+from infinity.remote_thrift.utils import check_valid_name
+
+
+class StubClient:
+    check_params = True
+
+    def get_table(self, db_name, table_name):
+        return ttypes.CommonResponse(error_code=0)
+
+
+def legacy_name_validity_check(arg_name: str, name_type: str = "Table"):
+    # the decorator before the checks were precomputed, kept here as the baseline
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if arg_name in kwargs:
+                name = kwargs[arg_name]
+            else:
+                arg_names = list(inspect.signature(func).parameters.keys())
+                name = args[arg_names.index(arg_name)]
+            check_valid_name(name, name_type)
+            return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def legacy_params_type_check(func):
+    # the decorator before the checks were precomputed, kept here as the baseline
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        sig = inspect.signature(func)
+        params = sig.parameters
+        for arg, param in zip(args, params.values()):
+            if param.annotation is not param.empty and not isinstance(arg, param.annotation):
+                raise TypeError(f"TypeError: Argument {param.name} must be {param.annotation}")
+        for kwarg, value in kwargs.items():
+            if params[kwarg].annotation is not params[kwarg].empty and not isinstance(value,
+                                                                                      params[kwarg].annotation):
+                raise TypeError(f"TypeError: Argument {kwarg} must be {params[kwarg].annotation}")
+        return func(*args, **kwargs)
+
+    return wrapper
+
+
+def measure(name, func, rounds):
+    for _ in range(min(rounds, 1000)):
+        func()
+    begin = time.perf_counter()
+    for _ in range(rounds):
+        func()
+    cost = (time.perf_counter() - begin) / rounds
+    print(f"{name:<40} {cost * 1e6:>10.2f} us")
+    return cost
+
+
+def benchmark_get_table(rounds):
+    print("RemoteDatabase.get_table")
+    client = StubClient()
+    db = RemoteDatabase(client, "default_db")
+    undecorated = RemoteDatabase.get_table.__wrapped__
+    legacy = legacy_name_validity_check("table_name", "Table")(undecorated)
+
+    base = measure("undecorated", lambda: undecorated(db, "my_table"), rounds)
+    legacy_cost = measure("legacy decorator", lambda: legacy(db, "my_table"), rounds)
+    cost = measure("name_validity_check", lambda: db.get_table("my_table"), rounds)
+    client.check_params = False
+    skipped_cost = measure("name_validity_check, check_params=False", lambda: db.get_table("my_table"), rounds)
+    client.check_params = True
+    print(f"overhead: legacy {(legacy_cost - base) * 1e6:.2f} us, now {(cost - base) * 1e6:.2f} us, "
+          f"skipped {(skipped_cost - base) * 1e6:.2f} us")
+
+
+def benchmark_match_text(rounds):
+    print("RemoteTable.match_text")
+    client = StubClient()
+    table = RemoteTable(client, "default_db", "my_table")
+    undecorated = RemoteTable.match_text.__wrapped__
+    legacy = legacy_params_type_check(undecorated)
+
+    def call(func):
+        func(table, "body", "harmful chemical", 10)
+        table.query_builder.reset()
+
+    base = measure("undecorated", lambda: call(undecorated), rounds)
+    legacy_cost = measure("legacy decorator", lambda: call(legacy), rounds)
+    cost = measure("params_type_check", lambda: call(RemoteTable.match_text), rounds)
+    client.check_params = False
+    skipped_cost = measure("params_type_check, check_params=False", lambda: call(RemoteTable.match_text), rounds)
+    client.check_params = True
+    print(f"overhead: legacy {(legacy_cost - base) * 1e6:.2f} us, now {(cost - base) * 1e6:.2f} us, "
+          f"skipped {(skipped_cost - base) * 1e6:.2f} us")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="SDK argument check overhead benchmark")
+    parser.add_argument("--rounds", type=int, default=100000, dest="rounds")
+    args = parser.parse_args()
+
+    benchmark_get_table(args.rounds)
+    print()
+    benchmark_match_text(args.rounds)
@@ -0,0 +1,162 @@
+# Copyright(C) 2023 InfiniFlow, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Benchmark of row-wise and columnar inserts. Without --server only the client side is measured: building
+# the InsertRequest and serializing it with the binary protocol the client uses. With --server the rows are
+# inserted into a running infinity server, also comparing a hand-rolled batch loop with table.writer(), and
+# row-wise inserts with uploading the same rows as a local CSV file through import_data(upload=True) and
+# with importing the columns as a frame through import_dataframe().
+#
+# Only the client side of a columnar insert is faster: the server still turns every cell of the packed
+# columns into a constant expression, as it does for row-wise inserts, so the --server numbers mostly show
+# the smaller request and the saved python encoding.
+
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+from thrift.protocol import TBinaryProtocol
+from thrift.transport import TTransport
+
+import infinity
+import infinity.remote_thrift.infinity_thrift_rpc.ttypes as ttypes
+from infinity.common import NetworkAddress, ConflictType
+from infinity.remote_thrift.types import numpy_to_insert_column
+from infinity.remote_thrift.utils import get_remote_constant_expr_from_python_value
+
+
+def row_request(columns):
+    # what RemoteTable.insert builds for a list of row dicts
+    rows = [dict(zip(columns.keys(), row)) for row in zip(*(values.tolist() for values in columns.values()))]
+    fields = []
+    for row in rows:
+        parse_exprs = [ttypes.ParsedExpr(type=ttypes.ParsedExprType(
+            constant_expr=get_remote_constant_expr_from_python_value(value))) for value in row.values()]
+        fields.append(ttypes.Field(parse_exprs=parse_exprs))
+    return ttypes.InsertRequest(db_name="default_db", table_name="insert_benchmark",
+                                column_names=list(columns.keys()), fields=fields)
+
+
+def columnar_request(columns):
+    return ttypes.InsertRequest(db_name="default_db", table_name="insert_benchmark",
+                                columns=[numpy_to_insert_column(name, values) for name, values in columns.items()])
+
+
+def serialize(request):
+    buffer = TTransport.TMemoryBuffer()
+    request.write(TBinaryProtocol.TBinaryProtocol(buffer))
+    return buffer.getvalue()
+
+
+def measure(name, func, rows, rounds):
+    begin = time.perf_counter()
+    for _ in range(rounds):
+        size = func()
+    cost = (time.perf_counter() - begin) / rounds
+    print(f"{name:<12} {rows / cost:>14.0f} rows/s {size / (1 << 20):>10.1f} MiB")
+    return cost
+
+
+def benchmark_client(columns, rows, rounds):
+    print("client side request building + serialization")
+    row_cost = measure("row", lambda: len(serialize(row_request(columns))), rows, rounds)
+    columnar_cost = measure("columnar", lambda: len(serialize(columnar_request(columns))), rows, rounds)
+    print(f"columnar speedup: {row_cost / columnar_cost:.1f}x")
+
+
+def benchmark_server(columns, rows, dimension, address, rounds, batch_size):
+    print(f"insert into server {address}")
+    conn = infinity.connect(address)
+    db_obj = conn.get_database("default_db")
+
+    def insert(data):
+        db_obj.drop_table("insert_benchmark", ConflictType.Ignore)
+        table_obj = db_obj.create_table("insert_benchmark", {
+            "id": {"type": "int"}, "vec": {"type": f"vector,{dimension},float"}}, ConflictType.Error)
+        if isinstance(data, dict):
+            table_obj.insert_columns(data)
+        else:
+            table_obj.insert(data)
+        return 0
+
+    def insert_batches(data):
+        # the hand-rolled loop the writer replaces, every insert blocks on its RPC
+        db_obj.drop_table("insert_benchmark", ConflictType.Ignore)
+        table_obj = db_obj.create_table("insert_benchmark", {
+            "id": {"type": "int"}, "vec": {"type": f"vector,{dimension},float"}}, ConflictType.Error)
+        for begin in range(0, len(data), batch_size):
+            table_obj.insert(data[begin:begin + batch_size])
+        return 0
+
+    def import_upload(file_path):
+        db_obj.drop_table("insert_benchmark", ConflictType.Ignore)
+        table_obj = db_obj.create_table("insert_benchmark", {
+            "id": {"type": "int"}, "vec": {"type": f"vector,{dimension},float"}}, ConflictType.Error)
+        table_obj.import_data(file_path, upload=True)
+        return os.path.getsize(file_path)
+
+    def import_frame(data):
+        db_obj.drop_table("insert_benchmark", ConflictType.Ignore)
+        table_obj = db_obj.create_table("insert_benchmark", {
+            "id": {"type": "int"}, "vec": {"type": f"vector,{dimension},float"}}, ConflictType.Error)
+        table_obj.import_dataframe(data)
+        return 0
+
+    def insert_writer(data):
+        db_obj.drop_table("insert_benchmark", ConflictType.Ignore)
+        table_obj = db_obj.create_table("insert_benchmark", {
+            "id": {"type": "int"}, "vec": {"type": f"vector,{dimension},float"}}, ConflictType.Error)
+        with table_obj.writer(max_rows=batch_size) as writer:
+            for row in data:
+                writer.write(row)
+        return 0
+
+    row_data = [{"id": row_id, "vec": vec} for row_id, vec in zip(columns["id"].tolist(), columns["vec"].tolist())]
+    row_cost = measure("row", lambda: insert(row_data), rows, rounds)
+    columnar_cost = measure("columnar", lambda: insert(columns), rows, rounds)
+    print(f"columnar speedup: {row_cost / columnar_cost:.1f}x")
+    batches_cost = measure("row batches", lambda: insert_batches(row_data), rows, rounds)
+    writer_cost = measure("writer", lambda: insert_writer(row_data), rows, rounds)
+    print(f"writer speedup over {batch_size} row batches: {batches_cost / writer_cost:.1f}x")
+    with tempfile.TemporaryDirectory() as temp_dir:
+        csv_path = os.path.join(temp_dir, "insert_benchmark.csv")
+        with open(csv_path, "w") as f:
+            for row in row_data:
+                f.write(f'{row["id"]},"[{",".join(map(str, row["vec"]))}]"\n')
+        upload_cost = measure("upload", lambda: import_upload(csv_path), rows, rounds)
+    print(f"upload import speedup over row inserts: {row_cost / upload_cost:.1f}x")
+    frame_cost = measure("dataframe", lambda: import_frame(columns), rows, rounds)
+    print(f"dataframe import speedup over columnar inserts: {columnar_cost / frame_cost:.1f}x")
+    db_obj.drop_table("insert_benchmark", ConflictType.Ignore)
+    conn.disconnect()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Row-wise vs columnar insert benchmark")
+    parser.add_argument("--rows", type=int, default=8192, dest="rows")
+    parser.add_argument("--dimension", type=int, default=768, dest="dimension")
+    parser.add_argument("--rounds", type=int, default=3, dest="rounds")
+    parser.add_argument("--batch_size", type=int, default=1024, dest="batch_size")
+    parser.add_argument("--server", type=str, default=None, dest="server", help="ip:port of a running server")
+    args = parser.parse_args()
+
+    data = {"id": np.arange(args.rows, dtype=np.int32),
+            "vec": np.random.rand(args.rows, args.dimension).astype(np.float32)}
+    benchmark_client(data, args.rows, args.rounds)
+    if args.server is not None:
+        ip, port = args.server.split(":")
+        print()
+        benchmark_server(data, args.rows, args.dimension, NetworkAddress(ip, int(port)), args.rounds, args.batch_size)
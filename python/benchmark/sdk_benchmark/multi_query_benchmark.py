@@ -0,0 +1,84 @@
+# Copyright(C) 2023 InfiniFlow, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Search QPS of one connection running a matrix of query vectors: one Select request per vector, and
+# match_dense given several rows of the matrix at once, one request running a search per row, against a
+# table filled with random vectors on a running server. The server scans the table once per search either
+# way, the difference is the request round trips.
+
+import argparse
+import time
+
+import numpy as np
+
+import infinity
+from infinity.common import NetworkAddress, ConflictType
+
+TABLE_NAME = "multi_query_benchmark"
+
+
+def fill_table(table_obj, rows, dimension):
+    for begin in range(0, rows, 8192):
+        end = min(begin + 8192, rows)
+        table_obj.insert_columns({"id": np.arange(begin, end, dtype=np.int32),
+                                  "vec": np.random.rand(end - begin, dimension).astype(np.float32)})
+
+
+def search_one_by_one(table_obj, queries, topn):
+    results = []
+    for query in queries:
+        results.append(table_obj.output(["id", "_distance"]).match_dense("vec", query, "float", "l2", topn).to_pl())
+    return results
+
+
+def search_per_request(table_obj, queries, topn, queries_per_request):
+    results = []
+    for begin in range(0, len(queries), queries_per_request):
+        results += table_obj.output(["id", "_distance"]).match_dense(
+            "vec", queries[begin:begin + queries_per_request], "float", "l2", topn).to_pl()
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Several searches per request vs one by one QPS benchmark")
+    parser.add_argument("--server", type=str, default="127.0.0.1:23817", dest="server", help="ip:port of the server")
+    parser.add_argument("--rows", type=int, default=100000, dest="rows")
+    parser.add_argument("--dimension", type=int, default=128, dest="dimension")
+    parser.add_argument("--topn", type=int, default=10, dest="topn")
+    parser.add_argument("--queries", type=int, default=10000, dest="queries")
+    parser.add_argument("--queries-per-request", type=str, default="16,128,1024", dest="queries_per_request")
+    args = parser.parse_args()
+
+    ip, port = args.server.split(":")
+    conn = infinity.connect(NetworkAddress(ip, int(port)))
+    db_obj = conn.get_database("default_db")
+    db_obj.drop_table(TABLE_NAME, ConflictType.Ignore)
+    table_obj = db_obj.create_table(TABLE_NAME, {
+        "id": {"type": "int"}, "vec": {"type": f"vector,{args.dimension},float"}}, ConflictType.Error)
+    fill_table(table_obj, args.rows, args.dimension)
+    query_matrix = np.random.rand(args.queries, args.dimension).astype(np.float32)
+
+    begin = time.perf_counter()
+    expected = search_one_by_one(table_obj, query_matrix, args.topn)
+    cost = time.perf_counter() - begin
+    print(f"{'one by one':<12} {args.queries / cost:>10.0f} QPS")
+    for queries_per_request in map(int, args.queries_per_request.split(",")):
+        begin = time.perf_counter()
+        results = search_per_request(table_obj, query_matrix, args.topn, queries_per_request)
+        cost = time.perf_counter() - begin
+        assert all(res["id"].to_list() == exp["id"].to_list() for res, exp in zip(results, expected))
+        print(f"{f'{queries_per_request} per req':<12} {args.queries / cost:>10.0f} QPS")
+
+    db_obj.drop_table(TABLE_NAME, ConflictType.Error)
+    conn.disconnect()
@@ -0,0 +1,101 @@
+# Copyright(C) 2023 InfiniFlow, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Search QPS and latency of one connection, one request at a time and pipelined with several max_in_flight.
+# The latency of a pipelined search runs from sending its request to reading its response. Both run the same
+# match_dense queries against a table filled with random vectors on a running server.
+
+import argparse
+import time
+
+import numpy as np
+
+import infinity
+from infinity.common import NetworkAddress, ConflictType
+
+TABLE_NAME = "pipeline_benchmark"
+
+
+def fill_table(address, rows, dimension):
+    conn = infinity.connect(address)
+    db_obj = conn.get_database("default_db")
+    db_obj.drop_table(TABLE_NAME, ConflictType.Ignore)
+    table_obj = db_obj.create_table(TABLE_NAME, {
+        "id": {"type": "int"}, "vec": {"type": f"vector,{dimension},float"}}, ConflictType.Error)
+    for begin in range(0, rows, 8192):
+        end = min(begin + 8192, rows)
+        table_obj.insert_columns({"id": np.arange(begin, end, dtype=np.int32),
+                                  "vec": np.random.rand(end - begin, dimension).astype(np.float32)})
+    conn.disconnect()
+
+
+def report(name, latencies, cost):
+    latencies = np.array(latencies) * 1000
+    print(f"{name:<14} {len(latencies) / cost:>10.0f} QPS   p50 {np.percentile(latencies, 50):.3f} ms   "
+          f"p99 {np.percentile(latencies, 99):.3f} ms")
+
+
+def run_sequential(address, queries, topn):
+    conn = infinity.connect(address)
+    table_obj = conn.get_database("default_db").get_table(TABLE_NAME)
+    latencies = []
+    begin = time.perf_counter()
+    for query in queries:
+        sent = time.perf_counter()
+        table_obj.output(["id", "_distance"]).match_dense("vec", query, "float", "l2", topn).to_pl()
+        latencies.append(time.perf_counter() - sent)
+    cost = time.perf_counter() - begin
+    conn.disconnect()
+    return latencies, cost
+
+
+def run_pipelined(address, queries, topn, max_in_flight):
+    conn = infinity.connect(address)
+    table_obj = conn.get_database("default_db").get_table(TABLE_NAME)
+    latencies = []
+
+    def record(sent):
+        return lambda future: latencies.append(time.perf_counter() - sent)
+
+    begin = time.perf_counter()
+    with conn.pipeline(max_in_flight) as pipeline:
+        table = pipeline.table(table_obj)
+        for query in queries:
+            future = table.output(["id", "_distance"]).match_dense("vec", query, "float", "l2", topn).to_pl()
+            future.add_done_callback(record(time.perf_counter()))
+    cost = time.perf_counter() - begin
+    conn.disconnect()
+    return latencies, cost
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Sequential vs pipelined search benchmark on one connection")
+    parser.add_argument("--server", type=str, default="127.0.0.1:23817", dest="server", help="ip:port of the server")
+    parser.add_argument("--rows", type=int, default=100000, dest="rows")
+    parser.add_argument("--dimension", type=int, default=128, dest="dimension")
+    parser.add_argument("--topn", type=int, default=10, dest="topn")
+    parser.add_argument("--queries", type=int, default=10000, dest="queries")
+    parser.add_argument("--max_in_flight", type=int, nargs="+", default=[4, 16, 64], dest="max_in_flight")
+    parser.add_argument("--skip_fill", action="store_true", dest="skip_fill", help="reuse the table of a previous run")
+    args = parser.parse_args()
+
+    ip, port = args.server.split(":")
+    server = NetworkAddress(ip, int(port))
+    if not args.skip_fill:
+        fill_table(server, args.rows, args.dimension)
+    query_vectors = list(np.random.rand(args.queries, args.dimension).astype(np.float32))
+    print(f"{args.queries} searches on one connection")
+    report("sequential", *run_sequential(server, query_vectors, args.topn))
+    for depth in args.max_in_flight:
+        report(f"pipelined {depth}", *run_pipelined(server, query_vectors, args.topn, depth))
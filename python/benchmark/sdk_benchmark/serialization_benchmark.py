@@ -0,0 +1,87 @@
+# Copyright(C) 2023 InfiniFlow, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Micro-benchmark of encoding and decoding the thrift messages of the SDK with the pure python protocols
+# and with the ones the client uses: the binary protocol hands whole structs to thrift's fastbinary extension,
+# the compact protocol is pure python either way. Row-wise inserts, made of many small structs, gain the most;
+# columnar inserts and result columns are mostly raw bytes either way. No server is needed.
+
+import argparse
+import time
+
+import numpy as np
+from thrift.protocol import TBinaryProtocol, TCompactProtocol
+from thrift.transport import TTransport
+
+from infinity.remote_thrift.client import make_protocol, THRIFT_ACCELERATED
+from insert_benchmark import row_request
+from thrift_protocol_benchmark import insert_request, search_request, search_response
+
+PURE_PROTOCOLS = {"binary": TBinaryProtocol.TBinaryProtocol, "compact": TCompactProtocol.TCompactProtocol}
+
+
+def encode(message, make):
+    buffer = TTransport.TMemoryBuffer()
+    message.write(make(buffer))
+    return buffer.getvalue()
+
+
+def decode(data, message_type, make):
+    # the accelerated decoder needs a transport it can read from in C, as the client's buffered socket
+    message = message_type()
+    message.read(make(TTransport.TBufferedTransport(TTransport.TMemoryBuffer(data))))
+    return message
+
+
+def measure(func, rounds):
+    func()
+    begin = time.perf_counter()
+    for _ in range(rounds):
+        func()
+    return (time.perf_counter() - begin) / rounds
+
+
+def benchmark(payloads, rounds):
+    print(f"{'payload':<16} {'protocol':<9} {'pure encode':>14} {'fast encode':>14} {'pure decode':>14} "
+          f"{'fast decode':>14}")
+    for name, message in payloads:
+        for protocol, pure in PURE_PROTOCOLS.items():
+            fast = lambda transport: make_protocol(transport, protocol)
+            data = encode(message, pure)
+            if encode(message, fast) != data or decode(data, type(message), fast) != decode(data, type(message), pure):
+                raise RuntimeError(f"{name} is encoded differently by the client's {protocol} protocol")
+            costs = [measure(lambda: encode(message, pure), rounds),
+                     measure(lambda: encode(message, fast), rounds),
+                     measure(lambda: decode(data, type(message), pure), rounds),
+                     measure(lambda: decode(data, type(message), fast), rounds)]
+            print(f"{name:<16} {protocol:<9} " + " ".join(f"{cost * 1000:>11.3f} ms" for cost in costs) +
+                  f"   {costs[0] / costs[1]:.1f}x / {costs[2] / costs[3]:.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Pure python vs accelerated thrift serialization benchmark")
+    parser.add_argument("--rows", type=int, default=1024, dest="rows")
+    parser.add_argument("--dimension", type=int, default=128, dest="dimension")
+    parser.add_argument("--topn", type=int, default=100, dest="topn")
+    parser.add_argument("--rounds", type=int, default=20, dest="rounds")
+    args = parser.parse_args()
+
+    if not THRIFT_ACCELERATED:
+        print("thrift.protocol.fastbinary isn't built, the binary protocol falls back to pure python")
+    data = {"id": np.arange(args.rows, dtype=np.int32),
+            "vec": np.random.rand(args.rows, args.dimension).astype(np.float32)}
+    benchmark([("row insert", row_request(data)),
+               ("columnar insert", insert_request(data)),
+               ("search request", search_request(np.random.rand(args.dimension).astype(np.float32), args.topn)),
+               ("search response", search_response(args.topn, args.dimension))], args.rounds)
@@ -0,0 +1,168 @@
+# Copyright(C) 2023 InfiniFlow, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# Benchmark of the thrift protocols (binary/compact) and transports (buffered/framed) of remote connections.
+# Without --server every combination encodes and decodes an insert-heavy payload, a columnar InsertRequest,
+# and a search-heavy one, a match_dense SelectRequest and its SelectResponse, and the bytes on the wire and
+# the encode/decode latency are printed. With --server the inserts and searches are also sent to a running
+# server, which only accepts the combination of its thrift_protocol and thrift_transport configs, so that
+# combination is passed with --protocol and --transport.
+
+import argparse
+import time
+
+import numpy as np
+from thrift.transport import TTransport
+
+import infinity
+import infinity.remote_thrift.infinity_thrift_rpc.ttypes as ttypes
+from infinity.common import NetworkAddress, ConflictType, THRIFT_PROTOCOLS, THRIFT_TRANSPORTS
+from infinity.remote_thrift.client import make_protocol
+from infinity.remote_thrift.table import RemoteTable
+from infinity.remote_thrift.types import numpy_to_insert_column
+
+
+class CapturedRequest(Exception):
+    def __init__(self, request):
+        super().__init__()
+        self.request = request
+
+
+class CaptureConnection:
+    # stands in for the client to get the SelectRequest the query builder sends
+    check_params = True
+
+    def select(self, **kwargs):
+        raise CapturedRequest(ttypes.SelectRequest(session_id=0, **kwargs))
+
+
+def insert_request(columns):
+    return ttypes.InsertRequest(db_name="default_db", table_name="protocol_benchmark",
+                                columns=[numpy_to_insert_column(name, values) for name, values in columns.items()])
+
+
+def search_request(query, topn):
+    table = RemoteTable(CaptureConnection(), "default_db", "protocol_benchmark")
+    try:
+        table.output(["id", "vec", "_distance"]).match_dense("vec", query, "float", "l2", topn).to_result()
+    except CapturedRequest as captured:
+        return captured.request
+
+
+def search_response(topn, dimension):
+    # what the server sends back for search_request: ids, the vectors and their distances
+    number_type = ttypes.PhysicalType(number_type=ttypes.NumberType())
+    embedding_type = ttypes.PhysicalType(embedding_type=ttypes.EmbeddingType(
+        dimension=dimension, element_type=ttypes.ElementType.ElementFloat32))
+    column_defs = [
+        ttypes.ColumnDef(id=0, name="id", data_type=ttypes.DataType(logic_type=ttypes.LogicType.Integer,
+                                                                     physical_type=number_type)),
+        ttypes.ColumnDef(id=1, name="vec", data_type=ttypes.DataType(logic_type=ttypes.LogicType.Embedding,
+                                                                      physical_type=embedding_type)),
+        ttypes.ColumnDef(id=2, name="DISTANCE", data_type=ttypes.DataType(logic_type=ttypes.LogicType.Float,
+                                                                           physical_type=number_type)),
+    ]
+    column_fields = [
+        ttypes.ColumnField(column_type=ttypes.ColumnType.ColumnInt32,
+                           column_vectors=[np.arange(topn, dtype=np.int32).tobytes()]),
+        ttypes.ColumnField(column_type=ttypes.ColumnType.ColumnEmbedding,
+                           column_vectors=[np.random.rand(topn, dimension).astype(np.float32).tobytes()]),
+        ttypes.ColumnField(column_type=ttypes.ColumnType.ColumnFloat32,
+                           column_vectors=[np.random.rand(topn).astype(np.float32).tobytes()]),
+    ]
+    return ttypes.SelectResponse(error_code=0, error_msg="", column_defs=column_defs, column_fields=column_fields)
+
+
+def encode(message, protocol, transport):
+    buffer = TTransport.TMemoryBuffer()
+    wire = TTransport.TFramedTransport(buffer) if transport == "framed" else TTransport.TBufferedTransport(buffer)
+    message.write(make_protocol(wire, protocol))
+    wire.flush()
+    return buffer.getvalue()
+
+
+def decode(data, message_type, protocol, transport):
+    buffer = TTransport.TMemoryBuffer(data)
+    wire = TTransport.TFramedTransport(buffer) if transport == "framed" else TTransport.TBufferedTransport(buffer)
+    message = message_type()
+    message.read(make_protocol(wire, protocol))
+    return message
+
+
+def timed(func, rounds):
+    func()
+    begin = time.perf_counter()
+    for _ in range(rounds):
+        func()
+    return (time.perf_counter() - begin) / rounds
+
+
+def benchmark_client(payloads, rounds):
+    print(f"{'payload':<16} {'protocol':<9} {'transport':<10} {'size':>12} {'encode':>12} {'decode':>12}")
+    for name, message in payloads:
+        for protocol in THRIFT_PROTOCOLS:
+            for transport in THRIFT_TRANSPORTS:
+                data = encode(message, protocol, transport)
+                encode_cost = timed(lambda: encode(message, protocol, transport), rounds)
+                decode_cost = timed(lambda: decode(data, type(message), protocol, transport), rounds)
+                print(f"{name:<16} {protocol:<9} {transport:<10} {len(data) / 1024:>9.1f} KiB "
+                      f"{encode_cost * 1000:>9.3f} ms {decode_cost * 1000:>9.3f} ms")
+
+
+def benchmark_server(columns, queries, topn, dimension, address, protocol, transport, rounds):
+    print(f"server {address} over {protocol}/{transport}")
+    conn = infinity.connect(address, protocol=protocol, transport=transport)
+    db_obj = conn.get_database("default_db")
+    db_obj.drop_table("protocol_benchmark", ConflictType.Ignore)
+    table_obj = db_obj.create_table("protocol_benchmark", {
+        "id": {"type": "int"}, "vec": {"type": f"vector,{dimension},float"}}, ConflictType.Error)
+
+    insert_cost = timed(lambda: table_obj.insert_columns(columns), rounds)
+    print(f"insert {len(columns['id'])} rows: {insert_cost * 1000:.3f} ms")
+
+    latencies = []
+    for query in queries:
+        begin = time.perf_counter()
+        table_obj.output(["id", "vec", "_distance"]).match_dense("vec", query, "float", "l2", topn).to_result()
+        latencies.append(time.perf_counter() - begin)
+    latencies = np.array(latencies) * 1000
+    print(f"search top {topn}: p50 {np.percentile(latencies, 50):.3f} ms, p99 {np.percentile(latencies, 99):.3f} ms")
+
+    db_obj.drop_table("protocol_benchmark", ConflictType.Ignore)
+    conn.disconnect()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Thrift protocol and transport benchmark")
+    parser.add_argument("--rows", type=int, default=1024, dest="rows")
+    parser.add_argument("--dimension", type=int, default=768, dest="dimension")
+    parser.add_argument("--topn", type=int, default=100, dest="topn")
+    parser.add_argument("--queries", type=int, default=1000, dest="queries")
+    parser.add_argument("--rounds", type=int, default=20, dest="rounds")
+    parser.add_argument("--server", type=str, default=None, dest="server", help="ip:port of a running server")
+    parser.add_argument("--protocol", type=str, default="binary", choices=THRIFT_PROTOCOLS, dest="protocol")
+    parser.add_argument("--transport", type=str, default="buffered", choices=THRIFT_TRANSPORTS, dest="transport")
+    args = parser.parse_args()
+
+    data = {"id": np.arange(args.rows, dtype=np.int32),
+            "vec": np.random.rand(args.rows, args.dimension).astype(np.float32)}
+    query_vector = np.random.rand(args.dimension).astype(np.float32)
+    benchmark_client([("insert", insert_request(data)),
+                      ("search request", search_request(query_vector, args.topn)),
+                      ("search response", search_response(args.topn, args.dimension))], args.rounds)
+    if args.server is not None:
+        ip, port = args.server.split(":")
+        print()
+        benchmark_server(data, np.random.rand(args.queries, args.dimension).astype(np.float32), args.topn,
+                         args.dimension, NetworkAddress(ip, int(port)), args.protocol, args.transport, args.rounds)
@@ -17,19 +17,41 @@
 # __version__ = importlib.metadata.version("infinity_sdk")
 
 import os
+from typing import Optional
 # import pkg_resources
 # __version__ = pkg_resources.get_distribution("infinity_sdk").version
 
-from infinity.common import URI, NetworkAddress, LOCAL_HOST, LOCAL_INFINITY_PATH, InfinityException
+from infinity.common import URI, NetworkAddress, LOCAL_HOST, LOCAL_INFINITY_PATH, InfinityException, Param, \
+    DEFAULT_THRIFT_PROTOCOL, DEFAULT_THRIFT_TRANSPORT, DEFAULT_ASYNC_MAX_CONNECTIONS, RetryPolicy, HedgePolicy, \
+    DEFAULT_RETRY_POLICY
 from infinity.infinity import InfinityConnection
 from infinity.remote_thrift.infinity import RemoteThriftInfinityConnection
+from infinity.remote_thrift.async_infinity import AsyncRemoteThriftInfinityConnection
 from infinity.local_infinity.infinity import LocalInfinityConnection
 from infinity.errors import ErrorCode
 
-def connect(uri) -> InfinityConnection:
+def connect(uri, check_params: bool = True, protocol: str = DEFAULT_THRIFT_PROTOCOL,
+            transport: str = DEFAULT_THRIFT_TRANSPORT, retry: Optional[RetryPolicy] = DEFAULT_RETRY_POLICY,
+            hedge: Optional[HedgePolicy] = None) -> InfinityConnection:
+    # with check_params=False the SDK skips its own name and argument type checks, the server still validates
+    # protocol and transport only apply to remote connections and must match the server's thrift configs,
+    # so do retry and hedge: requests failed by a transport error are retried as retry allows, none with None,
+    # and Selects are hedged on a second socket with a HedgePolicy
     if isinstance(uri, NetworkAddress):
-        return RemoteThriftInfinityConnection(uri)
+        return RemoteThriftInfinityConnection(uri, check_params, protocol, transport, retry, hedge)
     elif isinstance(uri, str) and len(uri) != 0:
-        return LocalInfinityConnection(uri)
+        return LocalInfinityConnection(uri, check_params)
     else:
         raise InfinityException(ErrorCode.INVALID_SERVER_ADDRESS, f"Unknown uri: {uri}")
+
+
+async def connect_async(uri, check_params: bool = True, protocol: str = DEFAULT_THRIFT_PROTOCOL,
+                        transport: str = DEFAULT_THRIFT_TRANSPORT,
+                        max_connections: int = DEFAULT_ASYNC_MAX_CONNECTIONS,
+                        retry: Optional[RetryPolicy] = DEFAULT_RETRY_POLICY) -> AsyncRemoteThriftInfinityConnection:
+    # only a server can be reached without blocking the event loop, embedded infinity runs in the calling thread
+    if not isinstance(uri, NetworkAddress):
+        raise InfinityException(ErrorCode.INVALID_SERVER_ADDRESS, f"Unknown uri: {uri}, expect a NetworkAddress")
+    conn = AsyncRemoteThriftInfinityConnection(uri, check_params, protocol, transport, max_connections, retry)
+    await conn.client.open()
+    return conn
@@ -0,0 +1,264 @@
+# Copyright(C) 2023 InfiniFlow, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import queue
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Iterator, Optional
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+from thrift.transport.TTransport import TTransportException
+
+from infinity.common import InfinityException, SparseMatrix
+from infinity.errors import ErrorCode
+from infinity.table_writer import estimate_value_size, estimate_columns_size
+from infinity.utils import to_insert_columns
+
+DEFAULT_BULK_LOAD_BATCH_ROWS = 8192
+
+
+@dataclass
+class BulkLoadProgress:
+    rows: int = 0
+    bytes: int = 0
+    batches: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.elapsed if self.elapsed > 0 else 0.0
+
+    @property
+    def bytes_per_second(self) -> float:
+        return self.bytes / self.elapsed if self.elapsed > 0 else 0.0
+
+    def __str__(self):
+        return (f"{self.rows} rows, {self.bytes / (1 << 20):.1f} MiB in {self.elapsed:.1f}s: "
+                f"{self.rows_per_second:.0f} rows/s, {self.bytes_per_second / (1 << 20):.1f} MiB/s")
+
+
+def split_columns(columns: dict[str, np.ndarray], batch_rows: int) -> Iterator[tuple[Any, int, int]]:
+    rows = len(next(iter(columns.values())))
+    for begin in range(0, rows, batch_rows):
+        batch = {name: values[begin:begin + batch_rows] for name, values in columns.items()}
+        yield batch, len(next(iter(batch.values()))), estimate_columns_size(batch)
+
+
+def iter_source_batches(source, batch_rows: int) -> Iterator[tuple[Any, int, int]]:
+    # rows are grouped into lists of batch_rows, frames are split into batch_rows slices of dicts of columns
+    columns = to_insert_columns(source, columnar=isinstance(source, dict))
+    if columns is not None:
+        yield from split_columns(columns, batch_rows)
+        return
+    rows = []
+    size = 0
+    for item in source:
+        columns = to_insert_columns(item)
+        if columns is not None:
+            if rows:
+                yield rows, len(rows), size
+                rows, size = [], 0
+            yield from split_columns(columns, batch_rows)
+            continue
+        for row in [item] if isinstance(item, dict) else item:
+            rows.append(row)
+            size += sum(estimate_value_size(value) for value in row.values())
+            if len(rows) == batch_rows:
+                yield rows, len(rows), size
+                rows, size = [], 0
+    if rows:
+        yield rows, len(rows), size
+
+
+def iter_parquet_batches(path: str, batch_rows: int) -> Iterator[tuple[Any, int, int]]:
+    for record_batch in pq.ParquetFile(path).iter_batches(batch_size=batch_rows):
+        yield pa.Table.from_batches([record_batch]), record_batch.num_rows, record_batch.nbytes
+
+
+def with_row_ids(columns: list[str], begin: int, end: int, values) -> dict[str, Any]:
+    # one column name takes the values, with two the first one also gets the row numbers
+    if len(columns) == 1:
+        return {columns[0]: values}
+    return {columns[0]: np.arange(begin, end, dtype=np.int64), columns[1]: values}
+
+
+def iter_fvecs_batches(path: str, batch_rows: int, columns: list[str]) -> Iterator[tuple[Any, int, int]]:
+    # each vector is stored as its int32 dimension followed by the float32 values
+    if os.path.getsize(path) == 0:
+        return
+    raw = np.memmap(path, dtype=np.int32, mode="r")
+    dimension = int(raw[0])
+    if dimension <= 0 or len(raw) % (dimension + 1) != 0:
+        raise InfinityException(ErrorCode.IMPORT_FILE_FORMAT_ERROR, f"Invalid fvecs file: {path}")
+    vectors = raw.reshape(-1, dimension + 1)[:, 1:].view(np.float32)
+    for begin in range(0, len(vectors), batch_rows):
+        end = min(begin + batch_rows, len(vectors))
+        batch = np.ascontiguousarray(vectors[begin:end])
+        yield with_row_ids(columns, begin, end, batch), end - begin, batch.nbytes
+
+
+def iter_csr_batches(path: str, batch_rows: int, columns: list[str]) -> Iterator[tuple[Any, int, int]]:
+    # int64 nrow, ncol and nnz, then int64 indptr[nrow + 1], int32 indices[nnz] and float32 data[nnz]
+    header = np.fromfile(path, dtype=np.int64, count=3)
+    if len(header) != 3:
+        raise InfinityException(ErrorCode.IMPORT_FILE_FORMAT_ERROR, f"Invalid csr file: {path}")
+    nrow, ncol, nnz = (int(value) for value in header)
+    if os.path.getsize(path) != 24 + (nrow + 1) * 8 + nnz * 8:
+        raise InfinityException(ErrorCode.IMPORT_FILE_FORMAT_ERROR, f"Invalid csr file: {path}")
+    indptr = np.memmap(path, dtype=np.int64, mode="r", offset=24, shape=(nrow + 1,))
+    indices = np.memmap(path, dtype=np.int32, mode="r", offset=24 + (nrow + 1) * 8, shape=(nnz,))
+    data = np.memmap(path, dtype=np.float32, mode="r", offset=24 + (nrow + 1) * 8 + nnz * 4, shape=(nnz,))
+    matrix = SparseMatrix(indptr, indices, data, ncol)
+    for begin in range(0, nrow, batch_rows):
+        end = min(begin + batch_rows, nrow)
+        # each batch is sent as one sparse column, read from the file when it is encoded
+        batch = matrix[begin:end]
+        yield with_row_ids(columns, begin, end, batch), end - begin, batch.nbytes
+
+
+def open_source(source, batch_rows: int, columns: Optional[list[str]]) -> Iterator[tuple[Any, int, int]]:
+    if not isinstance(source, (str, os.PathLike)):
+        return iter_source_batches(source, batch_rows)
+    path = os.fspath(source)
+    if not os.path.isfile(path):
+        raise InfinityException(ErrorCode.FILE_NOT_FOUND, f"Bulk load source not found: {path}")
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".parquet":
+        return iter_parquet_batches(path, batch_rows)
+    if extension not in (".fvecs", ".csr"):
+        raise InfinityException(ErrorCode.INVALID_PARAMETER_VALUE, f"Unsupported bulk load file type: {path}")
+    if columns is None or len(columns) not in (1, 2):
+        raise InfinityException(ErrorCode.INVALID_PARAMETER_VALUE,
+                                f"{extension} files need one column name, or a row number and a vector column")
+    if extension == ".fvecs":
+        return iter_fvecs_batches(path, batch_rows, columns)
+    return iter_csr_batches(path, batch_rows, columns)
+
+
+def bulk_load(pool, table_name: str, source, workers: int = 4, db_name: str = "default_db",
+              batch_rows: int = DEFAULT_BULK_LOAD_BATCH_ROWS, columns: Optional[list[str]] = None,
+              progress: Optional[Callable[[BulkLoadProgress], None]] = None,
+              progress_interval: float = 1.0) -> BulkLoadProgress:
+    """
+    Inserts a large source into a table with `workers` threads, each on its own connection of the pool.
+    The source is an iterable of rows or frames, a frame, a dict of column names to ndarrays, or a path to a .parquet, .fvecs or .csr file;
+    .fvecs and .csr files need `columns`: the vector column name, or a row number column name and the
+    vector column name. The source is read and split into batches of batch_rows rows on the calling
+    thread, which also calls progress every progress_interval seconds and once at the end.
+
+    Batches are inserted in no particular order. The first failed insert stops the load and is raised
+    once the workers are done; batches inserted before it stay in the table.
+    """
+    if workers < 1 or batch_rows < 1:
+        raise InfinityException(ErrorCode.INVALID_PARAMETER_VALUE,
+                                f"Invalid bulk load workers: {workers} or batch rows: {batch_rows}")
+    batches = open_source(source, batch_rows, columns)
+
+    state = BulkLoadProgress()
+    lock = threading.Lock()
+    stop = threading.Event()
+    errors = []
+    # a few batches per worker are read ahead, so a worker never waits for the source
+    pending = queue.Queue(maxsize=workers * 2)
+    begin_time = time.perf_counter()
+
+    def insert_batches(conn) -> bool:
+        # returns whether a transport error broke the connection
+        table = conn.get_database(db_name).get_table(table_name)
+        broken = False
+        while True:
+            item = pending.get()
+            if item is None:
+                return broken
+            if stop.is_set():
+                continue
+            data, rows, size = item
+            try:
+                if isinstance(data, dict):
+                    table.insert_columns(data)
+                else:
+                    table.insert(data)
+            except Exception as e:
+                with lock:
+                    errors.append(e)
+                stop.set()
+                broken = broken or isinstance(e, (TTransportException, OSError))
+                continue
+            with lock:
+                state.rows += rows
+                state.bytes += size
+                state.batches += 1
+
+    def run_worker(conn):
+        broken = False
+        try:
+            broken = insert_batches(conn)
+        except Exception as e:
+            with lock:
+                errors.append(e)
+            stop.set()
+            broken = isinstance(e, (TTransportException, OSError))
+            # keep taking batches so the reader is not blocked
+            while pending.get() is not None:
+                pass
+        finally:
+            # a connection broken by a transport error is closed instead of going back to the pool
+            if broken:
+                pool.discard_conn(conn)
+            else:
+                pool.release_conn(conn)
+
+    def report():
+        with lock:
+            state.elapsed = time.perf_counter() - begin_time
+            snapshot = BulkLoadProgress(state.rows, state.bytes, state.batches, state.elapsed)
+        if progress is not None:
+            progress(snapshot)
+        return snapshot
+
+    threads = []
+    next_report = begin_time + progress_interval
+    try:
+        for i in range(workers):
+            thread = threading.Thread(target=run_worker, args=(pool.get_conn(),), name=f"infinity-bulk-load-{i}",
+                                      daemon=True)
+            thread.start()
+            threads.append(thread)
+        for batch in batches:
+            while not stop.is_set():
+                try:
+                    pending.put(batch, timeout=max(next_report - time.perf_counter(), 0.01))
+                    break
+                except queue.Full:
+                    pass
+                finally:
+                    if time.perf_counter() >= next_report:
+                        report()
+                        next_report += progress_interval
+            if stop.is_set():
+                break
+    finally:
+        for _ in threads:
+            pending.put(None)
+        for thread in threads:
+            thread.join()
+
+    result = report()
+    if errors:
+        raise errors[0]
+    return result
@@ -11,11 +11,15 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+from collections.abc import Mapping
 from pathlib import Path
-from typing import Union
+from typing import Any, Callable, Optional, Union
 from dataclasses import dataclass
+import random
 import numpy as np
 
+from infinity.errors import ErrorCode
+
 
 class NetworkAddress:
     def __init__(self, ip, port):
@@ -51,6 +55,102 @@ class SparseVector:
         return str(self)
 
 
+@dataclass
+class SparseMatrix:
+    """
+    A whole sparse column in CSR layout: the indices and values of row i are
+    indices[indptr[i]:indptr[i + 1]] and data[indptr[i]:indptr[i + 1]].
+    """
+    indptr: np.ndarray
+    indices: np.ndarray
+    data: np.ndarray
+    dimension: int
+
+    def __len__(self):
+        return len(self.indptr) - 1
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return len(self), self.dimension
+
+    @property
+    def nbytes(self) -> int:
+        # of the rows only, indices and data may be shared with a larger matrix
+        nnz = int(self.indptr[-1] - self.indptr[0])
+        return self.indptr[:-1].nbytes + nnz * (self.indices.itemsize + self.data.itemsize)
+
+    def __getitem__(self, rows: slice) -> "SparseMatrix":
+        # rows begin:end, sharing indices and data with this matrix
+        begin, end, _ = rows.indices(len(self))
+        return SparseMatrix(self.indptr[begin:max(begin, end) + 1], self.indices, self.data, self.dimension)
+
+    def row(self, i: int) -> SparseVector:
+        begin, end = self.indptr[i], self.indptr[i + 1]
+        return SparseVector(self.indices[begin:end].tolist(), self.data[begin:end].tolist())
+
+
+@dataclass
+class RaggedTensor:
+    """
+    A whole tensor or tensor array column as one (vectors, dimension) values array plus offsets.
+    For a tensor column the vectors of row i are values[offsets[i]:offsets[i + 1]]. For a tensor
+    array column offsets selects the tensors of a row, and the vectors of tensor j are
+    values[tensor_offsets[j]:tensor_offsets[j + 1]].
+    """
+    values: np.ndarray
+    offsets: np.ndarray
+    tensor_offsets: Optional[np.ndarray] = None
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def row(self, i: int) -> Union[np.ndarray, list[np.ndarray]]:
+        # views into values, a 2-D array per tensor
+        begin, end = self.offsets[i], self.offsets[i + 1]
+        if self.tensor_offsets is None:
+            return self.values[begin:end]
+        return [self.values[self.tensor_offsets[j]:self.tensor_offsets[j + 1]] for j in range(begin, end)]
+
+    def rows(self) -> list[Union[np.ndarray, list[np.ndarray]]]:
+        return [self.row(i) for i in range(len(self))]
+
+
+class LazyColumns(Mapping):
+    """
+    The columns of a query result, each one decoded from the raw buffers on first access and
+    cached afterwards. Iteration follows the output order and does not decode anything.
+    """
+
+    def __init__(self, decoders: dict[str, Callable[[], Any]]):
+        self._decoders = decoders
+        self._columns = {}
+
+    def __getitem__(self, column_name: str) -> Any:
+        if column_name not in self._columns:
+            self._columns[column_name] = self._decoders[column_name]()
+            # the raw buffers are only referenced by the decoder
+            self._decoders[column_name] = None
+        return self._columns[column_name]
+
+    def __iter__(self):
+        return iter(self._decoders)
+
+    def __len__(self):
+        return len(self._decoders)
+
+    def is_decoded(self, column_name: str) -> bool:
+        return column_name in self._columns
+
+
+@dataclass(frozen=True)
+class Param:
+    """
+    A binding slot of a prepared query, given in place of the query vector or topn of
+    match_dense. Filter literals are written as :name inside the filter string instead.
+    """
+    name: str
+
+
 URI = Union[NetworkAddress, Path]
 VEC = Union[list, np.ndarray]
 INSERT_DATA = dict[str, Union[str, int, float, list[Union[int, float]]], SparseVector]
@@ -73,5 +173,72 @@ class InfinityException(Exception):
         self.error_message = error_message
 
 
+# the RPCs which only read, running one twice has the effect of running it once
+IDEMPOTENT_RPCS = frozenset({
+    "Select", "SelectBatch", "Explain", "ListDatabase", "ShowDatabase", "GetDatabase", "ListTable", "ShowTables",
+    "ShowTable", "ShowColumns", "GetTable", "ListIndex", "ShowIndex", "ShowSegments", "ShowSegment", "ShowBlocks",
+    "ShowBlock", "ShowBlockColumn"})
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    How a remote connection retries a request failed by a transport error: it reconnects, with a new server
+    session, and sends the request again up to max_retries times. A request is sent again only if it never
+    reached the server, or if its RPC is in `idempotent`. Requests using state of their session, the chunks of
+    an uploaded file and its import, are never sent again since the new session doesn't have it. Retry number n waits a random delay of up to
+    min(max_backoff, backoff * 2 ** n) seconds first, so that clients cut off together don't come back together.
+    """
+    max_retries: int = 2
+    backoff: float = 0.05
+    max_backoff: float = 2.0
+    idempotent: frozenset[str] = IDEMPOTENT_RPCS
+
+    def __post_init__(self):
+        if self.max_retries < 0 or self.backoff < 0 or self.max_backoff < 0:
+            raise InfinityException(ErrorCode.INVALID_PARAMETER_VALUE, f"Invalid retry policy: {self}")
+
+    def delay(self, retry: int) -> float:
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** retry))
+
+
+@dataclass(frozen=True)
+class HedgePolicy:
+    """
+    Hedged Select requests of a remote connection: a Select without response after the percentile of the
+    latencies of the last window Selects, and at least min_delay seconds, is sent again on a spare socket of
+    the connection, and the first response is used. The spare socket has a server session of its own, so a
+    hedging connection holds two sessions. Hedging starts after min_samples Selects, and stops while
+    more than max_ratio of the Selects in the window were hedged, so that a server slow for everyone doesn't
+    get twice the load.
+    """
+    percentile: float = 95.0
+    min_delay: float = 0.001
+    window: int = 1000
+    min_samples: int = 100
+    max_ratio: float = 0.1
+
+    def __post_init__(self):
+        if not 0 < self.percentile < 100 or self.min_delay < 0 or self.window < 1 or \
+                not 0 < self.min_samples <= self.window or not 0 <= self.max_ratio <= 1:
+            raise InfinityException(ErrorCode.INVALID_PARAMETER_VALUE, f"Invalid hedge policy: {self}")
+
+
 DEFAULT_MATCH_VECTOR_TOPN = 10
 DEFAULT_MATCH_SPARSE_TOPN = 10
+DEFAULT_EXPRESSION_CACHE_SIZE = 1024
+DEFAULT_WRITER_MAX_ROWS = 8192
+DEFAULT_WRITER_MAX_BYTES = 16 * 1024 * 1024
+DEFAULT_WRITER_INFLIGHT = 2
+DEFAULT_UPLOAD_CHUNK_SIZE = 4 * 1024 * 1024
+# thrift encoding of remote connections, it must match the thrift_protocol and thrift_transport server configs
+THRIFT_PROTOCOLS = ("binary", "compact")
+THRIFT_TRANSPORTS = ("buffered", "framed")
+DEFAULT_THRIFT_PROTOCOL = "binary"
+DEFAULT_THRIFT_TRANSPORT = "buffered"
+# server sessions an async connection opens at most, one per request in flight
+DEFAULT_ASYNC_MAX_CONNECTIONS = 16
+# requests aren't retried unless a RetryPolicy is given
+DEFAULT_RETRY_POLICY = None
+# requests a pipeline sends at most before reading the oldest response
+DEFAULT_PIPELINE_MAX_IN_FLIGHT = 32
@@ -1,61 +1,305 @@
-from threading import Lock, Condition
-import infinity
-from infinity.common import NetworkAddress
+import contextlib
 import logging
-from infinity.remote_thrift.infinity import RemoteThriftInfinityConnection
+import threading
+import time
+import weakref
+from dataclasses import dataclass
+from threading import Condition
+from typing import Optional
 
+from thrift.transport.TTransport import TTransportException
+
+import infinity
+from infinity.common import NetworkAddress, InfinityException, DEFAULT_THRIFT_PROTOCOL, DEFAULT_THRIFT_TRANSPORT, \
+    RetryPolicy, HedgePolicy, DEFAULT_RETRY_POLICY
+from infinity.errors import ErrorCode
+from infinity.infinity import InfinityConnection
+
+
+@dataclass
+class ConnectionPoolStats:
+    size: int = 0
+    idle: int = 0
+    in_use: int = 0
+    peak_in_use: int = 0
+    max_size: int = 0
+    # threads blocked in get_conn right now
+    waiting: int = 0
+    gets: int = 0
+    timeouts: int = 0
+    created: int = 0
+    closed: int = 0
+    validation_failures: int = 0
+    # seconds spent in get_conn waiting for a free connection, by the gets which got one
+    wait_time: float = 0.0
+    max_wait_time: float = 0.0
+
+    @property
+    def utilization(self) -> float:
+        return self.in_use / self.max_size if self.max_size > 0 else 0.0
+
+    @property
+    def mean_wait_time(self) -> float:
+        return self.wait_time / self.gets if self.gets > 0 else 0.0
 
-class ConnectionPool(object):
 
+def maintain_pool(pool_ref, stop: threading.Event, interval: float):
+    # holds the pool weakly, the thread ends with destroy() or once the pool is collected
+    while not stop.wait(interval):
+        pool = pool_ref()
+        if pool is None:
+            return
+        try:
+            pool.maintain()
+        except Exception as e:
+            logging.warning(f"connection pool maintenance failed: {e}")
+        del pool
 
-    def __init__(self, uri = NetworkAddress("127.0.0.1", 23817), min_size=4, max_size=16, timeout=10.0):
-        assert (min_size <= max_size)
+
+class ConnectionPool(object):
+    """
+    A thread-safe pool of connections. Connections are reused last released first, so the few connections
+    a light load needs stay warm and the others become idle. A background thread checks the connections
+    idle for validation_interval seconds with a cheap request and closes broken ones, closes those idle
+    for idle_timeout seconds beyond min_size, and those older than max_lifetime seconds, then reopens
+    connections up to min_size.
+    """
+
+    def __init__(self, uri = NetworkAddress("127.0.0.1", 23817), min_size=4, max_size=16, timeout=10.0,
+                 protocol=DEFAULT_THRIFT_PROTOCOL, transport=DEFAULT_THRIFT_TRANSPORT,
+                 idle_timeout: Optional[float] = 300.0, max_lifetime: Optional[float] = None,
+                 validation_interval: Optional[float] = 30.0, retry: Optional[RetryPolicy] = DEFAULT_RETRY_POLICY,
+                 hedge: Optional[HedgePolicy] = None):
+        if min_size < 0 or max_size < 1 or min_size > max_size:
+            raise InfinityException(ErrorCode.INVALID_PARAMETER_VALUE,
+                                    f"Invalid connection pool min_size: {min_size} or max_size: {max_size}")
         self.uri_ = uri
+        self.protocol_ = protocol
+        self.transport_ = transport
+        # passed to every connection, which hedges its Selects on a second socket of its own
+        self.retry_ = retry
+        self.hedge_ = hedge
         self.min_size_ = min_size
         self.max_size_ = max_size
+        # open connections, idle or not, and the ones being opened
         self.curr_size_ = 0
         self.timeout_ = timeout
+        self.idle_timeout_ = idle_timeout
+        self.max_lifetime_ = max_lifetime
+        self.validation_interval_ = validation_interval
+        # idle connections, the last released at the end
         self.free_pool_ = []
-        self.created_conns_ = []
+        self.created_at_ = {}
+        self.idle_since_ = {}
+        self.stats_ = ConnectionPoolStats(max_size=max_size)
+        self.closed_ = False
         self.cond_ = Condition()
 
-        while(self.curr_size_ < self.min_size_):
-            self._create_conn()
+        try:
+            while self.curr_size_ < self.min_size_:
+                self.curr_size_ += 1
+                self._add_idle(self._create_conn())
+        except BaseException:
+            # the connections opened before the failure
+            for conn in self.free_pool_:
+                conn.disconnect()
+            raise
 
+        self.stop_ = threading.Event()
+        self.maintainer_ = None
+        if validation_interval:
+            self.maintainer_ = threading.Thread(target=maintain_pool,
+                                                args=(weakref.ref(self), self.stop_, validation_interval),
+                                                name="infinity-connection-pool", daemon=True)
+            self.maintainer_.start()
 
-    def _create_conn(self):
-        infinity_coon = infinity.connect(self.uri_)
-        self.curr_size_ += 1
-        self.free_pool_.append(infinity_coon)
-        self.created_conns_.append(infinity_coon)
+    def _create_conn(self) -> InfinityConnection:
+        # the caller has counted the connection in curr_size_
+        try:
+            conn = infinity.connect(self.uri_, protocol=self.protocol_, transport=self.transport_, retry=self.retry_,
+                                    hedge=self.hedge_)
+        except BaseException:
+            with self.cond_:
+                self.curr_size_ -= 1
+                self.cond_.notify()
+            raise
+        with self.cond_:
+            self.created_at_[conn] = time.monotonic()
+            self.stats_.created += 1
+        return conn
 
+    def _add_idle(self, conn):
+        with self.cond_:
+            if not self.closed_:
+                self.free_pool_.append(conn)
+                self.idle_since_[conn] = time.monotonic()
+                self.cond_.notify()
+                return
+        # the pool was destroyed while the connection was opened
+        self._close_conn(conn)
 
-    def get_conn(self) -> RemoteThriftInfinityConnection:
+    def _close_conn(self, conn):
         with self.cond_:
-            while True:
-                is_waken = self.cond_.wait_for(lambda: len(self.free_pool_) != 0 or self.curr_size_ < self.max_size_, self.timeout_)
-                if is_waken:
-                    break
-                logging.warn("connection waiting...")
-            if (len(self.free_pool_) == 0):
-                self._create_conn()
-            conn = self.free_pool_.pop()
-            logging.debug("get_conn")
-            return conn
+            del self.created_at_[conn]
+            self.curr_size_ -= 1
+            self.stats_.closed += 1
+            self.cond_.notify()
+        try:
+            conn.disconnect()
+        except Exception:
+            pass
 
+    def get_conn(self, timeout: Optional[float] = None) -> InfinityConnection:
+        timeout = self.timeout_ if timeout is None else timeout
+        begin_time = time.monotonic()
+        with self.cond_:
+            self.stats_.waiting += 1
+            try:
+                available = self.cond_.wait_for(
+                    lambda: self.closed_ or len(self.free_pool_) != 0 or self.curr_size_ < self.max_size_, timeout)
+            finally:
+                self.stats_.waiting -= 1
+            if self.closed_:
+                raise InfinityException(ErrorCode.CLIENT_CLOSE, "The connection pool is destroyed")
+            if not available:
+                self.stats_.timeouts += 1
+                raise InfinityException(ErrorCode.TOO_MANY_CONNECTIONS,
+                                        f"No connection of the pool is free after {timeout}s, "
+                                        f"all {self.max_size_} are in use")
+            wait_time = time.monotonic() - begin_time
+            self.stats_.wait_time += wait_time
+            self.stats_.max_wait_time = max(self.stats_.max_wait_time, wait_time)
+            self.stats_.gets += 1
+            self.stats_.in_use += 1
+            self.stats_.peak_in_use = max(self.stats_.peak_in_use, self.stats_.in_use)
+            if len(self.free_pool_) != 0:
+                conn = self.free_pool_.pop()
+                del self.idle_since_[conn]
+                return conn
+            self.curr_size_ += 1
+        try:
+            return self._create_conn()
+        except BaseException:
+            with self.cond_:
+                self.stats_.in_use -= 1
+            raise
 
     def release_conn(self, conn):
         with self.cond_:
-            if(not self.created_conns_.count(conn)):
-                raise Exception("the connection is unknown")
-            if(self.free_pool_.count(conn)):
-                raise Exception("the connection has been released")
-            self.curr_size_ -= 1
-            self.free_pool_.append(conn)
-            self.cond_.notify_all()
-            logging.debug("release_conn")
+            if conn not in self.created_at_:
+                raise InfinityException(ErrorCode.INVALID_PARAMETER_VALUE, "the connection is unknown")
+            if conn in self.idle_since_:
+                raise InfinityException(ErrorCode.INVALID_PARAMETER_VALUE, "the connection has been released")
+            self.stats_.in_use -= 1
+            expired = self.closed_ or self._expired(conn, time.monotonic())
+            if not expired:
+                self.free_pool_.append(conn)
+                self.idle_since_[conn] = time.monotonic()
+                self.cond_.notify()
+        if expired:
+            self._close_conn(conn)
+
+    def discard_conn(self, conn):
+        # for a connection that failed, it is closed instead of being reused
+        with self.cond_:
+            if conn not in self.created_at_ or conn in self.idle_since_:
+                raise InfinityException(ErrorCode.INVALID_PARAMETER_VALUE, "the connection isn't in use")
+            self.stats_.in_use -= 1
+        self._close_conn(conn)
 
+    @contextlib.contextmanager
+    def connection(self, timeout: Optional[float] = None):
+        """
+        with pool.connection() as conn: takes a connection and releases it at the end of the block, or
+        closes it if the block raised a transport error.
+        """
+        conn = self.get_conn(timeout)
+        broken = False
+        try:
+            yield conn
+        except (TTransportException, OSError):
+            broken = True
+            raise
+        finally:
+            if broken:
+                self.discard_conn(conn)
+            else:
+                self.release_conn(conn)
+
+    def _expired(self, conn, now: float) -> bool:
+        return self.max_lifetime_ is not None and now - self.created_at_[conn] >= self.max_lifetime_
+
+    def maintain(self):
+        # called by the background thread every validation_interval seconds
+        now = time.monotonic()
+        closing = []
+        checking = []
+        with self.cond_:
+            if self.closed_:
+                return
+            # the longest idle are at the front
+            for conn in list(self.free_pool_):
+                idle_time = now - self.idle_since_[conn]
+                if self._expired(conn, now) or (self.idle_timeout_ is not None and idle_time >= self.idle_timeout_
+                                                and self.curr_size_ - len(closing) > self.min_size_):
+                    closing.append(conn)
+                elif self.validation_interval_ and idle_time >= self.validation_interval_:
+                    checking.append(conn)
+            # taken out of the pool while they are closed or checked, still counted in curr_size_
+            idle_since = {}
+            for conn in closing + checking:
+                self.free_pool_.remove(conn)
+                idle_since[conn] = self.idle_since_.pop(conn)
+
+        for conn in closing:
+            self._close_conn(conn)
+        alive = []
+        for conn in checking:
+            try:
+                conn.list_databases()
+                alive.append(conn)
+            except Exception as e:
+                logging.warning(f"closing a broken connection of the pool: {e}")
+                with self.cond_:
+                    self.stats_.validation_failures += 1
+                self._close_conn(conn)
+        # back in front of the pool, the check doesn't count as a use for idle_timeout
+        with self.cond_:
+            if self.closed_:
+                closing = alive
+            else:
+                closing = []
+                self.free_pool_[0:0] = alive
+                for conn in alive:
+                    self.idle_since_[conn] = idle_since[conn]
+                    self.cond_.notify()
+        for conn in closing:
+            self._close_conn(conn)
+
+        while True:
+            with self.cond_:
+                if self.closed_ or self.curr_size_ >= self.min_size_:
+                    return
+                self.curr_size_ += 1
+            self._add_idle(self._create_conn())
+
+    def stats(self) -> ConnectionPoolStats:
+        with self.cond_:
+            return ConnectionPoolStats(**{**self.stats_.__dict__, "size": self.curr_size_,
+                                          "idle": len(self.free_pool_)})
+
+    def bulk_load(self, table_name, source, workers=4, **kwargs):
+        from infinity.bulk_load import bulk_load
+        return bulk_load(self, table_name, source, workers=workers, **kwargs)
 
     def destroy(self):
-        for conn in iter(self.created_conns_):
-            conn.disconnect()
\ No newline at end of file
+        # idle connections are closed now, the ones in use when they are released
+        self.stop_.set()
+        with self.cond_:
+            self.closed_ = True
+            conns = self.free_pool_
+            self.free_pool_ = []
+            self.idle_since_.clear()
+            self.cond_.notify_all()
+        for conn in conns:
+            self._close_conn(conn)
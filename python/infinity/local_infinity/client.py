@@ -36,6 +36,8 @@ class LocalQueryResult:
 class LocalInfinityClient:
     def __init__(self, path: str = LOCAL_INFINITY_PATH):
         self.path = path
+        # argument checks of the SDK decorators, see infinity.connect
+        self.check_params = True
         Infinity.LocalInit(path)
         self.client = Infinity.LocalConnect()
 
@@ -150,16 +152,7 @@ class LocalInfinityClient:
     def insert(self, db_name: str, table_name: str, column_names: list[str], fields):
         if self.client is None:
             raise Exception("Local infinity is not connected")
-        retry = 0
-        inner_ex = None
-        while retry <= 2:
-            try:
-                res = self.client.Insert(db_name, table_name, column_names, fields)
-                return self.convert_res(res)
-            except Exception as ex:
-                inner_ex = ex
-                retry += 1
-        return PyErrorCode.TOO_MANY_CONNECTIONS, "insert failed with exception: " + str(inner_ex)
+        return self.convert_res(self.client.Insert(db_name, table_name, column_names, fields))
 
     def import_data(self, db_name: str, table_name: str, file_name: str, import_options):
         if self.client is None:
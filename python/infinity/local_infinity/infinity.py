@@ -11,7 +11,7 @@ import logging
 
 
 class LocalInfinityConnection(InfinityConnection, ABC):
-    def __init__(self, uri=LOCAL_INFINITY_PATH):
+    def __init__(self, uri=LOCAL_INFINITY_PATH, check_params: bool = True):
         if not os.path.exists(uri):
             try:
                 logging.warning(f"Directory {uri} not found, try to create it")
@@ -21,6 +21,7 @@ class LocalInfinityConnection(InfinityConnection, ABC):
         if os.path.isdir(uri):
             if os.access(uri, os.R_OK | os.W_OK):
                 self._client = LocalInfinityClient(uri)
+                self._client.check_params = check_params
                 self._is_connected = True
             else:
                 raise InfinityException(ErrorCode.UNEXPECTED_ERROR,
@@ -108,5 +109,9 @@ class LocalInfinityConnection(InfinityConnection, ABC):
         else:
             raise InfinityException(res.error_code, res.error_msg)
 
+    def pipeline(self, *args, **kwargs):
+        raise InfinityException(ErrorCode.NOT_SUPPORTED, "Embedded infinity runs requests in the calling thread, "
+                                                         "there is no round trip to pipeline")
+
     def client(self):
         return self._client
@@ -1,19 +1,21 @@
 from __future__ import annotations
 
+import functools
 from abc import ABC
-from typing import List, Optional, Any
+from typing import Callable, List, Optional, Any
 
 import numpy as np
 import pandas as pd
 import polars as pl
 import pyarrow as pa
 from pyarrow import Table
-from sqlglot import condition, maybe_parse
 
-from infinity.common import VEC, SparseVector, InfinityException
+from infinity.common import VEC, SparseVector, InfinityException, Param
 from infinity.embedded_infinity_ext import *
-from infinity.local_infinity.types import logic_type_to_dtype, make_match_tensor_expr
-from infinity.local_infinity.utils import traverse_conditions, parse_expr
+from infinity.local_infinity.types import logic_type_to_dtype, make_match_tensor_expr, build_arrow_table, \
+    build_polars_dataframe, build_numpy_dict, build_result, pack_bits
+from infinity.local_infinity.utils import parse_filter, parse_output
+from infinity.utils import pack_embedding
 from infinity.table import ExplainType as BaseExplainType
 from infinity.errors import ErrorCode
 
@@ -25,12 +27,17 @@ class Query(ABC):
         filter: Optional[WrapParsedExpr],
         limit: Optional[WrapParsedExpr],
         offset: Optional[WrapParsedExpr],
+        batch_match_index: Optional[int] = None,
+        batch_embeddings: Optional[List[EmbeddingData]] = None,
     ):
         self.columns = columns
         self.search = search
         self.filter = filter
         self.limit = limit
         self.offset = offset
+        # with a matrix of query vectors, the match_dense at batch_match_index runs once per vector
+        self.batch_match_index = batch_match_index
+        self.batch_embeddings = batch_embeddings
 
 
 class ExplainQuery(Query):
@@ -47,6 +54,75 @@ class ExplainQuery(Query):
         self.explain_type = explain_type
 
 
+def check_knn_topn(topn):
+    if not isinstance(topn, int):
+        raise InfinityException(
+            ErrorCode.INVALID_TOPK_TYPE, f"Invalid topn, type should be embedded, but get {type(topn)}"
+        )
+
+
+def make_embedding_data(embedding_data: VEC, embedding_data_type: str) -> EmbeddingData:
+    # type checking, bit vectors may also be given packed as bytes
+    if not isinstance(embedding_data, (list, tuple, np.ndarray)) and not (
+            embedding_data_type == "bit" and isinstance(embedding_data, (bytes, bytearray, memoryview))):
+        raise InfinityException(
+            ErrorCode.INVALID_DATA_TYPE,
+            f"Invalid embedding data, type should be embedded, but get {type(embedding_data)}",
+        )
+    data = EmbeddingData()
+    if embedding_data_type == "bit":
+        data.packed_value = pack_bits(embedding_data).tobytes()
+    else:
+        # the query is sent as one little-endian buffer, no per element conversion
+        data.packed_value = pack_embedding(embedding_data, embedding_data_type)
+    return data
+
+
+def make_embedding_batch(embedding_data: np.ndarray, embedding_data_type: str) -> List[EmbeddingData]:
+    # one EmbeddingData per row of a (Q, dim) matrix
+    if len(embedding_data) == 0:
+        raise InfinityException(ErrorCode.INVALID_EMBEDDING_DATA_TYPE, "Invalid embedding data, no query vector")
+    return [make_embedding_data(row, embedding_data_type) for row in embedding_data]
+
+
+def update_knn_expr(match_index: int, query: Query, field: str, value):
+    # match_exprs is a vector of values on the C++ side: the getter returns copies,
+    # so the changed expression has to be assigned back
+    match_exprs = query.search.match_exprs
+    setattr(match_exprs[match_index].knn_expr, field, value)
+    query.search.match_exprs = match_exprs
+
+
+def bind_knn_topn(match_index: int, query: Query, topn: int):
+    check_knn_topn(topn)
+    update_knn_expr(match_index, query, "topn", topn)
+
+
+def bind_knn_embedding_data(match_index: int, embedding_data_type: str, query: Query, embedding_data: VEC):
+    update_knn_expr(match_index, query, "embedding_data", make_embedding_data(embedding_data, embedding_data_type))
+
+
+def check_result_formats(sparse_format: str, tensor_format: str):
+    # sparse columns are returned as one dict per row, or as a single SparseMatrix with "csr"
+    if sparse_format not in ("dict", "csr"):
+        raise InfinityException(ErrorCode.INVALID_PARAMETER_VALUE, f"Invalid sparse format: {sparse_format}")
+    # tensor columns are returned as nested lists, or as a single RaggedTensor with "ragged"
+    if tensor_format not in ("list", "ragged"):
+        raise InfinityException(ErrorCode.INVALID_PARAMETER_VALUE, f"Invalid tensor format: {tensor_format}")
+
+
+def result_to_df(data_dict: dict[str, list[Any]], data_type_dict: dict[str, Any]) -> pd.DataFrame:
+    df_dict = {}
+    for k, v in data_dict.items():
+        data_series = pd.Series(v, dtype=logic_type_to_dtype(data_type_dict[k]))
+        df_dict[k] = data_series
+    return pd.DataFrame(df_dict)
+
+
+def build_df(res) -> pd.DataFrame:
+    return result_to_df(*build_result(res))
+
+
 class InfinityLocalQueryBuilder(ABC):
     def __init__(self, table):
         self._table = table
@@ -55,6 +131,9 @@ class InfinityLocalQueryBuilder(ABC):
         self._filter = None
         self._limit = None
         self._offset = None
+        self._params = {}
+        self._batch_match_index = None
+        self._batch_embeddings = None
 
     def reset(self):
         self._columns = None
@@ -62,6 +141,12 @@ class InfinityLocalQueryBuilder(ABC):
         self._filter = None
         self._limit = None
         self._offset = None
+        self._params = {}
+        self._batch_match_index = None
+        self._batch_embeddings = None
+
+    def _add_param(self, name: str, slot: Callable[[Query, Any], None]):
+        self._params.setdefault(name, []).append(slot)
 
     def match_dense(
         self,
@@ -80,65 +165,52 @@ class InfinityLocalQueryBuilder(ABC):
         column_expr.names = [vector_column_name]
         column_expr.star = False
 
-        if not isinstance(topn, int):
-            raise InfinityException(
-                ErrorCode.INVALID_TOPK_TYPE, f"Invalid topn, type should be embedded, but get {type(topn)}"
-            )
-
-        # type casting
-        if isinstance(embedding_data, list):
-            embedding_data = embedding_data
-        elif isinstance(embedding_data, tuple):
-            embedding_data = embedding_data
-        elif isinstance(embedding_data, np.ndarray):
-            embedding_data = embedding_data.tolist()
+        # a Param is a binding slot of a prepared query, filled in by PreparedQuery.bind
+        match_index = len(self._search.match_exprs)
+        if isinstance(topn, Param):
+            self._add_param(topn.name, functools.partial(bind_knn_topn, match_index))
+            topn = 0
         else:
-            raise InfinityException(
-                ErrorCode.INVALID_DATA_TYPE,
-                f"Invalid embedding data, type should be embedded, but get {type(embedding_data)}",
-            )
-
-        if embedding_data_type in ["int", "uint8", "int8", "int16", "int32", "int64", "tinyint", "unsigned tinyint",
-                                   "smallint", "bigint"]:
-            embedding_data = [int(x) for x in embedding_data]
-
-        if embedding_data_type in ["float", "float32", "double", "float64", "float16", "bfloat16"]:
-            embedding_data = [float(x) for x in embedding_data]
+            check_knn_topn(topn)
+        if isinstance(embedding_data, Param):
+            self._add_param(embedding_data.name,
+                            functools.partial(bind_knn_embedding_data, match_index, embedding_data_type))
+            data = EmbeddingData()
+        elif isinstance(embedding_data, np.ndarray) and embedding_data.ndim == 2:
+            # a (Q, dim) matrix runs the Q searches, the query returns Q results
+            if self._batch_embeddings is not None:
+                self.reset()
+                raise InfinityException(ErrorCode.INVALID_PARAMETER_VALUE,
+                                        "Only one match_dense of a query can take a matrix of query vectors")
+            self._batch_match_index = match_index
+            self._batch_embeddings = make_embedding_batch(embedding_data, embedding_data_type)
+            data = self._batch_embeddings[0]
+        else:
+            data = make_embedding_data(embedding_data, embedding_data_type)
 
-        data = EmbeddingData()
         elem_type = EmbeddingDataType.kElemFloat
         if embedding_data_type == "bit":
             elem_type = EmbeddingDataType.kElemBit
-            raise Exception(f"Invalid embedding {embedding_data[0]} type")
         elif embedding_data_type in ["unsigned tinyint", "uint8"]:
             elem_type = EmbeddingDataType.kElemUInt8
-            data.u8_array_value = embedding_data
         elif embedding_data_type in ["tinyint", "int8"]:
             elem_type = EmbeddingDataType.kElemInt8
-            data.i8_array_value = embedding_data
         elif embedding_data_type in ["smallint", "int16"]:
             elem_type = EmbeddingDataType.kElemInt16
-            data.i16_array_value = embedding_data
         elif embedding_data_type in ["int", "int32"]:
             elem_type = EmbeddingDataType.kElemInt32
-            data.i32_array_value = embedding_data
         elif embedding_data_type in ["bigint", "int64"]:
             elem_type = EmbeddingDataType.kElemInt64
-            data.i64_array_value = embedding_data
         elif embedding_data_type in ["float", "float32"]:
             elem_type = EmbeddingDataType.kElemFloat
-            data.f32_array_value = embedding_data
         elif embedding_data_type in ["double", "float64"]:
             elem_type = EmbeddingDataType.kElemDouble
-            data.f64_array_value = embedding_data
         elif embedding_data_type in ["float16"]:
             elem_type = EmbeddingDataType.kElemFloat16
-            data.f16_array_value = embedding_data
         elif embedding_data_type in ["bfloat16"]:
             elem_type = EmbeddingDataType.kElemBFloat16
-            data.bf16_array_value = embedding_data
         else:
-            raise InfinityException(ErrorCode.INVALID_EMBEDDING_DATA_TYPE, f"Invalid embedding {embedding_data[0]} type")
+            raise InfinityException(ErrorCode.INVALID_EMBEDDING_DATA_TYPE, f"Invalid embedding {embedding_data_type} type")
 
         dist_type = KnnDistanceType.kInvalid
         if distance_type == "l2":
@@ -311,7 +383,7 @@ class InfinityLocalQueryBuilder(ABC):
         return self
 
     def filter(self, where: Optional[str]) -> InfinityLocalQueryBuilder:
-        where_expr = traverse_conditions(condition(where))
+        where_expr = parse_filter(where, self._params)
         self._filter = where_expr
         return self
 
@@ -392,36 +464,51 @@ class InfinityLocalQueryBuilder(ABC):
                     select_list.append(parsed_expr)
 
                 case _:
-                    parsed_expr = parse_expr(maybe_parse(column))
+                    parsed_expr = parse_output(column)
                     select_list.append(parsed_expr)
 
         self._columns = select_list
         return self
 
-    def to_result(self):
+    def _take_query(self, prepare: bool = False) -> Query:
+        if self._params and not prepare:
+            names = ", ".join(self._params)
+            self.reset()
+            raise InfinityException(ErrorCode.INVALID_PARAMETER_VALUE,
+                                    f"Query has parameters {names}, run it with prepare() and bind()")
         query = Query(
             columns=self._columns,
             search=self._search,
             filter=self._filter,
             limit=self._limit,
             offset=self._offset,
+            batch_match_index=self._batch_match_index,
+            batch_embeddings=self._batch_embeddings,
         )
         self.reset()
-        return self._table._execute_query(query)
+        return query
+
+    def prepare(self) -> PreparedQuery:
+        params = self._params
+        return PreparedQuery(self._table, self._take_query(prepare=True), params)
+
+    def to_result(self, sparse_format: str = "dict", tensor_format: str = "list", lazy: bool = False):
+        query = self._take_query()
+        check_result_formats(sparse_format, tensor_format)
+        # with lazy the columns are decoded on first access, see LazyColumns
+        return self._table._execute_query(query, sparse_format, tensor_format, lazy)
 
     def to_df(self) -> pd.DataFrame:
-        df_dict = {}
-        data_dict, data_type_dict = self.to_result()
-        for k, v in data_dict.items():
-            data_series = pd.Series(v, dtype=logic_type_to_dtype(data_type_dict[k]))
-            df_dict[k] = data_series
-        return pd.DataFrame(df_dict)
+        return self._table._build_query_result(self._take_query(), build_df)
 
     def to_pl(self) -> pl.DataFrame:
-        return pl.from_pandas(self.to_df())
+        return self._table._build_query_result(self._take_query(), build_polars_dataframe)
 
     def to_arrow(self) -> Table:
-        return pa.Table.from_pandas(self.to_df())
+        return self._table._build_query_result(self._take_query(), build_arrow_table)
+
+    def to_numpy(self) -> dict[str, np.ndarray]:
+        return self._table._build_query_result(self._take_query(), build_numpy_dict)
 
     def explain(self, explain_type=ExplainType.kPhysical) -> Any:
         query = ExplainQuery(
@@ -433,3 +520,54 @@ class InfinityLocalQueryBuilder(ABC):
             explain_type=explain_type,
         )
         return self._table._explain_query(query)
+
+
+class PreparedQuery:
+    """
+    A query whose expression tree is built once, see Table.prepare. bind() only swaps the values of
+    the Param slots and :name filter literals into that tree, so repeated executions skip building
+    and parsing the query. A prepared query is not safe to bind and execute from several threads.
+    """
+
+    def __init__(self, table, query: Query, params: dict[str, list[Callable[[Query, Any], None]]]):
+        self._table = table
+        self._query = query
+        self._params = params
+        self._unbound = set(params)
+
+    @property
+    def parameters(self) -> list[str]:
+        return list(self._params)
+
+    def bind(self, **values) -> PreparedQuery:
+        for name, value in values.items():
+            if name not in self._params:
+                raise InfinityException(ErrorCode.INVALID_PARAMETER_VALUE, f"Unknown query parameter: {name}")
+            for slot in self._params[name]:
+                slot(self._query, value)
+            self._unbound.discard(name)
+        return self
+
+    def _bound_query(self) -> Query:
+        # values stay bound across executions, only the changed ones need to be bound again
+        if self._unbound:
+            raise InfinityException(ErrorCode.INVALID_PARAMETER_VALUE,
+                                    f"Unbound query parameters: {', '.join(sorted(self._unbound))}")
+        return self._query
+
+    def to_result(self, sparse_format: str = "dict", tensor_format: str = "list", lazy: bool = False):
+        query = self._bound_query()
+        check_result_formats(sparse_format, tensor_format)
+        return self._table._execute_query(query, sparse_format, tensor_format, lazy)
+
+    def to_df(self) -> pd.DataFrame:
+        return self._table._build_query_result(self._bound_query(), build_df)
+
+    def to_pl(self) -> pl.DataFrame:
+        return self._table._build_query_result(self._bound_query(), build_polars_dataframe)
+
+    def to_arrow(self) -> Table:
+        return self._table._build_query_result(self._bound_query(), build_arrow_table)
+
+    def to_numpy(self) -> dict[str, np.ndarray]:
+        return self._table._build_query_result(self._bound_query(), build_numpy_dict)
@@ -13,26 +13,32 @@
 # limitations under the License.
 import functools
 import inspect
+import os
+import tempfile
 from abc import ABC
-from typing import Optional, Union, List, Any
+from typing import Callable, Optional, Union, List, Any
 
 import numpy as np
+import pyarrow.parquet as pq
 from infinity.embedded_infinity_ext import ConflictType as LocalConflictType
 from infinity.embedded_infinity_ext import WrapIndexInfo, ImportOptions, CopyFileType, WrapParsedExpr, \
     ParsedExprType, WrapUpdateExpr, ExportOptions, WrapOptimizeOptions
-from infinity.common import ConflictType, DEFAULT_MATCH_VECTOR_TOPN
+from infinity.common import ConflictType, DEFAULT_MATCH_VECTOR_TOPN, DEFAULT_WRITER_MAX_ROWS, DEFAULT_WRITER_MAX_BYTES, \
+    DEFAULT_WRITER_INFLIGHT
 from infinity.common import INSERT_DATA, VEC, SparseVector, InfinityException
 from infinity.errors import ErrorCode
 from infinity.index import IndexInfo
-from infinity.local_infinity.query_builder import Query, InfinityLocalQueryBuilder, ExplainQuery
+from infinity.local_infinity.query_builder import Query, InfinityLocalQueryBuilder, ExplainQuery, update_knn_expr
 from infinity.local_infinity.types import build_result
+from infinity.local_infinity.client import LocalQueryResult
 from infinity.local_infinity.utils import traverse_conditions, select_res_to_polars
 from infinity.local_infinity.utils import get_local_constant_expr_from_python_value
 from infinity.remote_thrift.utils import name_validity_check
 from infinity.table import Table, ExplainType
+from infinity.table_writer import TableWriter
 import infinity.index as index
 from infinity.index import InitParameter
-from infinity.utils import deprecated_api
+from infinity.utils import deprecated_api, to_insert_columns, to_import_table, column_to_rows
 from sqlglot import condition
 
 
@@ -45,17 +51,21 @@ class LocalTable(Table, ABC):
         self.query_builder = InfinityLocalQueryBuilder(table=self)
 
     def params_type_check(func):
+        # the annotations are collected once, not on every call
+        params = inspect.signature(func).parameters
+        annotations = [(param.name, param.annotation) for param in params.values()]
+        kwarg_annotations = {name: annotation for name, annotation in annotations if annotation is not inspect.Parameter.empty}
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            sig = inspect.signature(func)
-            params = sig.parameters
-            for arg, param in zip(args, params.values()):
-                if param.annotation is not param.empty and not isinstance(arg, param.annotation):
-                    raise TypeError(f"TypeError: Argument {param.name} must be {param.annotation}")
-            for kwarg, value in kwargs.items():
-                if params[kwarg].annotation is not params[kwarg].empty and not isinstance(value,
-                                                                                          params[kwarg].annotation):
-                    raise TypeError(f"TypeError: Argument {kwarg} must be {params[kwarg].annotation}")
+            if args[0]._conn.check_params:
+                for arg, (name, annotation) in zip(args, annotations):
+                    if annotation is not inspect.Parameter.empty and not isinstance(arg, annotation):
+                        raise TypeError(f"TypeError: Argument {name} must be {annotation}")
+                for kwarg, value in kwargs.items():
+                    annotation = kwarg_annotations.get(kwarg)
+                    if annotation is not None and not isinstance(value, annotation):
+                        raise TypeError(f"TypeError: Argument {kwarg} must be {annotation}")
             return func(*args, **kwargs)
 
         return wrapper
@@ -146,11 +156,29 @@ class LocalTable(Table, ABC):
 
     def insert(self, data: Union[INSERT_DATA, list[INSERT_DATA]]):
         # [{"c1": 1, "c2": 1.1}, {"c1": 2, "c2": 2.2}]
+        return self._send_insert(self._encode_insert(data))
+
+    def insert_columns(self, columns: dict[str, np.ndarray]):
+        # {"c1": np.array([1, 2]), "c2": np.array([1.1, 2.2])}, one entry per row
+        return self._send_insert(self._encode_insert(columns, columnar=True))
+
+    def writer(self, max_rows: int = DEFAULT_WRITER_MAX_ROWS, max_bytes: int = DEFAULT_WRITER_MAX_BYTES,
+               inflight: int = DEFAULT_WRITER_INFLIGHT) -> TableWriter:
+        return TableWriter(self, max_rows, max_bytes, inflight)
+
+    def _encode_insert(self, data: Union[INSERT_DATA, list[INSERT_DATA]],
+                       columnar: bool = False) -> Callable[[], LocalQueryResult]:
+        # converts the rows, the insert is only made when the returned call is made
         db_name = self._db_name
         table_name = self._table_name
         column_names: list[str] = []
         fields = []
 
+        columns = to_insert_columns(data, columnar)
+        if columns is not None:
+            # the embedded api takes rows, so columnar data is only split up here
+            data = [dict(zip(columns.keys(), row)) for row in zip(*(column_to_rows(values) for values in columns.values()))]
+
         if isinstance(data, dict):
             data = [data]
 
@@ -163,14 +191,18 @@ class LocalTable(Table, ABC):
 
             fields.append(parse_exprs)
 
-        res = self._conn.insert(db_name=db_name, table_name=table_name, column_names=column_names,
-                                fields=fields)
+        return functools.partial(self._conn.insert, db_name=db_name, table_name=table_name,
+                                 column_names=column_names, fields=fields)
+
+    def _send_insert(self, request: Callable[[], LocalQueryResult]):
+        res = request()
         if res.error_code == ErrorCode.OK:
             return res
         else:
             raise InfinityException(res.error_code, res.error_msg)
 
-    def import_data(self, file_path: str, import_options: {} = None):
+    def import_data(self, file_path: str, import_options: {} = None, upload: bool = False):
+        # the embedded database reads the caller's files directly, there is nothing to upload
         options = ImportOptions()
         options.header = False
         options.delimiter = ','
@@ -192,6 +224,8 @@ class LocalTable(Table, ABC):
                         options.copy_file_type = CopyFileType.kCSR
                     elif file_type == 'bvecs':
                         options.copy_file_type = CopyFileType.kBVECS
+                    elif file_type == 'parquet':
+                        options.copy_file_type = CopyFileType.kPARQUET
                     else:
                         raise InfinityException(ErrorCode.IMPORT_FILE_FORMAT_ERROR, f"Unrecognized export file type: {file_type}")
                 elif key == 'delimiter':
@@ -216,6 +250,17 @@ class LocalTable(Table, ABC):
         else:
             raise InfinityException(res.error_code, res.error_msg)
 
+    def import_dataframe(self, data):
+        res = self._conn.show_columns(db_name=self._db_name, table_name=self._table_name)
+        if res.error_code != ErrorCode.OK:
+            raise InfinityException(res.error_code, res.error_msg)
+        columns = select_res_to_polars(res)
+        table = to_import_table(data, list(zip(columns["column_name"], columns["column_type"])))
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, "import.parquet")
+            pq.write_table(table, file_path, compression="none")
+            return self.import_data(file_path, {"file_type": "parquet"})
+
     def export_data(self, file_path: str, export_options: {} = None, columns: [str] = None):
         options = ExportOptions()
         options.header = False
@@ -357,8 +402,8 @@ class LocalTable(Table, ABC):
         self.query_builder.output(columns)
         return self
 
-    def to_result(self):
-        return self.query_builder.to_result()
+    def to_result(self, sparse_format: str = "dict", tensor_format: str = "list", lazy: bool = False):
+        return self.query_builder.to_result(sparse_format, tensor_format, lazy)
 
     def filter(self, filter: Optional[str]):
         self.query_builder.filter(filter)
@@ -381,6 +426,13 @@ class LocalTable(Table, ABC):
     def to_arrow(self):
         return self.query_builder.to_arrow()
 
+    def to_numpy(self):
+        return self.query_builder.to_numpy()
+
+    def prepare(self):
+        # builds the pending query once, Param values and :name filter literals are bound per execution
+        return self.query_builder.prepare()
+
     def explain(self, explain_type: ExplainType = ExplainType.Physical):
         return self.query_builder.explain(explain_type)
     
@@ -390,7 +442,23 @@ class LocalTable(Table, ABC):
         opt_options.opt_params = [InitParameter(k, v).to_local_type() for k, v in opt_params.items()]
         return self._conn.optimize(db_name=self._db_name, table_name=self._table_name, optimize_opt=opt_options)
 
-    def _execute_query(self, query: Query):
+    def _execute_query(self, query: Query, sparse_format: str = "dict", tensor_format: str = "list",
+                       lazy: bool = False):
+        # process the results
+        return self._build_query_result(query, functools.partial(
+            build_result, sparse_format=sparse_format, tensor_format=tensor_format, lazy=lazy))
+
+    def _build_query_result(self, query: Query, build: Callable[[Any], Any]):
+        # a match_dense given a matrix of query vectors returns a list, one result per vector
+        if query.batch_embeddings is None:
+            return build(self._execute_query_raw(query))
+        results = []
+        for embedding_data in query.batch_embeddings:
+            update_knn_expr(query.batch_match_index, query, "embedding_data", embedding_data)
+            results.append(build(self._execute_query_raw(query)))
+        return results
+
+    def _execute_query_raw(self, query: Query):
         # execute the query
         res = self._conn.select(db_name=self._db_name,
                                 table_name=self._table_name,
@@ -401,9 +469,8 @@ class LocalTable(Table, ABC):
                                 limit_expr=query.limit,
                                 offset_expr=query.offset)
 
-        # process the results
         if res.error_code == ErrorCode.OK:
-            return build_result(res)
+            return res
         else:
             raise InfinityException(res.error_code, res.error_msg)
 
@@ -15,18 +15,22 @@
 import re
 import functools
 import inspect
-import pandas as pd
 import polars as pl
 import sqlglot.expressions as exp
+from sqlglot import condition, maybe_parse
 import numpy as np
 from infinity.errors import ErrorCode
-from infinity.common import InfinityException, SparseVector
-from infinity.local_infinity.types import build_result, logic_type_to_dtype
-from infinity.utils import binary_exp_to_paser_exp
+from infinity.common import InfinityException, SparseVector, DEFAULT_EXPRESSION_CACHE_SIZE
+from infinity.local_infinity.types import build_polars_dataframe
+from infinity.utils import binary_exp_to_paser_exp, ExpressionCache
 from infinity.embedded_infinity_ext import WrapParsedExpr, WrapFunctionExpr, WrapColumnExpr, WrapSearchExpr, WrapConstantExpr, ParsedExprType, LiteralType
 
 
-def traverse_conditions(cons, fn=None):
+# parsed filter and output expressions of this client, cache_info() tells how well it is sized
+expression_cache = ExpressionCache(DEFAULT_EXPRESSION_CACHE_SIZE)
+
+
+def traverse_conditions(cons, fn=None, params=None):
     if isinstance(cons, exp.Binary):
         parsed_expr = WrapParsedExpr()
         function_expr = WrapFunctionExpr()
@@ -36,9 +40,9 @@ def traverse_conditions(cons, fn=None):
         arguments = []
         for value in cons.hashable_args:
             if fn:
-                expr = fn(value)
+                expr = fn(value, params)
             else:
-                expr = traverse_conditions(value)
+                expr = traverse_conditions(value, params=params)
             arguments.append(expr)
         function_expr.arguments = arguments
 
@@ -93,7 +97,7 @@ def traverse_conditions(cons, fn=None):
 
     elif isinstance(cons, exp.Paren):
         for value in cons.hashable_args:
-            return traverse_conditions(value)
+            return traverse_conditions(value, params=params)
 
     elif isinstance(cons, exp.Neg):
         parsed_expr = WrapParsedExpr()
@@ -116,7 +120,7 @@ def traverse_conditions(cons, fn=None):
         arguments = []
         for arg in cons.args.values():
             if arg:
-                parsed_expr = parse_expr(arg)
+                parsed_expr = parse_expr(arg, params)
                 arguments.append(parsed_expr)
         func_expr = WrapFunctionExpr()
         func_expr.func_name = cons.key
@@ -126,13 +130,22 @@ def traverse_conditions(cons, fn=None):
         parsed_expr.type = ParsedExprType.kFunction
         parsed_expr.function_expr = func_expr
         return parsed_expr
+    elif isinstance(cons, exp.Placeholder):
+        # :name in the filter of a prepared query, params maps the name to its binding slots.
+        # Function arguments are held by shared_ptr, so the constant can be set in place later.
+        if params is None or not cons.name:
+            raise InfinityException(ErrorCode.INVALID_EXPRESSION,
+                                    f"Invalid placeholder: {cons}, only named placeholders of prepared queries are allowed")
+        parsed_expr = WrapParsedExpr(ParsedExprType.kConstant)
+        params.setdefault(cons.name, []).append(functools.partial(bind_constant_expr, parsed_expr))
+        return parsed_expr
     else:
         raise Exception(f"unknown condition type: {cons}")
 
 
-def parse_expr(expr):
+def parse_expr(expr, params=None):
     try:
-        return traverse_conditions(expr, parse_expr)
+        return traverse_conditions(expr, parse_expr, params)
     except:
         if isinstance(expr, exp.Star):
             column_expr = WrapColumnExpr()
@@ -144,6 +157,31 @@ def parse_expr(expr):
             raise Exception(f"unknown expression type: {expr}")
 
 
+def parse_filter(where: str, params: dict = None) -> WrapParsedExpr:
+    parsed_expr = expression_cache.get(("filter", where))
+    if parsed_expr is not None:
+        return parsed_expr
+    cons = condition(where)
+    # a filter with placeholders gets a tree of its own, since bind() writes into it
+    if next(cons.find_all(exp.Placeholder), None) is not None:
+        return traverse_conditions(cons, params=params)
+    parsed_expr = traverse_conditions(cons)
+    expression_cache.put(("filter", where), parsed_expr)
+    return parsed_expr
+
+
+def parse_output(column: str) -> WrapParsedExpr:
+    parsed_expr = expression_cache.get(("output", column))
+    if parsed_expr is None:
+        parsed_expr = parse_expr(maybe_parse(column))
+        expression_cache.put(("output", column), parsed_expr)
+    return parsed_expr
+
+
+def bind_constant_expr(parsed_expr: WrapParsedExpr, query, value):
+    parsed_expr.constant_expr = get_local_constant_expr_from_python_value(value)
+
+
 def get_local_constant_expr_from_python_value(value) -> WrapConstantExpr:
     # convert numpy types
     if isinstance(value, np.integer):
@@ -224,12 +262,13 @@ def get_local_constant_expr_from_python_value(value) -> WrapConstantExpr:
 #     None,
 # ]
 identifier_limit = 65536
+valid_name_pattern = re.compile(r"^[a-zA-Z][a-zA-Z0-9_]*$")
 
 
 def check_valid_name(name, name_type: str = "Table"):
     if not isinstance(name, str):
         raise ValueError(f"{name_type} name must be a string, got {type(name)}")
-    if not re.match(r"^[a-zA-Z][a-zA-Z0-9_]*$", name):
+    if not valid_name_pattern.match(name):
         raise ValueError(
             f"{name_type} name '{name}' is not valid. It should start with a letter and can contain only letters, numbers and underscores")
     if len(name) > identifier_limit:
@@ -246,21 +285,39 @@ def check_valid_name(name, name_type: str = "Table"):
         raise ValueError(f"invalid name: {name}")
 
 
+def check_valid_name_cached(name, name_type: str = "Table"):
+    # valid names are remembered, an invalid one is checked again and raises on every call
+    if type(name) is str:
+        check_valid_str_name(name, name_type)
+    else:
+        check_valid_name(name, name_type)
+
+
+@functools.lru_cache(maxsize=1024)
+def check_valid_str_name(name: str, name_type: str):
+    check_valid_name(name, name_type)
+
+
+def check_params_enabled(obj) -> bool:
+    # connections hold their client as _client, databases and tables as _conn
+    client = obj._conn if hasattr(obj, "_conn") else obj._client
+    return client.check_params
+
+
 def name_validity_check(arg_name: str, name_type: str = "Table"):
     def decorator(func):
+        # the position of the argument is looked up once, not on every call
+        arg_index = list(inspect.signature(func).parameters.keys()).index(arg_name)
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            if arg_name in kwargs:
-                name = kwargs[arg_name]
-            else:
-                arg_names = list(inspect.signature(func).parameters.keys())
-                name = args[arg_names.index(arg_name)]
-
-            try:
-                check_valid_name(name, name_type)
-                return func(*args, **kwargs)
-            except ValueError as e:
-                raise
+            if check_params_enabled(args[0]):
+                if arg_name in kwargs:
+                    name = kwargs[arg_name]
+                else:
+                    name = args[arg_index]
+                check_valid_name_cached(name, name_type)
+            return func(*args, **kwargs)
 
         return wrapper
 
@@ -268,10 +325,4 @@ def name_validity_check(arg_name: str, name_type: str = "Table"):
 
 
 def select_res_to_polars(res) -> pl.DataFrame:
-    df_dict = {}
-    data_dict, data_type_dict = build_result(res)
-    for k, v in data_dict.items():
-        data_series = pd.Series(v, dtype=logic_type_to_dtype(data_type_dict[k]))
-        df_dict[k] = data_series
-
-    return pl.from_pandas(pd.DataFrame(df_dict))
+    return build_polars_dataframe(res)
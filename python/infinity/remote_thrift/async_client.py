@@ -0,0 +1,465 @@
+# Copyright(C) 2023 InfiniFlow, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import contextlib
+import copy
+import struct
+import time
+from typing import Optional
+
+from thrift.Thrift import TApplicationException, TType
+from thrift.protocol.TCompactProtocol import CompactType
+from thrift.protocol.TProtocol import TProtocolException
+from thrift.transport import TTransport
+from thrift.transport.TTransport import TTransportException
+
+from infinity import URI
+from infinity.remote_thrift.infinity_thrift_rpc import *
+from infinity.remote_thrift.infinity_thrift_rpc.ttypes import *
+from infinity.remote_thrift.client import ThriftInfinityClient, ServiceClient, make_protocol, check_thrift_options, \
+    CLIENT_VERSION, TRANSPORT_ERRORS, DISCONNECT_UNREAD_TIMEOUT
+from infinity.errors import ErrorCode
+from infinity.common import InfinityException, DEFAULT_THRIFT_PROTOCOL, DEFAULT_THRIFT_TRANSPORT, \
+    DEFAULT_ASYNC_MAX_CONNECTIONS, RetryPolicy, DEFAULT_RETRY_POLICY
+
+# bytes read from the socket at once while a response without a frame header arrives
+ASYNC_READ_SIZE = 1 << 20
+# bytes of the fixed size values of the binary and compact protocols, the integers of compact are varints
+BINARY_SIZES = {TType.BOOL: 1, TType.BYTE: 1, TType.I16: 2, TType.I32: 4, TType.I64: 8, TType.DOUBLE: 8}
+COMPACT_SIZES = {CompactType.TRUE: 1, CompactType.FALSE: 1, CompactType.BYTE: 1, CompactType.DOUBLE: 8}
+
+
+class IncompleteMessage(Exception):
+    # the bytes read end inside the message, which has at least size bytes
+    def __init__(self, size: int):
+        super().__init__(size)
+        self.size = size
+
+
+class MessageScanner:
+    """
+    Finds where a thrift message ends in the bytes read so far, for the responses without a frame header. The
+    values are skipped, not decoded: a binary value is skipped by its length, so a scan costs as much as the
+    fields of the message and not its size.
+    """
+
+    def __init__(self, data: bytearray):
+        self._data = data
+        self._pos = 0
+
+    def message_size(self, protocol: str) -> int:
+        if protocol == "compact":
+            # protocol id, version and type, sequence id, name
+            self._skip(2)
+            self._varint()
+            self._skip(self._varint())
+            self._compact_value(CompactType.STRUCT)
+        else:
+            version = self._i32()
+            if version < 0:
+                # version and type, name
+                self._skip(self._i32())
+            else:
+                # name, type
+                self._skip(version + 1)
+            # sequence id
+            self._skip(4)
+            self._binary_value(TType.STRUCT)
+        return self._pos
+
+    def _skip(self, size: int):
+        self._pos += size
+        if self._pos > len(self._data):
+            raise IncompleteMessage(self._pos)
+
+    def _byte(self) -> int:
+        self._skip(1)
+        return self._data[self._pos - 1]
+
+    def _i32(self) -> int:
+        self._skip(4)
+        return struct.unpack_from("!i", self._data, self._pos - 4)[0]
+
+    def _varint(self) -> int:
+        value = shift = 0
+        while True:
+            byte = self._byte()
+            value |= (byte & 0x7f) << shift
+            if byte < 0x80:
+                return value
+            shift += 7
+
+    def _binary_value(self, ttype: int):
+        size = BINARY_SIZES.get(ttype)
+        if size is not None:
+            self._skip(size)
+        elif ttype == TType.STRING:
+            self._skip(self._i32())
+        elif ttype == TType.STRUCT:
+            while (field_type := self._byte()) != TType.STOP:
+                # field id
+                self._skip(2)
+                self._binary_value(field_type)
+        elif ttype == TType.MAP:
+            key_type, value_type, count = self._byte(), self._byte(), self._i32()
+            for _ in range(count):
+                self._binary_value(key_type)
+                self._binary_value(value_type)
+        elif ttype in (TType.LIST, TType.SET):
+            element_type, count = self._byte(), self._i32()
+            size = BINARY_SIZES.get(element_type)
+            if size is not None:
+                self._skip(size * count)
+            else:
+                for _ in range(count):
+                    self._binary_value(element_type)
+        else:
+            raise TProtocolException(TProtocolException.INVALID_DATA, f"Unknown thrift type {ttype}")
+
+    def _compact_value(self, ctype: int):
+        size = COMPACT_SIZES.get(ctype)
+        if size is not None:
+            self._skip(size)
+        elif ctype in (CompactType.I16, CompactType.I32, CompactType.I64):
+            self._varint()
+        elif ctype == CompactType.BINARY:
+            self._skip(self._varint())
+        elif ctype == CompactType.STRUCT:
+            while (header := self._byte()) != CompactType.STOP:
+                if header >> 4 == 0:
+                    # field id not given as a delta
+                    self._varint()
+                # a bool field is held by its type
+                if header & 0x0f not in (CompactType.TRUE, CompactType.FALSE):
+                    self._compact_value(header & 0x0f)
+        elif ctype == CompactType.MAP:
+            count = self._varint()
+            if count > 0:
+                types = self._byte()
+                for _ in range(count):
+                    self._compact_value(types >> 4)
+                    self._compact_value(types & 0x0f)
+        elif ctype in (CompactType.LIST, CompactType.SET):
+            header = self._byte()
+            count = header >> 4
+            if count == 15:
+                count = self._varint()
+            size = COMPACT_SIZES.get(header & 0x0f)
+            if size is not None:
+                self._skip(size * count)
+            else:
+                for _ in range(count):
+                    self._compact_value(header & 0x0f)
+        else:
+            raise TProtocolException(TProtocolException.INVALID_DATA, f"Unknown compact thrift type {ctype}")
+
+
+class AsyncThriftChannel:
+    """
+    One socket of an async client with its own server session. It carries one request at a time, the
+    requests are encoded and the responses decoded by the generated InfinityService.Client.
+    """
+
+    def __init__(self, uri: URI, protocol: str, transport: str):
+        self._uri = uri
+        self._protocol = protocol
+        self._framed = transport == "framed"
+        self._reader = None
+        self._writer = None
+        self.session_id = -1
+        # the read of the response of a cancelled call, the socket is in step with the server once it is done
+        self.pending = None
+
+    @property
+    def is_open(self) -> bool:
+        return self._writer is not None
+
+    async def open(self):
+        try:
+            self._reader, self._writer = await asyncio.open_connection(self._uri.ip, self._uri.port)
+        except OSError as e:
+            raise TTransportException(TTransportException.NOT_OPEN,
+                                      f"Could not connect to {self._uri.ip}:{self._uri.port}: {e}")
+        res = await self._roundtrip("Connect", ConnectRequest(client_version=CLIENT_VERSION))
+        if res.error_code != 0:
+            self.close()
+            raise InfinityException(res.error_code, res.error_msg)
+        self.session_id = res.session_id
+
+    async def call(self, name: str, request):
+        await self.send(name, request)
+        return await self.receive(name)
+
+    # the two halves of call, to tell whether a failed request reached the socket
+
+    async def send(self, name: str, request):
+        request.session_id = self.session_id
+        await self._run(self._write(name, request))
+
+    async def receive(self, name: str):
+        # a cancelled call doesn't stop the read of its response, its request runs on the server anyway and
+        # the session can't be ended before it is done
+        read = asyncio.ensure_future(self._run(self._receive(name)))
+        try:
+            return await asyncio.shield(read)
+        except asyncio.CancelledError:
+            if not read.done():
+                self.pending = read
+            raise
+
+    async def discard_pending(self):
+        read, self.pending = self.pending, None
+        try:
+            await read
+        except (*TRANSPORT_ERRORS, TApplicationException, asyncio.CancelledError):
+            # a transport error closed the socket
+            pass
+
+    async def end_session(self, session_id: int):
+        # ends the session of a socket closed in the middle of a request, an error response means the server
+        # doesn't have it anymore
+        await self._roundtrip("Disconnect", CommonRequest(session_id=session_id))
+
+    async def disconnect(self):
+        try:
+            await self._roundtrip("Disconnect", CommonRequest(session_id=self.session_id))
+        except Exception:
+            pass
+        self.close()
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+            self._reader = None
+
+    async def _roundtrip(self, name: str, request):
+        await self._run(self._write(name, request))
+        return await self._run(self._receive(name))
+
+    async def _write(self, name: str, request):
+        self._writer.write(self._encode(name, request))
+        await self._writer.drain()
+
+    async def _run(self, step):
+        if self._writer is None:
+            step.close()
+            raise TTransportException(TTransportException.NOT_OPEN, "Connection is closed")
+        try:
+            return await step
+        except TApplicationException:
+            raise
+        except (OSError, asyncio.IncompleteReadError) as e:
+            self.close()
+            raise TTransportException(TTransportException.END_OF_FILE, f"Connection lost: {e}")
+        except BaseException:
+            # a request cancelled while it is written leaves a part of it on the socket
+            self.close()
+            raise
+
+    def _encode(self, name: str, request) -> bytes:
+        buffer = TTransport.TMemoryBuffer()
+        wire = TTransport.TFramedTransport(buffer) if self._framed else buffer
+        getattr(InfinityService.Client(make_protocol(wire, self._protocol)), "send_" + name)(request)
+        return buffer.getvalue()
+
+    def _decode(self, name: str, data: bytes):
+        return getattr(InfinityService.Client(make_protocol(TTransport.TMemoryBuffer(data), self._protocol)),
+                       "recv_" + name)()
+
+    async def _receive(self, name: str):
+        if self._framed:
+            size, = struct.unpack("!i", await self._reader.readexactly(4))
+            return self._decode(name, await self._reader.readexactly(size))
+        # a buffered response doesn't carry its size, the bytes read are scanned for its end, and only once
+        # as many bytes arrived as the last scan found the message needs at least
+        data = bytearray()
+        size = 1
+        while True:
+            chunk = await self._reader.read(max(ASYNC_READ_SIZE, size - len(data)))
+            if not chunk:
+                raise TTransportException(TTransportException.END_OF_FILE, "Connection closed by the server")
+            data += chunk
+            if len(data) < size:
+                continue
+            try:
+                size = MessageScanner(data).message_size(self._protocol)
+            except IncompleteMessage as e:
+                size = e.size
+                continue
+            return self._decode(name, bytes(data))
+
+
+class AsyncThriftInfinityClient(ThriftInfinityClient):
+    """
+    The client of async connections. The request building methods are those of ThriftInfinityClient,
+    here they return coroutines: each call takes an idle socket, or opens one while fewer than
+    max_connections are, and sends its request with the server session of that socket. A request failed by a
+    transport error is sent again on another socket as retry allows.
+    """
+
+    def __init__(self, uri: URI, protocol: str = DEFAULT_THRIFT_PROTOCOL, transport: str = DEFAULT_THRIFT_TRANSPORT,
+                 max_connections: int = DEFAULT_ASYNC_MAX_CONNECTIONS,
+                 retry: Optional[RetryPolicy] = DEFAULT_RETRY_POLICY):
+        self._is_connected = False
+        check_thrift_options(protocol, transport)
+        if max_connections < 1:
+            raise InfinityException(ErrorCode.INVALID_PARAMETER_VALUE,
+                                    f"max_connections must be positive, got {max_connections}")
+        # requests get the session of the socket they are sent on
+        self.session_id = -1
+        self.uri = uri
+        self.protocol_type = protocol
+        self.transport_type = transport
+        self.check_params = True
+        self.retry = retry
+        self.max_connections = max_connections
+        # idle sockets, the last released is reused first
+        self._idle: list[AsyncThriftChannel] = []
+        self._slots = asyncio.Semaphore(max_connections)
+        # sessions of the sockets closed in the middle of a request, ended over another socket
+        self._orphaned: list[int] = []
+        # the cleanups of released sockets running in the background
+        self._tasks = set()
+        self.client = ServiceClient(self._send)
+        self._is_connected = True
+
+    def __del__(self):
+        for channel in self._idle:
+            channel.close()
+
+    async def open(self):
+        # fails here if the server can't be reached instead of on the first request
+        self._release(await self._acquire())
+
+    async def reconnect(self):
+        # idle sockets are replaced by new ones on demand
+        channels, self._idle = self._idle, []
+        await asyncio.gather(*(channel.disconnect() for channel in channels))
+
+    async def _acquire(self) -> AsyncThriftChannel:
+        await self._slots.acquire()
+        try:
+            if not self._is_connected:
+                raise InfinityException(ErrorCode.CLIENT_CLOSE, "Connection is closed")
+            if self._idle:
+                return self._idle.pop()
+            channel = AsyncThriftChannel(self.uri, self.protocol_type, self.transport_type)
+            await channel.open()
+            return channel
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def _release(self, channel: AsyncThriftChannel):
+        if channel.pending is not None:
+            # the socket keeps its slot until the response of its cancelled call is read
+            self._spawn(self._drain(channel))
+            return
+        if channel.is_open and self._is_connected:
+            self._idle.append(channel)
+        elif channel.is_open:
+            self._spawn(channel.disconnect())
+        elif channel.session_id != -1:
+            self._orphaned.append(channel.session_id)
+            if not self._is_connected:
+                self._spawn(self._end_orphaned_detached())
+        self._slots.release()
+
+    def _spawn(self, coroutine):
+        task = asyncio.ensure_future(coroutine)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _drain(self, channel: AsyncThriftChannel):
+        await channel.discard_pending()
+        self._release(channel)
+
+    async def _end_orphaned(self, channel: AsyncThriftChannel):
+        while self._orphaned:
+            session_id = self._orphaned.pop()
+            try:
+                await channel.end_session(session_id)
+            except BaseException:
+                self._orphaned.append(session_id)
+                raise
+
+    async def _end_orphaned_detached(self):
+        # once disconnected, over a socket of its own
+        if not self._orphaned:
+            return
+        channel = AsyncThriftChannel(self.uri, self.protocol_type, self.transport_type)
+        try:
+            await channel.open()
+            await self._end_orphaned(channel)
+        except (*TRANSPORT_ERRORS, TApplicationException, InfinityException):
+            pass
+        await channel.disconnect()
+
+    async def _send(self, name: str, request):
+        retry = 0
+        while True:
+            sent = False
+            try:
+                channel = await self._acquire()
+                try:
+                    if self._orphaned:
+                        await self._end_orphaned(channel)
+                    await channel.send(name, request)
+                    sent = True
+                    return await channel.receive(name)
+                finally:
+                    # a failed socket is closed rather than reused
+                    self._release(channel)
+            except TRANSPORT_ERRORS:
+                if not self._should_retry(name, request, sent, retry):
+                    raise
+            await asyncio.sleep(self.retry.delay(retry))
+            retry += 1
+
+    @contextlib.asynccontextmanager
+    async def session(self):
+        """
+        Yields a client sending all its requests over one socket and server session, for the requests
+        depending on each other's session state, e.g. the chunks of an uploaded file and its import.
+        """
+        channel = await self._acquire()
+        try:
+            # not retried, the session of another socket wouldn't have the state
+            client = copy.copy(self)
+            client._idle = []
+            client.client = ServiceClient(channel.call)
+            yield client
+        finally:
+            self._release(channel)
+
+    async def disconnect(self):
+        if not self._is_connected:
+            return CommonResponse(ErrorCode.OK, "Already disconnected")
+        self._is_connected = False
+        # sockets still in use are disconnected when their requests are done
+        channels, self._idle = self._idle, []
+        if self._orphaned:
+            if channels:
+                with contextlib.suppress(*TRANSPORT_ERRORS, TApplicationException):
+                    await self._end_orphaned(channels[0])
+            if self._orphaned:
+                await self._end_orphaned_detached()
+        await asyncio.gather(*(channel.disconnect() for channel in channels))
+        # and the cleanups started already, as long as the responses of cancelled calls take to arrive
+        deadline = time.monotonic() + DISCONNECT_UNREAD_TIMEOUT
+        while self._tasks and time.monotonic() < deadline:
+            await asyncio.wait(set(self._tasks), timeout=deadline - time.monotonic())
+        return CommonResponse(ErrorCode.OK, "")
@@ -0,0 +1,75 @@
+# Copyright(C) 2023 InfiniFlow, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from abc import ABC
+
+from infinity.errors import ErrorCode
+from infinity.remote_thrift.async_table import AsyncRemoteTable
+from infinity.remote_thrift.db import RemoteDatabase, get_column_defs
+from infinity.remote_thrift.utils import name_validity_check, select_res_to_polars, get_create_conflict
+from infinity.common import ConflictType
+from infinity.common import InfinityException
+
+
+class AsyncRemoteDatabase(RemoteDatabase, ABC):
+    # the methods of RemoteDatabase as coroutines, drop_table already returns the one of the client
+
+    @name_validity_check("table_name", "Table")
+    async def create_table(self, table_name: str, columns_definition,
+                           conflict_type: ConflictType = ConflictType.Error):
+        res = await self._conn.create_table(db_name=self._db_name, table_name=table_name,
+                                            column_defs=get_column_defs(columns_definition),
+                                            conflict_type=get_create_conflict(conflict_type))
+        if res.error_code == ErrorCode.OK:
+            return AsyncRemoteTable(self._conn, self._db_name, table_name)
+        else:
+            raise InfinityException(res.error_code, res.error_msg)
+
+    async def list_tables(self):
+        res = await self._conn.list_tables(self._db_name)
+        if res.error_code == ErrorCode.OK:
+            return res
+        else:
+            raise InfinityException(res.error_code, res.error_msg)
+
+    @name_validity_check("table_name", "Table")
+    async def show_table(self, table_name):
+        res = await self._conn.show_table(db_name=self._db_name, table_name=table_name)
+        if res.error_code == ErrorCode.OK:
+            return res
+        else:
+            raise InfinityException(res.error_code, res.error_msg)
+
+    @name_validity_check("table_name", "Table")
+    async def show_columns(self, table_name):
+        res = await self._conn.show_columns(db_name=self._db_name, table_name=table_name)
+        if res.error_code == ErrorCode.OK:
+            return select_res_to_polars(res)
+        else:
+            raise InfinityException(res.error_code, res.error_msg)
+
+    @name_validity_check("table_name", "Table")
+    async def get_table(self, table_name):
+        res = await self._conn.get_table(db_name=self._db_name, table_name=table_name)
+        if res.error_code == ErrorCode.OK:
+            return AsyncRemoteTable(self._conn, self._db_name, table_name)
+        else:
+            raise InfinityException(res.error_code, res.error_msg)
+
+    async def show_tables(self):
+        res = await self._conn.show_tables(self._db_name)
+        if res.error_code == ErrorCode.OK:
+            return select_res_to_polars(res)
+        else:
+            raise InfinityException(res.error_code, res.error_msg)
@@ -0,0 +1,96 @@
+# Copyright(C) 2023 InfiniFlow, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from abc import ABC
+from typing import Optional
+
+from infinity import InfinityConnection
+from infinity.errors import ErrorCode
+from infinity.remote_thrift.async_client import AsyncThriftInfinityClient
+from infinity.remote_thrift.async_db import AsyncRemoteDatabase
+from infinity.remote_thrift.utils import name_validity_check, get_create_conflict, get_drop_conflict
+from infinity.common import ConflictType, InfinityException, DEFAULT_THRIFT_PROTOCOL, DEFAULT_THRIFT_TRANSPORT, \
+    DEFAULT_ASYNC_MAX_CONNECTIONS, RetryPolicy, DEFAULT_RETRY_POLICY
+
+
+class AsyncRemoteThriftInfinityConnection(InfinityConnection, ABC):
+    """
+    The connection returned by infinity.connect_async. Its methods, and those of its databases and tables,
+    are coroutines sending their requests over non-blocking sockets. Requests awaited together run on up to
+    max_connections sockets, each with its own server session.
+    """
+
+    def __init__(self, uri, check_params: bool = True, protocol: str = DEFAULT_THRIFT_PROTOCOL,
+                 transport: str = DEFAULT_THRIFT_TRANSPORT, max_connections: int = DEFAULT_ASYNC_MAX_CONNECTIONS,
+                 retry: Optional[RetryPolicy] = DEFAULT_RETRY_POLICY):
+        super().__init__(uri)
+        self.db_name = "default_db"
+        self._client = AsyncThriftInfinityClient(uri, protocol, transport, max_connections, retry)
+        self._client.check_params = check_params
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.disconnect()
+
+    @name_validity_check("db_name", "DB")
+    async def create_database(self, db_name: str, conflict_type: ConflictType = ConflictType.Error):
+        res = await self._client.create_database(db_name=db_name, conflict_type=get_create_conflict(conflict_type))
+        if res.error_code == ErrorCode.OK:
+            return AsyncRemoteDatabase(self._client, db_name)
+        else:
+            raise InfinityException(res.error_code, res.error_msg)
+
+    async def list_databases(self):
+        res = await self._client.list_databases()
+        if res.error_code == ErrorCode.OK:
+            return res
+        else:
+            raise InfinityException(res.error_code, res.error_msg)
+
+    @name_validity_check("db_name", "DB")
+    async def show_database(self, db_name: str):
+        res = await self._client.show_database(db_name=db_name)
+        if res.error_code == ErrorCode.OK:
+            return res
+        else:
+            raise InfinityException(res.error_code, res.error_msg)
+
+    @name_validity_check("db_name", "DB")
+    async def drop_database(self, db_name: str, conflict_type: ConflictType = ConflictType.Error):
+        res = await self._client.drop_database(db_name=db_name, conflict_type=get_drop_conflict(conflict_type))
+        if res.error_code == ErrorCode.OK:
+            return res
+        else:
+            raise InfinityException(res.error_code, res.error_msg)
+
+    @name_validity_check("db_name", "DB")
+    async def get_database(self, db_name: str):
+        res = await self._client.get_database(db_name)
+        if res.error_code == ErrorCode.OK:
+            return AsyncRemoteDatabase(self._client, db_name)
+        else:
+            raise InfinityException(res.error_code, res.error_msg)
+
+    async def disconnect(self):
+        res = await self._client.disconnect()
+        if res.error_code == ErrorCode.OK:
+            return res
+        else:
+            raise InfinityException(res.error_code, res.error_msg)
+
+    @property
+    def client(self):
+        return self._client
@@ -0,0 +1,251 @@
+# Copyright(C) 2023 InfiniFlow, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import functools
+import os
+import tempfile
+import uuid
+from abc import ABC
+from typing import Callable, Optional, Union, Any
+
+import pyarrow.parquet as pq
+
+import infinity.remote_thrift.infinity_thrift_rpc.ttypes as ttypes
+from infinity.common import InfinityException, ConflictType, DEFAULT_UPLOAD_CHUNK_SIZE
+from infinity.errors import ErrorCode
+from infinity.index import IndexInfo
+from infinity.remote_thrift.query_builder import Query, ExplainQuery
+from infinity.remote_thrift.table import RemoteTable, get_import_option, get_export_option, get_where_expr, \
+    get_update_exprs
+from infinity.remote_thrift.types import build_result
+from infinity.remote_thrift.utils import name_validity_check, select_res_to_polars, get_create_conflict, \
+    get_drop_conflict
+from infinity.utils import to_import_table
+
+
+class AsyncRemoteTable(RemoteTable, ABC):
+    """
+    The methods of RemoteTable as coroutines. The query builder methods stay synchronous and the methods
+    executing a query, of the table or of a prepared query, take it from the builder before returning their
+    coroutine, so that the queries of one table can be built one after another and awaited together, e.g.
+    with asyncio.gather.
+    """
+
+    @name_validity_check("index_name", "Index")
+    async def create_index(self, index_name: str, index_info: IndexInfo,
+                           conflict_type: ConflictType = ConflictType.Error):
+        res = await self._conn.create_index(db_name=self._db_name,
+                                            table_name=self._table_name,
+                                            index_name=index_name.strip(),
+                                            index_info=index_info.to_ttype(),
+                                            conflict_type=get_create_conflict(conflict_type))
+        if res.error_code == ErrorCode.OK:
+            return res
+        else:
+            raise InfinityException(res.error_code, res.error_msg)
+
+    @name_validity_check("index_name", "Index")
+    async def drop_index(self, index_name: str, conflict_type: ConflictType = ConflictType.Error):
+        res = await self._conn.drop_index(db_name=self._db_name, table_name=self._table_name,
+                                          index_name=index_name, conflict_type=get_drop_conflict(conflict_type))
+        if res.error_code == ErrorCode.OK:
+            return res
+        else:
+            raise InfinityException(res.error_code, res.error_msg)
+
+    @name_validity_check("index_name", "Index")
+    async def show_index(self, index_name: str):
+        res = await self._conn.show_index(db_name=self._db_name, table_name=self._table_name, index_name=index_name)
+        if res.error_code == ErrorCode.OK:
+            return res
+        else:
+            raise InfinityException(res.error_code, res.error_msg)
+
+    async def list_indexes(self):
+        res = await self._conn.list_indexes(db_name=self._db_name, table_name=self._table_name)
+        if res.error_code == ErrorCode.OK:
+            return res
+        else:
+            raise InfinityException(res.error_code, res.error_msg)
+
+    async def show_segments(self):
+        res = await self._conn.show_segments(db_name=self._db_name, table_name=self._table_name)
+        if res.error_code == ErrorCode.OK:
+            return select_res_to_polars(res)
+        else:
+            raise InfinityException(res.error_code, res.error_msg)
+
+    async def show_segment(self, segment_id: int):
+        res = await self._conn.show_segment(db_name=self._db_name, table_name=self._table_name,
+                                            segment_id=segment_id)
+        if res.error_code == ErrorCode.OK:
+            return res
+        else:
+            raise InfinityException(res.error_code, res.error_msg)
+
+    async def show_blocks(self, segment_id: int):
+        res = await self._conn.show_blocks(db_name=self._db_name, table_name=self._table_name, segment_id=segment_id)
+        if res.error_code == ErrorCode.OK:
+            return select_res_to_polars(res)
+        else:
+            raise InfinityException(res.error_code, res.error_msg)
+
+    async def show_block(self, segment_id: int, block_id: int):
+        res = await self._conn.show_block(db_name=self._db_name, table_name=self._table_name, segment_id=segment_id,
+                                          block_id=block_id)
+        if res.error_code == ErrorCode.OK:
+            return res
+        else:
+            raise InfinityException(res.error_code, res.error_msg)
+
+    async def show_block_column(self, segment_id: int, block_id: int, column_id: int):
+        res = await self._conn.show_block_column(db_name=self._db_name, table_name=self._table_name,
+                                                 segment_id=segment_id, block_id=block_id, column_id=column_id)
+        if res.error_code == ErrorCode.OK:
+            return res
+        else:
+            raise InfinityException(res.error_code, res.error_msg)
+
+    def writer(self, *args, **kwargs):
+        raise InfinityException(ErrorCode.NOT_SUPPORTED,
+                                "writer() batches in a background thread, gather the inserts of an async table instead")
+
+    def _send_insert(self, request: Callable[[], Any]):
+        # insert builds the request right away, the returned coroutine only sends it
+        return self._send_checked(request())
+
+    async def import_data(self, file_path: str, import_options: {} = None, upload: bool = False):
+        options = get_import_option(import_options)
+        if not upload:
+            res = await self._conn.import_data(db_name=self._db_name, table_name=self._table_name,
+                                               file_name=file_path, import_options=options, uploaded=False)
+        else:
+            # the server keeps uploaded files per session, the chunks and the import share one socket
+            async with self._conn.session() as conn:
+                file_name = await self._upload_file(conn, file_path)
+                res = await conn.import_data(db_name=self._db_name, table_name=self._table_name,
+                                             file_name=file_name, import_options=options, uploaded=True)
+        if res.error_code == ErrorCode.OK:
+            return res
+        else:
+            raise InfinityException(res.error_code, res.error_msg)
+
+    async def _upload_file(self, conn, file_path: str) -> str:
+        if not os.path.isfile(file_path):
+            raise InfinityException(ErrorCode.FILE_NOT_FOUND, f"File: {file_path} isn't found")
+        file_name = uuid.uuid4().hex
+        offset = 0
+        with open(file_path, "rb") as f:
+            while True:
+                chunk = f.read(DEFAULT_UPLOAD_CHUNK_SIZE)
+                res = await conn.upload_file_chunk(file_name, offset, chunk)
+                if res.error_code != ErrorCode.OK:
+                    raise InfinityException(res.error_code, res.error_msg)
+                offset += len(chunk)
+                if len(chunk) < DEFAULT_UPLOAD_CHUNK_SIZE:
+                    return file_name
+
+    async def import_dataframe(self, data):
+        res = await self._conn.show_columns(db_name=self._db_name, table_name=self._table_name)
+        if res.error_code != ErrorCode.OK:
+            raise InfinityException(res.error_code, res.error_msg)
+        columns = select_res_to_polars(res)
+        table = to_import_table(data, list(zip(columns["column_name"], columns["column_type"])))
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, "import.parquet")
+            pq.write_table(table, file_path, compression="none")
+            return await self.import_data(file_path, {"file_type": "parquet"}, upload=True)
+
+    async def export_data(self, file_path: str, export_options: {} = None, columns: [str] = None):
+        res = await self._conn.export_data(db_name=self._db_name,
+                                           table_name=self._table_name,
+                                           file_name=file_path,
+                                           export_options=get_export_option(export_options),
+                                           columns=columns)
+        if res.error_code == ErrorCode.OK:
+            return res
+        else:
+            raise InfinityException(res.error_code, res.error_msg)
+
+    def delete(self, cond: Optional[str] = None):
+        return self._send_checked(self._conn.delete(
+            db_name=self._db_name, table_name=self._table_name, where_expr=get_where_expr(cond)))
+
+    def update(self, cond: Optional[str],
+               data: Optional[list[dict[str, Union[str, int, float, list[Union[int, float]]]]]]):
+        return self._send_checked(self._conn.update(db_name=self._db_name, table_name=self._table_name,
+                                                    where_expr=get_where_expr(cond),
+                                                    update_expr_array=get_update_exprs(data)))
+
+    async def _send_checked(self, request):
+        res = await request
+        if res.error_code == ErrorCode.OK:
+            return res
+        else:
+            raise InfinityException(res.error_code, res.error_msg)
+
+    def _execute_query(self, query: Query, sparse_format: str = "dict", tensor_format: str = "list",
+                       lazy: bool = False):
+        return self._build_query_result(query, functools.partial(
+            build_result, sparse_format=sparse_format, tensor_format=tensor_format, lazy=lazy))
+
+    async def _build_query_result(self, query: Query, build: Callable[[ttypes.SelectResponse], Any]):
+        if query.batch_embeddings is None:
+            return build(await self._execute_query_raw(query))
+        return [build(res) for res in await self._execute_batch_query_raw(query)]
+
+    async def _execute_query_raw(self, query: Query) -> ttypes.SelectResponse:
+        res = await self._conn.select(db_name=self._db_name,
+                                      table_name=self._table_name,
+                                      select_list=query.columns,
+                                      search_expr=query.search,
+                                      where_expr=query.filter,
+                                      group_by_list=None,
+                                      limit_expr=query.limit,
+                                      offset_expr=query.offset)
+        if res.error_code == ErrorCode.OK:
+            return res
+        else:
+            raise InfinityException(res.error_code, res.error_msg)
+
+    async def _execute_batch_query_raw(self, query: Query) -> list[ttypes.SelectResponse]:
+        res = await self._conn.select_batch(db_name=self._db_name,
+                                            table_name=self._table_name,
+                                            select_list=query.columns,
+                                            search_expr=query.search,
+                                            where_expr=query.filter,
+                                            group_by_list=None,
+                                            limit_expr=query.limit,
+                                            offset_expr=query.offset,
+                                            match_index=query.batch_match_index,
+                                            embeddings=query.batch_embeddings)
+        if res.error_code == ErrorCode.OK:
+            return res.results
+        else:
+            raise InfinityException(res.error_code, res.error_msg)
+
+    async def _explain_query(self, query: ExplainQuery) -> Any:
+        res = await self._conn.explain(db_name=self._db_name,
+                                       table_name=self._table_name,
+                                       select_list=query.columns,
+                                       search_expr=query.search,
+                                       where_expr=query.filter,
+                                       group_by_list=None,
+                                       limit_expr=query.limit,
+                                       offset_expr=query.offset,
+                                       explain_type=query.explain_type.to_ttype())
+        if res.error_code == ErrorCode.OK:
+            return select_res_to_polars(res)
+        else:
+            raise InfinityException(res.error_code, res.error_msg)
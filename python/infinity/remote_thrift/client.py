@@ -12,22 +12,266 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import collections
+import functools
+import select
+import time
+from socket import IPPROTO_TCP, TCP_NODELAY
+from typing import Optional
+
+import numpy as np
+from thrift.Thrift import TApplicationException
 from thrift.protocol import TBinaryProtocol
 from thrift.protocol import TCompactProtocol
 from thrift.transport import TSocket
+from thrift.transport import TTransport
 from thrift.transport.TTransport import TTransportException
 
 from infinity import URI
 from infinity.remote_thrift.infinity_thrift_rpc import *
 from infinity.remote_thrift.infinity_thrift_rpc.ttypes import *
 from infinity.errors import ErrorCode
-from infinity.common import InfinityException
+from infinity.common import InfinityException, THRIFT_PROTOCOLS, THRIFT_TRANSPORTS, DEFAULT_THRIFT_PROTOCOL, \
+    DEFAULT_THRIFT_TRANSPORT, RetryPolicy, HedgePolicy, DEFAULT_RETRY_POLICY
+
+# errors of the socket, after which it is out of step with the server
+TRANSPORT_ERRORS = (TTransportException, OSError, EOFError)
+# Selects between two updates of the hedge threshold
+HEDGE_THRESHOLD_INTERVAL = 16
+# RPCs using state of their server session, which a retry on a new socket doesn't have
+SESSION_RPCS = frozenset({"UploadFileChunk"})
+# seconds disconnect waits for the responses left by hedges before it closes their sockets
+DISCONNECT_UNREAD_TIMEOUT = 10.0
+
+
+class AcceleratedBinaryProtocol(TBinaryProtocol.TBinaryProtocolAccelerated):
+    """
+    Encodes and decodes whole structs in C with thrift's fastbinary extension, except for the requests carrying
+    raw column or file bytes: fastbinary copies large binary fields many times slower than python writes them.
+    """
+
+    # a property rather than the bound _encode set on the instance, which would keep every protocol and its
+    # buffer alive in a reference cycle until the garbage collector runs
+    @property
+    def _fast_encode(self):
+        return self._encode if self._encode_struct is not None else None
+
+    @_fast_encode.setter
+    def _fast_encode(self, encode):
+        self._encode_struct = encode
+
+    def _encode(self, struct, spec):
+        # the call arguments of a method, or a request written on its own
+        request = getattr(struct, "request", struct)
+        if isinstance(request, UploadFileChunkRequest) or (isinstance(request, InsertRequest) and request.columns):
+            # written straight to the transport, nothing is left for the caller to write
+            struct.write(TBinaryProtocol.TBinaryProtocol(self.trans))
+            return b""
+        return self._encode_struct(struct, spec)
+
+
+def binary_protocol_class():
+    # fastbinary is only there when the thrift package was built with a compiler, a round trip checks it works
+    try:
+        request = ListDatabaseRequest(session_id=1)
+        buffer = TTransport.TMemoryBuffer()
+        request.write(AcceleratedBinaryProtocol(buffer, fallback=False))
+        decoded = ListDatabaseRequest()
+        decoded.read(AcceleratedBinaryProtocol(
+            TTransport.TBufferedTransport(TTransport.TMemoryBuffer(buffer.getvalue())), fallback=False))
+        if decoded == request:
+            return AcceleratedBinaryProtocol
+    except Exception:
+        pass
+    return TBinaryProtocol.TBinaryProtocol
+
+
+# the compact protocol stays pure python: the C compact decoder of thrift 0.20 raises SystemError on python 3.10+
+# once a message outgrows the read buffer
+THRIFT_PROTOCOL_CLASSES = {
+    "binary": binary_protocol_class(),
+    "compact": TCompactProtocol.TCompactProtocol,
+}
+THRIFT_ACCELERATED = THRIFT_PROTOCOL_CLASSES["binary"] is AcceleratedBinaryProtocol
+
+
+def make_protocol(transport, protocol: str = DEFAULT_THRIFT_PROTOCOL):
+    return THRIFT_PROTOCOL_CLASSES[protocol](transport)
+
+
+def check_thrift_options(protocol: str, transport: str):
+    if protocol not in THRIFT_PROTOCOLS:
+        raise InfinityException(ErrorCode.INVALID_PARAMETER_VALUE,
+                                f"Unknown thrift protocol: {protocol}, expect one of {', '.join(THRIFT_PROTOCOLS)}")
+    if transport not in THRIFT_TRANSPORTS:
+        raise InfinityException(ErrorCode.INVALID_PARAMETER_VALUE,
+                                f"Unknown thrift transport: {transport}, expect one of {', '.join(THRIFT_TRANSPORTS)}")
+
+
+# version: 0.2.0.dev2, client_version: 1
+# version: 0.2.0.dev3, client_version: 2
+# version: 0.2.0.dev4, client_version: 3
+# version: 0.2.0.dev5, client_version: 4
+# version: 0.2.0.dev6, client_version: 5
+# version: 0.2.0.dev7, client_version: 6
+# version: 0.2.0.dev8, client_version: 7
+# version: 0.2.0, client_version: 8
+# version: 0.2.1.dev5, client_version: 9
+# version: 0.2.1, client_version: 10
+# version: 0.3.0.dev1, client_version: 11
+# version: 0.3.0.dev3, client_version: 12
+# version: 0.3.0.dev4, client_version: 13
+# version: 0.3.0.dev5, client_version: 14
+CLIENT_VERSION = 14
+
+
+class ServiceClient:
+    # stands in for InfinityService.Client, a call returns call(name, request)
+    def __init__(self, call):
+        self._call = call
+
+    def __getattr__(self, name):
+        return functools.partial(self._call, name)
+
+
+class ThriftChannel:
+    """
+    One socket of a connection with its own server session. The requests are encoded and the responses decoded
+    by the generated InfinityService.Client, a failed request closes the socket.
+    """
+
+    def __init__(self, uri: URI, protocol: str, transport: str):
+        # both have to match the thrift_transport and thrift_protocol configs of the server
+        self.socket = TSocket.TSocket(uri.ip, uri.port)
+        match transport:
+            case "framed":
+                self.transport = TTransport.TFramedTransport(self.socket)
+            case _:
+                self.transport = TTransport.TBufferedTransport(self.socket)
+        self.service = InfinityService.Client(make_protocol(self.transport, protocol))
+        self.session_id = -1
+        # RPCs of the requests whose response a hedge left on the socket, the oldest first
+        self.unread = []
+
+    @property
+    def is_open(self) -> bool:
+        return self.transport.isOpen()
+
+    def open(self):
+        self.transport.open()
+        # the requests of a pipeline are written one after another, Nagle would hold all but the first
+        self.socket.handle.setsockopt(IPPROTO_TCP, TCP_NODELAY, 1)
+        res = self.service.Connect(ConnectRequest(client_version=CLIENT_VERSION))
+        if res.error_code != 0:
+            self.close()
+            raise InfinityException(res.error_code, res.error_msg)
+        self.session_id = res.session_id
+
+    def close(self):
+        self.transport.close()
+
+    def send(self, name: str, request):
+        request.session_id = self.session_id
+        try:
+            getattr(self.service, "send_" + name)(request)
+        except BaseException:
+            # the write buffer may keep a part of the request
+            self.close()
+            raise
+
+    def receive(self, name: str):
+        try:
+            return getattr(self.service, "recv_" + name)()
+        except TApplicationException:
+            # the server failed the request, its message was read to the end
+            raise
+        except BaseException:
+            self.close()
+            raise
+
+    def disconnect(self, session_id: int):
+        # ends a server session, the one of this socket or of a socket which can't carry requests anymore
+        try:
+            return self.service.Disconnect(CommonRequest(session_id=session_id))
+        except TApplicationException:
+            raise
+        except BaseException:
+            self.close()
+            raise
+
+    def wait_readable(self, timeout: Optional[float]) -> bool:
+        return len(select.select([self.socket.handle], [], [], timeout)[0]) != 0
+
+    def discard_unread(self, timeout: Optional[float] = 0) -> bool:
+        # reads the responses left by hedges as far as they arrive within timeout, tells if none is left
+        while self.unread:
+            if not self.is_open or not self.wait_readable(timeout):
+                return False
+            try:
+                self.receive(self.unread[0])
+            except TApplicationException:
+                pass
+            except TRANSPORT_ERRORS:
+                return False
+            self.unread.pop(0)
+        return True
+
+
+class HedgeState:
+    # latencies of the last Selects of a client and which of them were hedged
+    def __init__(self, policy: HedgePolicy):
+        self.policy = policy
+        self.latencies = collections.deque(maxlen=policy.window)
+        self.hedged = collections.deque(maxlen=policy.window)
+        self.hedged_count = 0
+        # seconds a Select waits for its response before it is hedged
+        self.threshold = None
+        self.selects = 0
+        self.hedges = 0
+        # hedges answered first
+        self.wins = 0
+
+    def delay(self) -> Optional[float]:
+        # None while the Selects aren't hedged
+        if self.threshold is None or self.hedged_count > self.policy.max_ratio * len(self.hedged):
+            return None
+        return self.threshold
+
+    def add(self, latency: float, hedged: bool):
+        if len(self.hedged) == self.policy.window:
+            self.hedged_count -= self.hedged[0]
+        self.latencies.append(latency)
+        self.hedged.append(hedged)
+        self.hedged_count += hedged
+        self.selects += 1
+        if len(self.latencies) >= self.policy.min_samples and \
+                (self.threshold is None or self.selects % HEDGE_THRESHOLD_INTERVAL == 0):
+            self.threshold = max(self.policy.min_delay,
+                                 float(np.percentile(self.latencies, self.policy.percentile)))
+
 
 class ThriftInfinityClient:
-    def __init__(self, uri: URI):
+    def __init__(self, uri: URI, protocol: str = DEFAULT_THRIFT_PROTOCOL, transport: str = DEFAULT_THRIFT_TRANSPORT,
+                 retry: Optional[RetryPolicy] = DEFAULT_RETRY_POLICY, hedge: Optional[HedgePolicy] = None):
+        self._is_connected = False
+        check_thrift_options(protocol, transport)
         self.session_id = -1
         self.uri = uri
-        self.transport = None
+        self.protocol_type = protocol
+        self.transport_type = transport
+        # argument checks of the SDK decorators, see infinity.connect
+        self.check_params = True
+        # requests failed by a transport error aren't retried with None
+        self.retry = retry
+        self.hedge = HedgeState(hedge) if hedge is not None else None
+        self._channel = None
+        # the second socket of hedged Selects, opened by the first hedge
+        self._spare = None
+        # sockets no longer used whose server session isn't ended yet, see _end_abandoned
+        self._abandoned = []
+        # hedges are off while a pipeline is open, a won hedge would swap the socket under it
+        self._pipelined = False
+        self.client = ServiceClient(self._call)
         self.reconnect()
         self._is_connected = True
     
@@ -35,36 +279,144 @@ class ThriftInfinityClient:
         if self._is_connected:
             self.disconnect()
 
+    @property
+    def transport(self):
+        return self._channel.transport if self._channel is not None else None
+
     def reconnect(self):
-        if self.transport is not None:
-            self.transport.close()
-            self.transport = None
-        # self.transport = TTransport.TFramedTransport(TSocket.TSocket(self.uri.ip, self.uri.port))  # async
-        self.transport = TTransport.TBufferedTransport(
-            TSocket.TSocket(self.uri.ip, self.uri.port))  # sync
-        self.protocol = TBinaryProtocol.TBinaryProtocol(self.transport)
-        # self.protocol = TCompactProtocol.TCompactProtocol(self.transport)
-        self.client = InfinityService.Client(self.protocol)
-        self.transport.open()
+        # a new socket, and server session, for the next requests
+        self._close_channel()
+        self._open_channel()
+
+    def _open_channel(self) -> ThriftChannel:
+        channel = ThriftChannel(self.uri, self.protocol_type, self.transport_type)
+        channel.open()
+        self._channel = channel
+        self.session_id = channel.session_id
+        return channel
+
+    def _get_channel(self) -> ThriftChannel:
+        # the socket of the connection, reopened after a failure closed it
+        if self._channel is None or not self._channel.is_open:
+            self._close_channel()
+            return self._open_channel()
+        return self._channel
+
+    def _close_channel(self):
+        if self._channel is not None:
+            self._channel.close()
+            self._abandoned.append(self._channel)
+            self._channel = None
+
+    def _end_abandoned(self, channel: ThriftChannel):
+        # the server keeps a session until it is disconnected. The session of an abandoned socket is ended over
+        # that socket once the responses left on it by hedges are read, over channel if the socket is closed.
+        waiting = []
+        try:
+            while self._abandoned:
+                old = self._abandoned.pop()
+                if old.is_open and old.discard_unread():
+                    try:
+                        old.disconnect(old.session_id)
+                        old.close()
+                        continue
+                    except (*TRANSPORT_ERRORS, TApplicationException):
+                        pass
+                if old.is_open:
+                    waiting.append(old)
+                    continue
+                try:
+                    channel.disconnect(old.session_id)
+                except BaseException:
+                    self._abandoned.append(old)
+                    raise
+        finally:
+            self._abandoned.extend(waiting)
+
+    def _call(self, name: str, request):
+        if not self._is_connected:
+            raise InfinityException(ErrorCode.CLIENT_CLOSE, "Connection is closed")
+        hedged = self.hedge is not None and name == "Select" and not self._pipelined
+        retry = 0
+        while True:
+            sent = False
+            try:
+                channel = self._get_channel()
+                if self._abandoned:
+                    self._end_abandoned(channel)
+                begin = time.monotonic()
+                channel.send(name, request)
+                sent = True
+                if hedged and retry == 0:
+                    return self._receive_hedged(channel, name, request, begin)
+                return channel.receive(name)
+            except TRANSPORT_ERRORS:
+                # the next attempt, or request, opens a new socket
+                self._close_channel()
+                if not self._should_retry(name, request, sent, retry):
+                    raise
+            time.sleep(self.retry.delay(retry))
+            retry += 1
+
+    def _should_retry(self, name: str, request, sent: bool, retry: int) -> bool:
+        # a request which wasn't written whole never ran on the server
+        if name in SESSION_RPCS or (name == "Import" and request.uploaded):
+            return False
+        return self.retry is not None and retry < self.retry.max_retries and \
+            (not sent or name in self.retry.idempotent)
+
+    def _receive_hedged(self, channel: ThriftChannel, name: str, request, begin: float):
+        delay = self.hedge.delay()
+        hedged = delay is not None and not channel.wait_readable(max(0.0, begin + delay - time.monotonic()))
+        if hedged:
+            res = self._hedge(channel, name, request, begin)
+        else:
+            res = channel.receive(name)
+        self.hedge.add(time.monotonic() - begin, hedged)
+        return res
 
-        # version: 0.2.0.dev2, client_version: 1
-        # version: 0.2.0.dev3, client_version: 2
-        # version: 0.2.0.dev4, client_version: 3
-        # version: 0.2.0.dev5, client_version: 4
-        # version: 0.2.0.dev6, client_version: 5
-        # version: 0.2.0.dev7, client_version: 6
-        # version: 0.2.0.dev8, client_version: 7
-        # version: 0.2.0, client_version: 8
-        # version: 0.2.1.dev5, client_version: 9
-        # version: 0.2.1, client_version: 10
-        # version: 0.3.0.dev1, client_version: 11
-        # version: 0.3.0.dev3, client_version: 12
-        # version: 0.3.0.dev4, client_version: 13
-        # version: 0.3.0.dev5, client_version: 14
-        res = self.client.Connect(ConnectRequest(client_version=14))
-        if res.error_code != 0:
-            raise InfinityException(res.error_code, res.error_msg)
-        self.session_id = res.session_id
+    def _hedge(self, channel: ThriftChannel, name: str, request, begin: float):
+        # sends the request again on the spare socket and returns the first response
+        spare = self._spare
+        try:
+            if spare is None or not spare.discard_unread():
+                if spare is not None:
+                    # its session is ended once the responses left on it arrived
+                    self._abandoned.append(spare)
+                self._spare = None
+                spare = ThriftChannel(self.uri, self.protocol_type, self.transport_type)
+                spare.open()
+                self._spare = spare
+            spare.send(name, request)
+        except (*TRANSPORT_ERRORS, InfinityException):
+            if self._spare is not None:
+                self._abandoned.append(self._spare)
+            self._spare = None
+            return channel.receive(name)
+        self.hedge.hedges += 1
+        # as long as the receive on the socket of the connection would have waited, counted from the send
+        timeout = channel.socket._timeout
+        remaining = None if timeout is None else max(0.0, begin + timeout - time.monotonic())
+        readable = select.select([channel.socket.handle, spare.socket.handle], [], [], remaining)[0]
+        if not readable:
+            spare.unread.append(name)
+            raise TTransportException(TTransportException.TIMED_OUT, f"{name} timed out")
+        if channel.socket.handle in readable:
+            spare.unread.append(name)
+            return channel.receive(name)
+        try:
+            res = spare.receive(name)
+        except BaseException:
+            self._spare = None
+            spare.close()
+            self._abandoned.append(spare)
+            return channel.receive(name)
+        # the spare socket, and its session, become the ones of the connection
+        self.hedge.wins += 1
+        channel.unread.append(name)
+        self._channel, self._spare = spare, channel
+        self.session_id = spare.session_id
+        return res
 
     def create_database(self, db_name: str, conflict_type: CreateConflict = CreateConflict.Error):
         return self.client.CreateDatabase(CreateDatabaseRequest(session_id=self.session_id,
@@ -150,40 +502,31 @@ class ThriftInfinityClient:
                                                       table_name=table_name))
 
     def insert(self, db_name: str, table_name: str, column_names: list[str], fields: list[Field]):
-        retry = 0
-        inner_ex = None
-        while retry <= 2:
-            try:
-                res = self.client.Insert(InsertRequest(session_id=self.session_id,
-                                                       db_name=db_name,
-                                                       table_name=table_name,
-                                                       column_names=column_names,
-                                                       fields=fields))
-                return res
-            except TTransportException as ex:
-                #import traceback
-                #traceback.print_exc()
-                self.reconnect()
-                inner_ex = ex
-                retry += 1
-            except Exception as ex:
-                inner_ex = ex
-        return CommonResponse(ErrorCode.TOO_MANY_CONNECTIONS, "insert failed with exception: " + str(inner_ex))
-
-    # Can be used in compact mode
-    # def insert(self, db_name: str, table_name: str, column_names: list[str], fields: list[Field]):
-    #     return self.client.Insert(InsertRequest(session_id=self.session_id,
-    #                                             db_name=db_name,
-    #                                             table_name=table_name,
-    #                                             column_names=column_names,
-    #                                             fields=fields))
-
-    def import_data(self, db_name: str, table_name: str, file_name: str, import_options):
+        return self.client.Insert(InsertRequest(session_id=self.session_id,
+                                                db_name=db_name,
+                                                table_name=table_name,
+                                                column_names=column_names,
+                                                fields=fields))
+
+    def insert_columns(self, db_name: str, table_name: str, columns: list[InsertColumn]):
+        return self.client.Insert(InsertRequest(session_id=self.session_id,
+                                                db_name=db_name,
+                                                table_name=table_name,
+                                                columns=columns))
+
+    def import_data(self, db_name: str, table_name: str, file_name: str, import_options, uploaded: bool = False):
         return self.client.Import(ImportRequest(session_id=self.session_id,
                                                 db_name=db_name,
                                                 table_name=table_name,
                                                 file_name=file_name,
-                                                import_option=import_options))
+                                                import_option=import_options,
+                                                uploaded=uploaded))
+
+    def upload_file_chunk(self, file_name: str, offset: int, data: bytes):
+        return self.client.UploadFileChunk(UploadFileChunkRequest(session_id=self.session_id,
+                                                                  file_name=file_name,
+                                                                  offset=offset,
+                                                                  data=data))
 
     def export_data(self, db_name: str, table_name: str, file_name: str, export_options: {}, columns: [str]):
         return self.client.Export(ExportRequest(session_id=self.session_id,
@@ -206,6 +549,24 @@ class ThriftInfinityClient:
                                                 offset_expr=offset_expr,
                                                 ))
 
+    def select_batch(self, db_name: str, table_name: str, select_list, search_expr,
+                     where_expr, group_by_list, limit_expr, offset_expr, match_index: int,
+                     embeddings: list[EmbeddingData]):
+        # the server runs the query once per embedding, as the one of the match_dense at match_index
+        query = SelectRequest(session_id=self.session_id,
+                              db_name=db_name,
+                              table_name=table_name,
+                              select_list=select_list,
+                              search_expr=search_expr,
+                              where_expr=where_expr,
+                              group_by_list=group_by_list,
+                              limit_expr=limit_expr,
+                              offset_expr=offset_expr)
+        return self.client.SelectBatch(SelectBatchRequest(session_id=self.session_id,
+                                                          query=query,
+                                                          match_index=match_index,
+                                                          embeddings=embeddings))
+
     def explain(self, db_name: str, table_name: str, select_list, search_expr,
                 where_expr, group_by_list, limit_expr, offset_expr, explain_type):
         return self.client.Explain(ExplainRequest(session_id=self.session_id,
@@ -237,12 +598,36 @@ class ThriftInfinityClient:
         res = None
         if not self._is_connected:
             return CommonResponse(ErrorCode.OK, "Already disconnected")
-        try:
-            res = self.client.Disconnect(CommonRequest(session_id=self.session_id))
-        except Exception:
-            pass
-        self.transport.close()
         self._is_connected = False
+        channels = self._abandoned + [channel for channel in (self._spare, self._channel) if channel is not None]
+        self._abandoned, self._spare, self._channel = [], None, None
+        # a session is ended over its socket once the responses left on it by hedges are read, the requests of
+        # a session have to be done before it ends. The sessions of closed sockets are ended over an open one,
+        # those of sockets whose responses don't come in time are left to the server.
+        deadline = time.monotonic() + DISCONNECT_UNREAD_TIMEOUT
+        live, closed = [], []
+        for channel in channels:
+            if channel.is_open and channel.discard_unread(max(0.0, deadline - time.monotonic())):
+                live.append(channel)
+            elif not channel.is_open and channel.session_id != -1:
+                closed.append(channel)
+            else:
+                channel.close()
+        if closed and not live:
+            try:
+                live.append(ThriftChannel(self.uri, self.protocol_type, self.transport_type))
+                live[0].open()
+            except (*TRANSPORT_ERRORS, InfinityException):
+                live = []
+        for channel in live:
+            try:
+                while closed:
+                    channel.disconnect(closed[-1].session_id)
+                    closed.pop()
+                res = channel.disconnect(channel.session_id)
+            except (*TRANSPORT_ERRORS, TApplicationException):
+                pass
+            channel.close()
         return res
 
     def show_tables(self, db_name: str):
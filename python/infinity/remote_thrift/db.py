@@ -19,7 +19,8 @@ import numpy as np
 from infinity.db import Database
 from infinity.errors import ErrorCode
 from infinity.remote_thrift.table import RemoteTable
-from infinity.remote_thrift.utils import check_valid_name, name_validity_check, select_res_to_polars
+from infinity.remote_thrift.utils import check_valid_name, name_validity_check, select_res_to_polars, \
+    get_create_conflict, get_drop_conflict
 from infinity.remote_thrift.utils import get_remote_constant_expr_from_python_value
 from infinity.common import ConflictType
 from infinity.common import InfinityException
@@ -241,6 +242,15 @@ def get_sparse_info(column_info, column_defs, column_name, index):
 
     column_defs.append(proto_column_def)
 
+
+def get_column_defs(columns_definition) -> list[ttypes.ColumnDef]:
+    column_defs = []
+    for index, (column_name, column_info) in enumerate(columns_definition.items()):
+        check_valid_name(column_name, "Column")
+        get_ordinary_info(column_info, column_defs, column_name, index)
+    return column_defs
+
+
 class RemoteDatabase(Database, ABC):
     def __init__(self, conn, name: str):
         self._conn = conn
@@ -263,25 +273,9 @@ class RemoteDatabase(Database, ABC):
                 }
             }, None)
         """
-        # to column_defs
-        column_defs = []
-        for index, (column_name, column_info) in enumerate(columns_definition.items()):
-            check_valid_name(column_name, "Column")
-            get_ordinary_info(column_info, column_defs, column_name, index)
-
-        create_table_conflict: ttypes.CreateConflict
-        if conflict_type == ConflictType.Error:
-            create_table_conflict = ttypes.CreateConflict.Error
-        elif conflict_type == ConflictType.Ignore:
-            create_table_conflict = ttypes.CreateConflict.Ignore
-        elif conflict_type == ConflictType.Replace:
-            create_table_conflict = ttypes.CreateConflict.Replace
-        else:
-            raise InfinityException(ErrorCode.INVALID_CONFLICT_TYPE, "Invalid conflict type")
-
         res = self._conn.create_table(db_name=self._db_name, table_name=table_name,
-                                      column_defs=column_defs,
-                                      conflict_type=create_table_conflict)
+                                      column_defs=get_column_defs(columns_definition),
+                                      conflict_type=get_create_conflict(conflict_type))
 
         if res.error_code == ErrorCode.OK:
             return RemoteTable(self._conn, self._db_name, table_name)
@@ -290,14 +284,8 @@ class RemoteDatabase(Database, ABC):
 
     @name_validity_check("table_name", "Table")
     def drop_table(self, table_name, conflict_type: ConflictType = ConflictType.Error):
-        if conflict_type == ConflictType.Error:
-            return self._conn.drop_table(db_name=self._db_name, table_name=table_name,
-                                         conflict_type=ttypes.DropConflict.Error)
-        elif conflict_type == ConflictType.Ignore:
-            return self._conn.drop_table(db_name=self._db_name, table_name=table_name,
-                                         conflict_type=ttypes.DropConflict.Ignore)
-        else:
-            raise InfinityException(ErrorCode.INVALID_CONFLICT_TYPE, "Invalid conflict type")
+        return self._conn.drop_table(db_name=self._db_name, table_name=table_name,
+                                     conflict_type=get_drop_conflict(conflict_type))
 
     def list_tables(self):
         res = self._conn.list_tables(self._db_name)
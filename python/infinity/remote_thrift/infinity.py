@@ -13,21 +13,28 @@
 # limitations under the License.
 
 from abc import ABC
+from typing import Optional
 
 import infinity.remote_thrift.infinity_thrift_rpc.ttypes as ttypes
 from infinity import InfinityConnection
 from infinity.errors import ErrorCode
 from infinity.remote_thrift.client import ThriftInfinityClient
 from infinity.remote_thrift.db import RemoteDatabase
-from infinity.remote_thrift.utils import name_validity_check, select_res_to_polars
-from infinity.common import ConflictType, InfinityException
+from infinity.remote_thrift.utils import name_validity_check, get_create_conflict, get_drop_conflict
+from infinity.remote_thrift.pipeline import Pipeline
+from infinity.common import ConflictType, InfinityException, DEFAULT_THRIFT_PROTOCOL, DEFAULT_THRIFT_TRANSPORT, \
+    DEFAULT_PIPELINE_MAX_IN_FLIGHT, RetryPolicy, HedgePolicy, DEFAULT_RETRY_POLICY
 
 
 class RemoteThriftInfinityConnection(InfinityConnection, ABC):
-    def __init__(self, uri):
+    def __init__(self, uri, check_params: bool = True, protocol: str = DEFAULT_THRIFT_PROTOCOL,
+                 transport: str = DEFAULT_THRIFT_TRANSPORT, retry: Optional[RetryPolicy] = DEFAULT_RETRY_POLICY,
+                 hedge: Optional[HedgePolicy] = None):
         super().__init__(uri)
+        self._is_connected = False
         self.db_name = "default_db"
-        self._client = ThriftInfinityClient(uri)
+        self._client = ThriftInfinityClient(uri, protocol, transport, retry, hedge)
+        self._client.check_params = check_params
         self._is_connected = True
 
     def __del__(self):
@@ -36,17 +43,7 @@ class RemoteThriftInfinityConnection(InfinityConnection, ABC):
 
     @name_validity_check("db_name", "DB")
     def create_database(self, db_name: str, conflict_type: ConflictType = ConflictType.Error):
-        create_database_conflict: ttypes.CreateConflict
-        if conflict_type == ConflictType.Error:
-            create_database_conflict = ttypes.CreateConflict.Error
-        elif conflict_type == ConflictType.Ignore:
-            create_database_conflict = ttypes.CreateConflict.Ignore
-        elif conflict_type == ConflictType.Replace:
-            create_database_conflict = ttypes.CreateConflict.Replace
-        else:
-            raise InfinityException(ErrorCode.INVALID_CONFLICT_TYPE, "Invalid conflict type")
-
-        res = self._client.create_database(db_name=db_name, conflict_type=create_database_conflict)
+        res = self._client.create_database(db_name=db_name, conflict_type=get_create_conflict(conflict_type))
         if res.error_code == ErrorCode.OK:
             return RemoteDatabase(self._client, db_name)
         else:
@@ -69,15 +66,7 @@ class RemoteThriftInfinityConnection(InfinityConnection, ABC):
 
     @name_validity_check("db_name", "DB")
     def drop_database(self, db_name: str, conflict_type: ConflictType = ConflictType.Error):
-        drop_database_conflict: ttypes.DropConflict
-        if conflict_type == ConflictType.Error:
-            drop_database_conflict = ttypes.DropConflict.Error
-        elif conflict_type == ConflictType.Ignore:
-            drop_database_conflict = ttypes.DropConflict.Ignore
-        else:
-            raise InfinityException(ErrorCode.INVALID_CONFLICT_TYPE, "Invalid conflict type")
-
-        res = self._client.drop_database(db_name=db_name, conflict_type = drop_database_conflict)
+        res = self._client.drop_database(db_name=db_name, conflict_type=get_drop_conflict(conflict_type))
         if res.error_code == ErrorCode.OK:
             return res
         else:
@@ -99,6 +88,11 @@ class RemoteThriftInfinityConnection(InfinityConnection, ABC):
         else:
             raise InfinityException(res.error_code, res.error_msg)
 
+    def pipeline(self, max_in_flight: int = DEFAULT_PIPELINE_MAX_IN_FLIGHT) -> Pipeline:
+        # with conn.pipeline() as pipe: the requests of pipe.table(table_obj) are sent without waiting for the
+        # previous response and return futures, the responses are all read at the end of the block
+        return Pipeline(self._client, max_in_flight)
+
     @property
     def client(self):
         return self._client
@@ -245,6 +245,7 @@ class CopyFileType(object):
     FVECS = 3
     CSR = 4
     BVECS = 5
+    PARQUET = 6
 
     _VALUES_TO_NAMES = {
         0: "CSV",
@@ -253,6 +254,7 @@ class CopyFileType(object):
         3: "FVECS",
         4: "CSR",
         5: "BVECS",
+        6: "PARQUET",
     }
 
     _NAMES_TO_VALUES = {
@@ -262,6 +264,7 @@ class CopyFileType(object):
         "FVECS": 3,
         "CSR": 4,
         "BVECS": 5,
+        "PARQUET": 6,
     }
 
 
@@ -1306,11 +1309,12 @@ class EmbeddingData(object):
      - f64_array_value
      - f16_array_value
      - bf16_array_value
+     - packed_value
 
     """
 
 
-    def __init__(self, bool_array_value=None, u8_array_value=None, i8_array_value=None, i16_array_value=None, i32_array_value=None, i64_array_value=None, f32_array_value=None, f64_array_value=None, f16_array_value=None, bf16_array_value=None,):
+    def __init__(self, bool_array_value=None, u8_array_value=None, i8_array_value=None, i16_array_value=None, i32_array_value=None, i64_array_value=None, f32_array_value=None, f64_array_value=None, f16_array_value=None, bf16_array_value=None, packed_value=None,):
         self.bool_array_value = bool_array_value
         self.u8_array_value = u8_array_value
         self.i8_array_value = i8_array_value
@@ -1321,6 +1325,7 @@ class EmbeddingData(object):
         self.f64_array_value = f64_array_value
         self.f16_array_value = f16_array_value
         self.bf16_array_value = bf16_array_value
+        self.packed_value = packed_value
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -1431,6 +1436,11 @@ class EmbeddingData(object):
                     iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
+            elif fid == 11:
+                if ftype == TType.STRING:
+                    self.packed_value = iprot.readBinary()
+                else:
+                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -1511,6 +1521,10 @@ class EmbeddingData(object):
                 oprot.writeDouble(iter83)
             oprot.writeListEnd()
             oprot.writeFieldEnd()
+        if self.packed_value is not None:
+            oprot.writeFieldBegin('packed_value', TType.STRING, 11)
+            oprot.writeBinary(self.packed_value)
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -3137,6 +3151,107 @@ class ColumnField(object):
         return not (self == other)
 
 
+class InsertColumn(object):
+    """
+    Attributes:
+     - column_name
+     - column_type
+     - element_type
+     - dimension
+     - column_vector
+
+    """
+
+
+    def __init__(self, column_name=None, column_type=None, element_type=None, dimension=None, column_vector=None,):
+        self.column_name = column_name
+        self.column_type = column_type
+        self.element_type = element_type
+        self.dimension = dimension
+        self.column_vector = column_vector
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.STRING:
+                    self.column_name = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.I32:
+                    self.column_type = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.I32:
+                    self.element_type = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 4:
+                if ftype == TType.I32:
+                    self.dimension = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 5:
+                if ftype == TType.STRING:
+                    self.column_vector = iprot.readBinary()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('InsertColumn')
+        if self.column_name is not None:
+            oprot.writeFieldBegin('column_name', TType.STRING, 1)
+            oprot.writeString(self.column_name.encode('utf-8') if sys.version_info[0] == 2 else self.column_name)
+            oprot.writeFieldEnd()
+        if self.column_type is not None:
+            oprot.writeFieldBegin('column_type', TType.I32, 2)
+            oprot.writeI32(self.column_type)
+            oprot.writeFieldEnd()
+        if self.element_type is not None:
+            oprot.writeFieldBegin('element_type', TType.I32, 3)
+            oprot.writeI32(self.element_type)
+            oprot.writeFieldEnd()
+        if self.dimension is not None:
+            oprot.writeFieldBegin('dimension', TType.I32, 4)
+            oprot.writeI32(self.dimension)
+            oprot.writeFieldEnd()
+        if self.column_vector is not None:
+            oprot.writeFieldBegin('column_vector', TType.STRING, 5)
+            oprot.writeBinary(self.column_vector)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
 class ImportOption(object):
     """
     Attributes:
@@ -5728,13 +5843,15 @@ class InsertRequest(object):
      - column_names
      - fields
      - session_id
+     - columns
 
     """
 
 
     def __init__(self, db_name=None, table_name=None, column_names=[
     ], fields=[
-    ], session_id=None,):
+    ], session_id=None, columns=[
+    ],):
         self.db_name = db_name
         self.table_name = table_name
         if column_names is self.thrift_spec[3][4]:
@@ -5746,6 +5863,10 @@ class InsertRequest(object):
             ]
         self.fields = fields
         self.session_id = session_id
+        if columns is self.thrift_spec[6][4]:
+            columns = [
+            ]
+        self.columns = columns
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -5792,6 +5913,17 @@ class InsertRequest(object):
                     self.session_id = iprot.readI64()
                 else:
                     iprot.skip(ftype)
+            elif fid == 6:
+                if ftype == TType.LIST:
+                    self.columns = []
+                    (_etype288, _size285) = iprot.readListBegin()
+                    for _i289 in range(_size285):
+                        _elem290 = InsertColumn()
+                        _elem290.read(iprot)
+                        self.columns.append(_elem290)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -5813,21 +5945,28 @@ class InsertRequest(object):
         if self.column_names is not None:
             oprot.writeFieldBegin('column_names', TType.LIST, 3)
             oprot.writeListBegin(TType.STRING, len(self.column_names))
-            for iter285 in self.column_names:
-                oprot.writeString(iter285.encode('utf-8') if sys.version_info[0] == 2 else iter285)
+            for iter291 in self.column_names:
+                oprot.writeString(iter291.encode('utf-8') if sys.version_info[0] == 2 else iter291)
             oprot.writeListEnd()
             oprot.writeFieldEnd()
         if self.fields is not None:
             oprot.writeFieldBegin('fields', TType.LIST, 4)
             oprot.writeListBegin(TType.STRUCT, len(self.fields))
-            for iter286 in self.fields:
-                iter286.write(oprot)
+            for iter292 in self.fields:
+                iter292.write(oprot)
             oprot.writeListEnd()
             oprot.writeFieldEnd()
         if self.session_id is not None:
             oprot.writeFieldBegin('session_id', TType.I64, 5)
             oprot.writeI64(self.session_id)
             oprot.writeFieldEnd()
+        if self.columns is not None:
+            oprot.writeFieldBegin('columns', TType.LIST, 6)
+            oprot.writeListBegin(TType.STRUCT, len(self.columns))
+            for iter293 in self.columns:
+                iter293.write(oprot)
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -5854,16 +5993,18 @@ class ImportRequest(object):
      - file_name
      - import_option
      - session_id
+     - uploaded
 
     """
 
 
-    def __init__(self, db_name=None, table_name=None, file_name=None, import_option=None, session_id=None,):
+    def __init__(self, db_name=None, table_name=None, file_name=None, import_option=None, session_id=None, uploaded=False,):
         self.db_name = db_name
         self.table_name = table_name
         self.file_name = file_name
         self.import_option = import_option
         self.session_id = session_id
+        self.uploaded = uploaded
 
     def read(self, iprot):
         if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
@@ -5900,6 +6041,11 @@ class ImportRequest(object):
                     self.session_id = iprot.readI64()
                 else:
                     iprot.skip(ftype)
+            elif fid == 6:
+                if ftype == TType.BOOL:
+                    self.uploaded = iprot.readBool()
+                else:
+                    iprot.skip(ftype)
             else:
                 iprot.skip(ftype)
             iprot.readFieldEnd()
@@ -5930,6 +6076,100 @@ class ImportRequest(object):
             oprot.writeFieldBegin('session_id', TType.I64, 5)
             oprot.writeI64(self.session_id)
             oprot.writeFieldEnd()
+        if self.uploaded is not None:
+            oprot.writeFieldBegin('uploaded', TType.BOOL, 6)
+            oprot.writeBool(self.uploaded)
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class UploadFileChunkRequest(object):
+    """
+    Attributes:
+     - session_id
+     - file_name
+     - offset
+     - data
+
+    """
+
+
+    def __init__(self, session_id=None, file_name=None, offset=None, data=None,):
+        self.session_id = session_id
+        self.file_name = file_name
+        self.offset = offset
+        self.data = data
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.I64:
+                    self.session_id = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRING:
+                    self.file_name = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.I64:
+                    self.offset = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 4:
+                if ftype == TType.STRING:
+                    self.data = iprot.readBinary()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('UploadFileChunkRequest')
+        if self.session_id is not None:
+            oprot.writeFieldBegin('session_id', TType.I64, 1)
+            oprot.writeI64(self.session_id)
+            oprot.writeFieldEnd()
+        if self.file_name is not None:
+            oprot.writeFieldBegin('file_name', TType.STRING, 2)
+            oprot.writeString(self.file_name.encode('utf-8') if sys.version_info[0] == 2 else self.file_name)
+            oprot.writeFieldEnd()
+        if self.offset is not None:
+            oprot.writeFieldBegin('offset', TType.I64, 3)
+            oprot.writeI64(self.offset)
+            oprot.writeFieldEnd()
+        if self.data is not None:
+            oprot.writeFieldBegin('data', TType.STRING, 4)
+            oprot.writeBinary(self.data)
+            oprot.writeFieldEnd()
         oprot.writeFieldStop()
         oprot.writeStructEnd()
 
@@ -5991,10 +6231,10 @@ class ExportRequest(object):
             elif fid == 3:
                 if ftype == TType.LIST:
                     self.columns = []
-                    (_etype290, _size287) = iprot.readListBegin()
-                    for _i291 in range(_size287):
-                        _elem292 = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
-                        self.columns.append(_elem292)
+                    (_etype297, _size294) = iprot.readListBegin()
+                    for _i298 in range(_size294):
+                        _elem299 = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                        self.columns.append(_elem299)
                     iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
@@ -6035,8 +6275,8 @@ class ExportRequest(object):
         if self.columns is not None:
             oprot.writeFieldBegin('columns', TType.LIST, 3)
             oprot.writeListBegin(TType.STRING, len(self.columns))
-            for iter293 in self.columns:
-                oprot.writeString(iter293.encode('utf-8') if sys.version_info[0] == 2 else iter293)
+            for iter300 in self.columns:
+                oprot.writeString(iter300.encode('utf-8') if sys.version_info[0] == 2 else iter300)
             oprot.writeListEnd()
             oprot.writeFieldEnd()
         if self.file_name is not None:
@@ -6141,11 +6381,11 @@ class ExplainRequest(object):
             elif fid == 4:
                 if ftype == TType.LIST:
                     self.select_list = []
-                    (_etype297, _size294) = iprot.readListBegin()
-                    for _i298 in range(_size294):
-                        _elem299 = ParsedExpr()
-                        _elem299.read(iprot)
-                        self.select_list.append(_elem299)
+                    (_etype304, _size301) = iprot.readListBegin()
+                    for _i305 in range(_size301):
+                        _elem306 = ParsedExpr()
+                        _elem306.read(iprot)
+                        self.select_list.append(_elem306)
                     iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
@@ -6164,11 +6404,11 @@ class ExplainRequest(object):
             elif fid == 7:
                 if ftype == TType.LIST:
                     self.group_by_list = []
-                    (_etype303, _size300) = iprot.readListBegin()
-                    for _i304 in range(_size300):
-                        _elem305 = ParsedExpr()
-                        _elem305.read(iprot)
-                        self.group_by_list.append(_elem305)
+                    (_etype310, _size307) = iprot.readListBegin()
+                    for _i311 in range(_size307):
+                        _elem312 = ParsedExpr()
+                        _elem312.read(iprot)
+                        self.group_by_list.append(_elem312)
                     iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
@@ -6193,11 +6433,11 @@ class ExplainRequest(object):
             elif fid == 11:
                 if ftype == TType.LIST:
                     self.order_by_list = []
-                    (_etype309, _size306) = iprot.readListBegin()
-                    for _i310 in range(_size306):
-                        _elem311 = OrderByExpr()
-                        _elem311.read(iprot)
-                        self.order_by_list.append(_elem311)
+                    (_etype316, _size313) = iprot.readListBegin()
+                    for _i317 in range(_size313):
+                        _elem318 = OrderByExpr()
+                        _elem318.read(iprot)
+                        self.order_by_list.append(_elem318)
                     iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
@@ -6231,8 +6471,8 @@ class ExplainRequest(object):
         if self.select_list is not None:
             oprot.writeFieldBegin('select_list', TType.LIST, 4)
             oprot.writeListBegin(TType.STRUCT, len(self.select_list))
-            for iter312 in self.select_list:
-                iter312.write(oprot)
+            for iter319 in self.select_list:
+                iter319.write(oprot)
             oprot.writeListEnd()
             oprot.writeFieldEnd()
         if self.search_expr is not None:
@@ -6246,8 +6486,8 @@ class ExplainRequest(object):
         if self.group_by_list is not None:
             oprot.writeFieldBegin('group_by_list', TType.LIST, 7)
             oprot.writeListBegin(TType.STRUCT, len(self.group_by_list))
-            for iter313 in self.group_by_list:
-                iter313.write(oprot)
+            for iter320 in self.group_by_list:
+                iter320.write(oprot)
             oprot.writeListEnd()
             oprot.writeFieldEnd()
         if self.having_expr is not None:
@@ -6265,8 +6505,8 @@ class ExplainRequest(object):
         if self.order_by_list is not None:
             oprot.writeFieldBegin('order_by_list', TType.LIST, 11)
             oprot.writeListBegin(TType.STRUCT, len(self.order_by_list))
-            for iter314 in self.order_by_list:
-                iter314.write(oprot)
+            for iter321 in self.order_by_list:
+                iter321.write(oprot)
             oprot.writeListEnd()
             oprot.writeFieldEnd()
         if self.explain_type is not None:
@@ -6338,22 +6578,22 @@ class ExplainResponse(object):
             elif fid == 3:
                 if ftype == TType.LIST:
                     self.column_defs = []
-                    (_etype318, _size315) = iprot.readListBegin()
-                    for _i319 in range(_size315):
-                        _elem320 = ColumnDef()
-                        _elem320.read(iprot)
-                        self.column_defs.append(_elem320)
+                    (_etype325, _size322) = iprot.readListBegin()
+                    for _i326 in range(_size322):
+                        _elem327 = ColumnDef()
+                        _elem327.read(iprot)
+                        self.column_defs.append(_elem327)
                     iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
             elif fid == 4:
                 if ftype == TType.LIST:
                     self.column_fields = []
-                    (_etype324, _size321) = iprot.readListBegin()
-                    for _i325 in range(_size321):
-                        _elem326 = ColumnField()
-                        _elem326.read(iprot)
-                        self.column_fields.append(_elem326)
+                    (_etype331, _size328) = iprot.readListBegin()
+                    for _i332 in range(_size328):
+                        _elem333 = ColumnField()
+                        _elem333.read(iprot)
+                        self.column_fields.append(_elem333)
                     iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
@@ -6378,15 +6618,15 @@ class ExplainResponse(object):
         if self.column_defs is not None:
             oprot.writeFieldBegin('column_defs', TType.LIST, 3)
             oprot.writeListBegin(TType.STRUCT, len(self.column_defs))
-            for iter327 in self.column_defs:
-                iter327.write(oprot)
+            for iter334 in self.column_defs:
+                iter334.write(oprot)
             oprot.writeListEnd()
             oprot.writeFieldEnd()
         if self.column_fields is not None:
             oprot.writeFieldBegin('column_fields', TType.LIST, 4)
             oprot.writeListBegin(TType.STRUCT, len(self.column_fields))
-            for iter328 in self.column_fields:
-                iter328.write(oprot)
+            for iter335 in self.column_fields:
+                iter335.write(oprot)
             oprot.writeListEnd()
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
@@ -6477,11 +6717,11 @@ class SelectRequest(object):
             elif fid == 4:
                 if ftype == TType.LIST:
                     self.select_list = []
-                    (_etype332, _size329) = iprot.readListBegin()
-                    for _i333 in range(_size329):
-                        _elem334 = ParsedExpr()
-                        _elem334.read(iprot)
-                        self.select_list.append(_elem334)
+                    (_etype339, _size336) = iprot.readListBegin()
+                    for _i340 in range(_size336):
+                        _elem341 = ParsedExpr()
+                        _elem341.read(iprot)
+                        self.select_list.append(_elem341)
                     iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
@@ -6500,11 +6740,11 @@ class SelectRequest(object):
             elif fid == 7:
                 if ftype == TType.LIST:
                     self.group_by_list = []
-                    (_etype338, _size335) = iprot.readListBegin()
-                    for _i339 in range(_size335):
-                        _elem340 = ParsedExpr()
-                        _elem340.read(iprot)
-                        self.group_by_list.append(_elem340)
+                    (_etype345, _size342) = iprot.readListBegin()
+                    for _i346 in range(_size342):
+                        _elem347 = ParsedExpr()
+                        _elem347.read(iprot)
+                        self.group_by_list.append(_elem347)
                     iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
@@ -6529,11 +6769,11 @@ class SelectRequest(object):
             elif fid == 11:
                 if ftype == TType.LIST:
                     self.order_by_list = []
-                    (_etype344, _size341) = iprot.readListBegin()
-                    for _i345 in range(_size341):
-                        _elem346 = OrderByExpr()
-                        _elem346.read(iprot)
-                        self.order_by_list.append(_elem346)
+                    (_etype351, _size348) = iprot.readListBegin()
+                    for _i352 in range(_size348):
+                        _elem353 = OrderByExpr()
+                        _elem353.read(iprot)
+                        self.order_by_list.append(_elem353)
                     iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
@@ -6562,8 +6802,8 @@ class SelectRequest(object):
         if self.select_list is not None:
             oprot.writeFieldBegin('select_list', TType.LIST, 4)
             oprot.writeListBegin(TType.STRUCT, len(self.select_list))
-            for iter347 in self.select_list:
-                iter347.write(oprot)
+            for iter354 in self.select_list:
+                iter354.write(oprot)
             oprot.writeListEnd()
             oprot.writeFieldEnd()
         if self.search_expr is not None:
@@ -6577,8 +6817,8 @@ class SelectRequest(object):
         if self.group_by_list is not None:
             oprot.writeFieldBegin('group_by_list', TType.LIST, 7)
             oprot.writeListBegin(TType.STRUCT, len(self.group_by_list))
-            for iter348 in self.group_by_list:
-                iter348.write(oprot)
+            for iter355 in self.group_by_list:
+                iter355.write(oprot)
             oprot.writeListEnd()
             oprot.writeFieldEnd()
         if self.having_expr is not None:
@@ -6596,8 +6836,8 @@ class SelectRequest(object):
         if self.order_by_list is not None:
             oprot.writeFieldBegin('order_by_list', TType.LIST, 11)
             oprot.writeListBegin(TType.STRUCT, len(self.order_by_list))
-            for iter349 in self.order_by_list:
-                iter349.write(oprot)
+            for iter356 in self.order_by_list:
+                iter356.write(oprot)
             oprot.writeListEnd()
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
@@ -6665,22 +6905,22 @@ class SelectResponse(object):
             elif fid == 3:
                 if ftype == TType.LIST:
                     self.column_defs = []
-                    (_etype353, _size350) = iprot.readListBegin()
-                    for _i354 in range(_size350):
-                        _elem355 = ColumnDef()
-                        _elem355.read(iprot)
-                        self.column_defs.append(_elem355)
+                    (_etype360, _size357) = iprot.readListBegin()
+                    for _i361 in range(_size357):
+                        _elem362 = ColumnDef()
+                        _elem362.read(iprot)
+                        self.column_defs.append(_elem362)
                     iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
             elif fid == 4:
                 if ftype == TType.LIST:
                     self.column_fields = []
-                    (_etype359, _size356) = iprot.readListBegin()
-                    for _i360 in range(_size356):
-                        _elem361 = ColumnField()
-                        _elem361.read(iprot)
-                        self.column_fields.append(_elem361)
+                    (_etype366, _size363) = iprot.readListBegin()
+                    for _i367 in range(_size363):
+                        _elem368 = ColumnField()
+                        _elem368.read(iprot)
+                        self.column_fields.append(_elem368)
                     iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
@@ -6705,15 +6945,211 @@ class SelectResponse(object):
         if self.column_defs is not None:
             oprot.writeFieldBegin('column_defs', TType.LIST, 3)
             oprot.writeListBegin(TType.STRUCT, len(self.column_defs))
-            for iter362 in self.column_defs:
-                iter362.write(oprot)
+            for iter369 in self.column_defs:
+                iter369.write(oprot)
             oprot.writeListEnd()
             oprot.writeFieldEnd()
         if self.column_fields is not None:
             oprot.writeFieldBegin('column_fields', TType.LIST, 4)
             oprot.writeListBegin(TType.STRUCT, len(self.column_fields))
-            for iter363 in self.column_fields:
-                iter363.write(oprot)
+            for iter370 in self.column_fields:
+                iter370.write(oprot)
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class SelectBatchRequest(object):
+    """
+    Attributes:
+     - session_id
+     - query
+     - match_index
+     - embeddings
+
+    """
+
+
+    def __init__(self, session_id=None, query=None, match_index=None, embeddings=[
+    ],):
+        self.session_id = session_id
+        self.query = query
+        self.match_index = match_index
+        if embeddings is self.thrift_spec[4][4]:
+            embeddings = [
+            ]
+        self.embeddings = embeddings
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.I64:
+                    self.session_id = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRUCT:
+                    self.query = SelectRequest()
+                    self.query.read(iprot)
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.I32:
+                    self.match_index = iprot.readI32()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 4:
+                if ftype == TType.LIST:
+                    self.embeddings = []
+                    (_etype374, _size371) = iprot.readListBegin()
+                    for _i375 in range(_size371):
+                        _elem376 = EmbeddingData()
+                        _elem376.read(iprot)
+                        self.embeddings.append(_elem376)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('SelectBatchRequest')
+        if self.session_id is not None:
+            oprot.writeFieldBegin('session_id', TType.I64, 1)
+            oprot.writeI64(self.session_id)
+            oprot.writeFieldEnd()
+        if self.query is not None:
+            oprot.writeFieldBegin('query', TType.STRUCT, 2)
+            self.query.write(oprot)
+            oprot.writeFieldEnd()
+        if self.match_index is not None:
+            oprot.writeFieldBegin('match_index', TType.I32, 3)
+            oprot.writeI32(self.match_index)
+            oprot.writeFieldEnd()
+        if self.embeddings is not None:
+            oprot.writeFieldBegin('embeddings', TType.LIST, 4)
+            oprot.writeListBegin(TType.STRUCT, len(self.embeddings))
+            for iter377 in self.embeddings:
+                iter377.write(oprot)
+            oprot.writeListEnd()
+            oprot.writeFieldEnd()
+        oprot.writeFieldStop()
+        oprot.writeStructEnd()
+
+    def validate(self):
+        return
+
+    def __repr__(self):
+        L = ['%s=%r' % (key, value)
+             for key, value in self.__dict__.items()]
+        return '%s(%s)' % (self.__class__.__name__, ', '.join(L))
+
+    def __eq__(self, other):
+        return isinstance(other, self.__class__) and self.__dict__ == other.__dict__
+
+    def __ne__(self, other):
+        return not (self == other)
+
+
+class SelectBatchResponse(object):
+    """
+    Attributes:
+     - error_code
+     - error_msg
+     - results
+
+    """
+
+
+    def __init__(self, error_code=None, error_msg=None, results=[
+    ],):
+        self.error_code = error_code
+        self.error_msg = error_msg
+        if results is self.thrift_spec[3][4]:
+            results = [
+            ]
+        self.results = results
+
+    def read(self, iprot):
+        if iprot._fast_decode is not None and isinstance(iprot.trans, TTransport.CReadableTransport) and self.thrift_spec is not None:
+            iprot._fast_decode(self, iprot, [self.__class__, self.thrift_spec])
+            return
+        iprot.readStructBegin()
+        while True:
+            (fname, ftype, fid) = iprot.readFieldBegin()
+            if ftype == TType.STOP:
+                break
+            if fid == 1:
+                if ftype == TType.I64:
+                    self.error_code = iprot.readI64()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 2:
+                if ftype == TType.STRING:
+                    self.error_msg = iprot.readString().decode('utf-8', errors='replace') if sys.version_info[0] == 2 else iprot.readString()
+                else:
+                    iprot.skip(ftype)
+            elif fid == 3:
+                if ftype == TType.LIST:
+                    self.results = []
+                    (_etype381, _size378) = iprot.readListBegin()
+                    for _i382 in range(_size378):
+                        _elem383 = SelectResponse()
+                        _elem383.read(iprot)
+                        self.results.append(_elem383)
+                    iprot.readListEnd()
+                else:
+                    iprot.skip(ftype)
+            else:
+                iprot.skip(ftype)
+            iprot.readFieldEnd()
+        iprot.readStructEnd()
+
+    def write(self, oprot):
+        if oprot._fast_encode is not None and self.thrift_spec is not None:
+            oprot.trans.write(oprot._fast_encode(self, [self.__class__, self.thrift_spec]))
+            return
+        oprot.writeStructBegin('SelectBatchResponse')
+        if self.error_code is not None:
+            oprot.writeFieldBegin('error_code', TType.I64, 1)
+            oprot.writeI64(self.error_code)
+            oprot.writeFieldEnd()
+        if self.error_msg is not None:
+            oprot.writeFieldBegin('error_msg', TType.STRING, 2)
+            oprot.writeString(self.error_msg.encode('utf-8') if sys.version_info[0] == 2 else self.error_msg)
+            oprot.writeFieldEnd()
+        if self.results is not None:
+            oprot.writeFieldBegin('results', TType.LIST, 3)
+            oprot.writeListBegin(TType.STRUCT, len(self.results))
+            for iter384 in self.results:
+                iter384.write(oprot)
             oprot.writeListEnd()
             oprot.writeFieldEnd()
         oprot.writeFieldStop()
@@ -6876,11 +7312,11 @@ class UpdateRequest(object):
             elif fid == 4:
                 if ftype == TType.LIST:
                     self.update_expr_array = []
-                    (_etype367, _size364) = iprot.readListBegin()
-                    for _i368 in range(_size364):
-                        _elem369 = UpdateExpr()
-                        _elem369.read(iprot)
-                        self.update_expr_array.append(_elem369)
+                    (_etype388, _size385) = iprot.readListBegin()
+                    for _i389 in range(_size385):
+                        _elem390 = UpdateExpr()
+                        _elem390.read(iprot)
+                        self.update_expr_array.append(_elem390)
                     iprot.readListEnd()
                 else:
                     iprot.skip(ftype)
@@ -6914,8 +7350,8 @@ class UpdateRequest(object):
         if self.update_expr_array is not None:
             oprot.writeFieldBegin('update_expr_array', TType.LIST, 4)
             oprot.writeListBegin(TType.STRUCT, len(self.update_expr_array))
-            for iter370 in self.update_expr_array:
-                iter370.write(oprot)
+            for iter391 in self.update_expr_array:
+                iter391.write(oprot)
             oprot.writeListEnd()
             oprot.writeFieldEnd()
         if self.session_id is not None:
@@ -8004,6 +8440,7 @@ EmbeddingData.thrift_spec = (
     (8, TType.LIST, 'f64_array_value', (TType.DOUBLE, None, False), None, ),  # 8
     (9, TType.LIST, 'f16_array_value', (TType.DOUBLE, None, False), None, ),  # 9
     (10, TType.LIST, 'bf16_array_value', (TType.DOUBLE, None, False), None, ),  # 10
+    (11, TType.STRING, 'packed_value', 'BINARY', None, ),  # 11
 )
 all_structs.append(InitParameter)
 InitParameter.thrift_spec = (
@@ -8134,6 +8571,15 @@ ColumnField.thrift_spec = (
     ], ),  # 2
     (3, TType.STRING, 'column_name', 'UTF8', None, ),  # 3
 )
+all_structs.append(InsertColumn)
+InsertColumn.thrift_spec = (
+    None,  # 0
+    (1, TType.STRING, 'column_name', 'UTF8', None, ),  # 1
+    (2, TType.I32, 'column_type', None, None, ),  # 2
+    (3, TType.I32, 'element_type', None, None, ),  # 3
+    (4, TType.I32, 'dimension', None, None, ),  # 4
+    (5, TType.STRING, 'column_vector', 'BINARY', None, ),  # 5
+)
 all_structs.append(ImportOption)
 ImportOption.thrift_spec = (
     None,  # 0
@@ -8375,6 +8821,8 @@ InsertRequest.thrift_spec = (
     (4, TType.LIST, 'fields', (TType.STRUCT, [Field, None], False), [
     ], ),  # 4
     (5, TType.I64, 'session_id', None, None, ),  # 5
+    (6, TType.LIST, 'columns', (TType.STRUCT, [InsertColumn, None], False), [
+    ], ),  # 6
 )
 all_structs.append(ImportRequest)
 ImportRequest.thrift_spec = (
@@ -8384,6 +8832,15 @@ ImportRequest.thrift_spec = (
     (3, TType.STRING, 'file_name', 'UTF8', None, ),  # 3
     (4, TType.STRUCT, 'import_option', [ImportOption, None], None, ),  # 4
     (5, TType.I64, 'session_id', None, None, ),  # 5
+    (6, TType.BOOL, 'uploaded', None, False, ),  # 6
+)
+all_structs.append(UploadFileChunkRequest)
+UploadFileChunkRequest.thrift_spec = (
+    None,  # 0
+    (1, TType.I64, 'session_id', None, None, ),  # 1
+    (2, TType.STRING, 'file_name', 'UTF8', None, ),  # 2
+    (3, TType.I64, 'offset', None, None, ),  # 3
+    (4, TType.STRING, 'data', 'BINARY', None, ),  # 4
 )
 all_structs.append(ExportRequest)
 ExportRequest.thrift_spec = (
@@ -8452,6 +8909,23 @@ SelectResponse.thrift_spec = (
     (4, TType.LIST, 'column_fields', (TType.STRUCT, [ColumnField, None], False), [
     ], ),  # 4
 )
+all_structs.append(SelectBatchRequest)
+SelectBatchRequest.thrift_spec = (
+    None,  # 0
+    (1, TType.I64, 'session_id', None, None, ),  # 1
+    (2, TType.STRUCT, 'query', [SelectRequest, None], None, ),  # 2
+    (3, TType.I32, 'match_index', None, None, ),  # 3
+    (4, TType.LIST, 'embeddings', (TType.STRUCT, [EmbeddingData, None], False), [
+    ], ),  # 4
+)
+all_structs.append(SelectBatchResponse)
+SelectBatchResponse.thrift_spec = (
+    None,  # 0
+    (1, TType.I64, 'error_code', None, None, ),  # 1
+    (2, TType.STRING, 'error_msg', 'UTF8', None, ),  # 2
+    (3, TType.LIST, 'results', (TType.STRUCT, [SelectResponse, None], False), [
+    ], ),  # 3
+)
 all_structs.append(DeleteRequest)
 DeleteRequest.thrift_spec = (
     None,  # 0
@@ -0,0 +1,337 @@
+# Copyright(C) 2023 InfiniFlow, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import collections
+import functools
+from abc import ABC
+from concurrent.futures import Future
+from typing import Callable, Optional, Union, Any
+
+from thrift.Thrift import TApplicationException
+
+import infinity.remote_thrift.infinity_thrift_rpc.ttypes as ttypes
+from infinity.common import InfinityException, DEFAULT_PIPELINE_MAX_IN_FLIGHT
+from infinity.errors import ErrorCode
+from infinity.remote_thrift.client import ThriftInfinityClient, ServiceClient
+from infinity.remote_thrift.query_builder import Query, ExplainQuery
+from infinity.remote_thrift.table import RemoteTable, get_where_expr, get_update_exprs
+from infinity.remote_thrift.types import build_result
+from infinity.remote_thrift.utils import select_res_to_polars
+
+
+def check_response(res):
+    if res.error_code == ErrorCode.OK:
+        return res
+    else:
+        raise InfinityException(res.error_code, res.error_msg)
+
+
+class PipelineFuture(Future):
+    """
+    The result of a request sent in a pipeline. result() and exception() read the responses of the
+    pipeline, in the order their requests were sent, up to the one of this request.
+    """
+
+    def __init__(self, pipeline: "Pipeline"):
+        super().__init__()
+        self._pipeline = pipeline
+
+    def cancel(self):
+        # the request is on its way, its response has to be read anyway
+        return False
+
+    def result(self, timeout: Optional[float] = None):
+        self._pipeline.wait(self)
+        return super().result(timeout)
+
+    def exception(self, timeout: Optional[float] = None):
+        self._pipeline.wait(self)
+        return super().exception(timeout)
+
+    def then(self, fn: Callable[[Any], Any]) -> "PipelineFuture":
+        # fn runs on the result when the response is read, it fails the returned future if it raises
+        future = PipelineFuture(self._pipeline)
+
+        def resolve(done: Future):
+            try:
+                future.set_result(fn(done.result()))
+            except BaseException as e:
+                future.set_exception(e)
+
+        self.add_done_callback(resolve)
+        return future
+
+
+class WaitingServiceClient:
+    # stands in for the service client of a connection while a pipeline is open, a call first reads the
+    # pending responses
+    def __init__(self, pipeline: "Pipeline", service):
+        self._pipeline = pipeline
+        self._service = service
+
+    def __getattr__(self, name):
+        call = getattr(self._service, name)
+
+        @functools.wraps(call)
+        def wrapper(*args, **kwargs):
+            self._pipeline.wait()
+            return call(*args, **kwargs)
+
+        return wrapper
+
+
+class PipelinedThriftInfinityClient(ThriftInfinityClient):
+    """
+    The client of the tables of a pipeline. The request building methods are those of ThriftInfinityClient,
+    here they return the PipelineFuture of the response, sent over the socket and session of the connection.
+    The requests of a pipeline aren't retried: the requests sent after a failed one fail with it.
+    """
+
+    def __init__(self, client: ThriftInfinityClient, pipeline: "Pipeline"):
+        # the socket belongs to client, this one never disconnects it
+        self._is_connected = False
+        self.session_id = client.session_id
+        self.uri = client.uri
+        self.protocol_type = client.protocol_type
+        self.transport_type = client.transport_type
+        self.check_params = client.check_params
+        self.client = ServiceClient(pipeline.send)
+
+
+class Pipeline:
+    """
+    Sends requests of a connection back to back, without waiting for the response of the previous one. The
+    server answers the requests of a connection one after another, so the responses are read in the order
+    of the requests. At most max_in_flight requests wait for their response: sending one more first reads
+    the oldest response, so that neither side blocks on a full socket buffer while the other writes.
+    """
+
+    def __init__(self, client: ThriftInfinityClient, max_in_flight: int = DEFAULT_PIPELINE_MAX_IN_FLIGHT):
+        if max_in_flight < 1:
+            raise InfinityException(ErrorCode.INVALID_PARAMETER_VALUE,
+                                    f"max_in_flight must be positive, got {max_in_flight}")
+        self.max_in_flight = max_in_flight
+        self._client = client
+        # the socket and the service client of the connection while the pipeline is open
+        self._channel = None
+        self._service = None
+        # (RPC name, future) of the requests sent, the oldest first
+        self._pending = collections.deque()
+        # the transport error which broke the connection
+        self._error = None
+        self._conn = PipelinedThriftInfinityClient(client, self)
+
+    def __enter__(self):
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    def open(self):
+        if isinstance(self._client.client, WaitingServiceClient):
+            raise InfinityException(ErrorCode.INVALID_PARAMETER_VALUE, "The connection already has an open pipeline")
+        self._channel = self._client._get_channel()
+        self._client._pipelined = True
+        self._error = None
+        # the other calls on the connection wait for the responses of the pipeline
+        self._service = self._client.client
+        self._client.client = WaitingServiceClient(self, self._service)
+        self._conn.session_id = self._channel.session_id
+
+    def close(self):
+        # the responses of all the requests sent are read, the connection can be used as before
+        if self._channel is None:
+            return
+        try:
+            self.wait()
+        finally:
+            self._client.client = self._service
+            self._client._pipelined = False
+            self._channel = None
+            self._service = None
+
+    def table(self, table: RemoteTable) -> "PipelinedRemoteTable":
+        if table._conn is not self._client:
+            raise InfinityException(ErrorCode.INVALID_PARAMETER_VALUE,
+                                    f"Table {table._table_name} isn't a table of the pipelined connection")
+        return PipelinedRemoteTable(self._conn, table)
+
+    def send(self, name: str, request) -> PipelineFuture:
+        if self._channel is None:
+            raise InfinityException(ErrorCode.CLIENT_CLOSE, "The pipeline isn't open")
+        while len(self._pending) >= self.max_in_flight and self._error is None:
+            self._receive()
+        if self._error is not None:
+            raise self._error
+        if not self._pending:
+            # the calls between two requests of the pipeline may have reopened the socket of the connection
+            self._channel = self._client._get_channel()
+        future = PipelineFuture(self)
+        try:
+            self._channel.send(name, request)
+        except BaseException as e:
+            # a part of the request may have been written
+            self._fail(e)
+            raise
+        self._pending.append((name, future))
+        return future
+
+    def wait(self, future: Optional[Future] = None):
+        # reads the responses up to the one of future, or all of them
+        while self._pending and (future is None or not future.done()):
+            self._receive()
+
+    def _receive(self):
+        name, future = self._pending.popleft()
+        try:
+            res = self._channel.receive(name)
+        except TApplicationException as e:
+            # the server failed this request only, the message was read to its end
+            future.set_exception(e)
+            return
+        except BaseException as e:
+            future.set_exception(e)
+            self._fail(e)
+            if not isinstance(e, Exception):
+                raise
+            return
+        future.set_result(res)
+
+    def _fail(self, error: BaseException):
+        # the stream is out of step, the pending requests fail and the socket is closed, the next call on the
+        # connection opens a new one
+        self._error = error
+        pending, self._pending = self._pending, collections.deque()
+        for _, future in pending:
+            future.set_exception(error)
+        self._channel.close()
+
+
+class PipelinedRemoteTable(RemoteTable, ABC):
+    """
+    A table of a pipeline. Queries, insert, delete and update return a PipelineFuture of what the method of
+    RemoteTable returns, the query builder methods stay synchronous. The other methods are not pipelined,
+    they run on the table of the connection once the pending responses are read.
+    """
+
+    def __init__(self, conn: PipelinedThriftInfinityClient, table: RemoteTable):
+        super().__init__(conn, table._db_name, table._table_name)
+        self._table = table
+
+    def _send_insert(self, request: Callable[[], PipelineFuture]):
+        return request().then(check_response)
+
+    def delete(self, cond: Optional[str] = None):
+        return self._conn.delete(db_name=self._db_name, table_name=self._table_name,
+                                 where_expr=get_where_expr(cond)).then(check_response)
+
+    def update(self, cond: Optional[str],
+               data: Optional[list[dict[str, Union[str, int, float, list[Union[int, float]]]]]]):
+        return self._conn.update(db_name=self._db_name, table_name=self._table_name,
+                                 where_expr=get_where_expr(cond),
+                                 update_expr_array=get_update_exprs(data)).then(check_response)
+
+    def optimize(self, index_name: str, opt_params: dict[str, str]):
+        return self._table.optimize(index_name, opt_params)
+
+    def _execute_query(self, query: Query, sparse_format: str = "dict", tensor_format: str = "list",
+                       lazy: bool = False):
+        return self._build_query_result(query, functools.partial(
+            build_result, sparse_format=sparse_format, tensor_format=tensor_format, lazy=lazy))
+
+    def _build_query_result(self, query: Query, build: Callable[[ttypes.SelectResponse], Any]):
+        if query.batch_embeddings is None:
+            return self._execute_query_raw(query).then(build)
+        return self._execute_batch_query_raw(query).then(lambda results: [build(res) for res in results])
+
+    def _execute_query_raw(self, query: Query) -> PipelineFuture:
+        return self._conn.select(db_name=self._db_name,
+                                 table_name=self._table_name,
+                                 select_list=query.columns,
+                                 search_expr=query.search,
+                                 where_expr=query.filter,
+                                 group_by_list=None,
+                                 limit_expr=query.limit,
+                                 offset_expr=query.offset).then(check_response)
+
+    def _execute_batch_query_raw(self, query: Query) -> PipelineFuture:
+        return self._conn.select_batch(db_name=self._db_name,
+                                       table_name=self._table_name,
+                                       select_list=query.columns,
+                                       search_expr=query.search,
+                                       where_expr=query.filter,
+                                       group_by_list=None,
+                                       limit_expr=query.limit,
+                                       offset_expr=query.offset,
+                                       match_index=query.batch_match_index,
+                                       embeddings=query.batch_embeddings).then(
+            lambda res: check_response(res).results)
+
+    def _explain_query(self, query: ExplainQuery) -> PipelineFuture:
+        return self._conn.explain(db_name=self._db_name,
+                                  table_name=self._table_name,
+                                  select_list=query.columns,
+                                  search_expr=query.search,
+                                  where_expr=query.filter,
+                                  group_by_list=None,
+                                  limit_expr=query.limit,
+                                  offset_expr=query.offset,
+                                  explain_type=query.explain_type.to_ttype()).then(
+            lambda res: select_res_to_polars(check_response(res)))
+
+    # not pipelined
+
+    def create_index(self, *args, **kwargs):
+        return self._table.create_index(*args, **kwargs)
+
+    def drop_index(self, *args, **kwargs):
+        return self._table.drop_index(*args, **kwargs)
+
+    def show_index(self, *args, **kwargs):
+        return self._table.show_index(*args, **kwargs)
+
+    def list_indexes(self):
+        return self._table.list_indexes()
+
+    def show_segments(self):
+        return self._table.show_segments()
+
+    def show_segment(self, *args, **kwargs):
+        return self._table.show_segment(*args, **kwargs)
+
+    def show_blocks(self, *args, **kwargs):
+        return self._table.show_blocks(*args, **kwargs)
+
+    def show_block(self, *args, **kwargs):
+        return self._table.show_block(*args, **kwargs)
+
+    def show_block_column(self, *args, **kwargs):
+        return self._table.show_block_column(*args, **kwargs)
+
+    def writer(self, *args, **kwargs):
+        return self._table.writer(*args, **kwargs)
+
+    def import_data(self, *args, **kwargs):
+        return self._table.import_data(*args, **kwargs)
+
+    def import_dataframe(self, *args, **kwargs):
+        return self._table.import_dataframe(*args, **kwargs)
+
+    def export_data(self, *args, **kwargs):
+        return self._table.export_data(*args, **kwargs)
@@ -14,9 +14,12 @@
 import functools
 import inspect
 import os
+import tempfile
+import uuid
 import numpy as np
+import pyarrow.parquet as pq
 from abc import ABC
-from typing import Optional, Union, List, Any
+from typing import Callable, Optional, Union, List, Any
 
 from sqlglot import condition
 
@@ -25,12 +28,133 @@ from infinity.common import INSERT_DATA, VEC, InfinityException, SparseVector
 from infinity.errors import ErrorCode
 from infinity.index import IndexInfo
 from infinity.remote_thrift.query_builder import Query, InfinityThriftQueryBuilder, ExplainQuery
-from infinity.remote_thrift.types import build_result
-from infinity.remote_thrift.utils import traverse_conditions, name_validity_check, select_res_to_polars
+from infinity.remote_thrift.types import build_result, numpy_to_insert_column
+from infinity.remote_thrift.utils import traverse_conditions, name_validity_check, select_res_to_polars, \
+    get_create_conflict, get_drop_conflict
 from infinity.remote_thrift.utils import get_remote_constant_expr_from_python_value
 from infinity.table import Table, ExplainType
-from infinity.common import ConflictType, DEFAULT_MATCH_VECTOR_TOPN
-from infinity.utils import deprecated_api
+from infinity.common import ConflictType, DEFAULT_MATCH_VECTOR_TOPN, DEFAULT_WRITER_MAX_ROWS, DEFAULT_WRITER_MAX_BYTES, \
+    DEFAULT_WRITER_INFLIGHT, DEFAULT_UPLOAD_CHUNK_SIZE
+from infinity.table_writer import TableWriter
+from infinity.utils import deprecated_api, to_insert_columns, to_import_table
+
+
+def get_import_option(import_options: {} = None) -> ttypes.ImportOption:
+    options = ttypes.ImportOption()
+    options.has_header = False
+    options.delimiter = ','
+    options.copy_file_type = ttypes.CopyFileType.CSV
+    if import_options != None:
+        for k, v in import_options.items():
+            key = k.lower()
+            if key == 'file_type':
+                file_type = v.lower()
+                if file_type == 'csv':
+                    options.copy_file_type = ttypes.CopyFileType.CSV
+                elif file_type == 'json':
+                    options.copy_file_type = ttypes.CopyFileType.JSON
+                elif file_type == 'jsonl':
+                    options.copy_file_type = ttypes.CopyFileType.JSONL
+                elif file_type == 'fvecs':
+                    options.copy_file_type = ttypes.CopyFileType.FVECS
+                elif file_type == 'csr':
+                    options.copy_file_type = ttypes.CopyFileType.CSR
+                elif file_type == 'bvecs':
+                    options.copy_file_type = ttypes.CopyFileType.BVECS
+                elif file_type == 'parquet':
+                    options.copy_file_type = ttypes.CopyFileType.PARQUET
+                else:
+                    raise InfinityException(ErrorCode.IMPORT_FILE_FORMAT_ERROR, f"Unrecognized export file type: {file_type}")
+            elif key == 'delimiter':
+                delimiter = v.lower()
+                if len(delimiter) != 1:
+                    raise InfinityException(ErrorCode.IMPORT_FILE_FORMAT_ERROR, f"Unrecognized export file delimiter: {delimiter}")
+                options.delimiter = delimiter[0]
+            elif key == 'header':
+                if isinstance(v, bool):
+                    options.has_header = v
+                else:
+                    raise InfinityException(ErrorCode.IMPORT_FILE_FORMAT_ERROR, "Boolean value is expected in header field")
+            else:
+                raise InfinityException(ErrorCode.IMPORT_FILE_FORMAT_ERROR, f"Unknown export parameter: {k}")
+    return options
+
+
+def get_export_option(export_options: {} = None) -> ttypes.ExportOption:
+    options = ttypes.ExportOption()
+    options.has_header = False
+    options.delimiter = ','
+    options.copy_file_type = ttypes.CopyFileType.CSV
+    options.offset = 0
+    options.limit = 0
+    options.row_limit = 0
+
+    if export_options != None:
+        for k, v in export_options.items():
+            key = k.lower()
+            if key == 'file_type':
+                file_type = v.lower()
+                if file_type == 'csv':
+                    options.copy_file_type = ttypes.CopyFileType.CSV
+                elif file_type == 'jsonl':
+                    options.copy_file_type = ttypes.CopyFileType.JSONL
+                elif file_type == 'fvecs':
+                    options.copy_file_type = ttypes.CopyFileType.FVECS
+                else:
+                    raise InfinityException(ErrorCode.IMPORT_FILE_FORMAT_ERROR, f"Unrecognized export file type: {file_type}")
+            elif key == 'delimiter':
+                delimiter = v.lower()
+                if len(delimiter) != 1:
+                    raise InfinityException(ErrorCode.IMPORT_FILE_FORMAT_ERROR, f"Unrecognized export file delimiter: {delimiter}")
+                options.delimiter = delimiter[0]
+            elif key == 'header':
+                if isinstance(v, bool):
+                    options.has_header = v
+                else:
+                    raise InfinityException(ErrorCode.IMPORT_FILE_FORMAT_ERROR, "Boolean value is expected in header field")
+            elif key == 'offset':
+                if isinstance(v, int):
+                    options.offset = v
+                else:
+                    raise InfinityException(ErrorCode.IMPORT_FILE_FORMAT_ERROR, "Integer value is expected in 'offset' field")
+            elif key == 'limit':
+                if isinstance(v, int):
+                    options.limit = v
+                else:
+                    raise InfinityException(ErrorCode.IMPORT_FILE_FORMAT_ERROR, "Integer value is expected in 'limit' field")
+            elif key == 'row_limit':
+                if isinstance(v, int):
+                    options.row_limit = v
+                else:
+                    raise InfinityException(ErrorCode.IMPORT_FILE_FORMAT_ERROR, "Integer value is expected in 'row_limit' field")
+            else:
+                raise InfinityException(ErrorCode.IMPORT_FILE_FORMAT_ERROR, f"Unknown export parameter: {k}")
+    return options
+
+
+def get_where_expr(cond: Optional[str]) -> Optional[ttypes.ParsedExpr]:
+    match cond:
+        case None:
+            return None
+        case _:
+            return traverse_conditions(condition(cond))
+
+
+def get_update_exprs(data: Optional[list[dict]]) -> Optional[list[ttypes.UpdateExpr]]:
+    # [{"c1": 1, "c2": 1.1}]
+    match data:
+        case None:
+            return None
+        case _:
+            update_expr_array: list[ttypes.UpdateExpr] = []
+            for row in data:
+                for column_name, value in row.items():
+                    constant_expression = get_remote_constant_expr_from_python_value(value)
+                    expr_type = ttypes.ParsedExprType(constant_expr=constant_expression)
+                    paser_expr = ttypes.ParsedExpr(type=expr_type)
+                    update_expr = ttypes.UpdateExpr(column_name=column_name, value=paser_expr)
+                    update_expr_array.append(update_expr)
+            return update_expr_array
 
 
 class RemoteTable(Table, ABC):
@@ -42,17 +166,21 @@ class RemoteTable(Table, ABC):
         self.query_builder = InfinityThriftQueryBuilder(table=self)
 
     def params_type_check(func):
+        # the annotations are collected once, not on every call
+        params = inspect.signature(func).parameters
+        annotations = [(param.name, param.annotation) for param in params.values()]
+        kwarg_annotations = {name: annotation for name, annotation in annotations if annotation is not inspect.Parameter.empty}
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            sig = inspect.signature(func)
-            params = sig.parameters
-            for arg, param in zip(args, params.values()):
-                if param.annotation is not param.empty and not isinstance(arg, param.annotation):
-                    raise TypeError(f"TypeError: Argument {param.name} must be {param.annotation}")
-            for kwarg, value in kwargs.items():
-                if params[kwarg].annotation is not params[kwarg].empty and not isinstance(value,
-                                                                                          params[kwarg].annotation):
-                    raise TypeError(f"TypeError: Argument {kwarg} must be {params[kwarg].annotation}")
+            if args[0]._conn.check_params:
+                for arg, (name, annotation) in zip(args, annotations):
+                    if annotation is not inspect.Parameter.empty and not isinstance(arg, annotation):
+                        raise TypeError(f"TypeError: Argument {name} must be {annotation}")
+                for kwarg, value in kwargs.items():
+                    annotation = kwarg_annotations.get(kwarg)
+                    if annotation is not None and not isinstance(value, annotation):
+                        raise TypeError(f"TypeError: Argument {kwarg} must be {annotation}")
             return func(*args, **kwargs)
 
         return wrapper
@@ -64,21 +192,11 @@ class RemoteTable(Table, ABC):
 
         index_info_to_use = index_info.to_ttype()
 
-        create_index_conflict: ttypes.CreateConflict
-        if conflict_type == ConflictType.Error:
-            create_index_conflict = ttypes.CreateConflict.Error
-        elif conflict_type == ConflictType.Ignore:
-            create_index_conflict = ttypes.CreateConflict.Ignore
-        elif conflict_type == ConflictType.Replace:
-            create_index_conflict = ttypes.CreateConflict.Replace
-        else:
-            raise InfinityException(ErrorCode.INVALID_CONFLICT_TYPE, f"Invalid conflict type")
-
         res = self._conn.create_index(db_name=self._db_name,
                                       table_name=self._table_name,
                                       index_name=index_name,
                                       index_info=index_info_to_use,
-                                      conflict_type=create_index_conflict)
+                                      conflict_type=get_create_conflict(conflict_type))
 
         if res.error_code == ErrorCode.OK:
             return res
@@ -87,16 +205,8 @@ class RemoteTable(Table, ABC):
 
     @name_validity_check("index_name", "Index")
     def drop_index(self, index_name: str, conflict_type: ConflictType = ConflictType.Error):
-        drop_index_conflict: ttypes.DropConflict
-        if conflict_type == ConflictType.Error:
-            drop_index_conflict = ttypes.DropConflict.Error
-        elif conflict_type == ConflictType.Ignore:
-            drop_index_conflict = ttypes.DropConflict.Ignore
-        else:
-            raise InfinityException(ErrorCode.INVALID_CONFLICT_TYPE, f"Invalid conflict type")
-
         res = self._conn.drop_index(db_name=self._db_name, table_name=self._table_name,
-                                    index_name=index_name, conflict_type=drop_index_conflict)
+                                    index_name=index_name, conflict_type=get_drop_conflict(conflict_type))
         if res.error_code == ErrorCode.OK:
             return res
         else:
@@ -157,11 +267,31 @@ class RemoteTable(Table, ABC):
 
     def insert(self, data: Union[INSERT_DATA, list[INSERT_DATA]]):
         # [{"c1": 1, "c2": 1.1}, {"c1": 2, "c2": 2.2}]
+        return self._send_insert(self._encode_insert(data))
+
+    def insert_columns(self, columns: dict[str, np.ndarray]):
+        # {"c1": np.array([1, 2]), "c2": np.array([1.1, 2.2])}, one entry per row
+        return self._send_insert(self._encode_insert(columns, columnar=True))
+
+    def writer(self, max_rows: int = DEFAULT_WRITER_MAX_ROWS, max_bytes: int = DEFAULT_WRITER_MAX_BYTES,
+               inflight: int = DEFAULT_WRITER_INFLIGHT) -> TableWriter:
+        return TableWriter(self, max_rows, max_bytes, inflight)
+
+    def _encode_insert(self, data: Union[INSERT_DATA, list[INSERT_DATA]],
+                       columnar: bool = False) -> Callable[[], ttypes.CommonResponse]:
+        # builds the insert request, the RPC is only made when the returned call is made
         db_name = self._db_name
         table_name = self._table_name
         column_names: list[str] = []
         fields: list[ttypes.Field] = []
 
+        columns = to_insert_columns(data, columnar)
+        if columns is not None:
+            # DataFrame, Arrow Table or insert_columns, sent as one packed buffer per column
+            insert_columns = [numpy_to_insert_column(column_name, values) for column_name, values in columns.items()]
+            return functools.partial(self._conn.insert_columns, db_name=db_name, table_name=table_name,
+                                     columns=insert_columns)
+
         if isinstance(data, dict):
             data = [data]
 
@@ -177,109 +307,60 @@ class RemoteTable(Table, ABC):
             field = ttypes.Field(parse_exprs=parse_exprs)
             fields.append(field)
 
-        res = self._conn.insert(db_name=db_name, table_name=table_name, column_names=column_names,
-                                fields=fields)
+        return functools.partial(self._conn.insert, db_name=db_name, table_name=table_name,
+                                 column_names=column_names, fields=fields)
+
+    def _send_insert(self, request: Callable[[], ttypes.CommonResponse]):
+        res = request()
         if res.error_code == ErrorCode.OK:
             return res
         else:
             raise InfinityException(res.error_code, res.error_msg)
 
-    def import_data(self, file_path: str, import_options: {} = None):
-        options = ttypes.ImportOption()
-        options.has_header = False
-        options.delimiter = ','
-        options.copy_file_type = ttypes.CopyFileType.CSV
-        if import_options != None:
-            for k, v in import_options.items():
-                key = k.lower()
-                if key == 'file_type':
-                    file_type = v.lower()
-                    if file_type == 'csv':
-                        options.copy_file_type = ttypes.CopyFileType.CSV
-                    elif file_type == 'json':
-                        options.copy_file_type = ttypes.CopyFileType.JSON
-                    elif file_type == 'jsonl':
-                        options.copy_file_type = ttypes.CopyFileType.JSONL
-                    elif file_type == 'fvecs':
-                        options.copy_file_type = ttypes.CopyFileType.FVECS
-                    elif file_type == 'csr':
-                        options.copy_file_type = ttypes.CopyFileType.CSR
-                    elif file_type == 'bvecs':
-                        options.copy_file_type = ttypes.CopyFileType.BVECS
-                    else:
-                        raise InfinityException(ErrorCode.IMPORT_FILE_FORMAT_ERROR, f"Unrecognized export file type: {file_type}")
-                elif key == 'delimiter':
-                    delimiter = v.lower()
-                    if len(delimiter) != 1:
-                        raise InfinityException(ErrorCode.IMPORT_FILE_FORMAT_ERROR, f"Unrecognized export file delimiter: {delimiter}")
-                    options.delimiter = delimiter[0]
-                elif key == 'header':
-                    if isinstance(v, bool):
-                        options.has_header = v
-                    else:
-                        raise InfinityException(ErrorCode.IMPORT_FILE_FORMAT_ERROR, "Boolean value is expected in header field")
-                else:
-                    raise InfinityException(ErrorCode.IMPORT_FILE_FORMAT_ERROR, f"Unknown export parameter: {k}")
-
+    def import_data(self, file_path: str, import_options: {} = None, upload: bool = False):
+        options = get_import_option(import_options)
+        file_name = self._upload_file(file_path) if upload else file_path
         res = self._conn.import_data(db_name=self._db_name,
                                      table_name=self._table_name,
-                                     file_name=file_path,
-                                     import_options=options)
+                                     file_name=file_name,
+                                     import_options=options,
+                                     uploaded=upload)
         if res.error_code == ErrorCode.OK:
             return res
         else:
             raise InfinityException(res.error_code, res.error_msg)
 
-    def export_data(self, file_path: str, export_options: {} = None, columns: [str] = None):
-        options = ttypes.ExportOption()
-        options.has_header = False
-        options.delimiter = ','
-        options.copy_file_type = ttypes.CopyFileType.CSV
-        options.offset = 0
-        options.limit = 0
-        options.row_limit = 0
-
-        if export_options != None:
-            for k, v in export_options.items():
-                key = k.lower()
-                if key == 'file_type':
-                    file_type = v.lower()
-                    if file_type == 'csv':
-                        options.copy_file_type = ttypes.CopyFileType.CSV
-                    elif file_type == 'jsonl':
-                        options.copy_file_type = ttypes.CopyFileType.JSONL
-                    elif file_type == 'fvecs':
-                        options.copy_file_type = ttypes.CopyFileType.FVECS
-                    else:
-                        raise InfinityException(ErrorCode.IMPORT_FILE_FORMAT_ERROR, f"Unrecognized export file type: {file_type}")
-                elif key == 'delimiter':
-                    delimiter = v.lower()
-                    if len(delimiter) != 1:
-                        raise InfinityException(ErrorCode.IMPORT_FILE_FORMAT_ERROR, f"Unrecognized export file delimiter: {delimiter}")
-                    options.delimiter = delimiter[0]
-                elif key == 'header':
-                    if isinstance(v, bool):
-                        options.has_header = v
-                    else:
-                        raise InfinityException(ErrorCode.IMPORT_FILE_FORMAT_ERROR, "Boolean value is expected in header field")
-                elif key == 'offset':
-                    if isinstance(v, int):
-                        options.offset = v
-                    else:
-                        raise InfinityException(ErrorCode.IMPORT_FILE_FORMAT_ERROR, "Integer value is expected in 'offset' field")
-                elif key == 'limit':
-                    if isinstance(v, int):
-                        options.limit = v
-                    else:
-                        raise InfinityException(ErrorCode.IMPORT_FILE_FORMAT_ERROR, "Integer value is expected in 'limit' field")
-                elif key == 'row_limit':
-                    if isinstance(v, int):
-                        options.row_limit = v
-                    else:
-                        raise InfinityException(ErrorCode.IMPORT_FILE_FORMAT_ERROR, "Integer value is expected in 'row_limit' field")
-                else:
-                    raise InfinityException(ErrorCode.IMPORT_FILE_FORMAT_ERROR, f"Unknown export parameter: {k}")
+    def _upload_file(self, file_path: str) -> str:
+        if not os.path.isfile(file_path):
+            raise InfinityException(ErrorCode.FILE_NOT_FOUND, f"File: {file_path} isn't found")
+        # the server keeps the file under this name until it is imported or the session ends
+        file_name = uuid.uuid4().hex
+        offset = 0
+        with open(file_path, "rb") as f:
+            while True:
+                # an empty file is still sent as one empty chunk
+                chunk = f.read(DEFAULT_UPLOAD_CHUNK_SIZE)
+                res = self._conn.upload_file_chunk(file_name, offset, chunk)
+                if res.error_code != ErrorCode.OK:
+                    raise InfinityException(res.error_code, res.error_msg)
+                offset += len(chunk)
+                if len(chunk) < DEFAULT_UPLOAD_CHUNK_SIZE:
+                    return file_name
+
+    def import_dataframe(self, data):
+        res = self._conn.show_columns(db_name=self._db_name, table_name=self._table_name)
+        if res.error_code != ErrorCode.OK:
+            raise InfinityException(res.error_code, res.error_msg)
+        columns = select_res_to_polars(res)
+        table = to_import_table(data, list(zip(columns["column_name"], columns["column_type"])))
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = os.path.join(temp_dir, "import.parquet")
+            # the server reads the whole file anyway, compressing it only costs time on both sides
+            pq.write_table(table, file_path, compression="none")
+            return self.import_data(file_path, {"file_type": "parquet"}, upload=True)
 
+    def export_data(self, file_path: str, export_options: {} = None, columns: [str] = None):
+        options = get_export_option(export_options)
         res = self._conn.export_data(db_name=self._db_name,
                                      table_name=self._table_name,
                                      file_name=file_path,
@@ -291,13 +372,8 @@ class RemoteTable(Table, ABC):
             raise InfinityException(res.error_code, res.error_msg)
 
     def delete(self, cond: Optional[str] = None):
-        match cond:
-            case None:
-                where_expr = None
-            case _:
-                where_expr = traverse_conditions(condition(cond))
         res = self._conn.delete(
-            db_name=self._db_name, table_name=self._table_name, where_expr=where_expr)
+            db_name=self._db_name, table_name=self._table_name, where_expr=get_where_expr(cond))
         if res.error_code == ErrorCode.OK:
             return res
         else:
@@ -305,27 +381,8 @@ class RemoteTable(Table, ABC):
 
     def update(self, cond: Optional[str],
                data: Optional[list[dict[str, Union[str, int, float, list[Union[int, float]]]]]]):
-        # {"c1": 1, "c2": 1.1}
-        match cond:
-            case None:
-                where_expr = None
-            case _:
-                where_expr = traverse_conditions(condition(cond))
-        match data:
-            case None:
-                update_expr_array = None
-            case _:
-                update_expr_array: list[ttypes.UpdateExpr] = []
-                for row in data:
-                    for column_name, value in row.items():
-                        constant_expression = get_remote_constant_expr_from_python_value(value)
-                        expr_type = ttypes.ParsedExprType(constant_expr=constant_expression)
-                        paser_expr = ttypes.ParsedExpr(type=expr_type)
-                        update_expr = ttypes.UpdateExpr(column_name=column_name, value=paser_expr)
-                        update_expr_array.append(update_expr)
-
-        res = self._conn.update(db_name=self._db_name, table_name=self._table_name, where_expr=where_expr,
-                                update_expr_array=update_expr_array)
+        res = self._conn.update(db_name=self._db_name, table_name=self._table_name, where_expr=get_where_expr(cond),
+                                update_expr_array=get_update_exprs(data))
         if res.error_code == ErrorCode.OK:
             return res
         else:
@@ -382,8 +439,8 @@ class RemoteTable(Table, ABC):
         self.query_builder.offset(offset)
         return self
 
-    def to_result(self):
-        return self.query_builder.to_result()
+    def to_result(self, sparse_format: str = "dict", tensor_format: str = "list", lazy: bool = False):
+        return self.query_builder.to_result(sparse_format, tensor_format, lazy)
 
     def to_df(self):
         return self.query_builder.to_df()
@@ -394,6 +451,13 @@ class RemoteTable(Table, ABC):
     def to_arrow(self):
         return self.query_builder.to_arrow()
 
+    def to_numpy(self):
+        return self.query_builder.to_numpy()
+
+    def prepare(self):
+        # builds the pending query once, Param values and :name filter literals are bound per execution
+        return self.query_builder.prepare()
+
     def explain(self, explain_type: ExplainType = ExplainType.Physical):
         return self.query_builder.explain(explain_type)
 
@@ -403,7 +467,20 @@ class RemoteTable(Table, ABC):
         opt_options.opt_params = [ttypes.InitParameter(k, v) for k, v in opt_params.items()]
         return self._conn.optimize(db_name=self._db_name, table_name=self._table_name, optimize_opt=opt_options)
 
-    def _execute_query(self, query: Query) -> tuple[dict[str, list[Any]], dict[str, Any]]:
+    def _execute_query(self, query: Query, sparse_format: str = "dict", tensor_format: str = "list",
+                       lazy: bool = False) -> \
+            tuple[dict[str, list[Any]], dict[str, Any]]:
+        # process the results
+        return self._build_query_result(query, functools.partial(
+            build_result, sparse_format=sparse_format, tensor_format=tensor_format, lazy=lazy))
+
+    def _build_query_result(self, query: Query, build: Callable[[ttypes.SelectResponse], Any]):
+        # a match_dense given a matrix of query vectors returns a list, one result per vector
+        if query.batch_embeddings is None:
+            return build(self._execute_query_raw(query))
+        return [build(res) for res in self._execute_batch_query_raw(query)]
+
+    def _execute_query_raw(self, query: Query) -> ttypes.SelectResponse:
 
         # execute the query
         res = self._conn.select(db_name=self._db_name,
@@ -415,9 +492,24 @@ class RemoteTable(Table, ABC):
                                 limit_expr=query.limit,
                                 offset_expr=query.offset)
 
-        # process the results
         if res.error_code == ErrorCode.OK:
-            return build_result(res)
+            return res
+        else:
+            raise InfinityException(res.error_code, res.error_msg)
+
+    def _execute_batch_query_raw(self, query: Query) -> list[ttypes.SelectResponse]:
+        res = self._conn.select_batch(db_name=self._db_name,
+                                      table_name=self._table_name,
+                                      select_list=query.columns,
+                                      search_expr=query.search,
+                                      where_expr=query.filter,
+                                      group_by_list=None,
+                                      limit_expr=query.limit,
+                                      offset_expr=query.offset,
+                                      match_index=query.batch_match_index,
+                                      embeddings=query.batch_embeddings)
+        if res.error_code == ErrorCode.OK:
+            return res.results
         else:
             raise InfinityException(res.error_code, res.error_msg)
 
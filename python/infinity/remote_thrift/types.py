@@ -12,16 +12,19 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
 import struct
 import numpy as np
-from infinity.common import VEC, SparseVector, InfinityException
+from infinity.common import VEC, SparseVector, SparseMatrix, RaggedTensor, LazyColumns, InfinityException
 from infinity.remote_thrift.infinity_thrift_rpc.ttypes import *
 from collections import defaultdict
 from typing import Any, Tuple, Dict, List, Optional
 
 import polars as pl
+import pyarrow as pa
 from numpy import dtype
 from infinity.errors import ErrorCode
+from infinity.utils import pack_embedding
 
 import infinity.remote_thrift.infinity_thrift_rpc.ttypes as ttypes
 
@@ -154,253 +157,370 @@ def logic_type_to_pl_type(ttype: ttypes.DataType):
                         raise NotImplementedError(f"Unsupported type {ttype}")
 
 
-def column_vector_to_list(column_type: ttypes.ColumnType, column_data_type: ttypes.DataType, column_vectors) -> \
-        list[Any, ...]:
+def element_type_to_numpy_dtype(element_type: ttypes.ElementType) -> dtype:
+    match element_type:
+        case ttypes.ElementType.ElementBit:
+            return dtype('<u1')
+        case ttypes.ElementType.ElementUInt8:
+            return dtype('<u1')
+        case ttypes.ElementType.ElementInt8:
+            return dtype('<i1')
+        case ttypes.ElementType.ElementInt16:
+            return dtype('<i2')
+        case ttypes.ElementType.ElementInt32:
+            return dtype('<i4')
+        case ttypes.ElementType.ElementInt64:
+            return dtype('<i8')
+        case ttypes.ElementType.ElementFloat32:
+            return dtype('<f4')
+        case ttypes.ElementType.ElementFloat64:
+            return dtype('<f8')
+        case ttypes.ElementType.ElementFloat16:
+            return dtype('<f2')
+        case ttypes.ElementType.ElementBFloat16:
+            # numpy has no bfloat16, the raw values are widened to float32 by bfloat16_to_float32
+            return dtype('<u2')
+        case _:
+            raise NotImplementedError(f"Unsupported type {element_type}")
+
+
+def bfloat16_to_float32(binary_data) -> np.ndarray:
+    # bfloat16 is the upper half of a float32, shift it back into place
+    tmp_u16 = np.frombuffer(binary_data, dtype='<u2')
+    return (tmp_u16.astype('<u4') << 16).view('<f4')
+
+
+def to_object_array(values: list) -> np.ndarray:
+    # np.array() would try to broadcast equal-length nested lists into extra dimensions
+    result = np.empty(len(values), dtype=object)
+    for i, value in enumerate(values):
+        result[i] = value
+    return result
+
+
+def embedding_to_numpy(column_data_type: ttypes.DataType, binary_data) -> np.ndarray:
+    """
+    Decode a buffer of fixed-size embeddings into a (rows, dimension) array of the element type.
+    Bit embeddings keep their packed layout, i.e. (rows, dimension // 8) uint8.
+    """
+    dimension = column_data_type.physical_type.embedding_type.dimension
+    element_type = column_data_type.physical_type.embedding_type.element_type
+    if element_type == ttypes.ElementType.ElementBit:
+        if dimension % 8 != 0:
+            raise ValueError(f"Unsupported dimension {dimension}")
+        dimension //= 8
+    if element_type == ttypes.ElementType.ElementBFloat16:
+        flat = bfloat16_to_float32(binary_data)
+    else:
+        flat = np.frombuffer(binary_data, dtype=element_type_to_numpy_dtype(element_type))
+    return flat.reshape(-1, dimension)
+
+
+def column_vector_to_numpy(column_type: ttypes.ColumnType, column_data_type: ttypes.DataType,
+                           column_vectors) -> np.ndarray:
+    """
+    Decode the column buffers of a SelectResponse into a numpy array without per-row python work.
+    Fixed-size columns are zero-copy views of the received buffer, so they are read-only.
+    """
     column_vector = b''.join(column_vectors)
     match column_type:
+        case ttypes.ColumnType.ColumnBool:
+            return np.frombuffer(column_vector, dtype=np.bool_)
+        case ttypes.ColumnType.ColumnInt8:
+            return np.frombuffer(column_vector, dtype='<i1')
+        case ttypes.ColumnType.ColumnInt16:
+            return np.frombuffer(column_vector, dtype='<i2')
         case ttypes.ColumnType.ColumnInt32:
-            return list(struct.unpack('<{}i'.format(len(column_vector) // 4), column_vector))
+            return np.frombuffer(column_vector, dtype='<i4')
         case ttypes.ColumnType.ColumnInt64:
-            return list(struct.unpack('<{}q'.format(len(column_vector) // 8), column_vector))
+            return np.frombuffer(column_vector, dtype='<i8')
         case ttypes.ColumnType.ColumnFloat32:
-            return list(struct.unpack('<{}f'.format(len(column_vector) // 4), column_vector))
+            return np.frombuffer(column_vector, dtype='<f4')
         case ttypes.ColumnType.ColumnFloat64:
-            return list(struct.unpack('<{}d'.format(len(column_vector) // 8), column_vector))
+            return np.frombuffer(column_vector, dtype='<f8')
         case ttypes.ColumnType.ColumnFloat16:
-            return list(struct.unpack('<{}e'.format(len(column_vector) // 2), column_vector))
+            return np.frombuffer(column_vector, dtype='<f2')
         case ttypes.ColumnType.ColumnBFloat16:
-            tmp_u16 = np.frombuffer(column_vector, dtype='<i2')
-            result_arr = np.zeros(2 * len(tmp_u16), dtype='<i2')
-            result_arr[1::2] = tmp_u16
-            view_float32 = result_arr.view('<f4')
-            return list(view_float32)
+            return bfloat16_to_float32(column_vector)
+        case ttypes.ColumnType.ColumnRowID:
+            return np.frombuffer(column_vector, dtype='<i8')
+        case ttypes.ColumnType.ColumnEmbedding:
+            embedding = embedding_to_numpy(column_data_type, column_vector)
+            if column_data_type.physical_type.embedding_type.element_type == ttypes.ElementType.ElementBit:
+                # one 0/1 value per dimension, the first dimension is the least significant bit
+                return np.unpackbits(embedding, axis=1, bitorder='little')
+            return embedding
+        case ttypes.ColumnType.ColumnVarchar:
+            return varchar_to_arrow(column_vector).to_numpy(zero_copy_only=False)
+        case ttypes.ColumnType.ColumnTensor | ttypes.ColumnType.ColumnTensorArray:
+            # one 2-D view per tensor
+            ragged = tensor_to_ragged(column_type, column_data_type, column_vector)
+            if column_data_type.physical_type.embedding_type.element_type == ttypes.ElementType.ElementBit:
+                ragged.values = np.unpackbits(ragged.values, axis=1, bitorder='little')
+            return to_object_array(ragged.rows())
+        case ttypes.ColumnType.ColumnSparse:
+            return to_object_array(parse_sparse_bytes(column_data_type, column_vector))
+        case _:
+            raise NotImplementedError(f"Unsupported type {column_type}")
+
+
+def column_vector_to_list(column_type: ttypes.ColumnType, column_data_type: ttypes.DataType, column_vectors) -> \
+        list[Any, ...]:
+    column_vector = b''.join(column_vectors)
+    match column_type:
         case ttypes.ColumnType.ColumnVarchar:
             return list(parse_bytes(column_vector))
-        case ttypes.ColumnType.ColumnBool:
-            return list(struct.unpack('<{}?'.format(len(column_vector)), column_vector))
-        case ttypes.ColumnType.ColumnInt8:
-            return list(struct.unpack('<{}b'.format(len(column_vector)), column_vector))
-        case ttypes.ColumnType.ColumnInt16:
-            return list(struct.unpack('<{}h'.format(len(column_vector) // 2), column_vector))
-        case ttypes.ColumnType.ColumnRowID:
-            return list(struct.unpack('<{}q'.format(len(column_vector) // 8), column_vector))
         case ttypes.ColumnType.ColumnEmbedding:
-            dimension = column_data_type.physical_type.embedding_type.dimension
-            if column_data_type.physical_type.embedding_type.element_type == ttypes.ElementType.ElementUInt8:
-                all_list = list(struct.unpack('<{}B'.format(len(column_vector)), column_vector))
-                return [all_list[i:i + dimension] for i in range(0, len(all_list), dimension)]
-            elif column_data_type.physical_type.embedding_type.element_type == ttypes.ElementType.ElementInt8:
-                all_list = list(struct.unpack('<{}b'.format(len(column_vector)), column_vector))
-                return [all_list[i:i + dimension] for i in range(0, len(all_list), dimension)]
-            elif column_data_type.physical_type.embedding_type.element_type == ttypes.ElementType.ElementInt16:
-                all_list = list(struct.unpack('<{}h'.format(len(column_vector) // 2), column_vector))
-                return [all_list[i:i + dimension] for i in range(0, len(all_list), dimension)]
-            elif column_data_type.physical_type.embedding_type.element_type == ttypes.ElementType.ElementInt32:
-                all_list = list(struct.unpack('<{}i'.format(len(column_vector) // 4), column_vector))
-                return [all_list[i:i + dimension] for i in range(0, len(all_list), dimension)]
-            elif column_data_type.physical_type.embedding_type.element_type == ttypes.ElementType.ElementInt64:
-                all_list = list(struct.unpack('<{}q'.format(len(column_vector) // 8), column_vector))
-                return [all_list[i:i + dimension] for i in range(0, len(all_list), dimension)]
-            elif column_data_type.physical_type.embedding_type.element_type == ttypes.ElementType.ElementFloat32:
-                all_list = list(struct.unpack('<{}f'.format(len(column_vector) // 4), column_vector))
-                return [all_list[i:i + dimension] for i in range(0, len(all_list), dimension)]
-            elif column_data_type.physical_type.embedding_type.element_type == ttypes.ElementType.ElementFloat64:
-                all_list = list(struct.unpack('<{}d'.format(len(column_vector) // 8), column_vector))
-                return [all_list[i:i + dimension] for i in range(0, len(all_list), dimension)]
-            elif column_data_type.physical_type.embedding_type.element_type == ttypes.ElementType.ElementFloat16:
-                all_list = list(struct.unpack('<{}e'.format(len(column_vector) // 2), column_vector))
-                return [all_list[i:i + dimension] for i in range(0, len(all_list), dimension)]
-            elif column_data_type.physical_type.embedding_type.element_type == ttypes.ElementType.ElementBFloat16:
-                tmp_u16 = np.frombuffer(column_vector, dtype='<i2')
-                result_arr = np.zeros(2 * len(tmp_u16), dtype='<i2')
-                result_arr[1::2] = tmp_u16
-                view_float32 = result_arr.view('<f4')
-                all_list = list(view_float32)
-                return [all_list[i:i + dimension] for i in range(0, len(all_list), dimension)]
-            elif column_data_type.physical_type.embedding_type.element_type == ttypes.ElementType.ElementBit:
-                all_list = list(struct.unpack('<{}B'.format(len(column_vector)), column_vector))
-                result = []
-                if dimension % 8 != 0:
-                    raise ValueError(f"Unsupported dimension {dimension}")
-                sub_dim: int = dimension // 8
-                for i in range(0, len(all_list), sub_dim):
-                    mid_res = all_list[i:i + sub_dim]
-                    mid_res_int: int = 0
-                    for j in reversed(mid_res):
-                        mid_res_int = mid_res_int * 256 + j
-                    result.append([f"\u007b0:0{dimension}b\u007d".format(mid_res_int)[::-1]])
-                return result
-            else:
-                raise NotImplementedError(
-                    f"Unsupported type {column_data_type.physical_type.embedding_type.element_type}")
+            return tensor_to_list(column_data_type, column_vector)
         case ttypes.ColumnType.ColumnTensor:
             return parse_tensor_bytes(column_data_type, column_vector)
         case ttypes.ColumnType.ColumnTensorArray:
             return parse_tensorarray_bytes(column_data_type, column_vector)
         case ttypes.ColumnType.ColumnSparse:
             return parse_sparse_bytes(column_data_type, column_vector)
+        case ttypes.ColumnType.ColumnBool | ttypes.ColumnType.ColumnInt8 | ttypes.ColumnType.ColumnInt16 | \
+             ttypes.ColumnType.ColumnInt32 | ttypes.ColumnType.ColumnInt64 | ttypes.ColumnType.ColumnFloat32 | \
+             ttypes.ColumnType.ColumnFloat64 | ttypes.ColumnType.ColumnFloat16 | ttypes.ColumnType.ColumnBFloat16 | \
+             ttypes.ColumnType.ColumnRowID:
+            return column_vector_to_numpy(column_type, column_data_type, [column_vector]).tolist()
         case _:
             raise NotImplementedError(f"Unsupported type {column_type}")
 
 
-def parse_bytes(bytes_data):
-    results = []
+def varchar_offsets(binary_data) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Scan the length-prefixed strings of a varchar column and return the start and the length
+    of every payload in binary_data. The walk over the prefixes is the only per-row Python work,
+    the lengths are derived from the distance between consecutive starts.
+    """
+    starts = []
+    append_start = starts.append
+    unpack_length = struct.Struct('<I').unpack_from
     offset = 0
-    while offset < len(bytes_data):
-        length = struct.unpack('I', bytes_data[offset:offset + 4])[0]
+    end = len(binary_data)
+    while offset < end:
         offset += 4
-        string_data = bytes_data[offset:offset + length].decode('utf-8')
-        results.append(string_data)
-        offset += length
-    return results
+        append_start(offset)
+        offset += unpack_length(binary_data, offset - 4)[0]
+    starts = np.array(starts, dtype=np.int64)
+    lengths = np.empty_like(starts)
+    lengths[:-1] = starts[1:] - starts[:-1] - 4
+    lengths[-1:] = end - starts[-1:]
+    return starts, lengths
+
+
+def varchar_to_arrow(binary_data) -> pa.Array:
+    starts, lengths = varchar_offsets(binary_data)
+    # drop the length prefixes so that the payloads form one contiguous arrow data buffer, the
+    # i-th payload then begins 4 * (i + 1) bytes before its start in binary_data
+    raw = np.frombuffer(binary_data, dtype=np.uint8)
+    keep = np.ones(len(raw), dtype=np.bool_)
+    keep[((starts - 4)[:, None] + np.arange(4)).ravel()] = False
+    data = raw[keep]
+    offsets = np.empty(len(starts) + 1, dtype=np.int64)
+    offsets[:-1] = starts - 4 * np.arange(1, len(starts) + 1)
+    offsets[-1] = len(data)
+    if offsets[-1] > np.iinfo(np.int32).max:
+        arrow_type = pa.large_string()
+    else:
+        arrow_type = pa.string()
+        offsets = offsets.astype(np.int32)
+    return pa.Array.from_buffers(arrow_type, len(starts), [None, pa.py_buffer(offsets), pa.py_buffer(data)])
+
+
+def tensor_to_ragged(column_type: ttypes.ColumnType, column_data_type: ttypes.DataType, binary_data) -> RaggedTensor:
+    """
+    Decode a tensor or tensor array column into a RaggedTensor. Only the u32 headers are read in
+    Python, the payloads are cut out of the buffer with one mask and decoded like an embedding
+    column, so bit tensors stay packed as uint8.
+    """
+    headers = []
+    tensor_lengths = []
+    tensor_counts = []
+    unpack_u32 = struct.Struct('<I').unpack_from
+    offset = 0
+    end = len(binary_data)
+    if column_type == ttypes.ColumnType.ColumnTensorArray:
+        while offset < end:
+            tensor_n = unpack_u32(binary_data, offset)[0]
+            headers.append(offset)
+            tensor_counts.append(tensor_n)
+            offset += 4
+            for _ in range(tensor_n):
+                length = unpack_u32(binary_data, offset)[0]
+                headers.append(offset)
+                tensor_lengths.append(length)
+                offset += 4 + length
+    else:
+        while offset < end:
+            length = unpack_u32(binary_data, offset)[0]
+            headers.append(offset)
+            tensor_lengths.append(length)
+            offset += 4 + length
+
+    raw = np.frombuffer(binary_data, dtype=np.uint8)
+    keep = np.ones(len(raw), dtype=np.bool_)
+    keep[(np.array(headers, dtype=np.int64)[:, None] + np.arange(4)).ravel()] = False
+    values = embedding_to_numpy(column_data_type, raw[keep])
+    vector_size = values.shape[1] * element_type_to_numpy_dtype(column_data_type.physical_type.embedding_type.element_type).itemsize
+    tensor_offsets = np.zeros(len(tensor_lengths) + 1, dtype=np.int64)
+    np.cumsum(np.array(tensor_lengths, dtype=np.int64) // vector_size, out=tensor_offsets[1:])
+    if column_type != ttypes.ColumnType.ColumnTensorArray:
+        return RaggedTensor(values, tensor_offsets)
+    offsets = np.zeros(len(tensor_counts) + 1, dtype=np.int64)
+    np.cumsum(np.array(tensor_counts, dtype=np.int64), out=offsets[1:])
+    return RaggedTensor(values, offsets, tensor_offsets)
+
+
+def offsets_to_list_array(offsets: np.ndarray, values: pa.Array) -> pa.Array:
+    if offsets[-1] > np.iinfo(np.int32).max:
+        return pa.LargeListArray.from_arrays(pa.array(offsets), values)
+    return pa.ListArray.from_arrays(pa.array(offsets.astype(np.int32)), values)
+
+
+def tensor_to_arrow(column_type: ttypes.ColumnType, column_data_type: ttypes.DataType, binary_data) -> pa.Array:
+    ragged = tensor_to_ragged(column_type, column_data_type, binary_data)
+    values = ragged.values
+    if column_data_type.physical_type.embedding_type.element_type == ttypes.ElementType.ElementBit:
+        # unpacked like bit embeddings, see column_vector_to_numpy
+        values = np.unpackbits(values, axis=1, bitorder='little')
+    if values.dtype == np.float16:
+        # polars has no float16
+        values = values.astype(np.float32)
+    array = pa.FixedSizeListArray.from_arrays(pa.array(values.reshape(-1)), values.shape[1])
+    if ragged.tensor_offsets is not None:
+        array = offsets_to_list_array(ragged.tensor_offsets, array)
+    return offsets_to_list_array(ragged.offsets, array)
+
+
+def column_vector_to_arrow(column_type: ttypes.ColumnType, column_data_type: ttypes.DataType,
+                           column_vectors) -> pa.Array:
+    """
+    Wrap the column buffers of a SelectResponse in an arrow array. Fixed-size columns share the
+    received buffer, embeddings become FixedSizeList arrays and varchar an offset-based StringArray.
+    """
+    match column_type:
+        case ttypes.ColumnType.ColumnBool:
+            # arrow booleans are bit-packed, the one byte per value buffer can not be shared
+            return pa.array(column_vector_to_numpy(column_type, column_data_type, column_vectors))
+        case ttypes.ColumnType.ColumnInt8 | ttypes.ColumnType.ColumnInt16 | ttypes.ColumnType.ColumnInt32 | \
+             ttypes.ColumnType.ColumnInt64 | ttypes.ColumnType.ColumnFloat32 | ttypes.ColumnType.ColumnFloat64 | \
+             ttypes.ColumnType.ColumnFloat16 | ttypes.ColumnType.ColumnBFloat16 | ttypes.ColumnType.ColumnRowID:
+            return pa.array(column_vector_to_numpy(column_type, column_data_type, column_vectors))
+        case ttypes.ColumnType.ColumnEmbedding:
+            embedding = column_vector_to_numpy(column_type, column_data_type, column_vectors)
+            return pa.FixedSizeListArray.from_arrays(pa.array(embedding.reshape(-1)), embedding.shape[1])
+        case ttypes.ColumnType.ColumnVarchar:
+            return varchar_to_arrow(b''.join(column_vectors))
+        case ttypes.ColumnType.ColumnTensor | ttypes.ColumnType.ColumnTensorArray:
+            return tensor_to_arrow(column_type, column_data_type, b''.join(column_vectors))
+        case ttypes.ColumnType.ColumnSparse:
+            return sparse_to_arrow(column_data_type, b''.join(column_vectors))
+        case _:
+            raise NotImplementedError(f"Unsupported type {column_type}")
+
+
+def parse_bytes(bytes_data):
+    starts, lengths = varchar_offsets(bytes_data)
+    ends = starts + lengths
+    return [bytes_data[start:end].decode('utf-8') for start, end in zip(starts.tolist(), ends.tolist())]
+
+
+def tensor_to_nested_list(column_type, column_data_type: ttypes.DataType, bytes_data) -> list:
+    ragged = tensor_to_ragged(column_type, column_data_type, bytes_data)
+    if column_data_type.physical_type.embedding_type.element_type == ttypes.ElementType.ElementBit:
+        vectors = bits_to_strings(ragged.values)
+        if ragged.tensor_offsets is None:
+            return split_list(vectors, ragged.offsets)
+        return split_list(split_list(vectors, ragged.tensor_offsets), ragged.offsets)
+    if ragged.tensor_offsets is None:
+        return [tensor.tolist() for tensor in ragged.rows()]
+    return [[tensor.tolist() for tensor in tensors] for tensors in ragged.rows()]
 
 
 def parse_tensor_bytes(column_data_type: ttypes.DataType, bytes_data):
-    results = []
-    offset = 0
-    while offset < len(bytes_data):
-        length = struct.unpack('I', bytes_data[offset:offset + 4])[0]
-        offset += 4
-        tensor_data = tensor_to_list(column_data_type, bytes_data[offset:offset + length])
-        results.append(tensor_data)
-        offset += length
-    return results
+    return tensor_to_nested_list(ttypes.ColumnType.ColumnTensor, column_data_type, bytes_data)
 
 
 def parse_tensorarray_bytes(column_data_type: ttypes.DataType, bytes_data):
-    results = []
-    offset = 0
-    while offset < len(bytes_data):
-        tensor_n = struct.unpack('I', bytes_data[offset:offset + 4])[0]
-        offset += 4
-        tensorarray_data = []
-        for _ in range(tensor_n):
-            length = struct.unpack('I', bytes_data[offset:offset + 4])[0]
-            offset += 4
-            tensor_data = tensor_to_list(column_data_type, bytes_data[offset:offset + length])
-            offset += length
-            tensorarray_data.append(tensor_data)
-        results.append(tensorarray_data)
-    return results
+    return tensor_to_nested_list(ttypes.ColumnType.ColumnTensorArray, column_data_type, bytes_data)
 
 
 def tensor_to_list(column_data_type: ttypes.DataType, binary_data) -> list[list[Any]]:
-    dimension = column_data_type.physical_type.embedding_type.dimension
+    vectors = embedding_to_numpy(column_data_type, binary_data)
     if column_data_type.physical_type.embedding_type.element_type == ttypes.ElementType.ElementBit:
-        all_list = list(struct.unpack('<{}B'.format(len(binary_data)), binary_data))
-        result = []
-        if dimension % 8 != 0:
-            raise ValueError(f"Unsupported dimension {dimension}")
-        sub_dim: int = dimension // 8
-        for i in range(0, len(all_list), sub_dim):
-            mid_res = all_list[i:i + sub_dim]
-            mid_res_int: int = 0
-            for j in reversed(mid_res):
-                mid_res_int = mid_res_int * 256 + j
-            result.append([f"\u007b0:0{dimension}b\u007d".format(mid_res_int)[::-1]])
-        return result
-    elif column_data_type.physical_type.embedding_type.element_type == ttypes.ElementType.ElementUInt8:
-        all_list = list(struct.unpack('<{}B'.format(len(binary_data)), binary_data))
-        return [all_list[i:i + dimension] for i in range(0, len(all_list), dimension)]
-    elif column_data_type.physical_type.embedding_type.element_type == ttypes.ElementType.ElementInt8:
-        all_list = list(struct.unpack('<{}b'.format(len(binary_data)), binary_data))
-        return [all_list[i:i + dimension] for i in range(0, len(all_list), dimension)]
-    elif column_data_type.physical_type.embedding_type.element_type == ttypes.ElementType.ElementInt16:
-        all_list = list(struct.unpack('<{}h'.format(len(binary_data) // 2), binary_data))
-        return [all_list[i:i + dimension] for i in range(0, len(all_list), dimension)]
-    elif column_data_type.physical_type.embedding_type.element_type == ttypes.ElementType.ElementInt32:
-        all_list = list(struct.unpack('<{}i'.format(len(binary_data) // 4), binary_data))
-        return [all_list[i:i + dimension] for i in range(0, len(all_list), dimension)]
-    elif column_data_type.physical_type.embedding_type.element_type == ttypes.ElementType.ElementInt64:
-        all_list = list(struct.unpack('<{}q'.format(len(binary_data) // 8), binary_data))
-        return [all_list[i:i + dimension] for i in range(0, len(all_list), dimension)]
-    elif column_data_type.physical_type.embedding_type.element_type == ttypes.ElementType.ElementFloat32:
-        all_list = list(struct.unpack('<{}f'.format(len(binary_data) // 4), binary_data))
-        return [all_list[i:i + dimension] for i in range(0, len(all_list), dimension)]
-    elif column_data_type.physical_type.embedding_type.element_type == ttypes.ElementType.ElementFloat64:
-        all_list = list(struct.unpack('<{}d'.format(len(binary_data) // 8), binary_data))
-        return [all_list[i:i + dimension] for i in range(0, len(all_list), dimension)]
-    elif column_data_type.physical_type.embedding_type.element_type == ttypes.ElementType.ElementFloat16:
-        all_list = list(struct.unpack('<{}e'.format(len(binary_data) // 2), binary_data))
-        return [all_list[i:i + dimension] for i in range(0, len(all_list), dimension)]
-    elif column_data_type.physical_type.embedding_type.element_type == ttypes.ElementType.ElementBFloat16:
-        tmp_u16 = np.frombuffer(binary_data, dtype='<i2')
-        result_arr = np.zeros(2 * len(tmp_u16), dtype='<i2')
-        result_arr[1::2] = tmp_u16
-        view_float32 = result_arr.view('<f4')
-        all_list = list(view_float32)
-        return [all_list[i:i + dimension] for i in range(0, len(all_list), dimension)]
+        return bits_to_strings(vectors)
+    return vectors.tolist()
+
+
+def bits_to_strings(packed: np.ndarray) -> list[list[str]]:
+    # each packed bit vector as a one string list, "0101..." with the first dimension first
+    dimension = packed.shape[1] * 8
+    chars = np.unpackbits(packed, axis=1, bitorder='little') + np.uint8(ord('0'))
+    return chars.view(f'S{dimension}').astype(f'U{dimension}').tolist()
+
+
+def split_list(values: list, offsets: np.ndarray) -> list[list]:
+    offsets = offsets.tolist()
+    return [values[begin:end] for begin, end in zip(offsets[:-1], offsets[1:])]
+
+
+def is_bit_column(column_type: ttypes.ColumnType, column_data_type: ttypes.DataType) -> bool:
+    return column_type in (ttypes.ColumnType.ColumnEmbedding, ttypes.ColumnType.ColumnTensor, ttypes.ColumnType.ColumnTensorArray) and \
+        column_data_type.physical_type.embedding_type.element_type == ttypes.ElementType.ElementBit
+
+
+def sparse_to_csr(column_data_type: ttypes.DataType, binary_data) -> SparseMatrix:
+    """
+    Decode a sparse column into CSR arrays. Every row is a u32 nnz followed by nnz indices and
+    nnz values, so only the nnz prefixes are read in Python and the payload bytes are split into
+    indices and values with one mask over the whole buffer.
+    """
+    sparse_type = column_data_type.physical_type.sparse_type
+    if sparse_type.element_type == ttypes.ElementType.ElementBit:
+        raise NotImplementedError(f"Unsupported type {sparse_type.element_type}")
+    index_dtype = element_type_to_numpy_dtype(sparse_type.index_type)
+    value_dtype = element_type_to_numpy_dtype(sparse_type.element_type)
+    entry_size = index_dtype.itemsize + value_dtype.itemsize
+    nnz_list = []
+    append_nnz = nnz_list.append
+    unpack_nnz = struct.Struct('<I').unpack_from
+    offset = 0
+    end = len(binary_data)
+    while offset < end:
+        nnz = unpack_nnz(binary_data, offset)[0]
+        append_nnz(nnz)
+        offset += 4 + nnz * entry_size
+    nnz = np.array(nnz_list, dtype=np.int64)
+    indptr = np.zeros(len(nnz) + 1, dtype=np.int64)
+    np.cumsum(nnz, out=indptr[1:])
+
+    # label the bytes of every row: 0 for the nnz prefix, 1 for the indices and 2 for the values
+    raw = np.frombuffer(binary_data, dtype=np.uint8)
+    row_starts = 4 * np.arange(len(nnz)) + indptr[:-1] * entry_size
+    labels = np.zeros(len(raw) + 1, dtype=np.int8)
+    np.add.at(labels, row_starts + 4, 1)
+    np.add.at(labels, row_starts + 4 + nnz * index_dtype.itemsize, 1)
+    np.add.at(labels, np.append(row_starts[1:], len(raw)), -2)
+    labels = np.cumsum(labels[:-1], dtype=np.int8)
+    indices = raw[labels == 1].view(index_dtype)
+    if sparse_type.element_type == ttypes.ElementType.ElementBFloat16:
+        data = bfloat16_to_float32(raw[labels == 2])
     else:
-        raise NotImplementedError(
-            f"Unsupported type {column_data_type.physical_type.embedding_type.element_type}")
+        data = raw[labels == 2].view(value_dtype)
+    return SparseMatrix(indptr, indices, data, sparse_type.dimension)
+
+
+def sparse_to_arrow(column_data_type: ttypes.DataType, binary_data) -> pa.Array:
+    matrix = sparse_to_csr(column_data_type, binary_data)
+    return pa.StructArray.from_arrays([offsets_to_list_array(matrix.indptr, pa.array(matrix.indices)),
+                                       offsets_to_list_array(matrix.indptr, pa.array(matrix.data))],
+                                      names=["indices", "values"])
+
 
 def parse_sparse_bytes(column_data_type: ttypes.DataType, column_vector):
-    dimension = column_data_type.physical_type.sparse_type.dimension
-    element_type = column_data_type.physical_type.sparse_type.element_type
-    index_type = column_data_type.physical_type.sparse_type.index_type
-    res = []
-    offset = 0
-    # print(len(column_vector))
-    while offset < len(column_vector):
-        nnz = struct.unpack('I', column_vector[offset:offset + 4])[0]
-        offset += 4
-        # print(nnz)
-        indices = []
-        values = []
-        match index_type:
-            case ttypes.ElementType.ElementInt8:
-                indices = struct.unpack('<{}b'.format(nnz), column_vector[offset:offset + nnz])
-                offset += nnz
-            case ttypes.ElementType.ElementInt16:
-                indices = struct.unpack('<{}h'.format(nnz), column_vector[offset:offset + nnz * 2])
-                offset += nnz * 2
-            case ttypes.ElementType.ElementInt32:
-                indices = struct.unpack('<{}i'.format(nnz), column_vector[offset:offset + nnz * 4])
-                offset += nnz * 4
-            case ttypes.ElementType.ElementInt64:
-                indices = struct.unpack('<{}q'.format(nnz), column_vector[offset:offset + nnz * 8])
-                offset += nnz * 8
-            case _:
-                raise NotImplementedError(f"Unsupported type {index_type}")
-        match element_type:
-            case ttypes.ElementType.ElementUInt8:
-                values = struct.unpack('<{}B'.format(nnz), column_vector[offset:offset + nnz])
-                offset += nnz
-            case ttypes.ElementType.ElementInt8:
-                values = struct.unpack('<{}b'.format(nnz), column_vector[offset:offset + nnz])
-                offset += nnz
-            case ttypes.ElementType.ElementInt16:
-                values = struct.unpack('<{}h'.format(nnz), column_vector[offset:offset + nnz * 2])
-                offset += nnz * 2
-            case ttypes.ElementType.ElementInt32:
-                values = struct.unpack('<{}i'.format(nnz), column_vector[offset:offset + nnz * 4])
-                offset += nnz * 4
-            case ttypes.ElementType.ElementInt64:
-                values = struct.unpack('<{}q'.format(nnz), column_vector[offset:offset + nnz * 8])
-                offset += nnz * 8
-            case ttypes.ElementType.ElementFloat32:
-                values = struct.unpack('<{}f'.format(nnz), column_vector[offset:offset + nnz * 4])
-                offset += nnz * 4
-            case ttypes.ElementType.ElementFloat64:
-                values = struct.unpack('<{}d'.format(nnz), column_vector[offset:offset + nnz * 8])
-                offset += nnz * 8
-            case ttypes.ElementType.ElementFloat16:
-                values = struct.unpack('<{}e'.format(nnz), column_vector[offset:offset + nnz * 2])
-                offset += nnz * 2
-            case ttypes.ElementType.ElementBFloat16:
-                tmp_u16 = np.frombuffer(column_vector[offset:offset + nnz * 2], dtype='<i2')
-                result_arr = np.zeros(2 * len(tmp_u16), dtype='<i2')
-                result_arr[1::2] = tmp_u16
-                view_float32 = result_arr.view('<f4')
-                values = list(view_float32)
-                offset += nnz * 2
-            case ttypes.ElementType.ElementBit:
-                raise NotImplementedError(f"Unsupported type {element_type}")
-            case _:
-                raise NotImplementedError(f"Unsupported type {element_type}")
-        # print("indices: {}, values: {}".format(indices, values))
-        res.append(SparseVector(list(indices), values).to_dict())
-    return res
+    matrix = sparse_to_csr(column_data_type, column_vector)
+    return [matrix.row(i).to_dict() for i in range(len(matrix))]
 
 
 def find_data_type(column_name: str, column_defs: list[ttypes.ColumnDef]) -> ttypes.DataType:
@@ -410,29 +530,96 @@ def find_data_type(column_name: str, column_defs: list[ttypes.ColumnDef]) -> tty
     raise KeyError(f"column name {column_name} not found in column defs")
 
 
-def build_result(res: ttypes.SelectResponse) -> tuple[dict[str | Any, list[Any, Any]], dict[str | Any, Any]]:
-    data_dict = {}
-    data_type_dict = {}
+def result_column_names(column_defs: list[ttypes.ColumnDef]) -> list[str]:
+    column_names = []
     column_counter = defaultdict(int)
-    for column_def, column_field in zip(res.column_defs, res.column_fields):
+    for column_def in column_defs:
         original_column_name = column_def.name
         column_counter[original_column_name] += 1
         column_name = f"{original_column_name}_{column_counter[original_column_name]}" \
             if column_counter[original_column_name] > 1 \
             else original_column_name
+        column_names.append(column_name)
+    return column_names
+
+
+def decode_result_column(column_type, column_data_type, column_vectors, sparse_format: str = "dict",
+                         tensor_format: str = "list") -> Any:
+    if column_type == ttypes.ColumnType.ColumnSparse and sparse_format == "csr":
+        return sparse_to_csr(column_data_type, b''.join(column_vectors))
+    if column_type in (ttypes.ColumnType.ColumnTensor, ttypes.ColumnType.ColumnTensorArray) and tensor_format == "ragged":
+        return tensor_to_ragged(column_type, column_data_type, b''.join(column_vectors))
+    return column_vector_to_list(column_type, column_data_type, column_vectors)
 
+
+def build_result(res: ttypes.SelectResponse, sparse_format: str = "dict", tensor_format: str = "list",
+                 lazy: bool = False) -> tuple[dict[str | Any, list[Any, Any]], dict[str | Any, Any]]:
+    data_dict = {}
+    data_type_dict = {}
+    column_names = result_column_names(res.column_defs)
+    for column_name, column_def, column_field in zip(column_names, res.column_defs, res.column_fields):
         column_type = column_field.column_type
         column_data_type = column_def.data_type
         column_vectors = column_field.column_vectors
 
-        data_list = column_vector_to_list(column_type, column_data_type, column_vectors)
-        # data_series = pd.Series(data_list, dtype=logic_type_to_dtype(column_data_type))
-        data_dict[column_name] = data_list
+        if lazy:
+            data_dict[column_name] = functools.partial(decode_result_column, column_type, column_data_type,
+                                                       column_vectors, sparse_format, tensor_format)
+        else:
+            data_dict[column_name] = decode_result_column(column_type, column_data_type, column_vectors,
+                                                          sparse_format, tensor_format)
         data_type_dict[column_name] = column_data_type
 
+    if lazy:
+        return LazyColumns(data_dict), data_type_dict
     return data_dict, data_type_dict
 
 
+def build_arrow_table(res: ttypes.SelectResponse) -> pa.Table:
+    column_names = result_column_names(res.column_defs)
+    arrays = [column_vector_to_arrow(column_field.column_type, column_def.data_type, column_field.column_vectors)
+              for column_def, column_field in zip(res.column_defs, res.column_fields)]
+    return pa.Table.from_arrays(arrays, names=column_names)
+
+
+def build_numpy_dict(res: ttypes.SelectResponse) -> dict[str, np.ndarray]:
+    # embeddings come back as (rows, dimension) matrices, _row_id as int64 and _score/_distance as float32
+    column_names = result_column_names(res.column_defs)
+    return {column_name: column_vector_to_numpy(column_field.column_type, column_def.data_type,
+                                               column_field.column_vectors)
+            for column_name, column_def, column_field in zip(column_names, res.column_defs, res.column_fields)}
+
+
+def build_polars_dataframe(res: ttypes.SelectResponse) -> pl.DataFrame:
+    # polars takes the arrow arrays over without copying, float16 columns are widened to Float32.
+    # Bit vectors and tensors are "0101..." strings, as to_result returns them.
+    column_names = result_column_names(res.column_defs)
+    columns = []
+    for column_name, column_def, column_field in zip(column_names, res.column_defs, res.column_fields):
+        column_type = column_field.column_type
+        if is_bit_column(column_type, column_def.data_type):
+            values = column_vector_to_list(column_type, column_def.data_type, column_field.column_vectors)
+        else:
+            values = column_vector_to_arrow(column_type, column_def.data_type, column_field.column_vectors)
+        columns.append(pl.Series(column_name, values))
+    return pl.DataFrame(columns)
+
+
+def pack_bits(embedding_data) -> np.ndarray:
+    """
+    Bit query vectors are sent packed, 8 dimensions per byte with the first dimension in the least
+    significant bit. bytes-like input, e.g. packed_array.tobytes(), is taken as already packed,
+    anything else as one 0/1 value per dimension.
+    """
+    if isinstance(embedding_data, (bytes, bytearray, memoryview)):
+        return np.frombuffer(embedding_data, dtype=np.uint8)
+    bits = np.asarray(embedding_data).reshape(-1)
+    if bits.size % 8 != 0 or not np.isin(bits, (0, 1)).all():
+        raise InfinityException(ErrorCode.INVALID_EMBEDDING_DATA_TYPE,
+                                f"Invalid bit embedding, expect 0/1 values and a dimension divisible by 8")
+    return np.packbits(bits.astype(np.uint8), bitorder='little')
+
+
 def make_match_tensor_expr(vector_column_name: str, embedding_data: VEC, embedding_data_type: str,
                            method_type: str, extra_option: str = None) -> MatchTensorExpr:
     match_tensor_expr = MatchTensorExpr()
@@ -441,36 +628,31 @@ def make_match_tensor_expr(vector_column_name: str, embedding_data: VEC, embeddi
     match_tensor_expr.extra_options = extra_option
     data = EmbeddingData()
     if embedding_data_type == 'bit':
-        raise InfinityException(ErrorCode.INVALID_EMBEDDING_DATA_TYPE, f"Invalid embedding {embedding_data[0]} type")
+        elem_type = ElementType.ElementBit
     elif embedding_data_type in ['unsigned tinyint', 'uint8', 'u8']:
         elem_type = ElementType.ElementUInt8
-        data.u8_array_value = np.asarray(embedding_data, dtype=np.uint8).flatten()
     elif embedding_data_type in ['tinyint', 'int8', 'i8']:
         elem_type = ElementType.ElementInt8
-        data.i8_array_value = np.asarray(embedding_data, dtype=np.int8).flatten()
     elif embedding_data_type in ['smallint', 'int16', 'i16']:
         elem_type = ElementType.ElementInt16
-        data.i16_array_value = np.asarray(embedding_data, dtype=np.int16).flatten()
     elif embedding_data_type in ['int', 'int32', 'i32']:
         elem_type = ElementType.ElementInt32
-        data.i32_array_value = np.asarray(embedding_data, dtype=np.int32).flatten()
     elif embedding_data_type in ['bigint', 'int64', 'i64']:
         elem_type = ElementType.ElementInt64
-        data.i64_array_value = np.asarray(embedding_data, dtype=np.int64).flatten()
     elif embedding_data_type in ['float', 'float32', 'f32']:
         elem_type = ElementType.ElementFloat32
-        data.f32_array_value = np.asarray(embedding_data, dtype=np.float32).flatten()
     elif embedding_data_type in ['double', 'float64', 'f64']:
         elem_type = ElementType.ElementFloat64
-        data.f64_array_value = np.asarray(embedding_data, dtype=np.float64).flatten()
     elif embedding_data_type in ['float16', 'fp16', 'f16']:
         elem_type = ElementType.ElementFloat16
-        data.f16_array_value = np.asarray(embedding_data, dtype=np.float16).flatten()
     elif embedding_data_type in ['bfloat16', 'bf16']:
         elem_type = ElementType.ElementBFloat16
-        data.bf16_array_value = np.asarray(embedding_data, dtype=np.float32).flatten()
     else:
         raise InfinityException(ErrorCode.INVALID_EMBEDDING_DATA_TYPE, f"Invalid embedding {embedding_data[0]} type")
+    if embedding_data_type == 'bit':
+        data.packed_value = pack_bits(embedding_data).tobytes()
+    else:
+        data.packed_value = pack_embedding(embedding_data, embedding_data_type)
 
     match_tensor_expr.embedding_data_type = elem_type
     match_tensor_expr.embedding_data = data
@@ -506,3 +688,95 @@ def make_match_sparse_expr(vector_column_name: str, sparse_data: SparseVector, m
     match_sparse_expr = MatchSparseExpr(column_expr=column_expr, query_sparse_expr=query_sparse_expr, metric_type=metric_type,
                                         topn=topn, opt_params=match_sparse_options)
     return match_sparse_expr
+
+
+# numpy "kind + itemsize" -> (column type, wire dtype) of a scalar insert column, unsigned and half
+# types are widened to the next signed or float type
+INSERT_SCALAR_TYPES = {
+    'b1': (ttypes.ColumnType.ColumnBool, '<u1'),
+    'i1': (ttypes.ColumnType.ColumnInt8, '<i1'),
+    'i2': (ttypes.ColumnType.ColumnInt16, '<i2'),
+    'i4': (ttypes.ColumnType.ColumnInt32, '<i4'),
+    'i8': (ttypes.ColumnType.ColumnInt64, '<i8'),
+    'u1': (ttypes.ColumnType.ColumnInt16, '<i2'),
+    'u2': (ttypes.ColumnType.ColumnInt32, '<i4'),
+    'u4': (ttypes.ColumnType.ColumnInt64, '<i8'),
+    'f2': (ttypes.ColumnType.ColumnFloat32, '<f4'),
+    'f4': (ttypes.ColumnType.ColumnFloat32, '<f4'),
+    'f8': (ttypes.ColumnType.ColumnFloat64, '<f8'),
+}
+
+# numpy "kind + itemsize" -> (element type, wire dtype) of an embedding insert column
+INSERT_ELEMENT_TYPES = {
+    'i1': (ttypes.ElementType.ElementInt8, '<i1'),
+    'u1': (ttypes.ElementType.ElementUInt8, '<u1'),
+    'i2': (ttypes.ElementType.ElementInt16, '<i2'),
+    'i4': (ttypes.ElementType.ElementInt32, '<i4'),
+    'i8': (ttypes.ElementType.ElementInt64, '<i8'),
+    'f2': (ttypes.ElementType.ElementFloat32, '<f4'),
+    'f4': (ttypes.ElementType.ElementFloat32, '<f4'),
+    'f8': (ttypes.ElementType.ElementFloat64, '<f8'),
+}
+
+
+def varchar_to_insert_buffer(column_name: str, values: np.ndarray) -> bytes:
+    # u32 length prefixed utf-8 strings, the layout the server uses for varchar columns
+    encoded = []
+    for value in values.tolist():
+        if isinstance(value, str):
+            encoded.append(value.encode('utf-8'))
+        elif isinstance(value, bytes):
+            encoded.append(value)
+        else:
+            raise InfinityException(ErrorCode.INVALID_PARAMETER_VALUE,
+                                    f"Column {column_name} has non-string value: {value}")
+    pack_length = struct.Struct('<I').pack
+    return b''.join(part for value in encoded for part in (pack_length(len(value)), value))
+
+
+# sparse insert columns carry int64, float32 or float64 values
+INSERT_SPARSE_TYPES = {
+    'i1': (ttypes.ElementType.ElementInt64, '<i8'),
+    'i2': (ttypes.ElementType.ElementInt64, '<i8'),
+    'i4': (ttypes.ElementType.ElementInt64, '<i8'),
+    'i8': (ttypes.ElementType.ElementInt64, '<i8'),
+    'f2': (ttypes.ElementType.ElementFloat32, '<f4'),
+    'f4': (ttypes.ElementType.ElementFloat32, '<f4'),
+    'f8': (ttypes.ElementType.ElementFloat64, '<f8'),
+}
+
+
+def sparse_to_insert_column(column_name: str, values: SparseMatrix) -> ttypes.InsertColumn:
+    # the layout of a .csr file: row count, indptr from 0, indices and values
+    type_key = f"{values.data.dtype.kind}{values.data.dtype.itemsize}"
+    if type_key not in INSERT_SPARSE_TYPES:
+        raise InfinityException(ErrorCode.INVALID_PARAMETER_VALUE,
+                                f"Column {column_name} of sparse {values.data.dtype} can't be inserted by column")
+    element_type, wire_dtype = INSERT_SPARSE_TYPES[type_key]
+    begin, end = int(values.indptr[0]), int(values.indptr[-1])
+    indptr = np.asarray(values.indptr, dtype='<i8') - begin
+    column_vector = b"".join((struct.pack('<q', len(values)), indptr.tobytes(),
+                              np.ascontiguousarray(values.indices[begin:end], dtype='<i8').tobytes(),
+                              np.ascontiguousarray(values.data[begin:end], dtype=wire_dtype).tobytes()))
+    return ttypes.InsertColumn(column_name=column_name, column_type=ttypes.ColumnType.ColumnSparse,
+                               element_type=element_type, dimension=values.dimension, column_vector=column_vector)
+
+
+def numpy_to_insert_column(column_name: str, values: np.ndarray) -> ttypes.InsertColumn:
+    if isinstance(values, SparseMatrix):
+        return sparse_to_insert_column(column_name, values)
+    type_key = f"{values.dtype.kind}{values.dtype.itemsize}"
+    if values.ndim == 1 and values.dtype.kind in ('U', 'S', 'O'):
+        return ttypes.InsertColumn(column_name=column_name, column_type=ttypes.ColumnType.ColumnVarchar,
+                                   column_vector=varchar_to_insert_buffer(column_name, values))
+    if values.ndim == 1 and type_key in INSERT_SCALAR_TYPES:
+        column_type, wire_dtype = INSERT_SCALAR_TYPES[type_key]
+        return ttypes.InsertColumn(column_name=column_name, column_type=column_type,
+                                   column_vector=np.ascontiguousarray(values, dtype=wire_dtype).tobytes())
+    if values.ndim == 2 and type_key in INSERT_ELEMENT_TYPES:
+        element_type, wire_dtype = INSERT_ELEMENT_TYPES[type_key]
+        return ttypes.InsertColumn(column_name=column_name, column_type=ttypes.ColumnType.ColumnEmbedding,
+                                   element_type=element_type, dimension=values.shape[1],
+                                   column_vector=np.ascontiguousarray(values, dtype=wire_dtype).tobytes())
+    raise InfinityException(ErrorCode.INVALID_PARAMETER_VALUE,
+                            f"Column {column_name} of {values.ndim}-D {values.dtype} can't be inserted by column")
@@ -15,18 +15,22 @@
 import re
 import functools
 import inspect
-import pandas as pd
 import polars as pl
 import sqlglot.expressions as exp
+from sqlglot import condition, maybe_parse
 import numpy as np
 import infinity.remote_thrift.infinity_thrift_rpc.ttypes as ttypes
-from infinity.remote_thrift.types import build_result, logic_type_to_dtype
-from infinity.utils import binary_exp_to_paser_exp
-from infinity.common import InfinityException, SparseVector
+from infinity.remote_thrift.types import build_polars_dataframe
+from infinity.utils import binary_exp_to_paser_exp, ExpressionCache
+from infinity.common import InfinityException, SparseVector, ConflictType, DEFAULT_EXPRESSION_CACHE_SIZE
 from infinity.errors import ErrorCode
 
 
-def traverse_conditions(cons, fn=None) -> ttypes.ParsedExpr:
+# parsed filter and output expressions of this client, cache_info() tells how well it is sized
+expression_cache = ExpressionCache(DEFAULT_EXPRESSION_CACHE_SIZE)
+
+
+def traverse_conditions(cons, fn=None, params=None) -> ttypes.ParsedExpr:
     if isinstance(cons, exp.Binary):
         parsed_expr = ttypes.ParsedExpr()
         function_expr = ttypes.FunctionExpr()
@@ -36,9 +40,9 @@ def traverse_conditions(cons, fn=None) -> ttypes.ParsedExpr:
         arguments = []
         for value in cons.hashable_args:
             if fn:
-                expr = fn(value)
+                expr = fn(value, params)
             else:
-                expr = traverse_conditions(value)
+                expr = traverse_conditions(value, params=params)
             arguments.append(expr)
         function_expr.arguments = arguments
 
@@ -124,7 +128,7 @@ def traverse_conditions(cons, fn=None) -> ttypes.ParsedExpr:
 
     elif isinstance(cons, exp.Paren):
         for value in cons.hashable_args:
-            return traverse_conditions(value)
+            return traverse_conditions(value, params=params)
     elif isinstance(cons, exp.Neg):
         parsed_expr = ttypes.ParsedExpr()
         if isinstance(cons.hashable_args[0], exp.Literal):
@@ -147,7 +151,7 @@ def traverse_conditions(cons, fn=None) -> ttypes.ParsedExpr:
         arguments = []
         for arg in cons.args.values():
             if arg:
-                arguments.append(parse_expr(arg))
+                arguments.append(parse_expr(arg, params))
         func_expr = ttypes.FunctionExpr(
             function_name=cons.key,
             arguments=arguments
@@ -155,13 +159,21 @@ def traverse_conditions(cons, fn=None) -> ttypes.ParsedExpr:
         expr_type = ttypes.ParsedExprType(function_expr=func_expr)
         parsed_expr = ttypes.ParsedExpr(type=expr_type)
         return parsed_expr
+    elif isinstance(cons, exp.Placeholder):
+        # :name in the filter of a prepared query, params maps the name to its binding slots
+        if params is None or not cons.name:
+            raise InfinityException(ErrorCode.INVALID_EXPRESSION,
+                                    f"Invalid placeholder: {cons}, only named placeholders of prepared queries are allowed")
+        expr_type = ttypes.ParsedExprType()
+        params.setdefault(cons.name, []).append(functools.partial(bind_constant_expr, expr_type))
+        return ttypes.ParsedExpr(type=expr_type)
     else:
         raise InfinityException(ErrorCode.INVALID_EXPRESSION, f"unknown condition type: {cons}")
 
 
-def parse_expr(expr) -> ttypes.ParsedExpr:
+def parse_expr(expr, params=None) -> ttypes.ParsedExpr:
     try:
-        return traverse_conditions(expr, parse_expr)
+        return traverse_conditions(expr, parse_expr, params)
     except:
         if isinstance(expr, exp.Star):
             column_expr = ttypes.ColumnExpr(
@@ -175,6 +187,31 @@ def parse_expr(expr) -> ttypes.ParsedExpr:
             raise InfinityException(ErrorCode.INVALID_EXPRESSION, f"unknown expression type: {expr}")
 
 
+def parse_filter(where: str, params: dict = None) -> ttypes.ParsedExpr:
+    parsed_expr = expression_cache.get(("filter", where))
+    if parsed_expr is not None:
+        return parsed_expr
+    cons = condition(where)
+    # a filter with placeholders gets a tree of its own, since bind() writes into it
+    if next(cons.find_all(exp.Placeholder), None) is not None:
+        return traverse_conditions(cons, params=params)
+    parsed_expr = traverse_conditions(cons)
+    expression_cache.put(("filter", where), parsed_expr)
+    return parsed_expr
+
+
+def parse_output(column: str) -> ttypes.ParsedExpr:
+    parsed_expr = expression_cache.get(("output", column))
+    if parsed_expr is None:
+        parsed_expr = parse_expr(maybe_parse(column))
+        expression_cache.put(("output", column), parsed_expr)
+    return parsed_expr
+
+
+def bind_constant_expr(expr_type: ttypes.ParsedExprType, query, value):
+    expr_type.constant_expr = get_remote_constant_expr_from_python_value(value)
+
+
 def get_remote_constant_expr_from_python_value(value) -> ttypes.ConstantExpr:
     # convert numpy types
     if isinstance(value, np.integer):
@@ -252,13 +289,14 @@ def get_remote_constant_expr_from_python_value(value) -> ttypes.ConstantExpr:
 #     None,
 # ]
 identifier_limit = 65536
+valid_name_pattern = re.compile(r"^[a-zA-Z][a-zA-Z0-9_]*$")
 
 
 def check_valid_name(name, name_type: str = "Table"):
     if not isinstance(name, str):
         raise InfinityException(ErrorCode.INVALID_IDENTIFIER_NAME,
                                 f"{name_type} name must be a string, got {type(name)}")
-    if not re.match(r"^[a-zA-Z][a-zA-Z0-9_]*$", name):
+    if not valid_name_pattern.match(name):
         raise InfinityException(ErrorCode.INVALID_IDENTIFIER_NAME,
                                 f"{name_type} name '{name}' is not valid. It should start with a letter and can contain only letters, numbers and underscores")
     if len(name) > identifier_limit:
@@ -276,21 +314,39 @@ def check_valid_name(name, name_type: str = "Table"):
         raise InfinityException(ErrorCode.INVALID_IDENTIFIER_NAME, f"invalid name: {name}")
 
 
+def check_valid_name_cached(name, name_type: str = "Table"):
+    # valid names are remembered, an invalid one is checked again and raises on every call
+    if type(name) is str:
+        check_valid_str_name(name, name_type)
+    else:
+        check_valid_name(name, name_type)
+
+
+@functools.lru_cache(maxsize=1024)
+def check_valid_str_name(name: str, name_type: str):
+    check_valid_name(name, name_type)
+
+
+def check_params_enabled(obj) -> bool:
+    # connections hold their client as _client, databases and tables as _conn
+    client = obj._conn if hasattr(obj, "_conn") else obj._client
+    return client.check_params
+
+
 def name_validity_check(arg_name: str, name_type: str = "Table"):
     def decorator(func):
+        # the position of the argument is looked up once, not on every call
+        arg_index = list(inspect.signature(func).parameters.keys()).index(arg_name)
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            if arg_name in kwargs:
-                name = kwargs[arg_name]
-            else:
-                arg_names = list(inspect.signature(func).parameters.keys())
-                name = args[arg_names.index(arg_name)]
-
-            try:
-                check_valid_name(name, name_type)
-                return func(*args, **kwargs)
-            except ValueError as e:
-                raise
+            if check_params_enabled(args[0]):
+                if arg_name in kwargs:
+                    name = kwargs[arg_name]
+                else:
+                    name = args[arg_index]
+                check_valid_name_cached(name, name_type)
+            return func(*args, **kwargs)
 
         return wrapper
 
@@ -298,10 +354,26 @@ def name_validity_check(arg_name: str, name_type: str = "Table"):
 
 
 def select_res_to_polars(res) -> pl.DataFrame:
-    df_dict = {}
-    data_dict, data_type_dict = build_result(res)
-    for k, v in data_dict.items():
-        data_series = pd.Series(v, dtype=logic_type_to_dtype(data_type_dict[k]))
-        df_dict[k] = data_series
+    return build_polars_dataframe(res)
+
+
+def get_create_conflict(conflict_type: ConflictType) -> ttypes.CreateConflict:
+    match conflict_type:
+        case ConflictType.Error:
+            return ttypes.CreateConflict.Error
+        case ConflictType.Ignore:
+            return ttypes.CreateConflict.Ignore
+        case ConflictType.Replace:
+            return ttypes.CreateConflict.Replace
+        case _:
+            raise InfinityException(ErrorCode.INVALID_CONFLICT_TYPE, "Invalid conflict type")
+
 
-    return pl.from_pandas(pd.DataFrame(df_dict))
+def get_drop_conflict(conflict_type: ConflictType) -> ttypes.DropConflict:
+    match conflict_type:
+        case ConflictType.Error:
+            return ttypes.DropConflict.Error
+        case ConflictType.Ignore:
+            return ttypes.DropConflict.Ignore
+        case _:
+            raise InfinityException(ErrorCode.INVALID_CONFLICT_TYPE, "Invalid conflict type")
@@ -16,6 +16,8 @@ from abc import ABC, abstractmethod
 from enum import Enum
 from typing import Optional, Union
 
+import numpy as np
+
 import infinity.remote_thrift.infinity_thrift_rpc.ttypes as ttypes
 from infinity.index import IndexInfo
 from infinity.common import InfinityException
@@ -80,7 +82,15 @@ class Table(ABC):
         pass
 
     @abstractmethod
-    def import_data(self, file_path: str, import_options: {} = None):
+    def insert_columns(self, columns: dict[str, np.ndarray]):
+        pass
+
+    @abstractmethod
+    def import_data(self, file_path: str, import_options: {} = None, upload: bool = False):
+        pass
+
+    @abstractmethod
+    def import_dataframe(self, data):
         pass
 
     @abstractmethod
@@ -0,0 +1,235 @@
+# Copyright(C) 2023 InfiniFlow, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import queue
+import threading
+from typing import Any, Optional
+
+import numpy as np
+
+from infinity.common import InfinityException, SparseVector, SparseMatrix
+from infinity.errors import ErrorCode
+from infinity.utils import to_insert_columns, concat_column
+
+
+def estimate_value_size(value) -> int:
+    # roughly the bytes a value takes in an insert request, used to cut batches
+    match value:
+        case str():
+            return len(value)
+        case bytes():
+            return len(value)
+        case np.ndarray():
+            return value.nbytes
+        case SparseVector():
+            return len(value.indices) * 16
+        case list() | tuple():
+            if len(value) > 0 and isinstance(value[0], (list, tuple, np.ndarray)):
+                return sum(estimate_value_size(element) for element in value)
+            return len(value) * 8
+        case _:
+            return 8
+
+
+def estimate_columns_size(columns: dict[str, np.ndarray]) -> int:
+    size = 0
+    for values in columns.values():
+        if not isinstance(values, SparseMatrix) and values.dtype == object:
+            size += sum(estimate_value_size(value) for value in values)
+        else:
+            size += values.nbytes
+    return size
+
+
+class TableWriter:
+    """
+    Collects rows and frames given to write() and write_columns() into inserts of at most max_rows rows and
+    about max_bytes bytes. Each batch is encoded on the calling thread, while up to `inflight` earlier batches are
+    sent in order by a background thread. Rows with the same columns, or frames with the same columns,
+    share a batch; a change of columns cuts the batch.
+
+    The first failed insert stops the writer: batches queued after it are dropped and the error is
+    raised by every later write() and flush(), and by close(). A batch that fails to encode is dropped
+    and the error is raised by the call that cut it. Leaving a with block normally flushes and closes
+    the writer. Leaving it by an exception drops the rows not cut into a batch yet, waits for the
+    batches already queued and lets the original exception through.
+
+    A writer is used from one thread, and its table's connection must not be used for other calls
+    while the writer is open.
+    """
+
+    def __init__(self, table, max_rows: int, max_bytes: int, inflight: int):
+        if max_rows < 1 or max_bytes < 1 or inflight < 1:
+            raise InfinityException(ErrorCode.INVALID_PARAMETER_VALUE,
+                                    f"Invalid writer limits: max_rows={max_rows}, max_bytes={max_bytes}, "
+                                    f"inflight={inflight}, all of them must be positive")
+        self._table = table
+        self._max_rows = max_rows
+        self._max_bytes = max_bytes
+        # one slot per batch queued or being sent
+        self._slots = threading.Semaphore(inflight)
+        self._queue = queue.Queue()
+        self._error: Optional[Exception] = None
+        self._closed = False
+        self.written_rows = 0
+
+        # the batch being collected: row dicts or column dicts, with the column names they share
+        self._rows: list[dict[str, Any]] = []
+        self._frames: list[dict[str, np.ndarray]] = []
+        self._column_names: Optional[tuple[str, ...]] = None
+        self._buffer_rows = 0
+        self._buffer_bytes = 0
+
+        self._thread = threading.Thread(target=self._send_batches, name="infinity-table-writer", daemon=True)
+        self._thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+            return False
+        self._clear_buffer()
+        self._stop()
+        return False
+
+    def write(self, data):
+        """
+        Adds a row dict, a list of row dicts, or a frame: a DataFrame or an Arrow table.
+        """
+        self._check_open()
+        columns = to_insert_columns(data)
+        if columns is not None:
+            self._write_frame(columns)
+        elif isinstance(data, dict):
+            self._write_row(data)
+        else:
+            for row in data:
+                self._write_row(row)
+
+    def write_columns(self, columns: dict[str, np.ndarray]):
+        """
+        Adds a frame given as a dict of column names to ndarrays, like Table.insert_columns.
+        """
+        self._check_open()
+        self._write_frame(to_insert_columns(columns, columnar=True))
+
+    def flush(self):
+        """
+        Sends the rows collected so far and waits until every batch is inserted.
+        """
+        self._check_open()
+        self._cut_batch()
+        self._queue.join()
+        self._raise_error()
+
+    def close(self):
+        if self._closed:
+            return
+        try:
+            self.flush()
+        finally:
+            self._stop()
+
+    def _check_open(self):
+        if self._closed:
+            raise InfinityException(ErrorCode.INVALID_PARAMETER_VALUE, "Table writer is closed")
+        self._raise_error()
+
+    def _raise_error(self):
+        if self._error is not None:
+            raise self._error
+
+    def _stop(self):
+        if not self._closed:
+            self._closed = True
+            self._queue.put(None)
+            self._thread.join()
+
+    def _write_row(self, row: dict[str, Any]):
+        column_names = tuple(row.keys())
+        if self._frames or column_names != self._column_names:
+            self._cut_batch()
+            self._column_names = column_names
+        size = sum(estimate_value_size(value) for value in row.values())
+        if self._rows and self._buffer_bytes + size > self._max_bytes:
+            self._cut_batch()
+        self._rows.append(row)
+        self._buffer_rows += 1
+        self._buffer_bytes += size
+        if self._buffer_rows >= self._max_rows:
+            self._cut_batch()
+
+    def _write_frame(self, columns: dict[str, np.ndarray]):
+        column_names = tuple(columns.keys())
+        if self._rows or column_names != self._column_names:
+            self._cut_batch()
+            self._column_names = column_names
+        rows = len(next(iter(columns.values()))) if columns else 0
+        if rows == 0:
+            return
+        row_bytes = max(estimate_columns_size(columns) // rows, 1)
+        begin = 0
+        while begin < rows:
+            # as many rows as still fit in the batch, at least one
+            space = min(self._max_rows - self._buffer_rows, (self._max_bytes - self._buffer_bytes) // row_bytes)
+            if space <= 0 and self._buffer_rows > 0:
+                self._cut_batch()
+                continue
+            end = min(rows, begin + max(space, 1))
+            self._frames.append({name: values[begin:end] for name, values in columns.items()})
+            self._buffer_rows += end - begin
+            self._buffer_bytes += (end - begin) * row_bytes
+            begin = end
+            if self._buffer_rows >= self._max_rows or self._buffer_bytes >= self._max_bytes:
+                self._cut_batch()
+
+    def _clear_buffer(self):
+        self._rows = []
+        self._frames = []
+        self._buffer_rows = 0
+        self._buffer_bytes = 0
+
+    def _cut_batch(self):
+        if self._buffer_rows == 0:
+            return
+        columnar = bool(self._frames)
+        if columnar:
+            data = {name: concat_column([frame[name] for frame in self._frames]) for name in self._column_names}
+        else:
+            data = self._rows
+        rows = self._buffer_rows
+        self._clear_buffer()
+        # encoded here, on the calling thread, while the background thread sends the earlier batches
+        request = self._table._encode_insert(data, columnar)
+        self._slots.acquire()
+        self._queue.put((request, rows))
+
+    def _send_batches(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                self._queue.task_done()
+                return
+            request, rows = item
+            try:
+                if self._error is None:
+                    self._table._send_insert(request)
+                    self.written_rows += rows
+            except Exception as e:
+                self._error = e
+            finally:
+                self._slots.release()
+                self._queue.task_done()
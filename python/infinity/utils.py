@@ -12,8 +12,16 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import re
+import threading
 import warnings
-from infinity.common import InfinityException
+from collections import OrderedDict, namedtuple
+from typing import Any, Hashable, Optional
+
+import numpy as np
+import pyarrow as pa
+
+from infinity.common import InfinityException, SparseMatrix
 from infinity.errors import ErrorCode
 
 
@@ -49,3 +57,250 @@ def binary_exp_to_paser_exp(binary_expr_key) -> str:
 
 def deprecated_api(message):
     warnings.warn(message, DeprecationWarning, stacklevel=2)
+
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+class ExpressionCache:
+    """
+    A bounded LRU cache of parsed expression trees keyed by the expression text, safe to share
+    between threads. The cached trees are shared by every query using them and must not be modified.
+    """
+
+    def __init__(self, maxsize: int):
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self._maxsize = maxsize
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: Hashable) -> Any:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any):
+        with self._lock:
+            if self._maxsize <= 0:
+                return
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def resize(self, maxsize: int):
+        with self._lock:
+            self._maxsize = maxsize
+            while len(self._entries) > max(maxsize, 0):
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def cache_info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._maxsize, len(self._entries))
+
+
+def arrow_column_to_numpy(column: pa.ChunkedArray) -> np.ndarray:
+    column = column.combine_chunks()
+    if pa.types.is_fixed_size_list(column.type):
+        values = column.flatten().to_numpy(zero_copy_only=False)
+        return values.reshape(len(column), column.type.list_size)
+    return column.to_numpy(zero_copy_only=False)
+
+
+def to_insert_columns(data, columnar: bool = False) -> Optional[dict[str, np.ndarray]]:
+    """
+    Returns the columns of a pandas/polars DataFrame or an Arrow Table, or None for row-wise insert data.
+    With columnar, data must be a dict mapping each column name to an ndarray with one entry per row, or to a
+    SparseMatrix for a sparse column; a dict is a row otherwise, even if its values are ndarrays. Vector columns
+    are returned as 2-D arrays.
+    """
+    if columnar:
+        if not isinstance(data, dict) or not data or not all(isinstance(values, (np.ndarray, SparseMatrix))
+                                                             for values in data.values()):
+            raise InfinityException(ErrorCode.INVALID_PARAMETER_VALUE,
+                                    f"Expect a dict of column names to ndarrays, got {type(data).__name__}")
+        columns = dict(data)
+    elif isinstance(data, pa.Table):
+        columns = {name: arrow_column_to_numpy(data[name]) for name in data.column_names}
+    elif hasattr(data, "columns") and hasattr(data, "to_numpy"):
+        # pandas and polars DataFrame
+        columns = {str(name): data[name].to_numpy() for name in data.columns}
+    else:
+        return None
+
+    row_count = None
+    for name, values in columns.items():
+        if isinstance(values, SparseMatrix):
+            pass
+        elif values.dtype == object and len(values) > 0 and not isinstance(values[0], (str, bytes)):
+            # one list or array per row
+            try:
+                values = np.stack([np.asarray(value) for value in values])
+            except ValueError:
+                raise InfinityException(ErrorCode.INVALID_PARAMETER_VALUE,
+                                        f"Column {name} has vectors of different dimensions")
+            columns[name] = values
+        if not isinstance(values, SparseMatrix) and values.ndim not in (1, 2):
+            raise InfinityException(ErrorCode.INVALID_PARAMETER_VALUE,
+                                    f"Column {name} has {values.ndim} dimensions, expect 1 or 2")
+        if row_count is None:
+            row_count = len(values)
+        elif len(values) != row_count:
+            raise InfinityException(ErrorCode.INVALID_PARAMETER_VALUE,
+                                    f"Column {name} has {len(values)} rows, expect {row_count}")
+    return columns
+
+
+def column_to_rows(values) -> list:
+    # the python values of the rows of an insert column
+    if isinstance(values, SparseMatrix):
+        return [values.row(i) for i in range(len(values))]
+    return values.tolist()
+
+
+def concat_column(parts: list):
+    if not isinstance(parts[0], SparseMatrix):
+        return np.concatenate(parts)
+    indptr = [np.zeros(1, dtype=np.int64)]
+    for part in parts:
+        indptr.append(part.indptr[1:] - part.indptr[0] + indptr[-1][-1])
+    return SparseMatrix(np.concatenate(indptr),
+                        np.concatenate([part.indices[part.indptr[0]:part.indptr[-1]] for part in parts]),
+                        np.concatenate([part.data[part.indptr[0]:part.indptr[-1]] for part in parts]),
+                        parts[0].dimension)
+
+
+# show_columns type names -> Arrow types the server's parquet import reads them from
+IMPORT_ARROW_TYPES = {
+    "Boolean": pa.bool_(),
+    "TinyInt": pa.int8(),
+    "SmallInt": pa.int16(),
+    "Integer": pa.int32(),
+    "BigInt": pa.int64(),
+    "Float16": pa.float16(),
+    "BFloat16": pa.float32(),
+    "Float": pa.float32(),
+    "Double": pa.float64(),
+    "Varchar": pa.string(),
+}
+
+IMPORT_ARROW_ELEMENT_TYPES = {
+    "bit": pa.bool_(),
+    "uint8": pa.uint8(),
+    "int8": pa.int8(),
+    "int16": pa.int16(),
+    "int32": pa.int32(),
+    "int64": pa.int64(),
+    "float16": pa.float16(),
+    "bfloat16": pa.float32(),
+    "float": pa.float32(),
+    "double": pa.float64(),
+}
+
+
+def to_import_array(name: str, column_type: str, values: np.ndarray) -> pa.Array:
+    if column_type in IMPORT_ARROW_TYPES:
+        if values.ndim != 1:
+            raise InfinityException(ErrorCode.DATA_TYPE_MISMATCH,
+                                    f"Column {name} of {column_type} is given vectors")
+        arrow_type = IMPORT_ARROW_TYPES[column_type]
+        if arrow_type == pa.string():
+            return pa.array(values, type=arrow_type)
+        return pa.array(values.astype(arrow_type.to_pandas_dtype(), copy=False))
+
+    embedding = re.fullmatch(r"Embedding\((\w+),(\d+)\)", column_type)
+    if embedding is None or embedding.group(1) not in IMPORT_ARROW_ELEMENT_TYPES:
+        raise InfinityException(ErrorCode.NOT_SUPPORTED,
+                                f"Column {name} of {column_type} can't be imported from a frame, use insert instead")
+    dimension = int(embedding.group(2))
+    if values.ndim != 2 or values.shape[1] != dimension:
+        raise InfinityException(ErrorCode.DATA_TYPE_MISMATCH,
+                                f"Column {name} of {column_type} is given {values.shape[1:]} values per row")
+    element_type = IMPORT_ARROW_ELEMENT_TYPES[embedding.group(1)]
+    elements = values.astype(element_type.to_pandas_dtype(), copy=False).reshape(-1)
+    return pa.FixedSizeListArray.from_arrays(pa.array(elements, type=element_type), dimension)
+
+
+def to_import_table(data, column_types: list[tuple[str, str]]) -> pa.Table:
+    """
+    Converts a pandas/polars DataFrame, an Arrow Table or a dict of ndarrays into an Arrow table with the
+    columns of a table in its order and with the types its parquet import expects. column_types are the
+    (name, type) pairs of show_columns. Every column of the table must be given.
+    """
+    # nothing here is a row, so a dict is always columns
+    columns = to_insert_columns(data, columnar=isinstance(data, dict))
+    if columns is None:
+        raise InfinityException(ErrorCode.INVALID_PARAMETER_VALUE,
+                                f"Can't import {type(data).__name__}, expect a DataFrame, an Arrow Table "
+                                f"or a dict of ndarrays")
+    names = [name for name, _ in column_types]
+    for name in columns:
+        if name not in names:
+            raise InfinityException(ErrorCode.COLUMN_NOT_EXIST, f"Column {name} doesn't exist in the table")
+    missing = [name for name in names if name not in columns]
+    if missing:
+        raise InfinityException(ErrorCode.COLUMN_COUNT_MISMATCH,
+                                f"Columns {', '.join(missing)} aren't given, import needs every column of the table")
+    arrays = [to_import_array(name, column_type, columns[name]) for name, column_type in column_types]
+    return pa.Table.from_arrays(arrays, names=names)
+
+
+# embedding data type names of match_dense and match_tensor -> little-endian dtype of a packed query
+EMBEDDING_DATA_DTYPES = {
+    'unsigned tinyint': '<u1', 'uint8': '<u1', 'u8': '<u1',
+    'tinyint': '<i1', 'int8': '<i1', 'i8': '<i1',
+    'smallint': '<i2', 'int16': '<i2', 'i16': '<i2',
+    'int': '<i4', 'int32': '<i4', 'i32': '<i4',
+    'bigint': '<i8', 'int64': '<i8', 'i64': '<i8',
+    'float': '<f4', 'float32': '<f4', 'f32': '<f4',
+    'double': '<f8', 'float64': '<f8', 'f64': '<f8',
+    'float16': '<f2', 'fp16': '<f2', 'f16': '<f2',
+    'bfloat16': '<u2', 'bf16': '<u2',
+}
+
+
+def float32_to_bfloat16(values: np.ndarray) -> np.ndarray:
+    # bfloat16 is the upper half of a float32, round the lower half to nearest even
+    bits = values.astype('<f4').view('<u4')
+    return ((bits + 0x7FFF + ((bits >> 16) & 1)) >> 16).astype('<u2')
+
+
+def pack_embedding(embedding_data, embedding_data_type: str) -> bytes:
+    """
+    Packs query vectors into the little-endian layout of embedding_data_type, all elements at once.
+    Integer types take integers, or floats holding whole numbers, within the range of the type.
+    """
+    if embedding_data_type not in EMBEDDING_DATA_DTYPES:
+        raise InfinityException(ErrorCode.INVALID_EMBEDDING_DATA_TYPE, f"Invalid embedding data type {embedding_data_type}")
+    try:
+        values = np.asarray(embedding_data).reshape(-1)
+    except ValueError:
+        raise InfinityException(ErrorCode.INVALID_EMBEDDING_DATA_TYPE, "Invalid embedding data, vectors of different dimensions")
+    if values.size == 0 or values.dtype.kind not in 'biuf':
+        raise InfinityException(ErrorCode.INVALID_EMBEDDING_DATA_TYPE,
+                                f"Invalid embedding data of {values.dtype}, expect a non-empty array of numbers")
+
+    dtype = np.dtype(EMBEDDING_DATA_DTYPES[embedding_data_type])
+    if embedding_data_type in ('bfloat16', 'bf16'):
+        return float32_to_bfloat16(values).tobytes()
+    if dtype.kind in 'iu':
+        if values.dtype.kind == 'f' and not np.array_equal(values, np.trunc(values)):
+            raise InfinityException(ErrorCode.INVALID_EMBEDDING_DATA_TYPE,
+                                    f"Invalid embedding data, {embedding_data_type} expects whole numbers")
+        info = np.iinfo(dtype)
+        if values.min() < info.min or values.max() > info.max:
+            raise InfinityException(ErrorCode.INVALID_EMBEDDING_DATA_TYPE,
+                                    f"Invalid embedding data, out of the range of {embedding_data_type}")
+    return values.astype(dtype, copy=False).tobytes()
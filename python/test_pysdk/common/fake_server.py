@@ -0,0 +1,156 @@
+# Copyright(C) 2023 InfiniFlow, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import collections
+import socket
+import threading
+import time
+
+import numpy as np
+from thrift.protocol import TBinaryProtocol, TCompactProtocol
+from thrift.server import TServer
+from thrift.transport import TSocket, TTransport
+from thrift.transport.TTransport import TTransportException
+
+from infinity.common import NetworkAddress
+from infinity.errors import ErrorCode
+from infinity.remote_thrift.infinity_thrift_rpc import InfinityService
+from infinity.remote_thrift.infinity_thrift_rpc.ttypes import *
+
+
+class FakeInfinityHandler:
+    """
+    The RPCs the client side tests of remote connections need, answered without a server. A Select returns
+    select_rows rows of an int column "id" holding the limit of the request, so that a test tells the responses
+    apart. The columns of every Insert are kept in inserts. stall and drop make the next calls slow or lose their
+    response.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._last_session = 0
+        # sessions connected and not disconnected yet
+        self.sessions = set()
+        self.calls = collections.Counter()
+        self._stalls = collections.deque()
+        self._drops = collections.Counter()
+        self.select_rows = 1
+        self.inserts = []
+
+    def stall(self, seconds: float, count: int = 1):
+        # the next count Selects are answered after seconds
+        with self._lock:
+            self._stalls.extend([seconds] * count)
+
+    def drop(self, rpc: str, count: int = 1):
+        # the server closes the socket of the next count calls of rpc instead of answering them
+        with self._lock:
+            self._drops[rpc] += count
+
+    def _enter(self, rpc: str):
+        with self._lock:
+            self.calls[rpc] += 1
+            if self._drops[rpc] > 0:
+                self._drops[rpc] -= 1
+                raise TTransportException(TTransportException.UNKNOWN, f"{rpc} dropped")
+            stall = self._stalls.popleft() if rpc == "Select" and self._stalls else 0
+        time.sleep(stall)
+
+    def Connect(self, request):
+        self._enter("Connect")
+        with self._lock:
+            self._last_session += 1
+            self.sessions.add(self._last_session)
+            return CommonResponse(error_code=ErrorCode.OK, session_id=self._last_session)
+
+    def Disconnect(self, request):
+        self._enter("Disconnect")
+        with self._lock:
+            if request.session_id not in self.sessions:
+                return CommonResponse(error_code=ErrorCode.SESSION_NOT_FOUND,
+                                      error_msg=f"Session {request.session_id} not found")
+            self.sessions.remove(request.session_id)
+            return CommonResponse(error_code=ErrorCode.OK)
+
+    def ListDatabase(self, request):
+        self._enter("ListDatabase")
+        return ListDatabaseResponse(error_code=ErrorCode.OK, db_names=["default_db"])
+
+    def GetDatabase(self, request):
+        self._enter("GetDatabase")
+        return CommonResponse(error_code=ErrorCode.OK)
+
+    def GetTable(self, request):
+        self._enter("GetTable")
+        return CommonResponse(error_code=ErrorCode.OK)
+
+    def Insert(self, request):
+        self._enter("Insert")
+        with self._lock:
+            self.inserts.append(request.columns)
+        return CommonResponse(error_code=ErrorCode.OK)
+
+    def UploadFileChunk(self, request):
+        self._enter("UploadFileChunk")
+        return CommonResponse(error_code=ErrorCode.OK)
+
+    def Import(self, request):
+        self._enter("Import")
+        return CommonResponse(error_code=ErrorCode.OK)
+
+    def Select(self, request):
+        self._enter("Select")
+        limit = request.limit_expr.type.constant_expr.i64_value if request.limit_expr is not None else 0
+        ids = np.full(self.select_rows, limit, np.int32)
+        data_type = DataType(logic_type=LogicType.Integer, physical_type=PhysicalType(number_type=NumberType()))
+        return SelectResponse(error_code=ErrorCode.OK,
+                              column_defs=[ColumnDef(id=0, name="id", data_type=data_type)],
+                              column_fields=[ColumnField(column_type=ColumnType.ColumnInt32,
+                                                         column_vectors=[ids.tobytes()])])
+
+
+class FakeInfinityServer:
+    # serves a FakeInfinityHandler on a free local port, each socket on its own thread
+    def __init__(self, protocol: str = "binary", transport: str = "buffered"):
+        self.handler = FakeInfinityHandler()
+        # connect with the same options
+        self.protocol = protocol
+        self.transport = transport
+        self._socket = TSocket.TServerSocket(host="127.0.0.1", port=0)
+        self._socket.listen()
+        self.port = self._socket.handle.getsockname()[1]
+        self._server = TServer.TThreadedServer(
+            InfinityService.Processor(self.handler), self._socket,
+            TTransport.TFramedTransportFactory() if transport == "framed" else TTransport.TBufferedTransportFactory(),
+            TCompactProtocol.TCompactProtocolFactory() if protocol == "compact"
+            else TBinaryProtocol.TBinaryProtocolFactory())
+        threading.Thread(target=self._serve, daemon=True).start()
+
+    @property
+    def uri(self) -> NetworkAddress:
+        return NetworkAddress("127.0.0.1", self.port)
+
+    def _serve(self):
+        while True:
+            try:
+                client = self._socket.accept()
+            except (OSError, AttributeError):
+                # stopped
+                return
+            threading.Thread(target=self._server.handle, args=(client,), daemon=True).start()
+
+    def stop(self):
+        # the sockets accepted so far are served on
+        self._socket.handle.shutdown(socket.SHUT_RDWR)
+        self._socket.close()
@@ -39,6 +39,7 @@ from infinity.connection_pool import ConnectionPool
 
 
 from common import common_values
+from common.fake_server import FakeInfinityServer
 
 
 @pytest.fixture(scope="function")
@@ -101,6 +102,15 @@ def get_infinity_connection_pool():
     connection_pool.destroy()
 
 
+@pytest.fixture(scope="function", params=[("binary", "buffered")])
+def fake_server(request):
+    # a thrift server on a free local port answering the client without infinity, see common/fake_server.py
+    protocol, transport = request.param
+    server = FakeInfinityServer(protocol, transport)
+    yield server
+    server.stop()
+
+
 @pytest.fixture(scope="class")
 def check_data(request):
     file_name = request.param["file_name"]
@@ -0,0 +1,83 @@
+import sys
+import os
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+import asyncio
+import pytest
+import infinity
+from infinity.common import RetryPolicy
+from infinity.errors import ErrorCode
+from infinity.remote_thrift.async_client import MessageScanner
+
+
+class TestAsyncClient:
+    @pytest.mark.parametrize("fake_server", [("binary", "buffered"), ("binary", "framed"),
+                                             ("compact", "buffered"), ("compact", "framed")], indirect=True)
+    def test_large_response(self, fake_server, monkeypatch):
+        scans = []
+        message_size = MessageScanner.message_size
+
+        def counted(scanner, protocol):
+            scans.append(protocol)
+            return message_size(scanner, protocol)
+
+        monkeypatch.setattr(MessageScanner, "message_size", counted)
+
+        async def select():
+            infinity_obj = await infinity.connect_async(fake_server.uri, protocol=fake_server.protocol,
+                                                        transport=fake_server.transport)
+            db_obj = await infinity_obj.get_database("default_db")
+            table_obj = await db_obj.get_table("test_large_response")
+            res = await table_obj.output(["id"]).limit(7).to_pl()
+            await infinity_obj.disconnect()
+            return res
+
+        # 32 MiB, which arrives in many reads
+        fake_server.handler.select_rows = 8 << 20
+        res = asyncio.run(select())
+        assert len(res) == 8 << 20 and res["id"][0] == 7 and res["id"][-1] == 7
+        # a buffered response is scanned for its end again only once the bytes it needs arrived: once for each of
+        # the four small responses, at most twice for the Select
+        if fake_server.transport == "buffered":
+            assert 4 < len(scans) <= 6
+        else:
+            assert not scans
+
+    def test_sessions_ended(self, fake_server):
+        async def run():
+            infinity_obj = await infinity.connect_async(fake_server.uri, max_connections=2,
+                                                        retry=RetryPolicy(max_retries=3, backoff=0.01))
+            client = infinity_obj.client
+            db_obj = await infinity_obj.get_database("default_db")
+            table_obj = await db_obj.get_table("test_sessions")
+
+            # the response of a cancelled Select is read on, its socket is reused after it
+            fake_server.handler.stall(0.3)
+            select = asyncio.ensure_future(table_obj.output(["id"]).limit(1).to_pl())
+            await asyncio.sleep(0.1)
+            select.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await select
+            assert (await table_obj.output(["id"]).limit(2).to_pl())["id"][0] == 2
+            await asyncio.gather(*client._tasks)
+            assert len(client._idle) == 2
+            assert fake_server.handler.calls["Connect"] == 2
+
+            # a socket closed by a lost response, its session is ended over another one
+            fake_server.handler.drop("Select")
+            assert (await table_obj.output(["id"]).limit(3).to_pl())["id"][0] == 3
+            assert len(fake_server.handler.sessions) == 1
+
+            # a socket in use is disconnected once its request is done
+            fake_server.handler.stall(0.3)
+            select = asyncio.ensure_future(table_obj.output(["id"]).limit(4).to_pl())
+            await asyncio.sleep(0.1)
+            assert (await infinity_obj.disconnect()).error_code == ErrorCode.OK
+            assert (await select)["id"][0] == 4
+            await asyncio.gather(*client._tasks)
+
+        asyncio.run(run())
+        assert fake_server.handler.sessions == set()
+        assert fake_server.handler.calls["Disconnect"] == fake_server.handler.calls["Connect"]
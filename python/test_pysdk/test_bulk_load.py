@@ -0,0 +1,88 @@
+# Copyright(C) 2023 InfiniFlow, Inc. All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      https://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import sys
+import os
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+import numpy as np
+import pytest
+from infinity.connection_pool import ConnectionPool
+from infinity.remote_thrift.client import TRANSPORT_ERRORS
+from infinity.remote_thrift.infinity_thrift_rpc.ttypes import ColumnType, ElementType
+
+
+def write_csr(path, indptr, indices, data, ncol):
+    with open(path, "wb") as f:
+        np.array([len(indptr) - 1, ncol, len(indices)], dtype=np.int64).tofile(f)
+        np.asarray(indptr, dtype=np.int64).tofile(f)
+        np.asarray(indices, dtype=np.int32).tofile(f)
+        np.asarray(data, dtype=np.float32).tofile(f)
+
+
+def read_sparse_column(column):
+    # row count, indptr, indices and float32 values
+    raw = column.column_vector
+    rows = int(np.frombuffer(raw, dtype="<i8", count=1)[0])
+    indptr = np.frombuffer(raw, dtype="<i8", count=rows + 1, offset=8)
+    nnz = int(indptr[-1])
+    indices = np.frombuffer(raw, dtype="<i8", count=nnz, offset=(rows + 2) * 8)
+    data = np.frombuffer(raw, dtype="<f4", count=nnz, offset=(rows + 2 + nnz) * 8)
+    assert len(raw) == (rows + 2 + nnz) * 8 + nnz * 4
+    return indptr, indices, data
+
+
+class TestBulkLoad:
+    def test_csr_columns(self, fake_server, tmp_path):
+        # row i has the i % 3 entries 0..i % 3 - 1 valued i
+        indptr = np.cumsum([0] + [i % 3 for i in range(10)])
+        indices = np.concatenate([np.arange(i % 3) for i in range(10)])
+        data = np.concatenate([np.full(i % 3, i) for i in range(10)])
+        write_csr(tmp_path / "vectors.csr", indptr, indices, data, 100)
+
+        pool = ConnectionPool(uri=fake_server.uri, min_size=1, max_size=2)
+        res = pool.bulk_load("test_bulk_load", str(tmp_path / "vectors.csr"), workers=2, batch_rows=4,
+                             columns=["id", "vec"])
+        assert res.rows == 10 and res.batches == 3
+
+        # each batch is one int64 id column and one sparse column with its own indptr from 0
+        batches = sorted(fake_server.handler.inserts, key=lambda columns: columns[0].column_vector)
+        assert len(batches) == 3
+        for begin, (ids, vectors) in zip((0, 4, 8), batches):
+            end = min(begin + 4, 10)
+            assert ids.column_type == ColumnType.ColumnInt64
+            assert np.frombuffer(ids.column_vector, dtype="<i8").tolist() == list(range(begin, end))
+            assert vectors.column_type == ColumnType.ColumnSparse
+            assert vectors.element_type == ElementType.ElementFloat32 and vectors.dimension == 100
+            batch_indptr, batch_indices, batch_data = read_sparse_column(vectors)
+            assert batch_indptr.tolist() == (indptr[begin:end + 1] - indptr[begin]).tolist()
+            assert batch_indices.tolist() == indices[indptr[begin]:indptr[end]].tolist()
+            assert batch_data.tolist() == data[indptr[begin]:indptr[end]].tolist()
+        pool.destroy()
+
+    def test_broken_connection_discarded(self, fake_server):
+        pool = ConnectionPool(uri=fake_server.uri, min_size=1, max_size=1)
+        fake_server.handler.drop("Insert")
+        with pytest.raises(TRANSPORT_ERRORS):
+            pool.bulk_load("test_bulk_load", {"id": np.arange(10)}, workers=1, batch_rows=10)
+        # the connection which lost its socket is closed, not handed out again
+        stats = pool.stats()
+        assert stats.in_use == 0 and stats.closed == 1
+
+        res = pool.bulk_load("test_bulk_load", {"id": np.arange(10)}, workers=1, batch_rows=5)
+        assert res.rows == 10
+        assert pool.stats().created == 2
+        pool.destroy()
@@ -8,7 +8,8 @@ import pytest
 from common import common_values
 import time
 from infinity.connection_pool import ConnectionPool
-from infinity.common import ConflictType
+from infinity.common import ConflictType, InfinityException
+import numpy as np
 
 import infinity
 from infinity.errors import ErrorCode
@@ -72,9 +73,134 @@ class TestInfinity:
         #test timeout is ok
         connection_pool = ConnectionPool(uri=self.uri, min_size=4, max_size=8, timeout=5.0)
         begin_time = time.time()
-        try:
+        conns = []
+        with pytest.raises(InfinityException) as e:
             while True:
-                connection_pool.get_conn()
-        except Exception as e:
-            print(e)
-        assert time.time() - begin_time < 10
\ No newline at end of file
+                conns.append(connection_pool.get_conn())
+        assert e.value.error_code == ErrorCode.TOO_MANY_CONNECTIONS
+        assert len(conns) == 8
+        assert time.time() - begin_time < 10
+        stats = connection_pool.stats()
+        assert stats.timeouts == 1
+        # the wait of the timed out get isn't averaged over the successful ones
+        assert stats.mean_wait_time < 1.0
+        for conn in conns:
+            connection_pool.release_conn(conn)
+        connection_pool.destroy()
+
+        with pytest.raises(InfinityException) as e:
+            connection_pool.get_conn()
+        assert e.value.error_code == ErrorCode.CLIENT_CLOSE
+
+    def test_connection_context(self):
+        connection_pool = ConnectionPool(uri=self.uri, min_size=2, max_size=4, validation_interval=None)
+        for i in range(10):
+            with connection_pool.connection() as infinity_obj:
+                res = infinity_obj.list_databases()
+                assert "default_db" in res.db_names
+        # the last released connection is reused, the pool doesn't grow
+        with connection_pool.connection() as first:
+            with connection_pool.connection() as second:
+                assert first is not second
+            with connection_pool.connection() as third:
+                assert third is second
+
+        stats = connection_pool.stats()
+        assert stats.size == 2 and stats.idle == 2 and stats.in_use == 0
+        assert stats.gets == 13 and stats.peak_in_use == 2 and stats.created == 2
+        assert stats.utilization == 0
+        connection_pool.destroy()
+        assert connection_pool.stats().size == 0
+
+    def test_eviction(self):
+        connection_pool = ConnectionPool(uri=self.uri, min_size=1, max_size=4, idle_timeout=0.1,
+                                         validation_interval=None)
+        conns = [connection_pool.get_conn() for _ in range(3)]
+        for conn in conns:
+            connection_pool.release_conn(conn)
+        assert connection_pool.stats().size == 3
+        time.sleep(0.2)
+        connection_pool.maintain()
+        stats = connection_pool.stats()
+        assert stats.size == 1 and stats.closed == 2
+
+        connection_pool.idle_timeout_ = None
+        connection_pool.max_lifetime_ = 0.1
+        conn = connection_pool.get_conn()
+        time.sleep(0.2)
+        # an expired connection is closed on release and replaced by maintain
+        connection_pool.release_conn(conn)
+        assert connection_pool.stats().size == 0
+        connection_pool.maintain()
+        stats = connection_pool.stats()
+        assert stats.size == 1 and stats.idle == 1 and stats.closed == 3
+        connection_pool.destroy()
+
+        # a connection opened by maintain while the pool is destroyed is closed
+        connection_pool.curr_size_ += 1
+        connection_pool._add_idle(connection_pool._create_conn())
+        stats = connection_pool.stats()
+        assert stats.size == 0 and stats.idle == 0 and stats.closed == 5
+
+    @pytest.mark.usefixtures("skip_if_local_infinity")
+    @pytest.mark.usefixtures("skip_if_http")
+    def test_failed_init(self, monkeypatch):
+        conns = []
+        connect = infinity.connect
+
+        def connect_twice(*args, **kwargs):
+            if len(conns) == 2:
+                raise InfinityException(ErrorCode.TOO_MANY_CONNECTIONS, "refused")
+            conns.append(connect(*args, **kwargs))
+            return conns[-1]
+
+        monkeypatch.setattr(infinity, "connect", connect_twice)
+        with pytest.raises(InfinityException) as e:
+            ConnectionPool(uri=self.uri, min_size=4, max_size=4)
+        assert e.value.error_code == ErrorCode.TOO_MANY_CONNECTIONS
+        # the two connections opened before the failure are disconnected
+        for conn in conns:
+            with pytest.raises(InfinityException) as e:
+                conn.list_databases()
+            assert e.value.error_code == ErrorCode.CLIENT_CLOSE
+
+    @pytest.mark.usefixtures("skip_if_local_infinity")
+    @pytest.mark.usefixtures("skip_if_http")
+    def test_bulk_load(self, suffix, tmp_path):
+        connection_pool = ConnectionPool(uri=self.uri, min_size=2, max_size=4)
+        infinity_obj = connection_pool.get_conn()
+        db_obj = infinity_obj.get_database("default_db")
+        table_name = "test_bulk_load" + suffix
+        db_obj.drop_table(table_name, ConflictType.Ignore)
+        table_obj = db_obj.create_table(table_name, {"id": {"type": "int64"}, "vec": {"type": "vector,4,float"}})
+
+        vectors = np.arange(1000 * 4, dtype=np.float32).reshape(1000, 4)
+        fvecs_path = tmp_path / "vectors.fvecs"
+        fvecs = np.empty((1000, 5), dtype=np.int32)
+        fvecs[:, 0] = 4
+        fvecs[:, 1:] = vectors.view(np.int32)
+        fvecs.tofile(fvecs_path)
+
+        reports = []
+        res = connection_pool.bulk_load(table_name, str(fvecs_path), workers=3, batch_rows=64,
+                                        columns=["id", "vec"], progress=reports.append)
+        assert res.rows == 1000 and res.batches == 16
+        assert res.bytes == vectors.nbytes
+        assert reports[-1].rows == 1000
+
+        rows = ({"id": 1000 + i, "vec": [float(i)] * 4} for i in range(500))
+        res = connection_pool.bulk_load(table_name, rows, workers=2, batch_rows=100)
+        assert res.rows == 500 and res.batches == 5
+
+        res = table_obj.output(["count(*)"]).to_pl()
+        assert res.item(0, 0) == 1500
+        res = table_obj.output(["vec"]).filter("id = 999").to_df()
+        assert list(res["vec"][0]) == list(vectors[999])
+
+        with pytest.raises(InfinityException) as e:
+            connection_pool.bulk_load(table_name, str(tmp_path / "missing.fvecs"), columns=["vec"])
+        assert e.value.error_code == ErrorCode.FILE_NOT_FOUND
+
+        db_obj.drop_table(table_name, ConflictType.Error)
+        connection_pool.release_conn(infinity_obj)
+        connection_pool.destroy()
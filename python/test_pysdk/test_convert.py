@@ -5,6 +5,9 @@ parent_dir = os.path.dirname(current_dir)
 if parent_dir not in sys.path:
     sys.path.insert(0, parent_dir)
 import pytest
+import pyarrow as pa
+import polars as pl
+import numpy as np
 from infinity.errors import ErrorCode
 from common import common_values
 import infinity
@@ -63,6 +66,99 @@ class TestInfinity:
         res = table_obj.output(["c1", "c2", "c1"]).to_arrow()
         print(res)
         db_obj.drop_table("test_to_pa"+suffix, ConflictType.Error)
+
+    @pytest.mark.usefixtures("skip_if_http")
+    def test_to_pa_column_types(self, suffix):
+        db_obj = self.infinity_obj.get_database("default_db")
+        db_obj.drop_table("test_to_pa_column_types"+suffix, ConflictType.Ignore)
+        db_obj.create_table("test_to_pa_column_types"+suffix, {
+            "c1": {"type": "int"}, "c2": {"type": "varchar"}, "c3": {"type": "vector,4,float"}}, ConflictType.Error)
+
+        table_obj = db_obj.get_table("test_to_pa_column_types"+suffix)
+        table_obj.insert([{"c1": 1, "c2": "hello", "c3": [1.0, 2.0, 3.0, 4.0]},
+                          {"c1": 2, "c2": "", "c3": [5.0, 6.0, 7.0, 8.0]},
+                          {"c1": 3, "c2": "世界", "c3": [0.5, 0.5, 0.5, 0.5]}])
+        res = table_obj.output(["c1", "c2", "c3"]).to_arrow()
+        print(res)
+        assert res.schema.field("c1").type == pa.int32()
+        assert res.schema.field("c2").type == pa.string()
+        assert res.schema.field("c3").type == pa.list_(pa.float32(), 4)
+        assert res.column("c2").to_pylist() == ["hello", "", "世界"]
+        assert res.column("c3").to_pylist() == [[1.0, 2.0, 3.0, 4.0], [5.0, 6.0, 7.0, 8.0], [0.5, 0.5, 0.5, 0.5]]
+        db_obj.drop_table("test_to_pa_column_types"+suffix, ConflictType.Error)
+
+    @pytest.mark.usefixtures("skip_if_http")
+    def test_to_pl_column_types(self, suffix):
+        db_obj = self.infinity_obj.get_database("default_db")
+        db_obj.drop_table("test_to_pl_column_types"+suffix, ConflictType.Ignore)
+        db_obj.create_table("test_to_pl_column_types"+suffix, {
+            "c1": {"type": "int"}, "c2": {"type": "varchar"}, "c3": {"type": "vector,4,float"}}, ConflictType.Error)
+
+        table_obj = db_obj.get_table("test_to_pl_column_types"+suffix)
+        table_obj.insert([{"c1": 1, "c2": "hello", "c3": [1.0, 2.0, 3.0, 4.0]},
+                          {"c1": 2, "c2": "世界", "c3": [5.0, 6.0, 7.0, 8.0]}])
+        res = table_obj.output(["c1", "c2", "c3", "c1"]).to_pl()
+        print(res)
+        assert res.columns == ["c1", "c2", "c3", "c1_2"]
+        assert res["c1"].dtype == pl.Int32
+        assert res["c2"].dtype == pl.String
+        assert res["c3"].dtype == pl.Array(pl.Float32, 4)
+        assert res["c2"].to_list() == ["hello", "世界"]
+        assert res["c3"].to_list() == [[1.0, 2.0, 3.0, 4.0], [5.0, 6.0, 7.0, 8.0]]
+        db_obj.drop_table("test_to_pl_column_types"+suffix, ConflictType.Error)
+
+    @pytest.mark.usefixtures("skip_if_http")
+    def test_to_numpy(self, suffix):
+        db_obj = self.infinity_obj.get_database("default_db")
+        db_obj.drop_table("test_to_numpy"+suffix, ConflictType.Ignore)
+        db_obj.create_table("test_to_numpy"+suffix, {
+            "c1": {"type": "int"}, "c2": {"type": "varchar"}, "c3": {"type": "vector,4,float"}}, ConflictType.Error)
+
+        table_obj = db_obj.get_table("test_to_numpy"+suffix)
+        table_obj.insert([{"c1": 1, "c2": "a", "c3": [1.0, 2.0, 3.0, 4.0]},
+                          {"c1": 2, "c2": "b", "c3": [5.0, 6.0, 7.0, 8.0]}])
+        res = table_obj.output(["c1", "c2", "c3"]).to_numpy()
+        print(res)
+        assert res["c1"].dtype == np.int32
+        np.testing.assert_array_equal(res["c1"], [1, 2])
+        assert res["c2"].tolist() == ["a", "b"]
+        assert res["c3"].dtype == np.float32
+        assert res["c3"].shape == (2, 4)
+        np.testing.assert_array_equal(res["c3"], [[1, 2, 3, 4], [5, 6, 7, 8]])
+
+        res = table_obj.output(["c1", "_row_id", "_distance"]).match_dense(
+            "c3", [5.0, 6.0, 7.0, 8.0], "float", "l2", 2).to_numpy()
+        print(res)
+        assert res["_row_id"].dtype == np.int64
+        assert res["_distance"].dtype == np.float32
+        assert res["c1"][0] == 2
+        assert res["_distance"][0] == 0.0
+        db_obj.drop_table("test_to_numpy"+suffix, ConflictType.Error)
+
+    @pytest.mark.usefixtures("skip_if_http")
+    def test_to_result_lazy(self, suffix):
+        db_obj = self.infinity_obj.get_database("default_db")
+        db_obj.drop_table("test_to_result_lazy"+suffix, ConflictType.Ignore)
+        db_obj.create_table("test_to_result_lazy"+suffix, {
+            "c1": {"type": "int"}, "c2": {"type": "varchar"}, "c3": {"type": "vector,4,float"}}, ConflictType.Error)
+
+        table_obj = db_obj.get_table("test_to_result_lazy"+suffix)
+        table_obj.insert([{"c1": 1, "c2": "a", "c3": [1.0, 2.0, 3.0, 4.0]},
+                          {"c1": 2, "c2": "b", "c3": [5.0, 6.0, 7.0, 8.0]}])
+        res, data_types = table_obj.output(["c1", "c2", "c3"]).to_result(lazy=True)
+        assert list(res) == ["c1", "c2", "c3"]
+        assert len(data_types) == 3
+        assert not any(res.is_decoded(column_name) for column_name in res)
+
+        assert res["c2"] == ["a", "b"]
+        assert res.is_decoded("c2")
+        assert not res.is_decoded("c1") and not res.is_decoded("c3")
+        assert res["c2"] is res["c2"]
+
+        eager_res, _ = table_obj.output(["c1", "c2", "c3"]).to_result()
+        assert dict(res) == eager_res
+        db_obj.drop_table("test_to_result_lazy"+suffix, ConflictType.Error)
+
     def test_to_df(self, suffix):
         db_obj = self.infinity_obj.get_database("default_db")
         db_obj.drop_table("test_to_df"+suffix, ConflictType.Ignore)
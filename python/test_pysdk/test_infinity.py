@@ -4,9 +4,12 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 parent_dir = os.path.dirname(current_dir)
 if parent_dir not in sys.path:
     sys.path.insert(0, parent_dir)
+import asyncio
+import numpy as np
 import pytest
 import infinity
 from infinity.errors import ErrorCode
+from infinity.common import InfinityException, ConflictType, RetryPolicy, HedgePolicy
 from infinity.remote_thrift.client import ThriftInfinityClient
 from common import common_values
 from infinity_http import infinity_http
@@ -42,3 +45,153 @@ class TestInfinity:
     def test_list_infinity(self):
         database_res = self.infinity_obj.list_databases()
         assert "default_db" in database_res.db_names
+
+    @pytest.mark.usefixtures("skip_if_local_infinity")
+    @pytest.mark.usefixtures("skip_if_http")
+    def test_connect_without_param_checks(self):
+        infinity_obj = infinity.connect(common_values.TEST_LOCAL_HOST, check_params=False)
+        db_obj = infinity_obj.get_database("default_db")
+        # the name is not checked by the SDK, the server still rejects it
+        with pytest.raises(InfinityException) as e:
+            db_obj.get_table("12name")
+        assert e.value.args[0] != ErrorCode.OK
+
+        db_obj = self.infinity_obj.get_database("default_db")
+        with pytest.raises(InfinityException) as e:
+            db_obj.get_table("12name")
+        assert e.value.args[0] == ErrorCode.INVALID_IDENTIFIER_NAME
+
+        res = infinity_obj.disconnect()
+        assert res.error_code == ErrorCode.OK
+
+    @pytest.mark.usefixtures("skip_if_local_infinity")
+    @pytest.mark.usefixtures("skip_if_http")
+    def test_connect_protocol_and_transport(self):
+        # the test server runs with the default binary protocol over a buffered transport
+        infinity_obj = infinity.connect(common_values.TEST_LOCAL_HOST, protocol="binary", transport="buffered")
+        database_res = infinity_obj.list_databases()
+        assert "default_db" in database_res.db_names
+        res = infinity_obj.disconnect()
+        assert res.error_code == ErrorCode.OK
+
+        with pytest.raises(InfinityException) as e:
+            infinity.connect(common_values.TEST_LOCAL_HOST, protocol="json")
+        assert e.value.args[0] == ErrorCode.INVALID_PARAMETER_VALUE
+        with pytest.raises(InfinityException) as e:
+            infinity.connect(common_values.TEST_LOCAL_HOST, transport="http")
+        assert e.value.args[0] == ErrorCode.INVALID_PARAMETER_VALUE
+
+    @pytest.mark.usefixtures("skip_if_local_infinity")
+    @pytest.mark.usefixtures("skip_if_http")
+    def test_connect_async(self):
+        async def run():
+            infinity_obj = await infinity.connect_async(common_values.TEST_LOCAL_HOST, max_connections=4)
+            database_res = await infinity_obj.list_databases()
+            assert "default_db" in database_res.db_names
+
+            db_obj = await infinity_obj.get_database("default_db")
+            await db_obj.drop_table("test_connect_async", ConflictType.Ignore)
+            table_obj = await db_obj.create_table("test_connect_async", {
+                "id": {"type": "int"}, "vec": {"type": "vector,4,float"}}, ConflictType.Error)
+            await asyncio.gather(*(table_obj.insert([{"id": i, "vec": [float(i)] * 4}]) for i in range(10)))
+            await table_obj.insert_columns({"id": np.arange(10, 20, dtype=np.int32),
+                                            "vec": np.arange(40, 80, dtype=np.float32).reshape(10, 4) / 4})
+
+            # more queries in flight than sockets, each built before the previous one is awaited
+            results = await asyncio.gather(*(
+                table_obj.output(["id"]).match_dense("vec", [float(i)] * 4, "float", "l2", 1).to_pl()
+                for i in range(20)))
+            assert [res["id"][0] for res in results] == list(range(20))
+            res, _ = await table_obj.output(["id"]).filter("id < 5").to_result()
+            assert sorted(res["id"]) == list(range(5))
+
+            with pytest.raises(InfinityException) as e:
+                await db_obj.get_table("test_connect_async_missing")
+            assert e.value.args[0] == ErrorCode.TABLE_NOT_EXIST
+
+            await db_obj.drop_table("test_connect_async", ConflictType.Error)
+            res = await infinity_obj.disconnect()
+            assert res.error_code == ErrorCode.OK
+            with pytest.raises(InfinityException) as e:
+                await infinity_obj.list_databases()
+            assert e.value.args[0] == ErrorCode.CLIENT_CLOSE
+
+        asyncio.run(run())
+
+        with pytest.raises(InfinityException) as e:
+            asyncio.run(infinity.connect_async(common_values.TEST_LOCAL_PATH))
+        assert e.value.args[0] == ErrorCode.INVALID_SERVER_ADDRESS
+
+    @pytest.mark.usefixtures("skip_if_local_infinity")
+    @pytest.mark.usefixtures("skip_if_http")
+    def test_pipeline(self):
+        infinity_obj = infinity.connect(common_values.TEST_LOCAL_HOST)
+        db_obj = infinity_obj.get_database("default_db")
+        db_obj.drop_table("test_pipeline", ConflictType.Ignore)
+        table_obj = db_obj.create_table("test_pipeline", {
+            "id": {"type": "int"}, "vec": {"type": "vector,4,float"}}, ConflictType.Error)
+
+        with infinity_obj.pipeline(max_in_flight=4) as pipe:
+            pipelined = pipe.table(table_obj)
+            inserts = [pipelined.insert([{"id": i, "vec": [float(i)] * 4}]) for i in range(10)]
+            # more requests than max_in_flight, the responses are matched in order
+            results = [pipelined.output(["id"]).match_dense("vec", [float(i)] * 4, "float", "l2", 1).to_pl()
+                       for i in range(10)]
+            assert pipe.pending <= 4
+            missing = pipelined.output(["id"]).filter("no_such_column > 0").to_pl()
+            deleted = pipelined.delete("id >= 8")
+            # calls outside the pipeline first wait for its responses
+            assert "default_db" in infinity_obj.list_databases().db_names
+            assert pipe.pending == 0
+
+        assert all(res.result().error_code == ErrorCode.OK for res in inserts)
+        assert [res.result()["id"][0] for res in results] == list(range(10))
+        assert isinstance(missing.exception(), InfinityException)
+        assert deleted.result().error_code == ErrorCode.OK
+        res, _ = table_obj.output(["id"]).to_result()
+        assert sorted(res["id"]) == list(range(8))
+
+        with pytest.raises(InfinityException) as e:
+            infinity_obj.pipeline(max_in_flight=0)
+        assert e.value.args[0] == ErrorCode.INVALID_PARAMETER_VALUE
+
+        db_obj.drop_table("test_pipeline", ConflictType.Error)
+        res = infinity_obj.disconnect()
+        assert res.error_code == ErrorCode.OK
+
+    @pytest.mark.usefixtures("skip_if_local_infinity")
+    @pytest.mark.usefixtures("skip_if_http")
+    def test_retry_and_hedge(self):
+        infinity_obj = infinity.connect(common_values.TEST_LOCAL_HOST, retry=RetryPolicy(max_retries=3),
+                                        hedge=HedgePolicy(min_samples=10, window=50))
+        db_obj = infinity_obj.get_database("default_db")
+        db_obj.drop_table("test_retry_and_hedge", ConflictType.Ignore)
+        table_obj = db_obj.create_table("test_retry_and_hedge", {"id": {"type": "int"}}, ConflictType.Error)
+        table_obj.insert([{"id": i} for i in range(10)])
+
+        # a socket closed under the connection is replaced, with a new session
+        session_id = infinity_obj.client.session_id
+        infinity_obj.client.transport.close()
+        res, _ = table_obj.output(["id"]).to_result()
+        assert sorted(res["id"]) == list(range(10))
+        assert infinity_obj.client.session_id != session_id
+
+        # hedged or not, every search returns its own result
+        for i in range(30):
+            res, _ = table_obj.output(["id"]).filter(f"id = {i % 10}").to_result()
+            assert res["id"] == [i % 10]
+        assert infinity_obj.client.hedge.threshold is not None
+
+        db_obj.drop_table("test_retry_and_hedge", ConflictType.Error)
+        res = infinity_obj.disconnect()
+        assert res.error_code == ErrorCode.OK
+        with pytest.raises(InfinityException) as e:
+            infinity_obj.list_databases()
+        assert e.value.args[0] == ErrorCode.CLIENT_CLOSE
+
+        with pytest.raises(InfinityException) as e:
+            RetryPolicy(max_retries=-1)
+        assert e.value.args[0] == ErrorCode.INVALID_PARAMETER_VALUE
+        with pytest.raises(InfinityException) as e:
+            HedgePolicy(percentile=100)
+        assert e.value.args[0] == ErrorCode.INVALID_PARAMETER_VALUE
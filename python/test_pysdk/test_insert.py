@@ -5,6 +5,7 @@ parent_dir = os.path.dirname(current_dir)
 if parent_dir not in sys.path:
     sys.path.insert(0, parent_dir)
 import pandas as pd
+import pyarrow as pa
 import pytest
 import numpy as np
 from numpy import dtype
@@ -839,3 +840,180 @@ class TestInfinity:
         res = db_obj.drop_table(
             "test_insert_no_match_column"+suffix, ConflictType.Error)
         assert res.error_code == ErrorCode.OK
+
+    @pytest.mark.usefixtures("skip_if_http")
+    def test_insert_sparse_csr_output(self, suffix):
+        db_obj = self.infinity_obj.get_database("default_db")
+        db_obj.drop_table("test_insert_sparse_csr_output"+suffix, ConflictType.Ignore)
+        table_obj = db_obj.create_table("test_insert_sparse_csr_output"+suffix,
+                                        {"c1": {"type": "int"}, "c2": {"type": "sparse,100,float,int"}},
+                                        ConflictType.Error)
+        res = table_obj.insert([{"c1": 1, "c2": SparseVector(**{"indices": [10, 20, 30], "values": [1.0, 2.0, 3.0]})},
+                                {"c1": 2, "c2": SparseVector(**{"indices": [], "values": []})},
+                                {"c1": 3, "c2": SparseVector(**{"indices": [40], "values": [-4.0]})}])
+        assert res.error_code == ErrorCode.OK
+
+        data_dict, _ = table_obj.output(["c1", "c2"]).to_result(sparse_format="csr")
+        matrix = data_dict["c2"]
+        assert matrix.shape == (3, 100)
+        np.testing.assert_array_equal(matrix.indptr, [0, 3, 3, 4])
+        np.testing.assert_array_equal(matrix.indices, [10, 20, 30, 40])
+        np.testing.assert_array_equal(matrix.data, np.array([1.0, 2.0, 3.0, -4.0], dtype=np.float32))
+        assert matrix.row(2).to_dict() == {"indices": [40], "values": [-4.0]}
+
+        res = table_obj.output(["c2"]).to_arrow()
+        assert res.column("c2").to_pylist() == [{"indices": [10, 20, 30], "values": [1.0, 2.0, 3.0]},
+                                                {"indices": [], "values": []},
+                                                {"indices": [40], "values": [-4.0]}]
+
+        with pytest.raises(InfinityException) as e:
+            table_obj.output(["c2"]).to_result(sparse_format="coo")
+        assert e.value.args[0] == ErrorCode.INVALID_PARAMETER_VALUE
+
+        res = db_obj.drop_table("test_insert_sparse_csr_output"+suffix, ConflictType.Error)
+        assert res.error_code == ErrorCode.OK
+
+    @pytest.mark.usefixtures("skip_if_http")
+    def test_insert_tensor_ragged_output(self, suffix):
+        db_obj = self.infinity_obj.get_database("default_db")
+        db_obj.drop_table("test_insert_tensor_ragged_output"+suffix, ConflictType.Ignore)
+        table_obj = db_obj.create_table("test_insert_tensor_ragged_output"+suffix,
+                                        {"c1": {"type": "tensor,2,float"}, "c2": {"type": "tensorarray,2,int"}},
+                                        ConflictType.Error)
+        res = table_obj.insert([{"c1": [[1.0, 2.0], [3.0, 4.0]], "c2": [[[1, 2], [3, 4]], [[5, 6]]]},
+                                {"c1": [[5.0, 6.0]], "c2": [[[7, 8], [9, 10], [11, 12]]]}])
+        assert res.error_code == ErrorCode.OK
+
+        data_dict, _ = table_obj.output(["c1", "c2"]).to_result(tensor_format="ragged")
+        tensor = data_dict["c1"]
+        assert len(tensor) == 2
+        np.testing.assert_array_equal(tensor.values, np.array([[1, 2], [3, 4], [5, 6]], dtype=np.float32))
+        np.testing.assert_array_equal(tensor.offsets, [0, 2, 3])
+        np.testing.assert_array_equal(tensor.row(1), [[5.0, 6.0]])
+        tensor_array = data_dict["c2"]
+        assert len(tensor_array) == 2
+        np.testing.assert_array_equal(tensor_array.offsets, [0, 2, 3])
+        np.testing.assert_array_equal(tensor_array.tensor_offsets, [0, 2, 3, 6])
+        assert [t.tolist() for t in tensor_array.row(0)] == [[[1, 2], [3, 4]], [[5, 6]]]
+
+        with pytest.raises(InfinityException) as e:
+            table_obj.output(["c1"]).to_result(tensor_format="nested")
+        assert e.value.args[0] == ErrorCode.INVALID_PARAMETER_VALUE
+
+        res = db_obj.drop_table("test_insert_tensor_ragged_output"+suffix, ConflictType.Error)
+        assert res.error_code == ErrorCode.OK
+
+    @pytest.mark.usefixtures("skip_if_http")
+    def test_insert_bit_embedding(self, suffix):
+        db_obj = self.infinity_obj.get_database("default_db")
+        db_obj.drop_table("test_insert_bit_embedding"+suffix, ConflictType.Ignore)
+        table_obj = db_obj.create_table("test_insert_bit_embedding"+suffix, {"c1": {"type": "vector,16,bit"}},
+                                        ConflictType.Error)
+        bits = [[1, 0, 0, 0, 0, 0, 0, 0, 1, 1, 0, 0, 0, 0, 0, 1],
+                [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1]]
+        res = table_obj.insert([{"c1": bits[0]}, {"c1": bits[1]}])
+        assert res.error_code == ErrorCode.OK
+
+        # one string per vector, the first dimension first
+        strings = [["1000000011000001"], ["0000000000000001"]]
+        data_dict, _ = table_obj.output(["c1"]).to_result()
+        assert data_dict["c1"] == strings
+        res = table_obj.output(["c1"]).to_pl()
+        assert res["c1"].to_list() == strings
+        # one 0/1 value per dimension
+        res = table_obj.output(["c1"]).to_numpy()
+        np.testing.assert_array_equal(res["c1"], bits)
+        res = table_obj.output(["c1"]).to_arrow()
+        assert res.column("c1").to_pylist() == bits
+
+        res = db_obj.drop_table("test_insert_bit_embedding"+suffix, ConflictType.Error)
+        assert res.error_code == ErrorCode.OK
+
+    @pytest.mark.usefixtures("skip_if_http")
+    def test_insert_columnar(self, suffix):
+        db_obj = self.infinity_obj.get_database("default_db")
+        db_obj.drop_table("test_insert_columnar"+suffix, ConflictType.Ignore)
+        table_obj = db_obj.create_table("test_insert_columnar"+suffix, {
+            "c1": {"type": "int"}, "c2": {"type": "varchar"}, "c3": {"type": "vector,4,float"}}, ConflictType.Error)
+        vectors = np.arange(12, dtype=np.float32).reshape(3, 4)
+
+        res = table_obj.insert_columns({"c1": np.array([1, 2, 3], dtype=np.int32),
+                                        "c2": np.array(["a", "bb", "ccc"]),
+                                        "c3": vectors})
+        assert res.error_code == ErrorCode.OK
+        res = table_obj.insert(pd.DataFrame({"c1": [4], "c2": ["d"], "c3": [vectors[0]]}))
+        assert res.error_code == ErrorCode.OK
+        res = table_obj.insert(pa.table({"c1": pa.array([5], pa.int32()), "c2": ["e"],
+                                         "c3": pa.FixedSizeListArray.from_arrays(pa.array(vectors[1]), 4)}))
+        assert res.error_code == ErrorCode.OK
+
+        res = table_obj.output(["c1", "c2", "c3"]).to_numpy()
+        np.testing.assert_array_equal(res["c1"], [1, 2, 3, 4, 5])
+        assert res["c2"].tolist() == ["a", "bb", "ccc", "d", "e"]
+        np.testing.assert_array_equal(res["c3"], np.concatenate([vectors, vectors[:2]]))
+
+        with pytest.raises(InfinityException) as e:
+            table_obj.insert_columns({"c1": np.array([6, 7]), "c2": np.array(["f"])})
+        assert e.value.args[0] == ErrorCode.INVALID_PARAMETER_VALUE
+
+        res = db_obj.drop_table("test_insert_columnar"+suffix, ConflictType.Error)
+        assert res.error_code == ErrorCode.OK
+
+    def test_insert_row_of_ndarray(self, suffix):
+        db_obj = self.infinity_obj.get_database("default_db")
+        db_obj.drop_table("test_insert_row_of_ndarray"+suffix, ConflictType.Ignore)
+        table_obj = db_obj.create_table("test_insert_row_of_ndarray"+suffix, {"c1": {"type": "vector,3,float"}},
+                                        ConflictType.Error)
+
+        # a dict is one row, even if all its values are arrays
+        res = table_obj.insert({"c1": np.array([1.0, 2.0, 3.0])})
+        assert res.error_code == ErrorCode.OK
+        res = table_obj.output(["c1"]).to_pl()
+        assert res["c1"].to_list() == [[1.0, 2.0, 3.0]]
+
+        res = db_obj.drop_table("test_insert_row_of_ndarray"+suffix, ConflictType.Error)
+        assert res.error_code == ErrorCode.OK
+
+    @pytest.mark.usefixtures("skip_if_http")
+    def test_insert_writer(self, suffix):
+        db_obj = self.infinity_obj.get_database("default_db")
+        db_obj.drop_table("test_insert_writer"+suffix, ConflictType.Ignore)
+        table_obj = db_obj.create_table("test_insert_writer"+suffix, {
+            "c1": {"type": "int"}, "c2": {"type": "vector,4,float"}}, ConflictType.Error)
+
+        with table_obj.writer(max_rows=7, inflight=2) as writer:
+            for i in range(20):
+                writer.write({"c1": i, "c2": [float(i)] * 4})
+            writer.write([{"c1": i, "c2": [float(i)] * 4} for i in range(20, 30)])
+            # frames cut the batch of rows and are split up by max_rows as well
+            writer.write(pd.DataFrame({"c1": np.arange(30, 45, dtype=np.int32),
+                                       "c2": list(np.repeat(np.arange(30, 45, dtype=np.float32), 4).reshape(15, 4))}))
+            writer.flush()
+            assert writer.written_rows == 45
+            writer.write({"c1": 45, "c2": [45.0] * 4})
+        assert writer.written_rows == 46
+
+        res = table_obj.output(["c1", "c2"]).to_numpy()
+        np.testing.assert_array_equal(np.sort(res["c1"]), np.arange(46))
+        np.testing.assert_array_equal(res["c2"][:, 0], res["c1"].astype(np.float32))
+
+        # a failed insert is raised by the next flush, the writer stays failed
+        writer = table_obj.writer(max_rows=2)
+        writer.write([{"c1": 1, "c2": [1.0] * 4}, {"c1": 2, "c3": [2.0] * 4}])
+        with pytest.raises(InfinityException):
+            writer.flush()
+        with pytest.raises(InfinityException):
+            writer.write({"c1": 3, "c2": [3.0] * 4})
+        with pytest.raises(InfinityException):
+            writer.close()
+        with pytest.raises(InfinityException) as e:
+            writer.flush()
+        assert e.value.args[0] == ErrorCode.INVALID_PARAMETER_VALUE
+        assert table_obj.output(["c1"]).to_pl()["c1"].len() == 47
+
+        with pytest.raises(InfinityException) as e:
+            table_obj.writer(max_rows=0)
+        assert e.value.args[0] == ErrorCode.INVALID_PARAMETER_VALUE
+
+        res = db_obj.drop_table("test_insert_writer"+suffix, ConflictType.Error)
+        assert res.error_code == ErrorCode.OK
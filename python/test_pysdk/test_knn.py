@@ -10,9 +10,10 @@ import infinity
 from infinity.remote_thrift.infinity import RemoteThriftInfinityConnection
 import infinity.index as index
 from infinity.errors import ErrorCode
-from infinity.common import ConflictType, InfinityException, SparseVector
+from infinity.common import ConflictType, InfinityException, SparseVector, Param
 from common.utils import copy_data, generate_commas_enwiki
 import pandas as pd
+import numpy as np
 from numpy import dtype
 from infinity_http import infinity_http
 
@@ -1704,3 +1705,103 @@ class TestInfinity:
 
         res = db_obj.drop_table("test_with_index"+suffix, ConflictType.Error)
         assert res.error_code == ErrorCode.OK
+
+    @pytest.mark.usefixtures("skip_if_http")
+    def test_knn_ndarray_query(self, suffix):
+        db_obj = self.infinity_obj.get_database("default_db")
+        db_obj.drop_table("test_knn_ndarray_query"+suffix, ConflictType.Ignore)
+        table_obj = db_obj.create_table("test_knn_ndarray_query"+suffix, {
+            "c1": {"type": "int"}, "c2": {"type": "vector,4,float"}}, ConflictType.Error)
+        table_obj.insert([{"c1": i, "c2": [float(i)] * 4} for i in range(8)])
+
+        query = [2.9, 3.1, 3.0, 3.2]
+        expected = table_obj.output(["c1", "_distance"]).match_dense("c2", query, "float", "l2", 3).to_pl()
+        for embedding_data, embedding_data_type in [(np.array(query, dtype=np.float32), "float"),
+                                                    (np.array(query, dtype=np.float64), "float"),
+                                                    (np.array(query, dtype=np.float64), "double")]:
+            res = table_obj.output(["c1", "_distance"]).match_dense(
+                "c2", embedding_data, embedding_data_type, "l2", 3).to_pl()
+            assert res["c1"].to_list() == expected["c1"].to_list() == [3, 4, 2]
+
+        # integer types take whole numbers only
+        with pytest.raises(InfinityException) as e:
+            table_obj.output(["c1"]).match_dense("c2", np.array(query), "int8", "l2", 3).to_pl()
+        assert e.value.args[0] == ErrorCode.INVALID_EMBEDDING_DATA_TYPE
+        with pytest.raises(InfinityException) as e:
+            table_obj.output(["c1"]).match_dense("c2", ["a", "b", "c", "d"], "float", "l2", 3).to_pl()
+        assert e.value.args[0] == ErrorCode.INVALID_EMBEDDING_DATA_TYPE
+
+        res = db_obj.drop_table("test_knn_ndarray_query"+suffix, ConflictType.Error)
+        assert res.error_code == ErrorCode.OK
+
+    @pytest.mark.usefixtures("skip_if_http")
+    def test_knn_prepared(self, suffix):
+        db_obj = self.infinity_obj.get_database("default_db")
+        db_obj.drop_table("test_knn_prepared"+suffix, ConflictType.Ignore)
+        table_obj = db_obj.create_table("test_knn_prepared"+suffix, {
+            "c1": {"type": "int"}, "c2": {"type": "vector,4,float"}}, ConflictType.Error)
+        table_obj.insert([{"c1": i, "c2": [float(i)] * 4} for i in range(8)])
+
+        query = table_obj.output(["c1"]).match_dense(
+            "c2", Param("vec"), "float", "l2", Param("topn")).filter("c1 >= :lower").prepare()
+        assert sorted(query.parameters) == ["lower", "topn", "vec"]
+        with pytest.raises(InfinityException) as e:
+            query.to_pl()
+        assert e.value.args[0] == ErrorCode.INVALID_PARAMETER_VALUE
+
+        res = query.bind(vec=[3.0, 3.0, 3.0, 3.2], topn=3, lower=0).to_pl()
+        assert res["c1"].to_list() == [3, 4, 2]
+        # only the changed parameters are bound again
+        res = query.bind(vec=np.full(4, 6.2, dtype=np.float32)).to_pl()
+        assert res["c1"].to_list() == [6, 7, 5]
+        res = query.bind(topn=2, lower=6).to_pl()
+        assert res["c1"].to_list() == [6, 7]
+        assert res["c1"].to_list() == table_obj.output(["c1"]).match_dense(
+            "c2", [6.2] * 4, "float", "l2", 2).filter("c1 >= 6").to_pl()["c1"].to_list()
+
+        with pytest.raises(InfinityException) as e:
+            query.bind(unknown=1)
+        assert e.value.args[0] == ErrorCode.INVALID_PARAMETER_VALUE
+        # parameters are only allowed in prepared queries
+        with pytest.raises(InfinityException) as e:
+            table_obj.output(["c1"]).match_dense("c2", Param("vec"), "float", "l2", 3).to_pl()
+        assert e.value.args[0] == ErrorCode.INVALID_PARAMETER_VALUE
+
+        res = db_obj.drop_table("test_knn_prepared"+suffix, ConflictType.Error)
+        assert res.error_code == ErrorCode.OK
+
+    @pytest.mark.usefixtures("skip_if_http")
+    def test_knn_batch(self, suffix):
+        db_obj = self.infinity_obj.get_database("default_db")
+        db_obj.drop_table("test_knn_batch"+suffix, ConflictType.Ignore)
+        table_obj = db_obj.create_table("test_knn_batch"+suffix, {
+            "c1": {"type": "int"}, "c2": {"type": "vector,4,float"}}, ConflictType.Error)
+        table_obj.insert([{"c1": i, "c2": [float(i)] * 4} for i in range(8)])
+
+        # a (Q, dim) matrix of query vectors returns Q results, in the order of the rows
+        queries = np.array([[3.0, 3.0, 3.0, 3.2], [6.2] * 4, [0.1] * 4], dtype=np.float32)
+        res = table_obj.output(["c1"]).match_dense("c2", queries, "float", "l2", 3).filter("c1 >= 1").to_pl()
+        assert len(res) == 3
+        assert res[0]["c1"].to_list() == [3, 4, 2]
+        assert res[1]["c1"].to_list() == [6, 7, 5]
+        assert res[2]["c1"].to_list() == [1, 2, 3]
+        for query, result in zip(queries, res):
+            assert result["c1"].to_list() == table_obj.output(["c1"]).match_dense(
+                "c2", query, "float", "l2", 3).filter("c1 >= 1").to_pl()["c1"].to_list()
+        dfs = table_obj.output(["c1", "_distance"]).match_dense("c2", queries, "float", "l2", 2).to_df()
+        assert [df["c1"].to_list() for df in dfs] == [[3, 4], [6, 7], [0, 1]]
+
+        query = table_obj.output(["c1"]).match_dense("c2", queries[:2], "float", "l2", Param("topn")).prepare()
+        res = query.bind(topn=1).to_pl()
+        assert [r["c1"].to_list() for r in res] == [[3], [6]]
+
+        with pytest.raises(InfinityException) as e:
+            table_obj.output(["c1"]).match_dense("c2", queries[:0], "float", "l2", 3)
+        assert e.value.args[0] == ErrorCode.INVALID_EMBEDDING_DATA_TYPE
+        with pytest.raises(InfinityException) as e:
+            table_obj.output(["c1"]).match_dense("c2", queries, "float", "l2", 3).match_dense(
+                "c2", queries, "float", "ip", 3)
+        assert e.value.args[0] == ErrorCode.INVALID_PARAMETER_VALUE
+
+        res = db_obj.drop_table("test_knn_batch"+suffix, ConflictType.Error)
+        assert res.error_code == ErrorCode.OK
@@ -6,6 +6,10 @@ if parent_dir not in sys.path:
     sys.path.insert(0, parent_dir)
 import os
 import pytest
+import pandas as pd
+import polars as pl
+import pyarrow as pa
+import pyarrow.parquet as pq
 from common import common_values
 import infinity
 from infinity.errors import ErrorCode
@@ -560,3 +564,76 @@ class TestInfinity:
         res = table_obj.output(["*"]).to_pl()
         print(res)
         db_obj.drop_table("test_import_json_file_with_default"+suffix, ConflictType.Error)
+
+    @pytest.mark.usefixtures("skip_if_local_infinity")
+    @pytest.mark.usefixtures("skip_if_http")
+    def test_import_upload(self, suffix, tmp_path, monkeypatch):
+        # small chunks, so the file is sent in several of them
+        monkeypatch.setattr("infinity.remote_thrift.table.DEFAULT_UPLOAD_CHUNK_SIZE", 64)
+        db_obj = self.infinity_obj.get_database("default_db")
+        db_obj.drop_table("test_import_upload"+suffix, ConflictType.Ignore)
+        table_obj = db_obj.create_table("test_import_upload"+suffix,
+                                        {"c1": {"type": "int"}, "c2": {"type": "vector,3,int"}}, ConflictType.Error)
+
+        csv_path = tmp_path / "upload.csv"
+        csv_path.write_text("".join(f'{i},"[{i},{i + 1},{i + 2}]"\n' for i in range(100)))
+        res = table_obj.import_data(str(csv_path), upload=True)
+        assert res.error_code == ErrorCode.OK
+        res = table_obj.output(["count(*)"]).to_pl()
+        assert res.item(0, 0) == 100
+        res = table_obj.output(["c2"]).filter("c1 = 42").to_pl()
+        assert list(res.item(0, 0)) == [42, 43, 44]
+
+        empty_path = tmp_path / "empty.csv"
+        empty_path.write_text("")
+        res = table_obj.import_data(str(empty_path), upload=True)
+        assert res.error_code == ErrorCode.OK
+
+        parquet_path = tmp_path / "upload.parquet"
+        pq.write_table(pa.table({"c1": pa.array(range(100, 150), type=pa.int32()),
+                                 "c2": pa.FixedSizeListArray.from_arrays(
+                                     pa.array([i + j for i in range(100, 150) for j in range(3)], type=pa.int32()), 3)}),
+                       parquet_path)
+        res = table_obj.import_data(str(parquet_path), {"file_type": "parquet"}, upload=True)
+        assert res.error_code == ErrorCode.OK
+        res = table_obj.output(["count(*)"]).to_pl()
+        assert res.item(0, 0) == 150
+        res = table_obj.output(["c2"]).filter("c1 = 142").to_pl()
+        assert list(res.item(0, 0)) == [142, 143, 144]
+
+        with pytest.raises(InfinityException) as e:
+            table_obj.import_data(str(tmp_path / "missing.csv"), upload=True)
+        assert e.value.error_code == ErrorCode.FILE_NOT_FOUND
+
+        db_obj.drop_table("test_import_upload"+suffix, ConflictType.Error)
+
+    @pytest.mark.usefixtures("skip_if_http")
+    def test_import_dataframe(self, suffix):
+        db_obj = self.infinity_obj.get_database("default_db")
+        db_obj.drop_table("test_import_dataframe"+suffix, ConflictType.Ignore)
+        table_obj = db_obj.create_table("test_import_dataframe"+suffix,
+                                        {"c1": {"type": "int"}, "c2": {"type": "varchar"},
+                                         "c3": {"type": "vector,3,float"}}, ConflictType.Error)
+
+        # columns in any order, they are matched by name
+        df = pd.DataFrame({"c3": [[i, i + 0.5, i + 1] for i in range(100)],
+                           "c2": [f"row {i}" for i in range(100)],
+                           "c1": range(100)})
+        res = table_obj.import_dataframe(df)
+        assert res.error_code == ErrorCode.OK
+        res = table_obj.import_dataframe(pl.from_pandas(df[df["c1"] < 10]))
+        assert res.error_code == ErrorCode.OK
+        res = table_obj.output(["count(*)"]).to_pl()
+        assert res.item(0, 0) == 110
+        res = table_obj.output(["c2", "c3"]).filter("c1 = 42").to_pl()
+        assert res.item(0, 0) == "row 42"
+        assert list(res.item(0, 1)) == [42, 42.5, 43]
+
+        with pytest.raises(InfinityException) as e:
+            table_obj.import_dataframe(df[["c1", "c2"]])
+        assert e.value.error_code == ErrorCode.COLUMN_COUNT_MISMATCH
+        with pytest.raises(InfinityException) as e:
+            table_obj.import_dataframe(df.assign(c4=1))
+        assert e.value.error_code == ErrorCode.COLUMN_NOT_EXIST
+
+        db_obj.drop_table("test_import_dataframe"+suffix, ConflictType.Error)
@@ -0,0 +1,196 @@
+import sys
+import os
+current_dir = os.path.dirname(os.path.abspath(__file__))
+parent_dir = os.path.dirname(current_dir)
+if parent_dir not in sys.path:
+    sys.path.insert(0, parent_dir)
+import time
+import pytest
+from thrift.transport.TTransport import TTransportException
+import infinity
+from infinity.common import RetryPolicy, HedgePolicy
+from infinity.remote_thrift.client import TRANSPORT_ERRORS
+
+
+def select_id(table_obj, value: int) -> int:
+    # the fake server answers with the limit of the Select
+    return table_obj.output(["id"]).limit(value).to_pl()["id"][0]
+
+
+class TestRetry:
+    def test_retry_select(self, fake_server):
+        infinity_obj = infinity.connect(fake_server.uri, retry=RetryPolicy(max_retries=3, backoff=0.01))
+        table_obj = infinity_obj.get_database("default_db").get_table("test_retry")
+        session_id = infinity_obj.client.session_id
+
+        # a Select lost with its socket is sent again on a new one, with a new session
+        fake_server.handler.drop("Select")
+        assert select_id(table_obj, 7) == 7
+        assert fake_server.handler.calls["Select"] == 2
+        assert infinity_obj.client.session_id != session_id
+
+        # no more than max_retries times
+        fake_server.handler.drop("Select", 4)
+        with pytest.raises(TRANSPORT_ERRORS):
+            select_id(table_obj, 8)
+        assert fake_server.handler.calls["Select"] == 6
+        assert select_id(table_obj, 9) == 9
+        infinity_obj.disconnect()
+
+    def test_insert_not_retried(self, fake_server):
+        infinity_obj = infinity.connect(fake_server.uri, retry=RetryPolicy(max_retries=3, backoff=0.01))
+        table_obj = infinity_obj.get_database("default_db").get_table("test_retry")
+
+        # the server may have run an Insert which reached it, it isn't sent twice
+        fake_server.handler.drop("Insert")
+        with pytest.raises(TRANSPORT_ERRORS):
+            table_obj.insert([{"id": 1}])
+        assert fake_server.handler.calls["Insert"] == 1
+
+        # the next request gets a new socket
+        table_obj.insert([{"id": 2}])
+        assert fake_server.handler.calls["Insert"] == 2
+        infinity_obj.disconnect()
+
+    def test_no_retry_by_default(self, fake_server):
+        infinity_obj = infinity.connect(fake_server.uri)
+        table_obj = infinity_obj.get_database("default_db").get_table("test_retry")
+        fake_server.handler.drop("Select")
+        with pytest.raises(TRANSPORT_ERRORS):
+            select_id(table_obj, 1)
+        assert fake_server.handler.calls["Select"] == 1
+        # the next request reconnects
+        assert select_id(table_obj, 2) == 2
+        infinity_obj.disconnect()
+
+    def test_upload_not_retried(self, fake_server, tmp_path):
+        infinity_obj = infinity.connect(fake_server.uri, retry=RetryPolicy(max_retries=3, backoff=0.01))
+        table_obj = infinity_obj.get_database("default_db").get_table("test_retry")
+        file_path = tmp_path / "upload.csv"
+        file_path.write_text("1\n2\n")
+
+        # a new session wouldn't have the chunks uploaded before, neither the chunks nor the import are sent again
+        fake_server.handler.drop("UploadFileChunk")
+        with pytest.raises(TRANSPORT_ERRORS):
+            table_obj.import_data(str(file_path), upload=True)
+        assert fake_server.handler.calls["UploadFileChunk"] == 1
+        assert fake_server.handler.calls["Import"] == 0
+
+        fake_server.handler.drop("Import")
+        with pytest.raises(TRANSPORT_ERRORS):
+            table_obj.import_data(str(file_path), upload=True)
+        assert fake_server.handler.calls["Import"] == 1
+
+        table_obj.import_data(str(file_path), upload=True)
+        assert fake_server.handler.calls["Import"] == 2
+        infinity_obj.disconnect()
+
+    def test_hedge(self, fake_server):
+        infinity_obj = infinity.connect(fake_server.uri,
+                                        hedge=HedgePolicy(min_delay=0.05, min_samples=10, window=50, max_ratio=0.5))
+        client = infinity_obj.client
+        table_obj = infinity_obj.get_database("default_db").get_table("test_hedge")
+        for i in range(10):
+            assert select_id(table_obj, i) == i
+        assert client.hedge.threshold is not None and client.hedge.hedges == 0
+
+        # a slow Select is sent again on a spare socket, whose response comes first
+        fake_server.handler.stall(2.0)
+        session_id = client.session_id
+        begin = time.monotonic()
+        assert select_id(table_obj, 100) == 100
+        assert time.monotonic() - begin < 1.0
+        assert client.hedge.hedges == 1 and client.hedge.wins == 1
+        # the spare socket becomes the one of the connection, the other one still owes a response
+        assert client.session_id != session_id
+        assert client._spare.session_id == session_id
+        assert client._spare.unread == ["Select"]
+
+        # the late response isn't taken for the one of a later Select
+        for i in range(10):
+            assert select_id(table_obj, i) == i
+
+        # a spare still waiting for its response is replaced by a new socket
+        fake_server.handler.stall(2.0)
+        assert select_id(table_obj, 200) == 200
+        assert client.hedge.hedges == 2 and client.hedge.wins == 2
+        assert client._spare.session_id not in (session_id, client.session_id)
+        for i in range(10):
+            assert select_id(table_obj, i) == i
+        assert fake_server.handler.calls["Select"] == 10 + 1 + 1 + 10 + 1 + 1 + 10
+        infinity_obj.disconnect()
+
+    def test_hedge_with_pipeline(self, fake_server):
+        infinity_obj = infinity.connect(fake_server.uri, retry=RetryPolicy(max_retries=3, backoff=0.01),
+                                        hedge=HedgePolicy(min_delay=0.05, min_samples=10, window=50, max_ratio=0.5))
+        client = infinity_obj.client
+        table_obj = infinity_obj.get_database("default_db").get_table("test_hedge")
+        for i in range(10):
+            assert select_id(table_obj, i) == i
+
+        with infinity_obj.pipeline() as pipe:
+            pipelined = pipe.table(table_obj)
+            first = pipelined.output(["id"]).limit(1).to_pl()
+            # a Select of the connection isn't hedged while the pipeline writes to its socket
+            fake_server.handler.stall(0.3)
+            assert select_id(table_obj, 2) == 2
+            second = pipelined.output(["id"]).limit(3).to_pl()
+            # a call retried on a new socket takes the pipeline with it
+            fake_server.handler.drop("ListDatabase")
+            assert "default_db" in infinity_obj.list_databases().db_names
+            third = pipelined.output(["id"]).limit(4).to_pl()
+        assert [res.result()["id"][0] for res in (first, second, third)] == [1, 3, 4]
+        assert client.hedge.hedges == 0
+
+        # and hedged again once it is closed
+        fake_server.handler.stall(2.0)
+        assert select_id(table_obj, 5) == 5
+        assert client.hedge.hedges == 1
+        infinity_obj.disconnect()
+
+    def test_hedge_timeout(self, fake_server):
+        infinity_obj = infinity.connect(fake_server.uri,
+                                        hedge=HedgePolicy(min_delay=0.05, min_samples=10, window=50, max_ratio=0.5))
+        client = infinity_obj.client
+        table_obj = infinity_obj.get_database("default_db").get_table("test_hedge")
+        for i in range(10):
+            assert select_id(table_obj, i) == i
+
+        # a hedged Select waits for either socket no longer than the timeout of the socket of the connection
+        client._channel.socket.setTimeout(300)
+        fake_server.handler.stall(1.0, 2)
+        begin = time.monotonic()
+        with pytest.raises(TTransportException):
+            select_id(table_obj, 100)
+        assert time.monotonic() - begin < 0.9
+        assert client.hedge.hedges == 1
+        assert select_id(table_obj, 101) == 101
+        infinity_obj.disconnect()
+        assert fake_server.handler.sessions == set()
+
+    def test_sessions_ended(self, fake_server):
+        infinity_obj = infinity.connect(fake_server.uri, retry=RetryPolicy(max_retries=3, backoff=0.01),
+                                        hedge=HedgePolicy(min_delay=0.05, min_samples=10, window=50, max_ratio=0.5))
+        client = infinity_obj.client
+        table_obj = infinity_obj.get_database("default_db").get_table("test_sessions")
+        for i in range(10):
+            assert select_id(table_obj, i) == i
+
+        # two hedges won in a row, the first spare still owes its response and is replaced
+        fake_server.handler.stall(1.0)
+        assert select_id(table_obj, 100) == 100
+        fake_server.handler.stall(1.0)
+        assert select_id(table_obj, 101) == 101
+        assert client.hedge.wins == 2
+        # sockets closed by a lost response and by reconnect
+        fake_server.handler.drop("Select")
+        assert select_id(table_obj, 102) == 102
+        client.reconnect()
+        assert select_id(table_obj, 103) == 103
+        # their sessions are ended over the socket of the connection
+        assert len(fake_server.handler.sessions) <= 4
+
+        # and the others once their responses arrived
+        assert infinity_obj.disconnect().error_code == 0
+        assert fake_server.handler.sessions == set()
+        assert fake_server.handler.calls["Disconnect"] == fake_server.handler.calls["Connect"]
@@ -11,7 +11,9 @@ from common import common_values
 import infinity
 from numpy import dtype
 from infinity.errors import ErrorCode
-from infinity.common import ConflictType
+from infinity.common import ConflictType, DEFAULT_EXPRESSION_CACHE_SIZE
+from infinity.remote_thrift.utils import expression_cache as remote_expression_cache
+from infinity.local_infinity.utils import expression_cache as local_expression_cache
 from infinity_http import infinity_http
 from common.utils import copy_data
 
@@ -503,6 +505,35 @@ class TestInfinity:
         res = db_obj.drop_table("test_select_same_output"+suffix, ConflictType.Error)
         assert res.error_code == ErrorCode.OK
 
+    @pytest.mark.usefixtures("skip_if_http")
+    def test_select_expression_cache(self, suffix):
+        db_obj = self.infinity_obj.get_database("default_db")
+        db_obj.drop_table("test_select_expression_cache"+suffix, ConflictType.Ignore)
+        table_obj = db_obj.create_table("test_select_expression_cache"+suffix, {
+            "c1": {"type": "int"}, "c2": {"type": "int"}}, ConflictType.Error)
+        table_obj.insert([{"c1": i, "c2": i * 10} for i in range(5)])
+
+        if self.uri == common_values.TEST_LOCAL_PATH:
+            cache = local_expression_cache
+        else:
+            cache = remote_expression_cache
+        cache.clear()
+        for _ in range(3):
+            res = table_obj.output(["c1", "c1 + c2"]).filter("c1 > 1 and c2 < 40").to_pl()
+            assert res["c1"].to_list() == [2, 3]
+        # two output columns and the filter, parsed by the first query only
+        info = cache.cache_info()
+        assert (info.hits, info.misses, info.currsize) == (6, 3, 3)
+
+        cache.resize(1)
+        assert cache.cache_info().currsize == 1
+        res = table_obj.output(["c1"]).filter("c1 > 1 and c2 < 40").to_pl()
+        assert res["c1"].to_list() == [2, 3]
+        cache.resize(DEFAULT_EXPRESSION_CACHE_SIZE)
+
+        res = db_obj.drop_table("test_select_expression_cache"+suffix, ConflictType.Error)
+        assert res.error_code == ErrorCode.OK
+
     @pytest.mark.usefixtures("skip_if_http")
     def test_empty_table(self, suffix):
         db_obj = self.infinity_obj.get_database("default_db")
@@ -183,6 +183,9 @@ export {
     constexpr SizeT DEFAULT_MEMINDEX_MEMORY_QUOTA = 4 * 1024lu * 1024lu * 1024lu; // 4GB
     constexpr std::string_view DEFAULT_MEMINDEX_MEMORY_QUOTA_STR = "4GB"; // 4GB
 
+    constexpr SizeT DEFAULT_UPLOAD_SIZE_LIMIT = 16 * 1024lu * 1024lu * 1024lu; // 16GB
+    constexpr std::string_view DEFAULT_UPLOAD_SIZE_LIMIT_STR = "16GB"; // 16GB
+
     constexpr SizeT DEFAULT_LOG_FILE_SIZE = 64 * 1024lu * 1024lu; // 64MB
     constexpr std::string_view DEFAULT_LOG_FILE_SIZE_STR = "64MB"; // 64MB
 
@@ -204,6 +207,9 @@ export {
     constexpr std::string_view HTTP_PORT_OPTION_NAME = "http_port";
     constexpr std::string_view CLIENT_PORT_OPTION_NAME = "client_port";
     constexpr std::string_view CONNECTION_POOL_SIZE_OPTION_NAME = "connection_pool_size";
+    constexpr std::string_view THRIFT_PROTOCOL_OPTION_NAME = "thrift_protocol";
+    constexpr std::string_view THRIFT_TRANSPORT_OPTION_NAME = "thrift_transport";
+    constexpr std::string_view UPLOAD_SIZE_LIMIT_OPTION_NAME = "upload_size_limit";
     constexpr std::string_view LOG_FILENAME_OPTION_NAME = "log_filename";
 
     constexpr std::string_view LOG_DIR_OPTION_NAME = "log_dir";
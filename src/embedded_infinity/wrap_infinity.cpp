@@ -215,9 +215,17 @@ ParsedExpr *WrapBetweenExpr::GetParsedExpr(Status &status) {
     return between_expr;
 }
 
-Tuple<void *, i64> GetEmbeddingDataTypeDataPtrFromProto(const EmbeddingData &embedding_data, Status &status) {
+Tuple<void *, i64> GetEmbeddingDataTypeDataPtrFromProto(const EmbeddingData &embedding_data, EmbeddingDataType embedding_data_type, Status &status) {
     status.code_ = ErrorCode::kOk;
-    if (embedding_data.u8_array_value.size() != 0) {
+    if (embedding_data.packed_value.size() != 0) {
+        // little-endian buffer in the layout of embedding_data_type, used as is
+        const SizeT element_size = embedding_data_type == EmbeddingDataType::kElemBit ? 1 : EmbeddingT::EmbeddingDataWidth(embedding_data_type);
+        if (embedding_data.packed_value.size() % element_size != 0) {
+            status = Status::InvalidEmbeddingDataType(fmt::format("packed buffer of {} bytes", embedding_data.packed_value.size()));
+            return {nullptr, 0};
+        }
+        return {(void *)embedding_data.packed_value.data(), embedding_data.packed_value.size() / element_size};
+    } else if (embedding_data.u8_array_value.size() != 0) {
         auto ptr_i16 = (int16_t *)(embedding_data.u8_array_value.data());
         auto ptr_u8 = (uint8_t *)(embedding_data.u8_array_value.data());
         for (size_t i = 0; i < embedding_data.u8_array_value.size(); ++i) {
@@ -285,7 +293,7 @@ ParsedExpr *WrapKnnExpr::GetParsedExpr(Status &status) {
         status = Status::InvalidEmbeddingDataType("unknown type");
         return nullptr;
     }
-    auto [embedding_data_ptr, dimension] = GetEmbeddingDataTypeDataPtrFromProto(embedding_data, status);
+    auto [embedding_data_ptr, dimension] = GetEmbeddingDataTypeDataPtrFromProto(embedding_data, knn_expr->embedding_data_type_, status);
     if (status.code_ != ErrorCode::kOk) {
         delete knn_expr;
         knn_expr = nullptr;
@@ -293,6 +301,10 @@ ParsedExpr *WrapKnnExpr::GetParsedExpr(Status &status) {
     }
     knn_expr->embedding_data_ptr_ = embedding_data_ptr;
     knn_expr->dimension_ = dimension;
+    if (knn_expr->embedding_data_type_ == EmbeddingDataType::kElemBit) {
+        // bit queries arrive packed, 8 dimensions per byte
+        knn_expr->dimension_ *= 8;
+    }
 
     knn_expr->topn_ = topn;
     if (knn_expr->topn_ <= 0) {
@@ -366,12 +378,16 @@ ParsedExpr *WrapMatchTensorExpr::GetParsedExpr(Status &status) {
         return nullptr;
     }
 
-    auto [embedding_data_ptr, dimension] = GetEmbeddingDataTypeDataPtrFromProto(embedding_data, status);
+    auto [embedding_data_ptr, dimension] = GetEmbeddingDataTypeDataPtrFromProto(embedding_data, match_tensor_expr->embedding_data_type_, status);
     if (status.code_ != ErrorCode::kOk) {
         delete match_tensor_expr;
         return nullptr;
     }
     match_tensor_expr->dimension_ = dimension;
+    if (match_tensor_expr->embedding_data_type_ == EmbeddingDataType::kElemBit) {
+        // bit queries arrive packed, 8 dimensions per byte
+        match_tensor_expr->dimension_ *= 8;
+    }
     const auto copy_bytes = EmbeddingT::EmbeddingSize(match_tensor_expr->embedding_data_type_, match_tensor_expr->dimension_);
     match_tensor_expr->query_tensor_data_ptr_ = MakeUniqueForOverwrite<char[]>(copy_bytes);
     std::memcpy(match_tensor_expr->query_tensor_data_ptr_.get(), embedding_data_ptr, copy_bytes);
@@ -181,6 +181,7 @@ export struct EmbeddingData {
     Vector<double> f64_array_value;
     Vector<double> f16_array_value;
     Vector<double> bf16_array_value;
+    String packed_value;
 };
 
 export struct WrapKnnExpr {
@@ -152,7 +152,11 @@ NB_MODULE(embedded_infinity_ext, m) {
         .def_rw("f16_array_value", &EmbeddingData::f16_array_value)
         .def_rw("bf16_array_value", &EmbeddingData::bf16_array_value)
         .def_rw("f32_array_value", &EmbeddingData::f32_array_value)
-        .def_rw("f64_array_value", &EmbeddingData::f64_array_value);
+        .def_rw("f64_array_value", &EmbeddingData::f64_array_value)
+        .def_prop_rw(
+            "packed_value",
+            [](const EmbeddingData &self) { return nb::bytes(self.packed_value.data(), self.packed_value.size()); },
+            [](EmbeddingData &self, nb::bytes value) { self.packed_value.assign(value.c_str(), value.size()); });
 
     // Bind WrapMatchExpr
     nb::class_<WrapMatchExpr>(m, "WrapMatchExpr")
@@ -311,6 +315,7 @@ NB_MODULE(embedded_infinity_ext, m) {
         .value("kFVECS", CopyFileType::kFVECS)
         .value("kCSR", CopyFileType::kCSR)
         .value("kBVECS", CopyFileType::kBVECS)
+        .value("kPARQUET", CopyFileType::kPARQUET)
         .value("kInvalid", CopyFileType::kInvalid);
 
     nb::class_<InitParameter>(m, "InitParameter")
@@ -224,6 +224,34 @@ Status Config::Init(const SharedPtr<String> &config_path, DefaultConfig* default
             UnrecoverableError(status.message());
         }
 
+        // Thrift protocol
+        String thrift_protocol = "binary";
+        UniquePtr<StringOption> thrift_protocol_option = MakeUnique<StringOption>(THRIFT_PROTOCOL_OPTION_NAME, thrift_protocol);
+        status = global_options_.AddOption(std::move(thrift_protocol_option));
+        if(!status.ok()) {
+            fmt::print("Fatal: {}", status.message());
+            UnrecoverableError(status.message());
+        }
+
+        // Thrift transport
+        String thrift_transport = "buffered";
+        UniquePtr<StringOption> thrift_transport_option = MakeUnique<StringOption>(THRIFT_TRANSPORT_OPTION_NAME, thrift_transport);
+        status = global_options_.AddOption(std::move(thrift_transport_option));
+        if(!status.ok()) {
+            fmt::print("Fatal: {}", status.message());
+            UnrecoverableError(status.message());
+        }
+
+        // Upload size limit
+        i64 upload_size_limit = DEFAULT_UPLOAD_SIZE_LIMIT;
+        UniquePtr<IntegerOption> upload_size_limit_option =
+            MakeUnique<IntegerOption>(UPLOAD_SIZE_LIMIT_OPTION_NAME, upload_size_limit, std::numeric_limits<i64>::max(), 0);
+        status = global_options_.AddOption(std::move(upload_size_limit_option));
+        if(!status.ok()) {
+            fmt::print("Fatal: {}", status.message());
+            UnrecoverableError(status.message());
+        }
+
         // Log file name
         String log_filename = "infinity.log";
         UniquePtr<StringOption> log_file_name_option = MakeUnique<StringOption>(LOG_FILENAME_OPTION_NAME, log_filename);
@@ -758,6 +786,67 @@ Status Config::Init(const SharedPtr<String> &config_path, DefaultConfig* default
                             }
                             break;
                         }
+                        case GlobalOptionIndex::kThriftProtocol: {
+                            // Thrift protocol
+                            String thrift_protocol = "binary";
+                            if (elem.second.is_string()) {
+                                thrift_protocol = elem.second.value_or(thrift_protocol);
+                            } else {
+                                return Status::InvalidConfig("'thrift_protocol' field isn't string.");
+                            }
+                            ToLower(thrift_protocol);
+                            if (thrift_protocol != "binary" && thrift_protocol != "compact") {
+                                return Status::InvalidConfig(fmt::format("Invalid thrift protocol: {}, expect binary or compact", thrift_protocol));
+                            }
+
+                            UniquePtr<StringOption> thrift_protocol_option = MakeUnique<StringOption>(THRIFT_PROTOCOL_OPTION_NAME, thrift_protocol);
+                            Status status = global_options_.AddOption(std::move(thrift_protocol_option));
+                            if(!status.ok()) {
+                                UnrecoverableError(status.message());
+                            }
+                            break;
+                        }
+                        case GlobalOptionIndex::kThriftTransport: {
+                            // Thrift transport
+                            String thrift_transport = "buffered";
+                            if (elem.second.is_string()) {
+                                thrift_transport = elem.second.value_or(thrift_transport);
+                            } else {
+                                return Status::InvalidConfig("'thrift_transport' field isn't string.");
+                            }
+                            ToLower(thrift_transport);
+                            if (thrift_transport != "buffered" && thrift_transport != "framed") {
+                                return Status::InvalidConfig(fmt::format("Invalid thrift transport: {}, expect buffered or framed", thrift_transport));
+                            }
+
+                            UniquePtr<StringOption> thrift_transport_option = MakeUnique<StringOption>(THRIFT_TRANSPORT_OPTION_NAME, thrift_transport);
+                            Status status = global_options_.AddOption(std::move(thrift_transport_option));
+                            if(!status.ok()) {
+                                UnrecoverableError(status.message());
+                            }
+                            break;
+                        }
+                        case GlobalOptionIndex::kUploadSizeLimit: {
+                            // Upload size limit
+                            i64 upload_size_limit = DEFAULT_UPLOAD_SIZE_LIMIT;
+                            if (elem.second.is_string()) {
+                                String upload_size_limit_str = elem.second.value_or(DEFAULT_UPLOAD_SIZE_LIMIT_STR.data());
+                                auto res = ParseByteSize(upload_size_limit_str, upload_size_limit);
+                                if (!res.ok()) {
+                                    return res;
+                                }
+                            } else {
+                                return Status::InvalidConfig("'upload_size_limit' field isn't string, such as \"16GB\"");
+                            }
+
+                            UniquePtr<IntegerOption> upload_size_limit_option =
+                                MakeUnique<IntegerOption>(UPLOAD_SIZE_LIMIT_OPTION_NAME, upload_size_limit, std::numeric_limits<i64>::max(), 0);
+                            Status status = global_options_.AddOption(std::move(upload_size_limit_option));
+                            if(!status.ok()) {
+                                UnrecoverableError(status.message());
+                            }
+                            break;
+                        }
                         default: {
                             return Status::InvalidConfig(fmt::format("Unrecognized config parameter: {} in 'network' field", var_name));
                         }
@@ -813,6 +902,37 @@ Status Config::Init(const SharedPtr<String> &config_path, DefaultConfig* default
                         UnrecoverableError(status.message());
                     }
                 }
+
+                if(global_options_.GetOptionByIndex(GlobalOptionIndex::kThriftProtocol) == nullptr) {
+                    // Thrift protocol
+                    String thrift_protocol = "binary";
+                    UniquePtr<StringOption> thrift_protocol_option = MakeUnique<StringOption>(THRIFT_PROTOCOL_OPTION_NAME, thrift_protocol);
+                    Status status = global_options_.AddOption(std::move(thrift_protocol_option));
+                    if(!status.ok()) {
+                        UnrecoverableError(status.message());
+                    }
+                }
+
+                if(global_options_.GetOptionByIndex(GlobalOptionIndex::kThriftTransport) == nullptr) {
+                    // Thrift transport
+                    String thrift_transport = "buffered";
+                    UniquePtr<StringOption> thrift_transport_option = MakeUnique<StringOption>(THRIFT_TRANSPORT_OPTION_NAME, thrift_transport);
+                    Status status = global_options_.AddOption(std::move(thrift_transport_option));
+                    if(!status.ok()) {
+                        UnrecoverableError(status.message());
+                    }
+                }
+
+                if(global_options_.GetOptionByIndex(GlobalOptionIndex::kUploadSizeLimit) == nullptr) {
+                    // Upload size limit
+                    i64 upload_size_limit = DEFAULT_UPLOAD_SIZE_LIMIT;
+                    UniquePtr<IntegerOption> upload_size_limit_option =
+                        MakeUnique<IntegerOption>(UPLOAD_SIZE_LIMIT_OPTION_NAME, upload_size_limit, std::numeric_limits<i64>::max(), 0);
+                    Status status = global_options_.AddOption(std::move(upload_size_limit_option));
+                    if(!status.ok()) {
+                        UnrecoverableError(status.message());
+                    }
+                }
             } else {
                 return Status::InvalidConfig("No 'network' section in configure file.");
             }
@@ -1777,6 +1897,21 @@ i64 Config::ConnectionPoolSize() {
     return global_options_.GetIntegerValue(GlobalOptionIndex::kConnectionPoolSize);
 }
 
+String Config::ThriftProtocol() {
+    std::lock_guard<std::mutex> guard(mutex_);
+    return global_options_.GetStringValue(GlobalOptionIndex::kThriftProtocol);
+}
+
+String Config::ThriftTransport() {
+    std::lock_guard<std::mutex> guard(mutex_);
+    return global_options_.GetStringValue(GlobalOptionIndex::kThriftTransport);
+}
+
+i64 Config::UploadSizeLimit() {
+    std::lock_guard<std::mutex> guard(mutex_);
+    return global_options_.GetIntegerValue(GlobalOptionIndex::kUploadSizeLimit);
+}
+
 // Log
 String Config::LogFileName() {
     std::lock_guard<std::mutex> guard(mutex_);
@@ -2018,6 +2153,9 @@ void Config::PrintAll() {
     fmt::print(" - http port: {}\n", HTTPPort());
     fmt::print(" - rpc client port: {}\n", ClientPort());
     fmt::print(" - connection pool size: {}\n", ConnectionPoolSize());
+    fmt::print(" - thrift protocol: {}\n", ThriftProtocol());
+    fmt::print(" - thrift transport: {}\n", ThriftTransport());
+    fmt::print(" - upload size limit: {}\n", Utility::FormatByteSize(UploadSizeLimit()));
 
     // Log
     fmt::print(" - log_filename: {}\n", LogFileName());
@@ -62,6 +62,9 @@ public:
     i64 HTTPPort();
     i64 ClientPort();
     i64 ConnectionPoolSize();
+    String ThriftProtocol();
+    String ThriftTransport();
+    i64 UploadSizeLimit();
 
     // Log
     String LogFileName();
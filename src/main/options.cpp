@@ -38,6 +38,9 @@ GlobalOptions::GlobalOptions() {
     name2index_[String(HTTP_PORT_OPTION_NAME)] = GlobalOptionIndex::kHTTPPort;
     name2index_[String(CLIENT_PORT_OPTION_NAME)] = GlobalOptionIndex::kClientPort;
     name2index_[String(CONNECTION_POOL_SIZE_OPTION_NAME)] = GlobalOptionIndex::kConnectionPoolSize;
+    name2index_[String(THRIFT_PROTOCOL_OPTION_NAME)] = GlobalOptionIndex::kThriftProtocol;
+    name2index_[String(THRIFT_TRANSPORT_OPTION_NAME)] = GlobalOptionIndex::kThriftTransport;
+    name2index_[String(UPLOAD_SIZE_LIMIT_OPTION_NAME)] = GlobalOptionIndex::kUploadSizeLimit;
     name2index_[String(LOG_FILENAME_OPTION_NAME)] = GlobalOptionIndex::kLogFileName;
 
     name2index_[String(LOG_DIR_OPTION_NAME)] = GlobalOptionIndex::kLogDir;
@@ -146,7 +146,10 @@ export enum class GlobalOptionIndex {
     kPersistenceDir = 31,
     kPersistenceObjectSizeLimit = 32,
     kMemIndexMemoryQuota = 33,
-    kInvalid = 34,
+    kThriftProtocol = 34,
+    kThriftTransport = 35,
+    kUploadSizeLimit = 36,
+    kInvalid = 37,
 };
 
 export struct GlobalOptions {
@@ -53,6 +53,8 @@ class InfinityServiceIf {
   virtual void DropIndex(CommonResponse& _return, const DropIndexRequest& request) = 0;
   virtual void ShowIndex(ShowIndexResponse& _return, const ShowIndexRequest& request) = 0;
   virtual void Optimize(CommonResponse& _return, const OptimizeRequest& request) = 0;
+  virtual void UploadFileChunk(CommonResponse& _return, const UploadFileChunkRequest& request) = 0;
+  virtual void SelectBatch(SelectBatchResponse& _return, const SelectBatchRequest& request) = 0;
 };
 
 class InfinityServiceIfFactory {
@@ -175,6 +177,12 @@ class InfinityServiceNull : virtual public InfinityServiceIf {
   void Optimize(CommonResponse& /* _return */, const OptimizeRequest& /* request */) override {
     return;
   }
+  void UploadFileChunk(CommonResponse& /* _return */, const UploadFileChunkRequest& /* request */) override {
+    return;
+  }
+  void SelectBatch(SelectBatchResponse& /* _return */, const SelectBatchRequest& /* request */) override {
+    return;
+  }
 };
 
 typedef struct _InfinityService_Connect_args__isset {
@@ -3401,6 +3409,214 @@ class InfinityService_Optimize_presult {
 
 };
 
+typedef struct _InfinityService_UploadFileChunk_args__isset {
+  _InfinityService_UploadFileChunk_args__isset() : request(false) {}
+  bool request :1;
+} _InfinityService_UploadFileChunk_args__isset;
+
+class InfinityService_UploadFileChunk_args {
+ public:
+
+  InfinityService_UploadFileChunk_args(const InfinityService_UploadFileChunk_args&);
+  InfinityService_UploadFileChunk_args& operator=(const InfinityService_UploadFileChunk_args&);
+  InfinityService_UploadFileChunk_args() noexcept {
+  }
+
+  virtual ~InfinityService_UploadFileChunk_args() noexcept;
+  UploadFileChunkRequest request;
+
+  _InfinityService_UploadFileChunk_args__isset __isset;
+
+  void __set_request(const UploadFileChunkRequest& val);
+
+  bool operator == (const InfinityService_UploadFileChunk_args & rhs) const
+  {
+    if (!(request == rhs.request))
+      return false;
+    return true;
+  }
+  bool operator != (const InfinityService_UploadFileChunk_args &rhs) const {
+    return !(*this == rhs);
+  }
+
+  bool operator < (const InfinityService_UploadFileChunk_args & ) const;
+
+  uint32_t read(::apache::thrift::protocol::TProtocol* iprot);
+  uint32_t write(::apache::thrift::protocol::TProtocol* oprot) const;
+
+};
+
+
+class InfinityService_UploadFileChunk_pargs {
+ public:
+
+
+  virtual ~InfinityService_UploadFileChunk_pargs() noexcept;
+  const UploadFileChunkRequest* request;
+
+  uint32_t write(::apache::thrift::protocol::TProtocol* oprot) const;
+
+};
+
+typedef struct _InfinityService_UploadFileChunk_result__isset {
+  _InfinityService_UploadFileChunk_result__isset() : success(false) {}
+  bool success :1;
+} _InfinityService_UploadFileChunk_result__isset;
+
+class InfinityService_UploadFileChunk_result {
+ public:
+
+  InfinityService_UploadFileChunk_result(const InfinityService_UploadFileChunk_result&);
+  InfinityService_UploadFileChunk_result& operator=(const InfinityService_UploadFileChunk_result&);
+  InfinityService_UploadFileChunk_result() noexcept {
+  }
+
+  virtual ~InfinityService_UploadFileChunk_result() noexcept;
+  CommonResponse success;
+
+  _InfinityService_UploadFileChunk_result__isset __isset;
+
+  void __set_success(const CommonResponse& val);
+
+  bool operator == (const InfinityService_UploadFileChunk_result & rhs) const
+  {
+    if (!(success == rhs.success))
+      return false;
+    return true;
+  }
+  bool operator != (const InfinityService_UploadFileChunk_result &rhs) const {
+    return !(*this == rhs);
+  }
+
+  bool operator < (const InfinityService_UploadFileChunk_result & ) const;
+
+  uint32_t read(::apache::thrift::protocol::TProtocol* iprot);
+  uint32_t write(::apache::thrift::protocol::TProtocol* oprot) const;
+
+};
+
+typedef struct _InfinityService_UploadFileChunk_presult__isset {
+  _InfinityService_UploadFileChunk_presult__isset() : success(false) {}
+  bool success :1;
+} _InfinityService_UploadFileChunk_presult__isset;
+
+class InfinityService_UploadFileChunk_presult {
+ public:
+
+
+  virtual ~InfinityService_UploadFileChunk_presult() noexcept;
+  CommonResponse* success;
+
+  _InfinityService_UploadFileChunk_presult__isset __isset;
+
+  uint32_t read(::apache::thrift::protocol::TProtocol* iprot);
+
+};
+
+typedef struct _InfinityService_SelectBatch_args__isset {
+  _InfinityService_SelectBatch_args__isset() : request(false) {}
+  bool request :1;
+} _InfinityService_SelectBatch_args__isset;
+
+class InfinityService_SelectBatch_args {
+ public:
+
+  InfinityService_SelectBatch_args(const InfinityService_SelectBatch_args&);
+  InfinityService_SelectBatch_args& operator=(const InfinityService_SelectBatch_args&);
+  InfinityService_SelectBatch_args() noexcept {
+  }
+
+  virtual ~InfinityService_SelectBatch_args() noexcept;
+  SelectBatchRequest request;
+
+  _InfinityService_SelectBatch_args__isset __isset;
+
+  void __set_request(const SelectBatchRequest& val);
+
+  bool operator == (const InfinityService_SelectBatch_args & rhs) const
+  {
+    if (!(request == rhs.request))
+      return false;
+    return true;
+  }
+  bool operator != (const InfinityService_SelectBatch_args &rhs) const {
+    return !(*this == rhs);
+  }
+
+  bool operator < (const InfinityService_SelectBatch_args & ) const;
+
+  uint32_t read(::apache::thrift::protocol::TProtocol* iprot);
+  uint32_t write(::apache::thrift::protocol::TProtocol* oprot) const;
+
+};
+
+
+class InfinityService_SelectBatch_pargs {
+ public:
+
+
+  virtual ~InfinityService_SelectBatch_pargs() noexcept;
+  const SelectBatchRequest* request;
+
+  uint32_t write(::apache::thrift::protocol::TProtocol* oprot) const;
+
+};
+
+typedef struct _InfinityService_SelectBatch_result__isset {
+  _InfinityService_SelectBatch_result__isset() : success(false) {}
+  bool success :1;
+} _InfinityService_SelectBatch_result__isset;
+
+class InfinityService_SelectBatch_result {
+ public:
+
+  InfinityService_SelectBatch_result(const InfinityService_SelectBatch_result&);
+  InfinityService_SelectBatch_result& operator=(const InfinityService_SelectBatch_result&);
+  InfinityService_SelectBatch_result() noexcept {
+  }
+
+  virtual ~InfinityService_SelectBatch_result() noexcept;
+  SelectBatchResponse success;
+
+  _InfinityService_SelectBatch_result__isset __isset;
+
+  void __set_success(const SelectBatchResponse& val);
+
+  bool operator == (const InfinityService_SelectBatch_result & rhs) const
+  {
+    if (!(success == rhs.success))
+      return false;
+    return true;
+  }
+  bool operator != (const InfinityService_SelectBatch_result &rhs) const {
+    return !(*this == rhs);
+  }
+
+  bool operator < (const InfinityService_SelectBatch_result & ) const;
+
+  uint32_t read(::apache::thrift::protocol::TProtocol* iprot);
+  uint32_t write(::apache::thrift::protocol::TProtocol* oprot) const;
+
+};
+
+typedef struct _InfinityService_SelectBatch_presult__isset {
+  _InfinityService_SelectBatch_presult__isset() : success(false) {}
+  bool success :1;
+} _InfinityService_SelectBatch_presult__isset;
+
+class InfinityService_SelectBatch_presult {
+ public:
+
+
+  virtual ~InfinityService_SelectBatch_presult() noexcept;
+  SelectBatchResponse* success;
+
+  _InfinityService_SelectBatch_presult__isset __isset;
+
+  uint32_t read(::apache::thrift::protocol::TProtocol* iprot);
+
+};
+
 class InfinityServiceClient : virtual public InfinityServiceIf {
  public:
   InfinityServiceClient(std::shared_ptr< ::apache::thrift::protocol::TProtocol> prot) {
@@ -3519,6 +3735,12 @@ class InfinityServiceClient : virtual public InfinityServiceIf {
   void Optimize(CommonResponse& _return, const OptimizeRequest& request) override;
   void send_Optimize(const OptimizeRequest& request);
   void recv_Optimize(CommonResponse& _return);
+  void UploadFileChunk(CommonResponse& _return, const UploadFileChunkRequest& request) override;
+  void send_UploadFileChunk(const UploadFileChunkRequest& request);
+  void recv_UploadFileChunk(CommonResponse& _return);
+  void SelectBatch(SelectBatchResponse& _return, const SelectBatchRequest& request) override;
+  void send_SelectBatch(const SelectBatchRequest& request);
+  void recv_SelectBatch(SelectBatchResponse& _return);
  protected:
   std::shared_ptr< ::apache::thrift::protocol::TProtocol> piprot_;
   std::shared_ptr< ::apache::thrift::protocol::TProtocol> poprot_;
@@ -3565,6 +3787,8 @@ class InfinityServiceProcessor : public ::apache::thrift::TDispatchProcessor {
   void process_DropIndex(int32_t seqid, ::apache::thrift::protocol::TProtocol* iprot, ::apache::thrift::protocol::TProtocol* oprot, void* callContext);
   void process_ShowIndex(int32_t seqid, ::apache::thrift::protocol::TProtocol* iprot, ::apache::thrift::protocol::TProtocol* oprot, void* callContext);
   void process_Optimize(int32_t seqid, ::apache::thrift::protocol::TProtocol* iprot, ::apache::thrift::protocol::TProtocol* oprot, void* callContext);
+  void process_UploadFileChunk(int32_t seqid, ::apache::thrift::protocol::TProtocol* iprot, ::apache::thrift::protocol::TProtocol* oprot, void* callContext);
+  void process_SelectBatch(int32_t seqid, ::apache::thrift::protocol::TProtocol* iprot, ::apache::thrift::protocol::TProtocol* oprot, void* callContext);
  public:
   InfinityServiceProcessor(::std::shared_ptr<InfinityServiceIf> iface) :
     iface_(iface) {
@@ -3599,6 +3823,8 @@ class InfinityServiceProcessor : public ::apache::thrift::TDispatchProcessor {
     processMap_["DropIndex"] = &InfinityServiceProcessor::process_DropIndex;
     processMap_["ShowIndex"] = &InfinityServiceProcessor::process_ShowIndex;
     processMap_["Optimize"] = &InfinityServiceProcessor::process_Optimize;
+    processMap_["UploadFileChunk"] = &InfinityServiceProcessor::process_UploadFileChunk;
+    processMap_["SelectBatch"] = &InfinityServiceProcessor::process_SelectBatch;
   }
 
   virtual ~InfinityServiceProcessor() {}
@@ -3937,6 +4163,26 @@ class InfinityServiceMultiface : virtual public InfinityServiceIf {
     return;
   }
 
+  void UploadFileChunk(CommonResponse& _return, const UploadFileChunkRequest& request) override {
+    size_t sz = ifaces_.size();
+    size_t i = 0;
+    for (; i < (sz - 1); ++i) {
+      ifaces_[i]->UploadFileChunk(_return, request);
+    }
+    ifaces_[i]->UploadFileChunk(_return, request);
+    return;
+  }
+
+  void SelectBatch(SelectBatchResponse& _return, const SelectBatchRequest& request) override {
+    size_t sz = ifaces_.size();
+    size_t i = 0;
+    for (; i < (sz - 1); ++i) {
+      ifaces_[i]->SelectBatch(_return, request);
+    }
+    ifaces_[i]->SelectBatch(_return, request);
+    return;
+  }
+
 };
 
 // The 'concurrent' client is a thread safe client that correctly handles
@@ -4062,6 +4308,12 @@ class InfinityServiceConcurrentClient : virtual public InfinityServiceIf {
   void Optimize(CommonResponse& _return, const OptimizeRequest& request) override;
   int32_t send_Optimize(const OptimizeRequest& request);
   void recv_Optimize(CommonResponse& _return, const int32_t seqid);
+  void UploadFileChunk(CommonResponse& _return, const UploadFileChunkRequest& request) override;
+  int32_t send_UploadFileChunk(const UploadFileChunkRequest& request);
+  void recv_UploadFileChunk(CommonResponse& _return, const int32_t seqid);
+  void SelectBatch(SelectBatchResponse& _return, const SelectBatchRequest& request) override;
+  int32_t send_SelectBatch(const SelectBatchRequest& request);
+  void recv_SelectBatch(SelectBatchResponse& _return, const int32_t seqid);
  protected:
   std::shared_ptr< ::apache::thrift::protocol::TProtocol> piprot_;
   std::shared_ptr< ::apache::thrift::protocol::TProtocol> poprot_;
@@ -300,7 +300,8 @@ int _kCopyFileTypeValues[] = {
   CopyFileType::JSONL,
   CopyFileType::FVECS,
   CopyFileType::CSR,
-  CopyFileType::BVECS
+  CopyFileType::BVECS,
+  CopyFileType::PARQUET
 };
 const char* _kCopyFileTypeNames[] = {
   "CSV",
@@ -308,9 +309,10 @@ const char* _kCopyFileTypeNames[] = {
   "JSONL",
   "FVECS",
   "CSR",
-  "BVECS"
+  "BVECS",
+  "PARQUET"
 };
-const std::map<int, const char*> _CopyFileType_VALUES_TO_NAMES(::apache::thrift::TEnumIterator(6, _kCopyFileTypeValues, _kCopyFileTypeNames), ::apache::thrift::TEnumIterator(-1, nullptr, nullptr));
+const std::map<int, const char*> _CopyFileType_VALUES_TO_NAMES(::apache::thrift::TEnumIterator(7, _kCopyFileTypeValues, _kCopyFileTypeNames), ::apache::thrift::TEnumIterator(-1, nullptr, nullptr));
 
 std::ostream& operator<<(std::ostream& out, const CopyFileType::type& val) {
   std::map<int, const char*>::const_iterator it = _CopyFileType_VALUES_TO_NAMES.find(val);
@@ -2199,6 +2201,11 @@ void EmbeddingData::__set_bf16_array_value(const std::vector<double> & val) {
   this->bf16_array_value = val;
 __isset.bf16_array_value = true;
 }
+
+void EmbeddingData::__set_packed_value(const std::string& val) {
+  this->packed_value = val;
+__isset.packed_value = true;
+}
 std::ostream& operator<<(std::ostream& out, const EmbeddingData& obj)
 {
   obj.printTo(out);
@@ -2427,6 +2434,14 @@ uint32_t EmbeddingData::read(::apache::thrift::protocol::TProtocol* iprot) {
           xfer += iprot->skip(ftype);
         }
         break;
+      case 11:
+        if (ftype == ::apache::thrift::protocol::T_STRING) {
+          xfer += iprot->readBinary(this->packed_value);
+          this->__isset.packed_value = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
       default:
         xfer += iprot->skip(ftype);
         break;
@@ -2574,6 +2589,11 @@ uint32_t EmbeddingData::write(::apache::thrift::protocol::TProtocol* oprot) cons
     }
     xfer += oprot->writeFieldEnd();
   }
+  if (this->__isset.packed_value) {
+    xfer += oprot->writeFieldBegin("packed_value", ::apache::thrift::protocol::T_STRING, 11);
+    xfer += oprot->writeBinary(this->packed_value);
+    xfer += oprot->writeFieldEnd();
+  }
   xfer += oprot->writeFieldStop();
   xfer += oprot->writeStructEnd();
   return xfer;
@@ -2591,6 +2611,7 @@ void swap(EmbeddingData &a, EmbeddingData &b) {
   swap(a.f64_array_value, b.f64_array_value);
   swap(a.f16_array_value, b.f16_array_value);
   swap(a.bf16_array_value, b.bf16_array_value);
+  swap(a.packed_value, b.packed_value);
   swap(a.__isset, b.__isset);
 }
 
@@ -2605,6 +2626,7 @@ EmbeddingData::EmbeddingData(const EmbeddingData& other102) {
   f64_array_value = other102.f64_array_value;
   f16_array_value = other102.f16_array_value;
   bf16_array_value = other102.bf16_array_value;
+  packed_value = other102.packed_value;
   __isset = other102.__isset;
 }
 EmbeddingData& EmbeddingData::operator=(const EmbeddingData& other103) {
@@ -2618,6 +2640,7 @@ EmbeddingData& EmbeddingData::operator=(const EmbeddingData& other103) {
   f64_array_value = other103.f64_array_value;
   f16_array_value = other103.f16_array_value;
   bf16_array_value = other103.bf16_array_value;
+  packed_value = other103.packed_value;
   __isset = other103.__isset;
   return *this;
 }
@@ -2634,6 +2657,7 @@ void EmbeddingData::printTo(std::ostream& out) const {
   out << ", " << "f64_array_value="; (__isset.f64_array_value ? (out << to_string(f64_array_value)) : (out << "<null>"));
   out << ", " << "f16_array_value="; (__isset.f16_array_value ? (out << to_string(f16_array_value)) : (out << "<null>"));
   out << ", " << "bf16_array_value="; (__isset.bf16_array_value ? (out << to_string(bf16_array_value)) : (out << "<null>"));
+  out << ", " << "packed_value="; (__isset.packed_value ? (out << to_string(packed_value)) : (out << "<null>"));
   out << ")";
 }
 
@@ -5517,6 +5541,182 @@ void ColumnField::printTo(std::ostream& out) const {
 }
 
 
+InsertColumn::~InsertColumn() noexcept {
+}
+
+
+void InsertColumn::__set_column_name(const std::string& val) {
+  this->column_name = val;
+}
+
+void InsertColumn::__set_column_type(const ColumnType::type val) {
+  this->column_type = val;
+}
+
+void InsertColumn::__set_element_type(const ElementType::type val) {
+  this->element_type = val;
+}
+
+void InsertColumn::__set_dimension(const int32_t val) {
+  this->dimension = val;
+}
+
+void InsertColumn::__set_column_vector(const std::string& val) {
+  this->column_vector = val;
+}
+std::ostream& operator<<(std::ostream& out, const InsertColumn& obj)
+{
+  obj.printTo(out);
+  return out;
+}
+
+
+uint32_t InsertColumn::read(::apache::thrift::protocol::TProtocol* iprot) {
+
+  ::apache::thrift::protocol::TInputRecursionTracker tracker(*iprot);
+  uint32_t xfer = 0;
+  std::string fname;
+  ::apache::thrift::protocol::TType ftype;
+  int16_t fid;
+
+  xfer += iprot->readStructBegin(fname);
+
+  using ::apache::thrift::protocol::TProtocolException;
+
+
+  while (true)
+  {
+    xfer += iprot->readFieldBegin(fname, ftype, fid);
+    if (ftype == ::apache::thrift::protocol::T_STOP) {
+      break;
+    }
+    switch (fid)
+    {
+      case 1:
+        if (ftype == ::apache::thrift::protocol::T_STRING) {
+          xfer += iprot->readString(this->column_name);
+          this->__isset.column_name = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      case 2:
+        if (ftype == ::apache::thrift::protocol::T_I32) {
+          int32_t ecast268;
+          xfer += iprot->readI32(ecast268);
+          this->column_type = static_cast<ColumnType::type>(ecast268);
+          this->__isset.column_type = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      case 3:
+        if (ftype == ::apache::thrift::protocol::T_I32) {
+          int32_t ecast269;
+          xfer += iprot->readI32(ecast269);
+          this->element_type = static_cast<ElementType::type>(ecast269);
+          this->__isset.element_type = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      case 4:
+        if (ftype == ::apache::thrift::protocol::T_I32) {
+          xfer += iprot->readI32(this->dimension);
+          this->__isset.dimension = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      case 5:
+        if (ftype == ::apache::thrift::protocol::T_STRING) {
+          xfer += iprot->readBinary(this->column_vector);
+          this->__isset.column_vector = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      default:
+        xfer += iprot->skip(ftype);
+        break;
+    }
+    xfer += iprot->readFieldEnd();
+  }
+
+  xfer += iprot->readStructEnd();
+
+  return xfer;
+}
+
+uint32_t InsertColumn::write(::apache::thrift::protocol::TProtocol* oprot) const {
+  uint32_t xfer = 0;
+  ::apache::thrift::protocol::TOutputRecursionTracker tracker(*oprot);
+  xfer += oprot->writeStructBegin("InsertColumn");
+
+  xfer += oprot->writeFieldBegin("column_name", ::apache::thrift::protocol::T_STRING, 1);
+  xfer += oprot->writeString(this->column_name);
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldBegin("column_type", ::apache::thrift::protocol::T_I32, 2);
+  xfer += oprot->writeI32(static_cast<int32_t>(this->column_type));
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldBegin("element_type", ::apache::thrift::protocol::T_I32, 3);
+  xfer += oprot->writeI32(static_cast<int32_t>(this->element_type));
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldBegin("dimension", ::apache::thrift::protocol::T_I32, 4);
+  xfer += oprot->writeI32(this->dimension);
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldBegin("column_vector", ::apache::thrift::protocol::T_STRING, 5);
+  xfer += oprot->writeBinary(this->column_vector);
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldStop();
+  xfer += oprot->writeStructEnd();
+  return xfer;
+}
+
+void swap(InsertColumn &a, InsertColumn &b) {
+  using ::std::swap;
+  swap(a.column_name, b.column_name);
+  swap(a.column_type, b.column_type);
+  swap(a.element_type, b.element_type);
+  swap(a.dimension, b.dimension);
+  swap(a.column_vector, b.column_vector);
+  swap(a.__isset, b.__isset);
+}
+
+InsertColumn::InsertColumn(const InsertColumn& other270) {
+  column_name = other270.column_name;
+  column_type = other270.column_type;
+  element_type = other270.element_type;
+  dimension = other270.dimension;
+  column_vector = other270.column_vector;
+  __isset = other270.__isset;
+}
+InsertColumn& InsertColumn::operator=(const InsertColumn& other271) {
+  column_name = other271.column_name;
+  column_type = other271.column_type;
+  element_type = other271.element_type;
+  dimension = other271.dimension;
+  column_vector = other271.column_vector;
+  __isset = other271.__isset;
+  return *this;
+}
+void InsertColumn::printTo(std::ostream& out) const {
+  using ::apache::thrift::to_string;
+  out << "InsertColumn(";
+  out << "column_name=" << to_string(column_name);
+  out << ", " << "column_type=" << to_string(column_type);
+  out << ", " << "element_type=" << to_string(element_type);
+  out << ", " << "dimension=" << to_string(dimension);
+  out << ", " << "column_vector=" << to_string(column_vector);
+  out << ")";
+}
+
+
 ImportOption::~ImportOption() noexcept {
 }
 
@@ -5578,9 +5778,9 @@ uint32_t ImportOption::read(::apache::thrift::protocol::TProtocol* iprot) {
         break;
       case 3:
         if (ftype == ::apache::thrift::protocol::T_I32) {
-          int32_t ecast268;
-          xfer += iprot->readI32(ecast268);
-          this->copy_file_type = static_cast<CopyFileType::type>(ecast268);
+          int32_t ecast272;
+          xfer += iprot->readI32(ecast272);
+          this->copy_file_type = static_cast<CopyFileType::type>(ecast272);
           this->__isset.copy_file_type = true;
         } else {
           xfer += iprot->skip(ftype);
@@ -5628,17 +5828,17 @@ void swap(ImportOption &a, ImportOption &b) {
   swap(a.__isset, b.__isset);
 }
 
-ImportOption::ImportOption(const ImportOption& other269) {
-  delimiter = other269.delimiter;
-  has_header = other269.has_header;
-  copy_file_type = other269.copy_file_type;
-  __isset = other269.__isset;
+ImportOption::ImportOption(const ImportOption& other273) {
+  delimiter = other273.delimiter;
+  has_header = other273.has_header;
+  copy_file_type = other273.copy_file_type;
+  __isset = other273.__isset;
 }
-ImportOption& ImportOption::operator=(const ImportOption& other270) {
-  delimiter = other270.delimiter;
-  has_header = other270.has_header;
-  copy_file_type = other270.copy_file_type;
-  __isset = other270.__isset;
+ImportOption& ImportOption::operator=(const ImportOption& other274) {
+  delimiter = other274.delimiter;
+  has_header = other274.has_header;
+  copy_file_type = other274.copy_file_type;
+  __isset = other274.__isset;
   return *this;
 }
 void ImportOption::printTo(std::ostream& out) const {
@@ -5724,9 +5924,9 @@ uint32_t ExportOption::read(::apache::thrift::protocol::TProtocol* iprot) {
         break;
       case 3:
         if (ftype == ::apache::thrift::protocol::T_I32) {
-          int32_t ecast271;
-          xfer += iprot->readI32(ecast271);
-          this->copy_file_type = static_cast<CopyFileType::type>(ecast271);
+          int32_t ecast275;
+          xfer += iprot->readI32(ecast275);
+          this->copy_file_type = static_cast<CopyFileType::type>(ecast275);
           this->__isset.copy_file_type = true;
         } else {
           xfer += iprot->skip(ftype);
@@ -5813,23 +6013,23 @@ void swap(ExportOption &a, ExportOption &b) {
   swap(a.__isset, b.__isset);
 }
 
-ExportOption::ExportOption(const ExportOption& other272) {
-  delimiter = other272.delimiter;
-  has_header = other272.has_header;
-  copy_file_type = other272.copy_file_type;
-  offset = other272.offset;
-  limit = other272.limit;
-  row_limit = other272.row_limit;
-  __isset = other272.__isset;
-}
-ExportOption& ExportOption::operator=(const ExportOption& other273) {
-  delimiter = other273.delimiter;
-  has_header = other273.has_header;
-  copy_file_type = other273.copy_file_type;
-  offset = other273.offset;
-  limit = other273.limit;
-  row_limit = other273.row_limit;
-  __isset = other273.__isset;
+ExportOption::ExportOption(const ExportOption& other276) {
+  delimiter = other276.delimiter;
+  has_header = other276.has_header;
+  copy_file_type = other276.copy_file_type;
+  offset = other276.offset;
+  limit = other276.limit;
+  row_limit = other276.row_limit;
+  __isset = other276.__isset;
+}
+ExportOption& ExportOption::operator=(const ExportOption& other277) {
+  delimiter = other277.delimiter;
+  has_header = other277.has_header;
+  copy_file_type = other277.copy_file_type;
+  offset = other277.offset;
+  limit = other277.limit;
+  row_limit = other277.row_limit;
+  __isset = other277.__isset;
   return *this;
 }
 void ExportOption::printTo(std::ostream& out) const {
@@ -5896,14 +6096,14 @@ uint32_t OptimizeOptions::read(::apache::thrift::protocol::TProtocol* iprot) {
         if (ftype == ::apache::thrift::protocol::T_LIST) {
           {
             this->opt_params.clear();
-            uint32_t _size274;
-            ::apache::thrift::protocol::TType _etype277;
-            xfer += iprot->readListBegin(_etype277, _size274);
-            this->opt_params.resize(_size274);
-            uint32_t _i278;
-            for (_i278 = 0; _i278 < _size274; ++_i278)
+            uint32_t _size278;
+            ::apache::thrift::protocol::TType _etype281;
+            xfer += iprot->readListBegin(_etype281, _size278);
+            this->opt_params.resize(_size278);
+            uint32_t _i282;
+            for (_i282 = 0; _i282 < _size278; ++_i282)
             {
-              xfer += this->opt_params[_i278].read(iprot);
+              xfer += this->opt_params[_i282].read(iprot);
             }
             xfer += iprot->readListEnd();
           }
@@ -5936,10 +6136,10 @@ uint32_t OptimizeOptions::write(::apache::thrift::protocol::TProtocol* oprot) co
   xfer += oprot->writeFieldBegin("opt_params", ::apache::thrift::protocol::T_LIST, 2);
   {
     xfer += oprot->writeListBegin(::apache::thrift::protocol::T_STRUCT, static_cast<uint32_t>(this->opt_params.size()));
-    std::vector<InitParameter> ::const_iterator _iter279;
-    for (_iter279 = this->opt_params.begin(); _iter279 != this->opt_params.end(); ++_iter279)
+    std::vector<InitParameter> ::const_iterator _iter283;
+    for (_iter283 = this->opt_params.begin(); _iter283 != this->opt_params.end(); ++_iter283)
     {
-      xfer += (*_iter279).write(oprot);
+      xfer += (*_iter283).write(oprot);
     }
     xfer += oprot->writeListEnd();
   }
@@ -5957,15 +6157,15 @@ void swap(OptimizeOptions &a, OptimizeOptions &b) {
   swap(a.__isset, b.__isset);
 }
 
-OptimizeOptions::OptimizeOptions(const OptimizeOptions& other280) {
-  index_name = other280.index_name;
-  opt_params = other280.opt_params;
-  __isset = other280.__isset;
+OptimizeOptions::OptimizeOptions(const OptimizeOptions& other284) {
+  index_name = other284.index_name;
+  opt_params = other284.opt_params;
+  __isset = other284.__isset;
 }
-OptimizeOptions& OptimizeOptions::operator=(const OptimizeOptions& other281) {
-  index_name = other281.index_name;
-  opt_params = other281.opt_params;
-  __isset = other281.__isset;
+OptimizeOptions& OptimizeOptions::operator=(const OptimizeOptions& other285) {
+  index_name = other285.index_name;
+  opt_params = other285.opt_params;
+  __isset = other285.__isset;
   return *this;
 }
 void OptimizeOptions::printTo(std::ostream& out) const {
@@ -6052,13 +6252,13 @@ void swap(ConnectRequest &a, ConnectRequest &b) {
   swap(a.__isset, b.__isset);
 }
 
-ConnectRequest::ConnectRequest(const ConnectRequest& other282) noexcept {
-  client_version = other282.client_version;
-  __isset = other282.__isset;
+ConnectRequest::ConnectRequest(const ConnectRequest& other286) noexcept {
+  client_version = other286.client_version;
+  __isset = other286.__isset;
 }
-ConnectRequest& ConnectRequest::operator=(const ConnectRequest& other283) noexcept {
-  client_version = other283.client_version;
-  __isset = other283.__isset;
+ConnectRequest& ConnectRequest::operator=(const ConnectRequest& other287) noexcept {
+  client_version = other287.client_version;
+  __isset = other287.__isset;
   return *this;
 }
 void ConnectRequest::printTo(std::ostream& out) const {
@@ -6144,13 +6344,13 @@ void swap(CommonRequest &a, CommonRequest &b) {
   swap(a.__isset, b.__isset);
 }
 
-CommonRequest::CommonRequest(const CommonRequest& other284) noexcept {
-  session_id = other284.session_id;
-  __isset = other284.__isset;
+CommonRequest::CommonRequest(const CommonRequest& other288) noexcept {
+  session_id = other288.session_id;
+  __isset = other288.__isset;
 }
-CommonRequest& CommonRequest::operator=(const CommonRequest& other285) noexcept {
-  session_id = other285.session_id;
-  __isset = other285.__isset;
+CommonRequest& CommonRequest::operator=(const CommonRequest& other289) noexcept {
+  session_id = other289.session_id;
+  __isset = other289.__isset;
   return *this;
 }
 void CommonRequest::printTo(std::ostream& out) const {
@@ -6270,17 +6470,17 @@ void swap(CommonResponse &a, CommonResponse &b) {
   swap(a.__isset, b.__isset);
 }
 
-CommonResponse::CommonResponse(const CommonResponse& other286) {
-  error_code = other286.error_code;
-  error_msg = other286.error_msg;
-  session_id = other286.session_id;
-  __isset = other286.__isset;
+CommonResponse::CommonResponse(const CommonResponse& other290) {
+  error_code = other290.error_code;
+  error_msg = other290.error_msg;
+  session_id = other290.session_id;
+  __isset = other290.__isset;
 }
-CommonResponse& CommonResponse::operator=(const CommonResponse& other287) {
-  error_code = other287.error_code;
-  error_msg = other287.error_msg;
-  session_id = other287.session_id;
-  __isset = other287.__isset;
+CommonResponse& CommonResponse::operator=(const CommonResponse& other291) {
+  error_code = other291.error_code;
+  error_msg = other291.error_msg;
+  session_id = other291.session_id;
+  __isset = other291.__isset;
   return *this;
 }
 void CommonResponse::printTo(std::ostream& out) const {
@@ -6368,13 +6568,13 @@ void swap(ListDatabaseRequest &a, ListDatabaseRequest &b) {
   swap(a.__isset, b.__isset);
 }
 
-ListDatabaseRequest::ListDatabaseRequest(const ListDatabaseRequest& other288) noexcept {
-  session_id = other288.session_id;
-  __isset = other288.__isset;
+ListDatabaseRequest::ListDatabaseRequest(const ListDatabaseRequest& other292) noexcept {
+  session_id = other292.session_id;
+  __isset = other292.__isset;
 }
-ListDatabaseRequest& ListDatabaseRequest::operator=(const ListDatabaseRequest& other289) noexcept {
-  session_id = other289.session_id;
-  __isset = other289.__isset;
+ListDatabaseRequest& ListDatabaseRequest::operator=(const ListDatabaseRequest& other293) noexcept {
+  session_id = other293.session_id;
+  __isset = other293.__isset;
   return *this;
 }
 void ListDatabaseRequest::printTo(std::ostream& out) const {
@@ -6448,14 +6648,14 @@ uint32_t ListDatabaseResponse::read(::apache::thrift::protocol::TProtocol* iprot
         if (ftype == ::apache::thrift::protocol::T_LIST) {
           {
             this->db_names.clear();
-            uint32_t _size290;
-            ::apache::thrift::protocol::TType _etype293;
-            xfer += iprot->readListBegin(_etype293, _size290);
-            this->db_names.resize(_size290);
-            uint32_t _i294;
-            for (_i294 = 0; _i294 < _size290; ++_i294)
+            uint32_t _size294;
+            ::apache::thrift::protocol::TType _etype297;
+            xfer += iprot->readListBegin(_etype297, _size294);
+            this->db_names.resize(_size294);
+            uint32_t _i298;
+            for (_i298 = 0; _i298 < _size294; ++_i298)
             {
-              xfer += iprot->readString(this->db_names[_i294]);
+              xfer += iprot->readString(this->db_names[_i298]);
             }
             xfer += iprot->readListEnd();
           }
@@ -6492,10 +6692,10 @@ uint32_t ListDatabaseResponse::write(::apache::thrift::protocol::TProtocol* opro
   xfer += oprot->writeFieldBegin("db_names", ::apache::thrift::protocol::T_LIST, 3);
   {
     xfer += oprot->writeListBegin(::apache::thrift::protocol::T_STRING, static_cast<uint32_t>(this->db_names.size()));
-    std::vector<std::string> ::const_iterator _iter295;
-    for (_iter295 = this->db_names.begin(); _iter295 != this->db_names.end(); ++_iter295)
+    std::vector<std::string> ::const_iterator _iter299;
+    for (_iter299 = this->db_names.begin(); _iter299 != this->db_names.end(); ++_iter299)
     {
-      xfer += oprot->writeString((*_iter295));
+      xfer += oprot->writeString((*_iter299));
     }
     xfer += oprot->writeListEnd();
   }
@@ -6514,17 +6714,17 @@ void swap(ListDatabaseResponse &a, ListDatabaseResponse &b) {
   swap(a.__isset, b.__isset);
 }
 
-ListDatabaseResponse::ListDatabaseResponse(const ListDatabaseResponse& other296) {
-  error_code = other296.error_code;
-  error_msg = other296.error_msg;
-  db_names = other296.db_names;
-  __isset = other296.__isset;
+ListDatabaseResponse::ListDatabaseResponse(const ListDatabaseResponse& other300) {
+  error_code = other300.error_code;
+  error_msg = other300.error_msg;
+  db_names = other300.db_names;
+  __isset = other300.__isset;
 }
-ListDatabaseResponse& ListDatabaseResponse::operator=(const ListDatabaseResponse& other297) {
-  error_code = other297.error_code;
-  error_msg = other297.error_msg;
-  db_names = other297.db_names;
-  __isset = other297.__isset;
+ListDatabaseResponse& ListDatabaseResponse::operator=(const ListDatabaseResponse& other301) {
+  error_code = other301.error_code;
+  error_msg = other301.error_msg;
+  db_names = other301.db_names;
+  __isset = other301.__isset;
   return *this;
 }
 void ListDatabaseResponse::printTo(std::ostream& out) const {
@@ -6629,15 +6829,15 @@ void swap(ListTableRequest &a, ListTableRequest &b) {
   swap(a.__isset, b.__isset);
 }
 
-ListTableRequest::ListTableRequest(const ListTableRequest& other298) {
-  db_name = other298.db_name;
-  session_id = other298.session_id;
-  __isset = other298.__isset;
+ListTableRequest::ListTableRequest(const ListTableRequest& other302) {
+  db_name = other302.db_name;
+  session_id = other302.session_id;
+  __isset = other302.__isset;
 }
-ListTableRequest& ListTableRequest::operator=(const ListTableRequest& other299) {
-  db_name = other299.db_name;
-  session_id = other299.session_id;
-  __isset = other299.__isset;
+ListTableRequest& ListTableRequest::operator=(const ListTableRequest& other303) {
+  db_name = other303.db_name;
+  session_id = other303.session_id;
+  __isset = other303.__isset;
   return *this;
 }
 void ListTableRequest::printTo(std::ostream& out) const {
@@ -6712,14 +6912,14 @@ uint32_t ListTableResponse::read(::apache::thrift::protocol::TProtocol* iprot) {
         if (ftype == ::apache::thrift::protocol::T_LIST) {
           {
             this->table_names.clear();
-            uint32_t _size300;
-            ::apache::thrift::protocol::TType _etype303;
-            xfer += iprot->readListBegin(_etype303, _size300);
-            this->table_names.resize(_size300);
-            uint32_t _i304;
-            for (_i304 = 0; _i304 < _size300; ++_i304)
+            uint32_t _size304;
+            ::apache::thrift::protocol::TType _etype307;
+            xfer += iprot->readListBegin(_etype307, _size304);
+            this->table_names.resize(_size304);
+            uint32_t _i308;
+            for (_i308 = 0; _i308 < _size304; ++_i308)
             {
-              xfer += iprot->readString(this->table_names[_i304]);
+              xfer += iprot->readString(this->table_names[_i308]);
             }
             xfer += iprot->readListEnd();
           }
@@ -6756,10 +6956,10 @@ uint32_t ListTableResponse::write(::apache::thrift::protocol::TProtocol* oprot)
   xfer += oprot->writeFieldBegin("table_names", ::apache::thrift::protocol::T_LIST, 3);
   {
     xfer += oprot->writeListBegin(::apache::thrift::protocol::T_STRING, static_cast<uint32_t>(this->table_names.size()));
-    std::vector<std::string> ::const_iterator _iter305;
-    for (_iter305 = this->table_names.begin(); _iter305 != this->table_names.end(); ++_iter305)
+    std::vector<std::string> ::const_iterator _iter309;
+    for (_iter309 = this->table_names.begin(); _iter309 != this->table_names.end(); ++_iter309)
     {
-      xfer += oprot->writeString((*_iter305));
+      xfer += oprot->writeString((*_iter309));
     }
     xfer += oprot->writeListEnd();
   }
@@ -6778,17 +6978,17 @@ void swap(ListTableResponse &a, ListTableResponse &b) {
   swap(a.__isset, b.__isset);
 }
 
-ListTableResponse::ListTableResponse(const ListTableResponse& other306) {
-  error_code = other306.error_code;
-  error_msg = other306.error_msg;
-  table_names = other306.table_names;
-  __isset = other306.__isset;
+ListTableResponse::ListTableResponse(const ListTableResponse& other310) {
+  error_code = other310.error_code;
+  error_msg = other310.error_msg;
+  table_names = other310.table_names;
+  __isset = other310.__isset;
 }
-ListTableResponse& ListTableResponse::operator=(const ListTableResponse& other307) {
-  error_code = other307.error_code;
-  error_msg = other307.error_msg;
-  table_names = other307.table_names;
-  __isset = other307.__isset;
+ListTableResponse& ListTableResponse::operator=(const ListTableResponse& other311) {
+  error_code = other311.error_code;
+  error_msg = other311.error_msg;
+  table_names = other311.table_names;
+  __isset = other311.__isset;
   return *this;
 }
 void ListTableResponse::printTo(std::ostream& out) const {
@@ -6910,17 +7110,17 @@ void swap(ListIndexRequest &a, ListIndexRequest &b) {
   swap(a.__isset, b.__isset);
 }
 
-ListIndexRequest::ListIndexRequest(const ListIndexRequest& other308) {
-  db_name = other308.db_name;
-  table_name = other308.table_name;
-  session_id = other308.session_id;
-  __isset = other308.__isset;
+ListIndexRequest::ListIndexRequest(const ListIndexRequest& other312) {
+  db_name = other312.db_name;
+  table_name = other312.table_name;
+  session_id = other312.session_id;
+  __isset = other312.__isset;
 }
-ListIndexRequest& ListIndexRequest::operator=(const ListIndexRequest& other309) {
-  db_name = other309.db_name;
-  table_name = other309.table_name;
-  session_id = other309.session_id;
-  __isset = other309.__isset;
+ListIndexRequest& ListIndexRequest::operator=(const ListIndexRequest& other313) {
+  db_name = other313.db_name;
+  table_name = other313.table_name;
+  session_id = other313.session_id;
+  __isset = other313.__isset;
   return *this;
 }
 void ListIndexRequest::printTo(std::ostream& out) const {
@@ -6996,14 +7196,14 @@ uint32_t ListIndexResponse::read(::apache::thrift::protocol::TProtocol* iprot) {
         if (ftype == ::apache::thrift::protocol::T_LIST) {
           {
             this->index_names.clear();
-            uint32_t _size310;
-            ::apache::thrift::protocol::TType _etype313;
-            xfer += iprot->readListBegin(_etype313, _size310);
-            this->index_names.resize(_size310);
-            uint32_t _i314;
-            for (_i314 = 0; _i314 < _size310; ++_i314)
+            uint32_t _size314;
+            ::apache::thrift::protocol::TType _etype317;
+            xfer += iprot->readListBegin(_etype317, _size314);
+            this->index_names.resize(_size314);
+            uint32_t _i318;
+            for (_i318 = 0; _i318 < _size314; ++_i318)
             {
-              xfer += iprot->readString(this->index_names[_i314]);
+              xfer += iprot->readString(this->index_names[_i318]);
             }
             xfer += iprot->readListEnd();
           }
@@ -7040,10 +7240,10 @@ uint32_t ListIndexResponse::write(::apache::thrift::protocol::TProtocol* oprot)
   xfer += oprot->writeFieldBegin("index_names", ::apache::thrift::protocol::T_LIST, 3);
   {
     xfer += oprot->writeListBegin(::apache::thrift::protocol::T_STRING, static_cast<uint32_t>(this->index_names.size()));
-    std::vector<std::string> ::const_iterator _iter315;
-    for (_iter315 = this->index_names.begin(); _iter315 != this->index_names.end(); ++_iter315)
+    std::vector<std::string> ::const_iterator _iter319;
+    for (_iter319 = this->index_names.begin(); _iter319 != this->index_names.end(); ++_iter319)
     {
-      xfer += oprot->writeString((*_iter315));
+      xfer += oprot->writeString((*_iter319));
     }
     xfer += oprot->writeListEnd();
   }
@@ -7062,17 +7262,17 @@ void swap(ListIndexResponse &a, ListIndexResponse &b) {
   swap(a.__isset, b.__isset);
 }
 
-ListIndexResponse::ListIndexResponse(const ListIndexResponse& other316) {
-  error_code = other316.error_code;
-  error_msg = other316.error_msg;
-  index_names = other316.index_names;
-  __isset = other316.__isset;
+ListIndexResponse::ListIndexResponse(const ListIndexResponse& other320) {
+  error_code = other320.error_code;
+  error_msg = other320.error_msg;
+  index_names = other320.index_names;
+  __isset = other320.__isset;
 }
-ListIndexResponse& ListIndexResponse::operator=(const ListIndexResponse& other317) {
-  error_code = other317.error_code;
-  error_msg = other317.error_msg;
-  index_names = other317.index_names;
-  __isset = other317.__isset;
+ListIndexResponse& ListIndexResponse::operator=(const ListIndexResponse& other321) {
+  error_code = other321.error_code;
+  error_msg = other321.error_msg;
+  index_names = other321.index_names;
+  __isset = other321.__isset;
   return *this;
 }
 void ListIndexResponse::printTo(std::ostream& out) const {
@@ -7177,15 +7377,15 @@ void swap(ShowDatabaseRequest &a, ShowDatabaseRequest &b) {
   swap(a.__isset, b.__isset);
 }
 
-ShowDatabaseRequest::ShowDatabaseRequest(const ShowDatabaseRequest& other318) {
-  db_name = other318.db_name;
-  session_id = other318.session_id;
-  __isset = other318.__isset;
+ShowDatabaseRequest::ShowDatabaseRequest(const ShowDatabaseRequest& other322) {
+  db_name = other322.db_name;
+  session_id = other322.session_id;
+  __isset = other322.__isset;
 }
-ShowDatabaseRequest& ShowDatabaseRequest::operator=(const ShowDatabaseRequest& other319) {
-  db_name = other319.db_name;
-  session_id = other319.session_id;
-  __isset = other319.__isset;
+ShowDatabaseRequest& ShowDatabaseRequest::operator=(const ShowDatabaseRequest& other323) {
+  db_name = other323.db_name;
+  session_id = other323.session_id;
+  __isset = other323.__isset;
   return *this;
 }
 void ShowDatabaseRequest::printTo(std::ostream& out) const {
@@ -7340,21 +7540,21 @@ void swap(ShowDatabaseResponse &a, ShowDatabaseResponse &b) {
   swap(a.__isset, b.__isset);
 }
 
-ShowDatabaseResponse::ShowDatabaseResponse(const ShowDatabaseResponse& other320) {
-  error_code = other320.error_code;
-  error_msg = other320.error_msg;
-  database_name = other320.database_name;
-  store_dir = other320.store_dir;
-  table_count = other320.table_count;
-  __isset = other320.__isset;
+ShowDatabaseResponse::ShowDatabaseResponse(const ShowDatabaseResponse& other324) {
+  error_code = other324.error_code;
+  error_msg = other324.error_msg;
+  database_name = other324.database_name;
+  store_dir = other324.store_dir;
+  table_count = other324.table_count;
+  __isset = other324.__isset;
 }
-ShowDatabaseResponse& ShowDatabaseResponse::operator=(const ShowDatabaseResponse& other321) {
-  error_code = other321.error_code;
-  error_msg = other321.error_msg;
-  database_name = other321.database_name;
-  store_dir = other321.store_dir;
-  table_count = other321.table_count;
-  __isset = other321.__isset;
+ShowDatabaseResponse& ShowDatabaseResponse::operator=(const ShowDatabaseResponse& other325) {
+  error_code = other325.error_code;
+  error_msg = other325.error_msg;
+  database_name = other325.database_name;
+  store_dir = other325.store_dir;
+  table_count = other325.table_count;
+  __isset = other325.__isset;
   return *this;
 }
 void ShowDatabaseResponse::printTo(std::ostream& out) const {
@@ -7478,17 +7678,17 @@ void swap(ShowTableRequest &a, ShowTableRequest &b) {
   swap(a.__isset, b.__isset);
 }
 
-ShowTableRequest::ShowTableRequest(const ShowTableRequest& other322) {
-  db_name = other322.db_name;
-  table_name = other322.table_name;
-  session_id = other322.session_id;
-  __isset = other322.__isset;
+ShowTableRequest::ShowTableRequest(const ShowTableRequest& other326) {
+  db_name = other326.db_name;
+  table_name = other326.table_name;
+  session_id = other326.session_id;
+  __isset = other326.__isset;
 }
-ShowTableRequest& ShowTableRequest::operator=(const ShowTableRequest& other323) {
-  db_name = other323.db_name;
-  table_name = other323.table_name;
-  session_id = other323.session_id;
-  __isset = other323.__isset;
+ShowTableRequest& ShowTableRequest::operator=(const ShowTableRequest& other327) {
+  db_name = other327.db_name;
+  table_name = other327.table_name;
+  session_id = other327.session_id;
+  __isset = other327.__isset;
   return *this;
 }
 void ShowTableRequest::printTo(std::ostream& out) const {
@@ -7695,27 +7895,27 @@ void swap(ShowTableResponse &a, ShowTableResponse &b) {
   swap(a.__isset, b.__isset);
 }
 
-ShowTableResponse::ShowTableResponse(const ShowTableResponse& other324) {
-  error_code = other324.error_code;
-  error_msg = other324.error_msg;
-  database_name = other324.database_name;
-  table_name = other324.table_name;
-  store_dir = other324.store_dir;
-  column_count = other324.column_count;
-  segment_count = other324.segment_count;
-  row_count = other324.row_count;
-  __isset = other324.__isset;
+ShowTableResponse::ShowTableResponse(const ShowTableResponse& other328) {
+  error_code = other328.error_code;
+  error_msg = other328.error_msg;
+  database_name = other328.database_name;
+  table_name = other328.table_name;
+  store_dir = other328.store_dir;
+  column_count = other328.column_count;
+  segment_count = other328.segment_count;
+  row_count = other328.row_count;
+  __isset = other328.__isset;
 }
-ShowTableResponse& ShowTableResponse::operator=(const ShowTableResponse& other325) {
-  error_code = other325.error_code;
-  error_msg = other325.error_msg;
-  database_name = other325.database_name;
-  table_name = other325.table_name;
-  store_dir = other325.store_dir;
-  column_count = other325.column_count;
-  segment_count = other325.segment_count;
-  row_count = other325.row_count;
-  __isset = other325.__isset;
+ShowTableResponse& ShowTableResponse::operator=(const ShowTableResponse& other329) {
+  error_code = other329.error_code;
+  error_msg = other329.error_msg;
+  database_name = other329.database_name;
+  table_name = other329.table_name;
+  store_dir = other329.store_dir;
+  column_count = other329.column_count;
+  segment_count = other329.segment_count;
+  row_count = other329.row_count;
+  __isset = other329.__isset;
   return *this;
 }
 void ShowTableResponse::printTo(std::ostream& out) const {
@@ -7842,17 +8042,17 @@ void swap(ShowColumnsRequest &a, ShowColumnsRequest &b) {
   swap(a.__isset, b.__isset);
 }
 
-ShowColumnsRequest::ShowColumnsRequest(const ShowColumnsRequest& other326) {
-  db_name = other326.db_name;
-  table_name = other326.table_name;
-  session_id = other326.session_id;
-  __isset = other326.__isset;
+ShowColumnsRequest::ShowColumnsRequest(const ShowColumnsRequest& other330) {
+  db_name = other330.db_name;
+  table_name = other330.table_name;
+  session_id = other330.session_id;
+  __isset = other330.__isset;
 }
-ShowColumnsRequest& ShowColumnsRequest::operator=(const ShowColumnsRequest& other327) {
-  db_name = other327.db_name;
-  table_name = other327.table_name;
-  session_id = other327.session_id;
-  __isset = other327.__isset;
+ShowColumnsRequest& ShowColumnsRequest::operator=(const ShowColumnsRequest& other331) {
+  db_name = other331.db_name;
+  table_name = other331.table_name;
+  session_id = other331.session_id;
+  __isset = other331.__isset;
   return *this;
 }
 void ShowColumnsRequest::printTo(std::ostream& out) const {
@@ -7974,17 +8174,17 @@ void swap(GetTableRequest &a, GetTableRequest &b) {
   swap(a.__isset, b.__isset);
 }
 
-GetTableRequest::GetTableRequest(const GetTableRequest& other328) {
-  db_name = other328.db_name;
-  table_name = other328.table_name;
-  session_id = other328.session_id;
-  __isset = other328.__isset;
+GetTableRequest::GetTableRequest(const GetTableRequest& other332) {
+  db_name = other332.db_name;
+  table_name = other332.table_name;
+  session_id = other332.session_id;
+  __isset = other332.__isset;
 }
-GetTableRequest& GetTableRequest::operator=(const GetTableRequest& other329) {
-  db_name = other329.db_name;
-  table_name = other329.table_name;
-  session_id = other329.session_id;
-  __isset = other329.__isset;
+GetTableRequest& GetTableRequest::operator=(const GetTableRequest& other333) {
+  db_name = other333.db_name;
+  table_name = other333.table_name;
+  session_id = other333.session_id;
+  __isset = other333.__isset;
   return *this;
 }
 void GetTableRequest::printTo(std::ostream& out) const {
@@ -8050,9 +8250,9 @@ uint32_t IndexInfo::read(::apache::thrift::protocol::TProtocol* iprot) {
         break;
       case 2:
         if (ftype == ::apache::thrift::protocol::T_I32) {
-          int32_t ecast330;
-          xfer += iprot->readI32(ecast330);
-          this->index_type = static_cast<IndexType::type>(ecast330);
+          int32_t ecast334;
+          xfer += iprot->readI32(ecast334);
+          this->index_type = static_cast<IndexType::type>(ecast334);
           this->__isset.index_type = true;
         } else {
           xfer += iprot->skip(ftype);
@@ -8062,14 +8262,14 @@ uint32_t IndexInfo::read(::apache::thrift::protocol::TProtocol* iprot) {
         if (ftype == ::apache::thrift::protocol::T_LIST) {
           {
             this->index_param_list.clear();
-            uint32_t _size331;
-            ::apache::thrift::protocol::TType _etype334;
-            xfer += iprot->readListBegin(_etype334, _size331);
-            this->index_param_list.resize(_size331);
-            uint32_t _i335;
-            for (_i335 = 0; _i335 < _size331; ++_i335)
+            uint32_t _size335;
+            ::apache::thrift::protocol::TType _etype338;
+            xfer += iprot->readListBegin(_etype338, _size335);
+            this->index_param_list.resize(_size335);
+            uint32_t _i339;
+            for (_i339 = 0; _i339 < _size335; ++_i339)
             {
-              xfer += this->index_param_list[_i335].read(iprot);
+              xfer += this->index_param_list[_i339].read(iprot);
             }
             xfer += iprot->readListEnd();
           }
@@ -8106,10 +8306,10 @@ uint32_t IndexInfo::write(::apache::thrift::protocol::TProtocol* oprot) const {
   xfer += oprot->writeFieldBegin("index_param_list", ::apache::thrift::protocol::T_LIST, 3);
   {
     xfer += oprot->writeListBegin(::apache::thrift::protocol::T_STRUCT, static_cast<uint32_t>(this->index_param_list.size()));
-    std::vector<InitParameter> ::const_iterator _iter336;
-    for (_iter336 = this->index_param_list.begin(); _iter336 != this->index_param_list.end(); ++_iter336)
+    std::vector<InitParameter> ::const_iterator _iter340;
+    for (_iter340 = this->index_param_list.begin(); _iter340 != this->index_param_list.end(); ++_iter340)
     {
-      xfer += (*_iter336).write(oprot);
+      xfer += (*_iter340).write(oprot);
     }
     xfer += oprot->writeListEnd();
   }
@@ -8128,17 +8328,17 @@ void swap(IndexInfo &a, IndexInfo &b) {
   swap(a.__isset, b.__isset);
 }
 
-IndexInfo::IndexInfo(const IndexInfo& other337) {
-  column_name = other337.column_name;
-  index_type = other337.index_type;
-  index_param_list = other337.index_param_list;
-  __isset = other337.__isset;
+IndexInfo::IndexInfo(const IndexInfo& other341) {
+  column_name = other341.column_name;
+  index_type = other341.index_type;
+  index_param_list = other341.index_param_list;
+  __isset = other341.__isset;
 }
-IndexInfo& IndexInfo::operator=(const IndexInfo& other338) {
-  column_name = other338.column_name;
-  index_type = other338.index_type;
-  index_param_list = other338.index_param_list;
-  __isset = other338.__isset;
+IndexInfo& IndexInfo::operator=(const IndexInfo& other342) {
+  column_name = other342.column_name;
+  index_type = other342.index_type;
+  index_param_list = other342.index_param_list;
+  __isset = other342.__isset;
   return *this;
 }
 void IndexInfo::printTo(std::ostream& out) const {
@@ -8311,23 +8511,23 @@ void swap(CreateIndexRequest &a, CreateIndexRequest &b) {
   swap(a.__isset, b.__isset);
 }
 
-CreateIndexRequest::CreateIndexRequest(const CreateIndexRequest& other339) {
-  db_name = other339.db_name;
-  table_name = other339.table_name;
-  index_name = other339.index_name;
-  index_info = other339.index_info;
-  session_id = other339.session_id;
-  create_option = other339.create_option;
-  __isset = other339.__isset;
-}
-CreateIndexRequest& CreateIndexRequest::operator=(const CreateIndexRequest& other340) {
-  db_name = other340.db_name;
-  table_name = other340.table_name;
-  index_name = other340.index_name;
-  index_info = other340.index_info;
-  session_id = other340.session_id;
-  create_option = other340.create_option;
-  __isset = other340.__isset;
+CreateIndexRequest::CreateIndexRequest(const CreateIndexRequest& other343) {
+  db_name = other343.db_name;
+  table_name = other343.table_name;
+  index_name = other343.index_name;
+  index_info = other343.index_info;
+  session_id = other343.session_id;
+  create_option = other343.create_option;
+  __isset = other343.__isset;
+}
+CreateIndexRequest& CreateIndexRequest::operator=(const CreateIndexRequest& other344) {
+  db_name = other344.db_name;
+  table_name = other344.table_name;
+  index_name = other344.index_name;
+  index_info = other344.index_info;
+  session_id = other344.session_id;
+  create_option = other344.create_option;
+  __isset = other344.__isset;
   return *this;
 }
 void CreateIndexRequest::printTo(std::ostream& out) const {
@@ -8486,21 +8686,21 @@ void swap(DropIndexRequest &a, DropIndexRequest &b) {
   swap(a.__isset, b.__isset);
 }
 
-DropIndexRequest::DropIndexRequest(const DropIndexRequest& other341) {
-  db_name = other341.db_name;
-  table_name = other341.table_name;
-  index_name = other341.index_name;
-  session_id = other341.session_id;
-  drop_option = other341.drop_option;
-  __isset = other341.__isset;
-}
-DropIndexRequest& DropIndexRequest::operator=(const DropIndexRequest& other342) {
-  db_name = other342.db_name;
-  table_name = other342.table_name;
-  index_name = other342.index_name;
-  session_id = other342.session_id;
-  drop_option = other342.drop_option;
-  __isset = other342.__isset;
+DropIndexRequest::DropIndexRequest(const DropIndexRequest& other345) {
+  db_name = other345.db_name;
+  table_name = other345.table_name;
+  index_name = other345.index_name;
+  session_id = other345.session_id;
+  drop_option = other345.drop_option;
+  __isset = other345.__isset;
+}
+DropIndexRequest& DropIndexRequest::operator=(const DropIndexRequest& other346) {
+  db_name = other346.db_name;
+  table_name = other346.table_name;
+  index_name = other346.index_name;
+  session_id = other346.session_id;
+  drop_option = other346.drop_option;
+  __isset = other346.__isset;
   return *this;
 }
 void DropIndexRequest::printTo(std::ostream& out) const {
@@ -8641,19 +8841,19 @@ void swap(ShowIndexRequest &a, ShowIndexRequest &b) {
   swap(a.__isset, b.__isset);
 }
 
-ShowIndexRequest::ShowIndexRequest(const ShowIndexRequest& other343) {
-  db_name = other343.db_name;
-  table_name = other343.table_name;
-  index_name = other343.index_name;
-  session_id = other343.session_id;
-  __isset = other343.__isset;
+ShowIndexRequest::ShowIndexRequest(const ShowIndexRequest& other347) {
+  db_name = other347.db_name;
+  table_name = other347.table_name;
+  index_name = other347.index_name;
+  session_id = other347.session_id;
+  __isset = other347.__isset;
 }
-ShowIndexRequest& ShowIndexRequest::operator=(const ShowIndexRequest& other344) {
-  db_name = other344.db_name;
-  table_name = other344.table_name;
-  index_name = other344.index_name;
-  session_id = other344.session_id;
-  __isset = other344.__isset;
+ShowIndexRequest& ShowIndexRequest::operator=(const ShowIndexRequest& other348) {
+  db_name = other348.db_name;
+  table_name = other348.table_name;
+  index_name = other348.index_name;
+  session_id = other348.session_id;
+  __isset = other348.__isset;
   return *this;
 }
 void ShowIndexRequest::printTo(std::ostream& out) const {
@@ -8929,35 +9129,35 @@ void swap(ShowIndexResponse &a, ShowIndexResponse &b) {
   swap(a.__isset, b.__isset);
 }
 
-ShowIndexResponse::ShowIndexResponse(const ShowIndexResponse& other345) {
-  error_code = other345.error_code;
-  error_msg = other345.error_msg;
-  db_name = other345.db_name;
-  table_name = other345.table_name;
-  index_name = other345.index_name;
-  index_type = other345.index_type;
-  index_column_names = other345.index_column_names;
-  index_column_ids = other345.index_column_ids;
-  other_parameters = other345.other_parameters;
-  store_dir = other345.store_dir;
-  store_size = other345.store_size;
-  segment_index_count = other345.segment_index_count;
-  __isset = other345.__isset;
+ShowIndexResponse::ShowIndexResponse(const ShowIndexResponse& other349) {
+  error_code = other349.error_code;
+  error_msg = other349.error_msg;
+  db_name = other349.db_name;
+  table_name = other349.table_name;
+  index_name = other349.index_name;
+  index_type = other349.index_type;
+  index_column_names = other349.index_column_names;
+  index_column_ids = other349.index_column_ids;
+  other_parameters = other349.other_parameters;
+  store_dir = other349.store_dir;
+  store_size = other349.store_size;
+  segment_index_count = other349.segment_index_count;
+  __isset = other349.__isset;
 }
-ShowIndexResponse& ShowIndexResponse::operator=(const ShowIndexResponse& other346) {
-  error_code = other346.error_code;
-  error_msg = other346.error_msg;
-  db_name = other346.db_name;
-  table_name = other346.table_name;
-  index_name = other346.index_name;
-  index_type = other346.index_type;
-  index_column_names = other346.index_column_names;
-  index_column_ids = other346.index_column_ids;
-  other_parameters = other346.other_parameters;
-  store_dir = other346.store_dir;
-  store_size = other346.store_size;
-  segment_index_count = other346.segment_index_count;
-  __isset = other346.__isset;
+ShowIndexResponse& ShowIndexResponse::operator=(const ShowIndexResponse& other350) {
+  error_code = other350.error_code;
+  error_msg = other350.error_msg;
+  db_name = other350.db_name;
+  table_name = other350.table_name;
+  index_name = other350.index_name;
+  index_type = other350.index_type;
+  index_column_names = other350.index_column_names;
+  index_column_ids = other350.index_column_ids;
+  other_parameters = other350.other_parameters;
+  store_dir = other350.store_dir;
+  store_size = other350.store_size;
+  segment_index_count = other350.segment_index_count;
+  __isset = other350.__isset;
   return *this;
 }
 void ShowIndexResponse::printTo(std::ostream& out) const {
@@ -9105,19 +9305,19 @@ void swap(OptimizeRequest &a, OptimizeRequest &b) {
   swap(a.__isset, b.__isset);
 }
 
-OptimizeRequest::OptimizeRequest(const OptimizeRequest& other347) {
-  db_name = other347.db_name;
-  table_name = other347.table_name;
-  optimize_options = other347.optimize_options;
-  session_id = other347.session_id;
-  __isset = other347.__isset;
+OptimizeRequest::OptimizeRequest(const OptimizeRequest& other351) {
+  db_name = other351.db_name;
+  table_name = other351.table_name;
+  optimize_options = other351.optimize_options;
+  session_id = other351.session_id;
+  __isset = other351.__isset;
 }
-OptimizeRequest& OptimizeRequest::operator=(const OptimizeRequest& other348) {
-  db_name = other348.db_name;
-  table_name = other348.table_name;
-  optimize_options = other348.optimize_options;
-  session_id = other348.session_id;
-  __isset = other348.__isset;
+OptimizeRequest& OptimizeRequest::operator=(const OptimizeRequest& other352) {
+  db_name = other352.db_name;
+  table_name = other352.table_name;
+  optimize_options = other352.optimize_options;
+  session_id = other352.session_id;
+  __isset = other352.__isset;
   return *this;
 }
 void OptimizeRequest::printTo(std::ostream& out) const {
@@ -9223,15 +9423,15 @@ void swap(GetDatabaseRequest &a, GetDatabaseRequest &b) {
   swap(a.__isset, b.__isset);
 }
 
-GetDatabaseRequest::GetDatabaseRequest(const GetDatabaseRequest& other349) {
-  db_name = other349.db_name;
-  session_id = other349.session_id;
-  __isset = other349.__isset;
+GetDatabaseRequest::GetDatabaseRequest(const GetDatabaseRequest& other353) {
+  db_name = other353.db_name;
+  session_id = other353.session_id;
+  __isset = other353.__isset;
 }
-GetDatabaseRequest& GetDatabaseRequest::operator=(const GetDatabaseRequest& other350) {
-  db_name = other350.db_name;
-  session_id = other350.session_id;
-  __isset = other350.__isset;
+GetDatabaseRequest& GetDatabaseRequest::operator=(const GetDatabaseRequest& other354) {
+  db_name = other354.db_name;
+  session_id = other354.session_id;
+  __isset = other354.__isset;
   return *this;
 }
 void GetDatabaseRequest::printTo(std::ostream& out) const {
@@ -9352,17 +9552,17 @@ void swap(CreateDatabaseRequest &a, CreateDatabaseRequest &b) {
   swap(a.__isset, b.__isset);
 }
 
-CreateDatabaseRequest::CreateDatabaseRequest(const CreateDatabaseRequest& other351) {
-  db_name = other351.db_name;
-  session_id = other351.session_id;
-  create_option = other351.create_option;
-  __isset = other351.__isset;
+CreateDatabaseRequest::CreateDatabaseRequest(const CreateDatabaseRequest& other355) {
+  db_name = other355.db_name;
+  session_id = other355.session_id;
+  create_option = other355.create_option;
+  __isset = other355.__isset;
 }
-CreateDatabaseRequest& CreateDatabaseRequest::operator=(const CreateDatabaseRequest& other352) {
-  db_name = other352.db_name;
-  session_id = other352.session_id;
-  create_option = other352.create_option;
-  __isset = other352.__isset;
+CreateDatabaseRequest& CreateDatabaseRequest::operator=(const CreateDatabaseRequest& other356) {
+  db_name = other356.db_name;
+  session_id = other356.session_id;
+  create_option = other356.create_option;
+  __isset = other356.__isset;
   return *this;
 }
 void CreateDatabaseRequest::printTo(std::ostream& out) const {
@@ -9484,17 +9684,17 @@ void swap(DropDatabaseRequest &a, DropDatabaseRequest &b) {
   swap(a.__isset, b.__isset);
 }
 
-DropDatabaseRequest::DropDatabaseRequest(const DropDatabaseRequest& other353) {
-  db_name = other353.db_name;
-  session_id = other353.session_id;
-  drop_option = other353.drop_option;
-  __isset = other353.__isset;
+DropDatabaseRequest::DropDatabaseRequest(const DropDatabaseRequest& other357) {
+  db_name = other357.db_name;
+  session_id = other357.session_id;
+  drop_option = other357.drop_option;
+  __isset = other357.__isset;
 }
-DropDatabaseRequest& DropDatabaseRequest::operator=(const DropDatabaseRequest& other354) {
-  db_name = other354.db_name;
-  session_id = other354.session_id;
-  drop_option = other354.drop_option;
-  __isset = other354.__isset;
+DropDatabaseRequest& DropDatabaseRequest::operator=(const DropDatabaseRequest& other358) {
+  db_name = other358.db_name;
+  session_id = other358.session_id;
+  drop_option = other358.drop_option;
+  __isset = other358.__isset;
   return *this;
 }
 void DropDatabaseRequest::printTo(std::ostream& out) const {
@@ -9578,14 +9778,14 @@ uint32_t CreateTableRequest::read(::apache::thrift::protocol::TProtocol* iprot)
         if (ftype == ::apache::thrift::protocol::T_LIST) {
           {
             this->column_defs.clear();
-            uint32_t _size355;
-            ::apache::thrift::protocol::TType _etype358;
-            xfer += iprot->readListBegin(_etype358, _size355);
-            this->column_defs.resize(_size355);
-            uint32_t _i359;
-            for (_i359 = 0; _i359 < _size355; ++_i359)
+            uint32_t _size359;
+            ::apache::thrift::protocol::TType _etype362;
+            xfer += iprot->readListBegin(_etype362, _size359);
+            this->column_defs.resize(_size359);
+            uint32_t _i363;
+            for (_i363 = 0; _i363 < _size359; ++_i363)
             {
-              xfer += this->column_defs[_i359].read(iprot);
+              xfer += this->column_defs[_i363].read(iprot);
             }
             xfer += iprot->readListEnd();
           }
@@ -9638,10 +9838,10 @@ uint32_t CreateTableRequest::write(::apache::thrift::protocol::TProtocol* oprot)
   xfer += oprot->writeFieldBegin("column_defs", ::apache::thrift::protocol::T_LIST, 3);
   {
     xfer += oprot->writeListBegin(::apache::thrift::protocol::T_STRUCT, static_cast<uint32_t>(this->column_defs.size()));
-    std::vector<ColumnDef> ::const_iterator _iter360;
-    for (_iter360 = this->column_defs.begin(); _iter360 != this->column_defs.end(); ++_iter360)
+    std::vector<ColumnDef> ::const_iterator _iter364;
+    for (_iter364 = this->column_defs.begin(); _iter364 != this->column_defs.end(); ++_iter364)
     {
-      xfer += (*_iter360).write(oprot);
+      xfer += (*_iter364).write(oprot);
     }
     xfer += oprot->writeListEnd();
   }
@@ -9670,21 +9870,21 @@ void swap(CreateTableRequest &a, CreateTableRequest &b) {
   swap(a.__isset, b.__isset);
 }
 
-CreateTableRequest::CreateTableRequest(const CreateTableRequest& other361) {
-  db_name = other361.db_name;
-  table_name = other361.table_name;
-  column_defs = other361.column_defs;
-  session_id = other361.session_id;
-  create_option = other361.create_option;
-  __isset = other361.__isset;
-}
-CreateTableRequest& CreateTableRequest::operator=(const CreateTableRequest& other362) {
-  db_name = other362.db_name;
-  table_name = other362.table_name;
-  column_defs = other362.column_defs;
-  session_id = other362.session_id;
-  create_option = other362.create_option;
-  __isset = other362.__isset;
+CreateTableRequest::CreateTableRequest(const CreateTableRequest& other365) {
+  db_name = other365.db_name;
+  table_name = other365.table_name;
+  column_defs = other365.column_defs;
+  session_id = other365.session_id;
+  create_option = other365.create_option;
+  __isset = other365.__isset;
+}
+CreateTableRequest& CreateTableRequest::operator=(const CreateTableRequest& other366) {
+  db_name = other366.db_name;
+  table_name = other366.table_name;
+  column_defs = other366.column_defs;
+  session_id = other366.session_id;
+  create_option = other366.create_option;
+  __isset = other366.__isset;
   return *this;
 }
 void CreateTableRequest::printTo(std::ostream& out) const {
@@ -9825,19 +10025,19 @@ void swap(DropTableRequest &a, DropTableRequest &b) {
   swap(a.__isset, b.__isset);
 }
 
-DropTableRequest::DropTableRequest(const DropTableRequest& other363) {
-  db_name = other363.db_name;
-  table_name = other363.table_name;
-  session_id = other363.session_id;
-  drop_option = other363.drop_option;
-  __isset = other363.__isset;
+DropTableRequest::DropTableRequest(const DropTableRequest& other367) {
+  db_name = other367.db_name;
+  table_name = other367.table_name;
+  session_id = other367.session_id;
+  drop_option = other367.drop_option;
+  __isset = other367.__isset;
 }
-DropTableRequest& DropTableRequest::operator=(const DropTableRequest& other364) {
-  db_name = other364.db_name;
-  table_name = other364.table_name;
-  session_id = other364.session_id;
-  drop_option = other364.drop_option;
-  __isset = other364.__isset;
+DropTableRequest& DropTableRequest::operator=(const DropTableRequest& other368) {
+  db_name = other368.db_name;
+  table_name = other368.table_name;
+  session_id = other368.session_id;
+  drop_option = other368.drop_option;
+  __isset = other368.__isset;
   return *this;
 }
 void DropTableRequest::printTo(std::ostream& out) const {
@@ -9874,6 +10074,10 @@ void InsertRequest::__set_fields(const std::vector<Field> & val) {
 void InsertRequest::__set_session_id(const int64_t val) {
   this->session_id = val;
 }
+
+void InsertRequest::__set_columns(const std::vector<InsertColumn> & val) {
+  this->columns = val;
+}
 std::ostream& operator<<(std::ostream& out, const InsertRequest& obj)
 {
   obj.printTo(out);
@@ -9922,14 +10126,14 @@ uint32_t InsertRequest::read(::apache::thrift::protocol::TProtocol* iprot) {
         if (ftype == ::apache::thrift::protocol::T_LIST) {
           {
             this->column_names.clear();
-            uint32_t _size365;
-            ::apache::thrift::protocol::TType _etype368;
-            xfer += iprot->readListBegin(_etype368, _size365);
-            this->column_names.resize(_size365);
-            uint32_t _i369;
-            for (_i369 = 0; _i369 < _size365; ++_i369)
+            uint32_t _size369;
+            ::apache::thrift::protocol::TType _etype372;
+            xfer += iprot->readListBegin(_etype372, _size369);
+            this->column_names.resize(_size369);
+            uint32_t _i373;
+            for (_i373 = 0; _i373 < _size369; ++_i373)
             {
-              xfer += iprot->readString(this->column_names[_i369]);
+              xfer += iprot->readString(this->column_names[_i373]);
             }
             xfer += iprot->readListEnd();
           }
@@ -9942,14 +10146,14 @@ uint32_t InsertRequest::read(::apache::thrift::protocol::TProtocol* iprot) {
         if (ftype == ::apache::thrift::protocol::T_LIST) {
           {
             this->fields.clear();
-            uint32_t _size370;
-            ::apache::thrift::protocol::TType _etype373;
-            xfer += iprot->readListBegin(_etype373, _size370);
-            this->fields.resize(_size370);
-            uint32_t _i374;
-            for (_i374 = 0; _i374 < _size370; ++_i374)
+            uint32_t _size374;
+            ::apache::thrift::protocol::TType _etype377;
+            xfer += iprot->readListBegin(_etype377, _size374);
+            this->fields.resize(_size374);
+            uint32_t _i378;
+            for (_i378 = 0; _i378 < _size374; ++_i378)
             {
-              xfer += this->fields[_i374].read(iprot);
+              xfer += this->fields[_i378].read(iprot);
             }
             xfer += iprot->readListEnd();
           }
@@ -9966,6 +10170,26 @@ uint32_t InsertRequest::read(::apache::thrift::protocol::TProtocol* iprot) {
           xfer += iprot->skip(ftype);
         }
         break;
+      case 6:
+        if (ftype == ::apache::thrift::protocol::T_LIST) {
+          {
+            this->columns.clear();
+            uint32_t _size379;
+            ::apache::thrift::protocol::TType _etype382;
+            xfer += iprot->readListBegin(_etype382, _size379);
+            this->columns.resize(_size379);
+            uint32_t _i383;
+            for (_i383 = 0; _i383 < _size379; ++_i383)
+            {
+              xfer += this->columns[_i383].read(iprot);
+            }
+            xfer += iprot->readListEnd();
+          }
+          this->__isset.columns = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
       default:
         xfer += iprot->skip(ftype);
         break;
@@ -9994,10 +10218,10 @@ uint32_t InsertRequest::write(::apache::thrift::protocol::TProtocol* oprot) cons
   xfer += oprot->writeFieldBegin("column_names", ::apache::thrift::protocol::T_LIST, 3);
   {
     xfer += oprot->writeListBegin(::apache::thrift::protocol::T_STRING, static_cast<uint32_t>(this->column_names.size()));
-    std::vector<std::string> ::const_iterator _iter375;
-    for (_iter375 = this->column_names.begin(); _iter375 != this->column_names.end(); ++_iter375)
+    std::vector<std::string> ::const_iterator _iter384;
+    for (_iter384 = this->column_names.begin(); _iter384 != this->column_names.end(); ++_iter384)
     {
-      xfer += oprot->writeString((*_iter375));
+      xfer += oprot->writeString((*_iter384));
     }
     xfer += oprot->writeListEnd();
   }
@@ -10006,10 +10230,10 @@ uint32_t InsertRequest::write(::apache::thrift::protocol::TProtocol* oprot) cons
   xfer += oprot->writeFieldBegin("fields", ::apache::thrift::protocol::T_LIST, 4);
   {
     xfer += oprot->writeListBegin(::apache::thrift::protocol::T_STRUCT, static_cast<uint32_t>(this->fields.size()));
-    std::vector<Field> ::const_iterator _iter376;
-    for (_iter376 = this->fields.begin(); _iter376 != this->fields.end(); ++_iter376)
+    std::vector<Field> ::const_iterator _iter385;
+    for (_iter385 = this->fields.begin(); _iter385 != this->fields.end(); ++_iter385)
     {
-      xfer += (*_iter376).write(oprot);
+      xfer += (*_iter385).write(oprot);
     }
     xfer += oprot->writeListEnd();
   }
@@ -10019,6 +10243,18 @@ uint32_t InsertRequest::write(::apache::thrift::protocol::TProtocol* oprot) cons
   xfer += oprot->writeI64(this->session_id);
   xfer += oprot->writeFieldEnd();
 
+  xfer += oprot->writeFieldBegin("columns", ::apache::thrift::protocol::T_LIST, 6);
+  {
+    xfer += oprot->writeListBegin(::apache::thrift::protocol::T_STRUCT, static_cast<uint32_t>(this->columns.size()));
+    std::vector<InsertColumn> ::const_iterator _iter386;
+    for (_iter386 = this->columns.begin(); _iter386 != this->columns.end(); ++_iter386)
+    {
+      xfer += (*_iter386).write(oprot);
+    }
+    xfer += oprot->writeListEnd();
+  }
+  xfer += oprot->writeFieldEnd();
+
   xfer += oprot->writeFieldStop();
   xfer += oprot->writeStructEnd();
   return xfer;
@@ -10031,24 +10267,27 @@ void swap(InsertRequest &a, InsertRequest &b) {
   swap(a.column_names, b.column_names);
   swap(a.fields, b.fields);
   swap(a.session_id, b.session_id);
+  swap(a.columns, b.columns);
   swap(a.__isset, b.__isset);
 }
 
-InsertRequest::InsertRequest(const InsertRequest& other377) {
-  db_name = other377.db_name;
-  table_name = other377.table_name;
-  column_names = other377.column_names;
-  fields = other377.fields;
-  session_id = other377.session_id;
-  __isset = other377.__isset;
-}
-InsertRequest& InsertRequest::operator=(const InsertRequest& other378) {
-  db_name = other378.db_name;
-  table_name = other378.table_name;
-  column_names = other378.column_names;
-  fields = other378.fields;
-  session_id = other378.session_id;
-  __isset = other378.__isset;
+InsertRequest::InsertRequest(const InsertRequest& other387) {
+  db_name = other387.db_name;
+  table_name = other387.table_name;
+  column_names = other387.column_names;
+  fields = other387.fields;
+  session_id = other387.session_id;
+  columns = other387.columns;
+  __isset = other387.__isset;
+}
+InsertRequest& InsertRequest::operator=(const InsertRequest& other388) {
+  db_name = other388.db_name;
+  table_name = other388.table_name;
+  column_names = other388.column_names;
+  fields = other388.fields;
+  session_id = other388.session_id;
+  columns = other388.columns;
+  __isset = other388.__isset;
   return *this;
 }
 void InsertRequest::printTo(std::ostream& out) const {
@@ -10059,6 +10298,7 @@ void InsertRequest::printTo(std::ostream& out) const {
   out << ", " << "column_names=" << to_string(column_names);
   out << ", " << "fields=" << to_string(fields);
   out << ", " << "session_id=" << to_string(session_id);
+  out << ", " << "columns=" << to_string(columns);
   out << ")";
 }
 
@@ -10086,6 +10326,10 @@ void ImportRequest::__set_import_option(const ImportOption& val) {
 void ImportRequest::__set_session_id(const int64_t val) {
   this->session_id = val;
 }
+
+void ImportRequest::__set_uploaded(const bool val) {
+  this->uploaded = val;
+}
 std::ostream& operator<<(std::ostream& out, const ImportRequest& obj)
 {
   obj.printTo(out);
@@ -10154,6 +10398,14 @@ uint32_t ImportRequest::read(::apache::thrift::protocol::TProtocol* iprot) {
           xfer += iprot->skip(ftype);
         }
         break;
+      case 6:
+        if (ftype == ::apache::thrift::protocol::T_BOOL) {
+          xfer += iprot->readBool(this->uploaded);
+          this->__isset.uploaded = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
       default:
         xfer += iprot->skip(ftype);
         break;
@@ -10191,6 +10443,10 @@ uint32_t ImportRequest::write(::apache::thrift::protocol::TProtocol* oprot) cons
   xfer += oprot->writeI64(this->session_id);
   xfer += oprot->writeFieldEnd();
 
+  xfer += oprot->writeFieldBegin("uploaded", ::apache::thrift::protocol::T_BOOL, 6);
+  xfer += oprot->writeBool(this->uploaded);
+  xfer += oprot->writeFieldEnd();
+
   xfer += oprot->writeFieldStop();
   xfer += oprot->writeStructEnd();
   return xfer;
@@ -10203,24 +10459,27 @@ void swap(ImportRequest &a, ImportRequest &b) {
   swap(a.file_name, b.file_name);
   swap(a.import_option, b.import_option);
   swap(a.session_id, b.session_id);
+  swap(a.uploaded, b.uploaded);
   swap(a.__isset, b.__isset);
 }
 
-ImportRequest::ImportRequest(const ImportRequest& other379) {
-  db_name = other379.db_name;
-  table_name = other379.table_name;
-  file_name = other379.file_name;
-  import_option = other379.import_option;
-  session_id = other379.session_id;
-  __isset = other379.__isset;
-}
-ImportRequest& ImportRequest::operator=(const ImportRequest& other380) {
-  db_name = other380.db_name;
-  table_name = other380.table_name;
-  file_name = other380.file_name;
-  import_option = other380.import_option;
-  session_id = other380.session_id;
-  __isset = other380.__isset;
+ImportRequest::ImportRequest(const ImportRequest& other389) {
+  db_name = other389.db_name;
+  table_name = other389.table_name;
+  file_name = other389.file_name;
+  import_option = other389.import_option;
+  session_id = other389.session_id;
+  uploaded = other389.uploaded;
+  __isset = other389.__isset;
+}
+ImportRequest& ImportRequest::operator=(const ImportRequest& other390) {
+  db_name = other390.db_name;
+  table_name = other390.table_name;
+  file_name = other390.file_name;
+  import_option = other390.import_option;
+  session_id = other390.session_id;
+  uploaded = other390.uploaded;
+  __isset = other390.__isset;
   return *this;
 }
 void ImportRequest::printTo(std::ostream& out) const {
@@ -10231,6 +10490,159 @@ void ImportRequest::printTo(std::ostream& out) const {
   out << ", " << "file_name=" << to_string(file_name);
   out << ", " << "import_option=" << to_string(import_option);
   out << ", " << "session_id=" << to_string(session_id);
+  out << ", " << "uploaded=" << to_string(uploaded);
+  out << ")";
+}
+
+
+UploadFileChunkRequest::~UploadFileChunkRequest() noexcept {
+}
+
+
+void UploadFileChunkRequest::__set_session_id(const int64_t val) {
+  this->session_id = val;
+}
+
+void UploadFileChunkRequest::__set_file_name(const std::string& val) {
+  this->file_name = val;
+}
+
+void UploadFileChunkRequest::__set_offset(const int64_t val) {
+  this->offset = val;
+}
+
+void UploadFileChunkRequest::__set_data(const std::string& val) {
+  this->data = val;
+}
+std::ostream& operator<<(std::ostream& out, const UploadFileChunkRequest& obj)
+{
+  obj.printTo(out);
+  return out;
+}
+
+
+uint32_t UploadFileChunkRequest::read(::apache::thrift::protocol::TProtocol* iprot) {
+
+  ::apache::thrift::protocol::TInputRecursionTracker tracker(*iprot);
+  uint32_t xfer = 0;
+  std::string fname;
+  ::apache::thrift::protocol::TType ftype;
+  int16_t fid;
+
+  xfer += iprot->readStructBegin(fname);
+
+  using ::apache::thrift::protocol::TProtocolException;
+
+
+  while (true)
+  {
+    xfer += iprot->readFieldBegin(fname, ftype, fid);
+    if (ftype == ::apache::thrift::protocol::T_STOP) {
+      break;
+    }
+    switch (fid)
+    {
+      case 1:
+        if (ftype == ::apache::thrift::protocol::T_I64) {
+          xfer += iprot->readI64(this->session_id);
+          this->__isset.session_id = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      case 2:
+        if (ftype == ::apache::thrift::protocol::T_STRING) {
+          xfer += iprot->readString(this->file_name);
+          this->__isset.file_name = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      case 3:
+        if (ftype == ::apache::thrift::protocol::T_I64) {
+          xfer += iprot->readI64(this->offset);
+          this->__isset.offset = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      case 4:
+        if (ftype == ::apache::thrift::protocol::T_STRING) {
+          xfer += iprot->readBinary(this->data);
+          this->__isset.data = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      default:
+        xfer += iprot->skip(ftype);
+        break;
+    }
+    xfer += iprot->readFieldEnd();
+  }
+
+  xfer += iprot->readStructEnd();
+
+  return xfer;
+}
+
+uint32_t UploadFileChunkRequest::write(::apache::thrift::protocol::TProtocol* oprot) const {
+  uint32_t xfer = 0;
+  ::apache::thrift::protocol::TOutputRecursionTracker tracker(*oprot);
+  xfer += oprot->writeStructBegin("UploadFileChunkRequest");
+
+  xfer += oprot->writeFieldBegin("session_id", ::apache::thrift::protocol::T_I64, 1);
+  xfer += oprot->writeI64(this->session_id);
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldBegin("file_name", ::apache::thrift::protocol::T_STRING, 2);
+  xfer += oprot->writeString(this->file_name);
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldBegin("offset", ::apache::thrift::protocol::T_I64, 3);
+  xfer += oprot->writeI64(this->offset);
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldBegin("data", ::apache::thrift::protocol::T_STRING, 4);
+  xfer += oprot->writeBinary(this->data);
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldStop();
+  xfer += oprot->writeStructEnd();
+  return xfer;
+}
+
+void swap(UploadFileChunkRequest &a, UploadFileChunkRequest &b) {
+  using ::std::swap;
+  swap(a.session_id, b.session_id);
+  swap(a.file_name, b.file_name);
+  swap(a.offset, b.offset);
+  swap(a.data, b.data);
+  swap(a.__isset, b.__isset);
+}
+
+UploadFileChunkRequest::UploadFileChunkRequest(const UploadFileChunkRequest& other391) {
+  session_id = other391.session_id;
+  file_name = other391.file_name;
+  offset = other391.offset;
+  data = other391.data;
+  __isset = other391.__isset;
+}
+UploadFileChunkRequest& UploadFileChunkRequest::operator=(const UploadFileChunkRequest& other392) {
+  session_id = other392.session_id;
+  file_name = other392.file_name;
+  offset = other392.offset;
+  data = other392.data;
+  __isset = other392.__isset;
+  return *this;
+}
+void UploadFileChunkRequest::printTo(std::ostream& out) const {
+  using ::apache::thrift::to_string;
+  out << "UploadFileChunkRequest(";
+  out << "session_id=" << to_string(session_id);
+  out << ", " << "file_name=" << to_string(file_name);
+  out << ", " << "offset=" << to_string(offset);
+  out << ", " << "data=" << to_string(data);
   out << ")";
 }
 
@@ -10310,14 +10722,14 @@ uint32_t ExportRequest::read(::apache::thrift::protocol::TProtocol* iprot) {
         if (ftype == ::apache::thrift::protocol::T_LIST) {
           {
             this->columns.clear();
-            uint32_t _size381;
-            ::apache::thrift::protocol::TType _etype384;
-            xfer += iprot->readListBegin(_etype384, _size381);
-            this->columns.resize(_size381);
-            uint32_t _i385;
-            for (_i385 = 0; _i385 < _size381; ++_i385)
+            uint32_t _size393;
+            ::apache::thrift::protocol::TType _etype396;
+            xfer += iprot->readListBegin(_etype396, _size393);
+            this->columns.resize(_size393);
+            uint32_t _i397;
+            for (_i397 = 0; _i397 < _size393; ++_i397)
             {
-              xfer += iprot->readString(this->columns[_i385]);
+              xfer += iprot->readString(this->columns[_i397]);
             }
             xfer += iprot->readListEnd();
           }
@@ -10378,10 +10790,10 @@ uint32_t ExportRequest::write(::apache::thrift::protocol::TProtocol* oprot) cons
   xfer += oprot->writeFieldBegin("columns", ::apache::thrift::protocol::T_LIST, 3);
   {
     xfer += oprot->writeListBegin(::apache::thrift::protocol::T_STRING, static_cast<uint32_t>(this->columns.size()));
-    std::vector<std::string> ::const_iterator _iter386;
-    for (_iter386 = this->columns.begin(); _iter386 != this->columns.end(); ++_iter386)
+    std::vector<std::string> ::const_iterator _iter398;
+    for (_iter398 = this->columns.begin(); _iter398 != this->columns.end(); ++_iter398)
     {
-      xfer += oprot->writeString((*_iter386));
+      xfer += oprot->writeString((*_iter398));
     }
     xfer += oprot->writeListEnd();
   }
@@ -10415,23 +10827,23 @@ void swap(ExportRequest &a, ExportRequest &b) {
   swap(a.__isset, b.__isset);
 }
 
-ExportRequest::ExportRequest(const ExportRequest& other387) {
-  db_name = other387.db_name;
-  table_name = other387.table_name;
-  columns = other387.columns;
-  file_name = other387.file_name;
-  export_option = other387.export_option;
-  session_id = other387.session_id;
-  __isset = other387.__isset;
-}
-ExportRequest& ExportRequest::operator=(const ExportRequest& other388) {
-  db_name = other388.db_name;
-  table_name = other388.table_name;
-  columns = other388.columns;
-  file_name = other388.file_name;
-  export_option = other388.export_option;
-  session_id = other388.session_id;
-  __isset = other388.__isset;
+ExportRequest::ExportRequest(const ExportRequest& other399) {
+  db_name = other399.db_name;
+  table_name = other399.table_name;
+  columns = other399.columns;
+  file_name = other399.file_name;
+  export_option = other399.export_option;
+  session_id = other399.session_id;
+  __isset = other399.__isset;
+}
+ExportRequest& ExportRequest::operator=(const ExportRequest& other400) {
+  db_name = other400.db_name;
+  table_name = other400.table_name;
+  columns = other400.columns;
+  file_name = other400.file_name;
+  export_option = other400.export_option;
+  session_id = other400.session_id;
+  __isset = other400.__isset;
   return *this;
 }
 void ExportRequest::printTo(std::ostream& out) const {
@@ -10561,14 +10973,14 @@ uint32_t ExplainRequest::read(::apache::thrift::protocol::TProtocol* iprot) {
         if (ftype == ::apache::thrift::protocol::T_LIST) {
           {
             this->select_list.clear();
-            uint32_t _size389;
-            ::apache::thrift::protocol::TType _etype392;
-            xfer += iprot->readListBegin(_etype392, _size389);
-            this->select_list.resize(_size389);
-            uint32_t _i393;
-            for (_i393 = 0; _i393 < _size389; ++_i393)
+            uint32_t _size401;
+            ::apache::thrift::protocol::TType _etype404;
+            xfer += iprot->readListBegin(_etype404, _size401);
+            this->select_list.resize(_size401);
+            uint32_t _i405;
+            for (_i405 = 0; _i405 < _size401; ++_i405)
             {
-              xfer += this->select_list[_i393].read(iprot);
+              xfer += this->select_list[_i405].read(iprot);
             }
             xfer += iprot->readListEnd();
           }
@@ -10597,14 +11009,14 @@ uint32_t ExplainRequest::read(::apache::thrift::protocol::TProtocol* iprot) {
         if (ftype == ::apache::thrift::protocol::T_LIST) {
           {
             this->group_by_list.clear();
-            uint32_t _size394;
-            ::apache::thrift::protocol::TType _etype397;
-            xfer += iprot->readListBegin(_etype397, _size394);
-            this->group_by_list.resize(_size394);
-            uint32_t _i398;
-            for (_i398 = 0; _i398 < _size394; ++_i398)
+            uint32_t _size406;
+            ::apache::thrift::protocol::TType _etype409;
+            xfer += iprot->readListBegin(_etype409, _size406);
+            this->group_by_list.resize(_size406);
+            uint32_t _i410;
+            for (_i410 = 0; _i410 < _size406; ++_i410)
             {
-              xfer += this->group_by_list[_i398].read(iprot);
+              xfer += this->group_by_list[_i410].read(iprot);
             }
             xfer += iprot->readListEnd();
           }
@@ -10641,14 +11053,14 @@ uint32_t ExplainRequest::read(::apache::thrift::protocol::TProtocol* iprot) {
         if (ftype == ::apache::thrift::protocol::T_LIST) {
           {
             this->order_by_list.clear();
-            uint32_t _size399;
-            ::apache::thrift::protocol::TType _etype402;
-            xfer += iprot->readListBegin(_etype402, _size399);
-            this->order_by_list.resize(_size399);
-            uint32_t _i403;
-            for (_i403 = 0; _i403 < _size399; ++_i403)
+            uint32_t _size411;
+            ::apache::thrift::protocol::TType _etype414;
+            xfer += iprot->readListBegin(_etype414, _size411);
+            this->order_by_list.resize(_size411);
+            uint32_t _i415;
+            for (_i415 = 0; _i415 < _size411; ++_i415)
             {
-              xfer += this->order_by_list[_i403].read(iprot);
+              xfer += this->order_by_list[_i415].read(iprot);
             }
             xfer += iprot->readListEnd();
           }
@@ -10659,9 +11071,9 @@ uint32_t ExplainRequest::read(::apache::thrift::protocol::TProtocol* iprot) {
         break;
       case 12:
         if (ftype == ::apache::thrift::protocol::T_I32) {
-          int32_t ecast404;
-          xfer += iprot->readI32(ecast404);
-          this->explain_type = static_cast<ExplainType::type>(ecast404);
+          int32_t ecast416;
+          xfer += iprot->readI32(ecast416);
+          this->explain_type = static_cast<ExplainType::type>(ecast416);
           this->__isset.explain_type = true;
         } else {
           xfer += iprot->skip(ftype);
@@ -10699,10 +11111,10 @@ uint32_t ExplainRequest::write(::apache::thrift::protocol::TProtocol* oprot) con
   xfer += oprot->writeFieldBegin("select_list", ::apache::thrift::protocol::T_LIST, 4);
   {
     xfer += oprot->writeListBegin(::apache::thrift::protocol::T_STRUCT, static_cast<uint32_t>(this->select_list.size()));
-    std::vector<ParsedExpr> ::const_iterator _iter405;
-    for (_iter405 = this->select_list.begin(); _iter405 != this->select_list.end(); ++_iter405)
+    std::vector<ParsedExpr> ::const_iterator _iter417;
+    for (_iter417 = this->select_list.begin(); _iter417 != this->select_list.end(); ++_iter417)
     {
-      xfer += (*_iter405).write(oprot);
+      xfer += (*_iter417).write(oprot);
     }
     xfer += oprot->writeListEnd();
   }
@@ -10722,10 +11134,10 @@ uint32_t ExplainRequest::write(::apache::thrift::protocol::TProtocol* oprot) con
     xfer += oprot->writeFieldBegin("group_by_list", ::apache::thrift::protocol::T_LIST, 7);
     {
       xfer += oprot->writeListBegin(::apache::thrift::protocol::T_STRUCT, static_cast<uint32_t>(this->group_by_list.size()));
-      std::vector<ParsedExpr> ::const_iterator _iter406;
-      for (_iter406 = this->group_by_list.begin(); _iter406 != this->group_by_list.end(); ++_iter406)
+      std::vector<ParsedExpr> ::const_iterator _iter418;
+      for (_iter418 = this->group_by_list.begin(); _iter418 != this->group_by_list.end(); ++_iter418)
       {
-        xfer += (*_iter406).write(oprot);
+        xfer += (*_iter418).write(oprot);
       }
       xfer += oprot->writeListEnd();
     }
@@ -10750,10 +11162,10 @@ uint32_t ExplainRequest::write(::apache::thrift::protocol::TProtocol* oprot) con
     xfer += oprot->writeFieldBegin("order_by_list", ::apache::thrift::protocol::T_LIST, 11);
     {
       xfer += oprot->writeListBegin(::apache::thrift::protocol::T_STRUCT, static_cast<uint32_t>(this->order_by_list.size()));
-      std::vector<OrderByExpr> ::const_iterator _iter407;
-      for (_iter407 = this->order_by_list.begin(); _iter407 != this->order_by_list.end(); ++_iter407)
+      std::vector<OrderByExpr> ::const_iterator _iter419;
+      for (_iter419 = this->order_by_list.begin(); _iter419 != this->order_by_list.end(); ++_iter419)
       {
-        xfer += (*_iter407).write(oprot);
+        xfer += (*_iter419).write(oprot);
       }
       xfer += oprot->writeListEnd();
     }
@@ -10785,35 +11197,35 @@ void swap(ExplainRequest &a, ExplainRequest &b) {
   swap(a.__isset, b.__isset);
 }
 
-ExplainRequest::ExplainRequest(const ExplainRequest& other408) {
-  session_id = other408.session_id;
-  db_name = other408.db_name;
-  table_name = other408.table_name;
-  select_list = other408.select_list;
-  search_expr = other408.search_expr;
-  where_expr = other408.where_expr;
-  group_by_list = other408.group_by_list;
-  having_expr = other408.having_expr;
-  limit_expr = other408.limit_expr;
-  offset_expr = other408.offset_expr;
-  order_by_list = other408.order_by_list;
-  explain_type = other408.explain_type;
-  __isset = other408.__isset;
-}
-ExplainRequest& ExplainRequest::operator=(const ExplainRequest& other409) {
-  session_id = other409.session_id;
-  db_name = other409.db_name;
-  table_name = other409.table_name;
-  select_list = other409.select_list;
-  search_expr = other409.search_expr;
-  where_expr = other409.where_expr;
-  group_by_list = other409.group_by_list;
-  having_expr = other409.having_expr;
-  limit_expr = other409.limit_expr;
-  offset_expr = other409.offset_expr;
-  order_by_list = other409.order_by_list;
-  explain_type = other409.explain_type;
-  __isset = other409.__isset;
+ExplainRequest::ExplainRequest(const ExplainRequest& other420) {
+  session_id = other420.session_id;
+  db_name = other420.db_name;
+  table_name = other420.table_name;
+  select_list = other420.select_list;
+  search_expr = other420.search_expr;
+  where_expr = other420.where_expr;
+  group_by_list = other420.group_by_list;
+  having_expr = other420.having_expr;
+  limit_expr = other420.limit_expr;
+  offset_expr = other420.offset_expr;
+  order_by_list = other420.order_by_list;
+  explain_type = other420.explain_type;
+  __isset = other420.__isset;
+}
+ExplainRequest& ExplainRequest::operator=(const ExplainRequest& other421) {
+  session_id = other421.session_id;
+  db_name = other421.db_name;
+  table_name = other421.table_name;
+  select_list = other421.select_list;
+  search_expr = other421.search_expr;
+  where_expr = other421.where_expr;
+  group_by_list = other421.group_by_list;
+  having_expr = other421.having_expr;
+  limit_expr = other421.limit_expr;
+  offset_expr = other421.offset_expr;
+  order_by_list = other421.order_by_list;
+  explain_type = other421.explain_type;
+  __isset = other421.__isset;
   return *this;
 }
 void ExplainRequest::printTo(std::ostream& out) const {
@@ -10902,14 +11314,14 @@ uint32_t ExplainResponse::read(::apache::thrift::protocol::TProtocol* iprot) {
         if (ftype == ::apache::thrift::protocol::T_LIST) {
           {
             this->column_defs.clear();
-            uint32_t _size410;
-            ::apache::thrift::protocol::TType _etype413;
-            xfer += iprot->readListBegin(_etype413, _size410);
-            this->column_defs.resize(_size410);
-            uint32_t _i414;
-            for (_i414 = 0; _i414 < _size410; ++_i414)
+            uint32_t _size422;
+            ::apache::thrift::protocol::TType _etype425;
+            xfer += iprot->readListBegin(_etype425, _size422);
+            this->column_defs.resize(_size422);
+            uint32_t _i426;
+            for (_i426 = 0; _i426 < _size422; ++_i426)
             {
-              xfer += this->column_defs[_i414].read(iprot);
+              xfer += this->column_defs[_i426].read(iprot);
             }
             xfer += iprot->readListEnd();
           }
@@ -10922,14 +11334,14 @@ uint32_t ExplainResponse::read(::apache::thrift::protocol::TProtocol* iprot) {
         if (ftype == ::apache::thrift::protocol::T_LIST) {
           {
             this->column_fields.clear();
-            uint32_t _size415;
-            ::apache::thrift::protocol::TType _etype418;
-            xfer += iprot->readListBegin(_etype418, _size415);
-            this->column_fields.resize(_size415);
-            uint32_t _i419;
-            for (_i419 = 0; _i419 < _size415; ++_i419)
+            uint32_t _size427;
+            ::apache::thrift::protocol::TType _etype430;
+            xfer += iprot->readListBegin(_etype430, _size427);
+            this->column_fields.resize(_size427);
+            uint32_t _i431;
+            for (_i431 = 0; _i431 < _size427; ++_i431)
             {
-              xfer += this->column_fields[_i419].read(iprot);
+              xfer += this->column_fields[_i431].read(iprot);
             }
             xfer += iprot->readListEnd();
           }
@@ -10966,10 +11378,10 @@ uint32_t ExplainResponse::write(::apache::thrift::protocol::TProtocol* oprot) co
   xfer += oprot->writeFieldBegin("column_defs", ::apache::thrift::protocol::T_LIST, 3);
   {
     xfer += oprot->writeListBegin(::apache::thrift::protocol::T_STRUCT, static_cast<uint32_t>(this->column_defs.size()));
-    std::vector<ColumnDef> ::const_iterator _iter420;
-    for (_iter420 = this->column_defs.begin(); _iter420 != this->column_defs.end(); ++_iter420)
+    std::vector<ColumnDef> ::const_iterator _iter432;
+    for (_iter432 = this->column_defs.begin(); _iter432 != this->column_defs.end(); ++_iter432)
     {
-      xfer += (*_iter420).write(oprot);
+      xfer += (*_iter432).write(oprot);
     }
     xfer += oprot->writeListEnd();
   }
@@ -10978,10 +11390,10 @@ uint32_t ExplainResponse::write(::apache::thrift::protocol::TProtocol* oprot) co
   xfer += oprot->writeFieldBegin("column_fields", ::apache::thrift::protocol::T_LIST, 4);
   {
     xfer += oprot->writeListBegin(::apache::thrift::protocol::T_STRUCT, static_cast<uint32_t>(this->column_fields.size()));
-    std::vector<ColumnField> ::const_iterator _iter421;
-    for (_iter421 = this->column_fields.begin(); _iter421 != this->column_fields.end(); ++_iter421)
+    std::vector<ColumnField> ::const_iterator _iter433;
+    for (_iter433 = this->column_fields.begin(); _iter433 != this->column_fields.end(); ++_iter433)
     {
-      xfer += (*_iter421).write(oprot);
+      xfer += (*_iter433).write(oprot);
     }
     xfer += oprot->writeListEnd();
   }
@@ -11001,19 +11413,19 @@ void swap(ExplainResponse &a, ExplainResponse &b) {
   swap(a.__isset, b.__isset);
 }
 
-ExplainResponse::ExplainResponse(const ExplainResponse& other422) {
-  error_code = other422.error_code;
-  error_msg = other422.error_msg;
-  column_defs = other422.column_defs;
-  column_fields = other422.column_fields;
-  __isset = other422.__isset;
+ExplainResponse::ExplainResponse(const ExplainResponse& other434) {
+  error_code = other434.error_code;
+  error_msg = other434.error_msg;
+  column_defs = other434.column_defs;
+  column_fields = other434.column_fields;
+  __isset = other434.__isset;
 }
-ExplainResponse& ExplainResponse::operator=(const ExplainResponse& other423) {
-  error_code = other423.error_code;
-  error_msg = other423.error_msg;
-  column_defs = other423.column_defs;
-  column_fields = other423.column_fields;
-  __isset = other423.__isset;
+ExplainResponse& ExplainResponse::operator=(const ExplainResponse& other435) {
+  error_code = other435.error_code;
+  error_msg = other435.error_msg;
+  column_defs = other435.column_defs;
+  column_fields = other435.column_fields;
+  __isset = other435.__isset;
   return *this;
 }
 void ExplainResponse::printTo(std::ostream& out) const {
@@ -11137,14 +11549,14 @@ uint32_t SelectRequest::read(::apache::thrift::protocol::TProtocol* iprot) {
         if (ftype == ::apache::thrift::protocol::T_LIST) {
           {
             this->select_list.clear();
-            uint32_t _size424;
-            ::apache::thrift::protocol::TType _etype427;
-            xfer += iprot->readListBegin(_etype427, _size424);
-            this->select_list.resize(_size424);
-            uint32_t _i428;
-            for (_i428 = 0; _i428 < _size424; ++_i428)
+            uint32_t _size436;
+            ::apache::thrift::protocol::TType _etype439;
+            xfer += iprot->readListBegin(_etype439, _size436);
+            this->select_list.resize(_size436);
+            uint32_t _i440;
+            for (_i440 = 0; _i440 < _size436; ++_i440)
             {
-              xfer += this->select_list[_i428].read(iprot);
+              xfer += this->select_list[_i440].read(iprot);
             }
             xfer += iprot->readListEnd();
           }
@@ -11173,14 +11585,14 @@ uint32_t SelectRequest::read(::apache::thrift::protocol::TProtocol* iprot) {
         if (ftype == ::apache::thrift::protocol::T_LIST) {
           {
             this->group_by_list.clear();
-            uint32_t _size429;
-            ::apache::thrift::protocol::TType _etype432;
-            xfer += iprot->readListBegin(_etype432, _size429);
-            this->group_by_list.resize(_size429);
-            uint32_t _i433;
-            for (_i433 = 0; _i433 < _size429; ++_i433)
+            uint32_t _size441;
+            ::apache::thrift::protocol::TType _etype444;
+            xfer += iprot->readListBegin(_etype444, _size441);
+            this->group_by_list.resize(_size441);
+            uint32_t _i445;
+            for (_i445 = 0; _i445 < _size441; ++_i445)
             {
-              xfer += this->group_by_list[_i433].read(iprot);
+              xfer += this->group_by_list[_i445].read(iprot);
             }
             xfer += iprot->readListEnd();
           }
@@ -11217,14 +11629,14 @@ uint32_t SelectRequest::read(::apache::thrift::protocol::TProtocol* iprot) {
         if (ftype == ::apache::thrift::protocol::T_LIST) {
           {
             this->order_by_list.clear();
-            uint32_t _size434;
-            ::apache::thrift::protocol::TType _etype437;
-            xfer += iprot->readListBegin(_etype437, _size434);
-            this->order_by_list.resize(_size434);
-            uint32_t _i438;
-            for (_i438 = 0; _i438 < _size434; ++_i438)
+            uint32_t _size446;
+            ::apache::thrift::protocol::TType _etype449;
+            xfer += iprot->readListBegin(_etype449, _size446);
+            this->order_by_list.resize(_size446);
+            uint32_t _i450;
+            for (_i450 = 0; _i450 < _size446; ++_i450)
             {
-              xfer += this->order_by_list[_i438].read(iprot);
+              xfer += this->order_by_list[_i450].read(iprot);
             }
             xfer += iprot->readListEnd();
           }
@@ -11265,10 +11677,10 @@ uint32_t SelectRequest::write(::apache::thrift::protocol::TProtocol* oprot) cons
   xfer += oprot->writeFieldBegin("select_list", ::apache::thrift::protocol::T_LIST, 4);
   {
     xfer += oprot->writeListBegin(::apache::thrift::protocol::T_STRUCT, static_cast<uint32_t>(this->select_list.size()));
-    std::vector<ParsedExpr> ::const_iterator _iter439;
-    for (_iter439 = this->select_list.begin(); _iter439 != this->select_list.end(); ++_iter439)
+    std::vector<ParsedExpr> ::const_iterator _iter451;
+    for (_iter451 = this->select_list.begin(); _iter451 != this->select_list.end(); ++_iter451)
     {
-      xfer += (*_iter439).write(oprot);
+      xfer += (*_iter451).write(oprot);
     }
     xfer += oprot->writeListEnd();
   }
@@ -11288,10 +11700,10 @@ uint32_t SelectRequest::write(::apache::thrift::protocol::TProtocol* oprot) cons
     xfer += oprot->writeFieldBegin("group_by_list", ::apache::thrift::protocol::T_LIST, 7);
     {
       xfer += oprot->writeListBegin(::apache::thrift::protocol::T_STRUCT, static_cast<uint32_t>(this->group_by_list.size()));
-      std::vector<ParsedExpr> ::const_iterator _iter440;
-      for (_iter440 = this->group_by_list.begin(); _iter440 != this->group_by_list.end(); ++_iter440)
+      std::vector<ParsedExpr> ::const_iterator _iter452;
+      for (_iter452 = this->group_by_list.begin(); _iter452 != this->group_by_list.end(); ++_iter452)
       {
-        xfer += (*_iter440).write(oprot);
+        xfer += (*_iter452).write(oprot);
       }
       xfer += oprot->writeListEnd();
     }
@@ -11316,10 +11728,10 @@ uint32_t SelectRequest::write(::apache::thrift::protocol::TProtocol* oprot) cons
     xfer += oprot->writeFieldBegin("order_by_list", ::apache::thrift::protocol::T_LIST, 11);
     {
       xfer += oprot->writeListBegin(::apache::thrift::protocol::T_STRUCT, static_cast<uint32_t>(this->order_by_list.size()));
-      std::vector<OrderByExpr> ::const_iterator _iter441;
-      for (_iter441 = this->order_by_list.begin(); _iter441 != this->order_by_list.end(); ++_iter441)
+      std::vector<OrderByExpr> ::const_iterator _iter453;
+      for (_iter453 = this->order_by_list.begin(); _iter453 != this->order_by_list.end(); ++_iter453)
       {
-        xfer += (*_iter441).write(oprot);
+        xfer += (*_iter453).write(oprot);
       }
       xfer += oprot->writeListEnd();
     }
@@ -11346,33 +11758,33 @@ void swap(SelectRequest &a, SelectRequest &b) {
   swap(a.__isset, b.__isset);
 }
 
-SelectRequest::SelectRequest(const SelectRequest& other442) {
-  session_id = other442.session_id;
-  db_name = other442.db_name;
-  table_name = other442.table_name;
-  select_list = other442.select_list;
-  search_expr = other442.search_expr;
-  where_expr = other442.where_expr;
-  group_by_list = other442.group_by_list;
-  having_expr = other442.having_expr;
-  limit_expr = other442.limit_expr;
-  offset_expr = other442.offset_expr;
-  order_by_list = other442.order_by_list;
-  __isset = other442.__isset;
-}
-SelectRequest& SelectRequest::operator=(const SelectRequest& other443) {
-  session_id = other443.session_id;
-  db_name = other443.db_name;
-  table_name = other443.table_name;
-  select_list = other443.select_list;
-  search_expr = other443.search_expr;
-  where_expr = other443.where_expr;
-  group_by_list = other443.group_by_list;
-  having_expr = other443.having_expr;
-  limit_expr = other443.limit_expr;
-  offset_expr = other443.offset_expr;
-  order_by_list = other443.order_by_list;
-  __isset = other443.__isset;
+SelectRequest::SelectRequest(const SelectRequest& other454) {
+  session_id = other454.session_id;
+  db_name = other454.db_name;
+  table_name = other454.table_name;
+  select_list = other454.select_list;
+  search_expr = other454.search_expr;
+  where_expr = other454.where_expr;
+  group_by_list = other454.group_by_list;
+  having_expr = other454.having_expr;
+  limit_expr = other454.limit_expr;
+  offset_expr = other454.offset_expr;
+  order_by_list = other454.order_by_list;
+  __isset = other454.__isset;
+}
+SelectRequest& SelectRequest::operator=(const SelectRequest& other455) {
+  session_id = other455.session_id;
+  db_name = other455.db_name;
+  table_name = other455.table_name;
+  select_list = other455.select_list;
+  search_expr = other455.search_expr;
+  where_expr = other455.where_expr;
+  group_by_list = other455.group_by_list;
+  having_expr = other455.having_expr;
+  limit_expr = other455.limit_expr;
+  offset_expr = other455.offset_expr;
+  order_by_list = other455.order_by_list;
+  __isset = other455.__isset;
   return *this;
 }
 void SelectRequest::printTo(std::ostream& out) const {
@@ -11460,14 +11872,14 @@ uint32_t SelectResponse::read(::apache::thrift::protocol::TProtocol* iprot) {
         if (ftype == ::apache::thrift::protocol::T_LIST) {
           {
             this->column_defs.clear();
-            uint32_t _size444;
-            ::apache::thrift::protocol::TType _etype447;
-            xfer += iprot->readListBegin(_etype447, _size444);
-            this->column_defs.resize(_size444);
-            uint32_t _i448;
-            for (_i448 = 0; _i448 < _size444; ++_i448)
+            uint32_t _size456;
+            ::apache::thrift::protocol::TType _etype459;
+            xfer += iprot->readListBegin(_etype459, _size456);
+            this->column_defs.resize(_size456);
+            uint32_t _i460;
+            for (_i460 = 0; _i460 < _size456; ++_i460)
             {
-              xfer += this->column_defs[_i448].read(iprot);
+              xfer += this->column_defs[_i460].read(iprot);
             }
             xfer += iprot->readListEnd();
           }
@@ -11480,14 +11892,14 @@ uint32_t SelectResponse::read(::apache::thrift::protocol::TProtocol* iprot) {
         if (ftype == ::apache::thrift::protocol::T_LIST) {
           {
             this->column_fields.clear();
-            uint32_t _size449;
-            ::apache::thrift::protocol::TType _etype452;
-            xfer += iprot->readListBegin(_etype452, _size449);
-            this->column_fields.resize(_size449);
-            uint32_t _i453;
-            for (_i453 = 0; _i453 < _size449; ++_i453)
+            uint32_t _size461;
+            ::apache::thrift::protocol::TType _etype464;
+            xfer += iprot->readListBegin(_etype464, _size461);
+            this->column_fields.resize(_size461);
+            uint32_t _i465;
+            for (_i465 = 0; _i465 < _size461; ++_i465)
             {
-              xfer += this->column_fields[_i453].read(iprot);
+              xfer += this->column_fields[_i465].read(iprot);
             }
             xfer += iprot->readListEnd();
           }
@@ -11524,10 +11936,10 @@ uint32_t SelectResponse::write(::apache::thrift::protocol::TProtocol* oprot) con
   xfer += oprot->writeFieldBegin("column_defs", ::apache::thrift::protocol::T_LIST, 3);
   {
     xfer += oprot->writeListBegin(::apache::thrift::protocol::T_STRUCT, static_cast<uint32_t>(this->column_defs.size()));
-    std::vector<ColumnDef> ::const_iterator _iter454;
-    for (_iter454 = this->column_defs.begin(); _iter454 != this->column_defs.end(); ++_iter454)
+    std::vector<ColumnDef> ::const_iterator _iter466;
+    for (_iter466 = this->column_defs.begin(); _iter466 != this->column_defs.end(); ++_iter466)
     {
-      xfer += (*_iter454).write(oprot);
+      xfer += (*_iter466).write(oprot);
     }
     xfer += oprot->writeListEnd();
   }
@@ -11536,10 +11948,10 @@ uint32_t SelectResponse::write(::apache::thrift::protocol::TProtocol* oprot) con
   xfer += oprot->writeFieldBegin("column_fields", ::apache::thrift::protocol::T_LIST, 4);
   {
     xfer += oprot->writeListBegin(::apache::thrift::protocol::T_STRUCT, static_cast<uint32_t>(this->column_fields.size()));
-    std::vector<ColumnField> ::const_iterator _iter455;
-    for (_iter455 = this->column_fields.begin(); _iter455 != this->column_fields.end(); ++_iter455)
+    std::vector<ColumnField> ::const_iterator _iter467;
+    for (_iter467 = this->column_fields.begin(); _iter467 != this->column_fields.end(); ++_iter467)
     {
-      xfer += (*_iter455).write(oprot);
+      xfer += (*_iter467).write(oprot);
     }
     xfer += oprot->writeListEnd();
   }
@@ -11559,19 +11971,19 @@ void swap(SelectResponse &a, SelectResponse &b) {
   swap(a.__isset, b.__isset);
 }
 
-SelectResponse::SelectResponse(const SelectResponse& other456) {
-  error_code = other456.error_code;
-  error_msg = other456.error_msg;
-  column_defs = other456.column_defs;
-  column_fields = other456.column_fields;
-  __isset = other456.__isset;
+SelectResponse::SelectResponse(const SelectResponse& other468) {
+  error_code = other468.error_code;
+  error_msg = other468.error_msg;
+  column_defs = other468.column_defs;
+  column_fields = other468.column_fields;
+  __isset = other468.__isset;
 }
-SelectResponse& SelectResponse::operator=(const SelectResponse& other457) {
-  error_code = other457.error_code;
-  error_msg = other457.error_msg;
-  column_defs = other457.column_defs;
-  column_fields = other457.column_fields;
-  __isset = other457.__isset;
+SelectResponse& SelectResponse::operator=(const SelectResponse& other469) {
+  error_code = other469.error_code;
+  error_msg = other469.error_msg;
+  column_defs = other469.column_defs;
+  column_fields = other469.column_fields;
+  __isset = other469.__isset;
   return *this;
 }
 void SelectResponse::printTo(std::ostream& out) const {
@@ -11585,6 +11997,330 @@ void SelectResponse::printTo(std::ostream& out) const {
 }
 
 
+SelectBatchRequest::~SelectBatchRequest() noexcept {
+}
+
+
+void SelectBatchRequest::__set_session_id(const int64_t val) {
+  this->session_id = val;
+}
+
+void SelectBatchRequest::__set_query(const SelectRequest& val) {
+  this->query = val;
+}
+
+void SelectBatchRequest::__set_match_index(const int32_t val) {
+  this->match_index = val;
+}
+
+void SelectBatchRequest::__set_embeddings(const std::vector<EmbeddingData> & val) {
+  this->embeddings = val;
+}
+std::ostream& operator<<(std::ostream& out, const SelectBatchRequest& obj)
+{
+  obj.printTo(out);
+  return out;
+}
+
+
+uint32_t SelectBatchRequest::read(::apache::thrift::protocol::TProtocol* iprot) {
+
+  ::apache::thrift::protocol::TInputRecursionTracker tracker(*iprot);
+  uint32_t xfer = 0;
+  std::string fname;
+  ::apache::thrift::protocol::TType ftype;
+  int16_t fid;
+
+  xfer += iprot->readStructBegin(fname);
+
+  using ::apache::thrift::protocol::TProtocolException;
+
+
+  while (true)
+  {
+    xfer += iprot->readFieldBegin(fname, ftype, fid);
+    if (ftype == ::apache::thrift::protocol::T_STOP) {
+      break;
+    }
+    switch (fid)
+    {
+      case 1:
+        if (ftype == ::apache::thrift::protocol::T_I64) {
+          xfer += iprot->readI64(this->session_id);
+          this->__isset.session_id = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      case 2:
+        if (ftype == ::apache::thrift::protocol::T_STRUCT) {
+          xfer += this->query.read(iprot);
+          this->__isset.query = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      case 3:
+        if (ftype == ::apache::thrift::protocol::T_I32) {
+          xfer += iprot->readI32(this->match_index);
+          this->__isset.match_index = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      case 4:
+        if (ftype == ::apache::thrift::protocol::T_LIST) {
+          {
+            this->embeddings.clear();
+            uint32_t _size470;
+            ::apache::thrift::protocol::TType _etype473;
+            xfer += iprot->readListBegin(_etype473, _size470);
+            this->embeddings.resize(_size470);
+            uint32_t _i474;
+            for (_i474 = 0; _i474 < _size470; ++_i474)
+            {
+              xfer += this->embeddings[_i474].read(iprot);
+            }
+            xfer += iprot->readListEnd();
+          }
+          this->__isset.embeddings = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      default:
+        xfer += iprot->skip(ftype);
+        break;
+    }
+    xfer += iprot->readFieldEnd();
+  }
+
+  xfer += iprot->readStructEnd();
+
+  return xfer;
+}
+
+uint32_t SelectBatchRequest::write(::apache::thrift::protocol::TProtocol* oprot) const {
+  uint32_t xfer = 0;
+  ::apache::thrift::protocol::TOutputRecursionTracker tracker(*oprot);
+  xfer += oprot->writeStructBegin("SelectBatchRequest");
+
+  xfer += oprot->writeFieldBegin("session_id", ::apache::thrift::protocol::T_I64, 1);
+  xfer += oprot->writeI64(this->session_id);
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldBegin("query", ::apache::thrift::protocol::T_STRUCT, 2);
+  xfer += this->query.write(oprot);
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldBegin("match_index", ::apache::thrift::protocol::T_I32, 3);
+  xfer += oprot->writeI32(this->match_index);
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldBegin("embeddings", ::apache::thrift::protocol::T_LIST, 4);
+  {
+    xfer += oprot->writeListBegin(::apache::thrift::protocol::T_STRUCT, static_cast<uint32_t>(this->embeddings.size()));
+    std::vector<EmbeddingData> ::const_iterator _iter475;
+    for (_iter475 = this->embeddings.begin(); _iter475 != this->embeddings.end(); ++_iter475)
+    {
+      xfer += (*_iter475).write(oprot);
+    }
+    xfer += oprot->writeListEnd();
+  }
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldStop();
+  xfer += oprot->writeStructEnd();
+  return xfer;
+}
+
+void swap(SelectBatchRequest &a, SelectBatchRequest &b) {
+  using ::std::swap;
+  swap(a.session_id, b.session_id);
+  swap(a.query, b.query);
+  swap(a.match_index, b.match_index);
+  swap(a.embeddings, b.embeddings);
+  swap(a.__isset, b.__isset);
+}
+
+SelectBatchRequest::SelectBatchRequest(const SelectBatchRequest& other476) {
+  session_id = other476.session_id;
+  query = other476.query;
+  match_index = other476.match_index;
+  embeddings = other476.embeddings;
+  __isset = other476.__isset;
+}
+SelectBatchRequest& SelectBatchRequest::operator=(const SelectBatchRequest& other477) {
+  session_id = other477.session_id;
+  query = other477.query;
+  match_index = other477.match_index;
+  embeddings = other477.embeddings;
+  __isset = other477.__isset;
+  return *this;
+}
+void SelectBatchRequest::printTo(std::ostream& out) const {
+  using ::apache::thrift::to_string;
+  out << "SelectBatchRequest(";
+  out << "session_id=" << to_string(session_id);
+  out << ", " << "query=" << to_string(query);
+  out << ", " << "match_index=" << to_string(match_index);
+  out << ", " << "embeddings=" << to_string(embeddings);
+  out << ")";
+}
+
+
+SelectBatchResponse::~SelectBatchResponse() noexcept {
+}
+
+
+void SelectBatchResponse::__set_error_code(const int64_t val) {
+  this->error_code = val;
+}
+
+void SelectBatchResponse::__set_error_msg(const std::string& val) {
+  this->error_msg = val;
+}
+
+void SelectBatchResponse::__set_results(const std::vector<SelectResponse> & val) {
+  this->results = val;
+}
+std::ostream& operator<<(std::ostream& out, const SelectBatchResponse& obj)
+{
+  obj.printTo(out);
+  return out;
+}
+
+
+uint32_t SelectBatchResponse::read(::apache::thrift::protocol::TProtocol* iprot) {
+
+  ::apache::thrift::protocol::TInputRecursionTracker tracker(*iprot);
+  uint32_t xfer = 0;
+  std::string fname;
+  ::apache::thrift::protocol::TType ftype;
+  int16_t fid;
+
+  xfer += iprot->readStructBegin(fname);
+
+  using ::apache::thrift::protocol::TProtocolException;
+
+
+  while (true)
+  {
+    xfer += iprot->readFieldBegin(fname, ftype, fid);
+    if (ftype == ::apache::thrift::protocol::T_STOP) {
+      break;
+    }
+    switch (fid)
+    {
+      case 1:
+        if (ftype == ::apache::thrift::protocol::T_I64) {
+          xfer += iprot->readI64(this->error_code);
+          this->__isset.error_code = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      case 2:
+        if (ftype == ::apache::thrift::protocol::T_STRING) {
+          xfer += iprot->readString(this->error_msg);
+          this->__isset.error_msg = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      case 3:
+        if (ftype == ::apache::thrift::protocol::T_LIST) {
+          {
+            this->results.clear();
+            uint32_t _size478;
+            ::apache::thrift::protocol::TType _etype481;
+            xfer += iprot->readListBegin(_etype481, _size478);
+            this->results.resize(_size478);
+            uint32_t _i482;
+            for (_i482 = 0; _i482 < _size478; ++_i482)
+            {
+              xfer += this->results[_i482].read(iprot);
+            }
+            xfer += iprot->readListEnd();
+          }
+          this->__isset.results = true;
+        } else {
+          xfer += iprot->skip(ftype);
+        }
+        break;
+      default:
+        xfer += iprot->skip(ftype);
+        break;
+    }
+    xfer += iprot->readFieldEnd();
+  }
+
+  xfer += iprot->readStructEnd();
+
+  return xfer;
+}
+
+uint32_t SelectBatchResponse::write(::apache::thrift::protocol::TProtocol* oprot) const {
+  uint32_t xfer = 0;
+  ::apache::thrift::protocol::TOutputRecursionTracker tracker(*oprot);
+  xfer += oprot->writeStructBegin("SelectBatchResponse");
+
+  xfer += oprot->writeFieldBegin("error_code", ::apache::thrift::protocol::T_I64, 1);
+  xfer += oprot->writeI64(this->error_code);
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldBegin("error_msg", ::apache::thrift::protocol::T_STRING, 2);
+  xfer += oprot->writeString(this->error_msg);
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldBegin("results", ::apache::thrift::protocol::T_LIST, 3);
+  {
+    xfer += oprot->writeListBegin(::apache::thrift::protocol::T_STRUCT, static_cast<uint32_t>(this->results.size()));
+    std::vector<SelectResponse> ::const_iterator _iter483;
+    for (_iter483 = this->results.begin(); _iter483 != this->results.end(); ++_iter483)
+    {
+      xfer += (*_iter483).write(oprot);
+    }
+    xfer += oprot->writeListEnd();
+  }
+  xfer += oprot->writeFieldEnd();
+
+  xfer += oprot->writeFieldStop();
+  xfer += oprot->writeStructEnd();
+  return xfer;
+}
+
+void swap(SelectBatchResponse &a, SelectBatchResponse &b) {
+  using ::std::swap;
+  swap(a.error_code, b.error_code);
+  swap(a.error_msg, b.error_msg);
+  swap(a.results, b.results);
+  swap(a.__isset, b.__isset);
+}
+
+SelectBatchResponse::SelectBatchResponse(const SelectBatchResponse& other484) {
+  error_code = other484.error_code;
+  error_msg = other484.error_msg;
+  results = other484.results;
+  __isset = other484.__isset;
+}
+SelectBatchResponse& SelectBatchResponse::operator=(const SelectBatchResponse& other485) {
+  error_code = other485.error_code;
+  error_msg = other485.error_msg;
+  results = other485.results;
+  __isset = other485.__isset;
+  return *this;
+}
+void SelectBatchResponse::printTo(std::ostream& out) const {
+  using ::apache::thrift::to_string;
+  out << "SelectBatchResponse(";
+  out << "error_code=" << to_string(error_code);
+  out << ", " << "error_msg=" << to_string(error_msg);
+  out << ", " << "results=" << to_string(results);
+  out << ")";
+}
+
+
 DeleteRequest::~DeleteRequest() noexcept {
 }
 
@@ -11711,19 +12447,19 @@ void swap(DeleteRequest &a, DeleteRequest &b) {
   swap(a.__isset, b.__isset);
 }
 
-DeleteRequest::DeleteRequest(const DeleteRequest& other458) {
-  db_name = other458.db_name;
-  table_name = other458.table_name;
-  where_expr = other458.where_expr;
-  session_id = other458.session_id;
-  __isset = other458.__isset;
+DeleteRequest::DeleteRequest(const DeleteRequest& other486) {
+  db_name = other486.db_name;
+  table_name = other486.table_name;
+  where_expr = other486.where_expr;
+  session_id = other486.session_id;
+  __isset = other486.__isset;
 }
-DeleteRequest& DeleteRequest::operator=(const DeleteRequest& other459) {
-  db_name = other459.db_name;
-  table_name = other459.table_name;
-  where_expr = other459.where_expr;
-  session_id = other459.session_id;
-  __isset = other459.__isset;
+DeleteRequest& DeleteRequest::operator=(const DeleteRequest& other487) {
+  db_name = other487.db_name;
+  table_name = other487.table_name;
+  where_expr = other487.where_expr;
+  session_id = other487.session_id;
+  __isset = other487.__isset;
   return *this;
 }
 void DeleteRequest::printTo(std::ostream& out) const {
@@ -11816,14 +12552,14 @@ uint32_t UpdateRequest::read(::apache::thrift::protocol::TProtocol* iprot) {
         if (ftype == ::apache::thrift::protocol::T_LIST) {
           {
             this->update_expr_array.clear();
-            uint32_t _size460;
-            ::apache::thrift::protocol::TType _etype463;
-            xfer += iprot->readListBegin(_etype463, _size460);
-            this->update_expr_array.resize(_size460);
-            uint32_t _i464;
-            for (_i464 = 0; _i464 < _size460; ++_i464)
+            uint32_t _size488;
+            ::apache::thrift::protocol::TType _etype491;
+            xfer += iprot->readListBegin(_etype491, _size488);
+            this->update_expr_array.resize(_size488);
+            uint32_t _i492;
+            for (_i492 = 0; _i492 < _size488; ++_i492)
             {
-              xfer += this->update_expr_array[_i464].read(iprot);
+              xfer += this->update_expr_array[_i492].read(iprot);
             }
             xfer += iprot->readListEnd();
           }
@@ -11872,10 +12608,10 @@ uint32_t UpdateRequest::write(::apache::thrift::protocol::TProtocol* oprot) cons
   xfer += oprot->writeFieldBegin("update_expr_array", ::apache::thrift::protocol::T_LIST, 4);
   {
     xfer += oprot->writeListBegin(::apache::thrift::protocol::T_STRUCT, static_cast<uint32_t>(this->update_expr_array.size()));
-    std::vector<UpdateExpr> ::const_iterator _iter465;
-    for (_iter465 = this->update_expr_array.begin(); _iter465 != this->update_expr_array.end(); ++_iter465)
+    std::vector<UpdateExpr> ::const_iterator _iter493;
+    for (_iter493 = this->update_expr_array.begin(); _iter493 != this->update_expr_array.end(); ++_iter493)
     {
-      xfer += (*_iter465).write(oprot);
+      xfer += (*_iter493).write(oprot);
     }
     xfer += oprot->writeListEnd();
   }
@@ -11900,21 +12636,21 @@ void swap(UpdateRequest &a, UpdateRequest &b) {
   swap(a.__isset, b.__isset);
 }
 
-UpdateRequest::UpdateRequest(const UpdateRequest& other466) {
-  db_name = other466.db_name;
-  table_name = other466.table_name;
-  where_expr = other466.where_expr;
-  update_expr_array = other466.update_expr_array;
-  session_id = other466.session_id;
-  __isset = other466.__isset;
-}
-UpdateRequest& UpdateRequest::operator=(const UpdateRequest& other467) {
-  db_name = other467.db_name;
-  table_name = other467.table_name;
-  where_expr = other467.where_expr;
-  update_expr_array = other467.update_expr_array;
-  session_id = other467.session_id;
-  __isset = other467.__isset;
+UpdateRequest::UpdateRequest(const UpdateRequest& other494) {
+  db_name = other494.db_name;
+  table_name = other494.table_name;
+  where_expr = other494.where_expr;
+  update_expr_array = other494.update_expr_array;
+  session_id = other494.session_id;
+  __isset = other494.__isset;
+}
+UpdateRequest& UpdateRequest::operator=(const UpdateRequest& other495) {
+  db_name = other495.db_name;
+  table_name = other495.table_name;
+  where_expr = other495.where_expr;
+  update_expr_array = other495.update_expr_array;
+  session_id = other495.session_id;
+  __isset = other495.__isset;
   return *this;
 }
 void UpdateRequest::printTo(std::ostream& out) const {
@@ -12021,15 +12757,15 @@ void swap(ShowTablesRequest &a, ShowTablesRequest &b) {
   swap(a.__isset, b.__isset);
 }
 
-ShowTablesRequest::ShowTablesRequest(const ShowTablesRequest& other468) {
-  session_id = other468.session_id;
-  db_name = other468.db_name;
-  __isset = other468.__isset;
+ShowTablesRequest::ShowTablesRequest(const ShowTablesRequest& other496) {
+  session_id = other496.session_id;
+  db_name = other496.db_name;
+  __isset = other496.__isset;
 }
-ShowTablesRequest& ShowTablesRequest::operator=(const ShowTablesRequest& other469) {
-  session_id = other469.session_id;
-  db_name = other469.db_name;
-  __isset = other469.__isset;
+ShowTablesRequest& ShowTablesRequest::operator=(const ShowTablesRequest& other497) {
+  session_id = other497.session_id;
+  db_name = other497.db_name;
+  __isset = other497.__isset;
   return *this;
 }
 void ShowTablesRequest::printTo(std::ostream& out) const {
@@ -12150,17 +12886,17 @@ void swap(ShowSegmentsRequest &a, ShowSegmentsRequest &b) {
   swap(a.__isset, b.__isset);
 }
 
-ShowSegmentsRequest::ShowSegmentsRequest(const ShowSegmentsRequest& other470) {
-  session_id = other470.session_id;
-  db_name = other470.db_name;
-  table_name = other470.table_name;
-  __isset = other470.__isset;
+ShowSegmentsRequest::ShowSegmentsRequest(const ShowSegmentsRequest& other498) {
+  session_id = other498.session_id;
+  db_name = other498.db_name;
+  table_name = other498.table_name;
+  __isset = other498.__isset;
 }
-ShowSegmentsRequest& ShowSegmentsRequest::operator=(const ShowSegmentsRequest& other471) {
-  session_id = other471.session_id;
-  db_name = other471.db_name;
-  table_name = other471.table_name;
-  __isset = other471.__isset;
+ShowSegmentsRequest& ShowSegmentsRequest::operator=(const ShowSegmentsRequest& other499) {
+  session_id = other499.session_id;
+  db_name = other499.db_name;
+  table_name = other499.table_name;
+  __isset = other499.__isset;
   return *this;
 }
 void ShowSegmentsRequest::printTo(std::ostream& out) const {
@@ -12299,19 +13035,19 @@ void swap(ShowSegmentRequest &a, ShowSegmentRequest &b) {
   swap(a.__isset, b.__isset);
 }
 
-ShowSegmentRequest::ShowSegmentRequest(const ShowSegmentRequest& other472) {
-  session_id = other472.session_id;
-  db_name = other472.db_name;
-  table_name = other472.table_name;
-  segment_id = other472.segment_id;
-  __isset = other472.__isset;
+ShowSegmentRequest::ShowSegmentRequest(const ShowSegmentRequest& other500) {
+  session_id = other500.session_id;
+  db_name = other500.db_name;
+  table_name = other500.table_name;
+  segment_id = other500.segment_id;
+  __isset = other500.__isset;
 }
-ShowSegmentRequest& ShowSegmentRequest::operator=(const ShowSegmentRequest& other473) {
-  session_id = other473.session_id;
-  db_name = other473.db_name;
-  table_name = other473.table_name;
-  segment_id = other473.segment_id;
-  __isset = other473.__isset;
+ShowSegmentRequest& ShowSegmentRequest::operator=(const ShowSegmentRequest& other501) {
+  session_id = other501.session_id;
+  db_name = other501.db_name;
+  table_name = other501.table_name;
+  segment_id = other501.segment_id;
+  __isset = other501.__isset;
   return *this;
 }
 void ShowSegmentRequest::printTo(std::ostream& out) const {
@@ -12570,33 +13306,33 @@ void swap(ShowSegmentResponse &a, ShowSegmentResponse &b) {
   swap(a.__isset, b.__isset);
 }
 
-ShowSegmentResponse::ShowSegmentResponse(const ShowSegmentResponse& other474) {
-  error_code = other474.error_code;
-  error_msg = other474.error_msg;
-  segment_id = other474.segment_id;
-  status = other474.status;
-  path = other474.path;
-  size = other474.size;
-  block_count = other474.block_count;
-  row_capacity = other474.row_capacity;
-  row_count = other474.row_count;
-  room = other474.room;
-  column_count = other474.column_count;
-  __isset = other474.__isset;
-}
-ShowSegmentResponse& ShowSegmentResponse::operator=(const ShowSegmentResponse& other475) {
-  error_code = other475.error_code;
-  error_msg = other475.error_msg;
-  segment_id = other475.segment_id;
-  status = other475.status;
-  path = other475.path;
-  size = other475.size;
-  block_count = other475.block_count;
-  row_capacity = other475.row_capacity;
-  row_count = other475.row_count;
-  room = other475.room;
-  column_count = other475.column_count;
-  __isset = other475.__isset;
+ShowSegmentResponse::ShowSegmentResponse(const ShowSegmentResponse& other502) {
+  error_code = other502.error_code;
+  error_msg = other502.error_msg;
+  segment_id = other502.segment_id;
+  status = other502.status;
+  path = other502.path;
+  size = other502.size;
+  block_count = other502.block_count;
+  row_capacity = other502.row_capacity;
+  row_count = other502.row_count;
+  room = other502.room;
+  column_count = other502.column_count;
+  __isset = other502.__isset;
+}
+ShowSegmentResponse& ShowSegmentResponse::operator=(const ShowSegmentResponse& other503) {
+  error_code = other503.error_code;
+  error_msg = other503.error_msg;
+  segment_id = other503.segment_id;
+  status = other503.status;
+  path = other503.path;
+  size = other503.size;
+  block_count = other503.block_count;
+  row_capacity = other503.row_capacity;
+  row_count = other503.row_count;
+  room = other503.room;
+  column_count = other503.column_count;
+  __isset = other503.__isset;
   return *this;
 }
 void ShowSegmentResponse::printTo(std::ostream& out) const {
@@ -12743,19 +13479,19 @@ void swap(ShowBlocksRequest &a, ShowBlocksRequest &b) {
   swap(a.__isset, b.__isset);
 }
 
-ShowBlocksRequest::ShowBlocksRequest(const ShowBlocksRequest& other476) {
-  session_id = other476.session_id;
-  db_name = other476.db_name;
-  table_name = other476.table_name;
-  segment_id = other476.segment_id;
-  __isset = other476.__isset;
+ShowBlocksRequest::ShowBlocksRequest(const ShowBlocksRequest& other504) {
+  session_id = other504.session_id;
+  db_name = other504.db_name;
+  table_name = other504.table_name;
+  segment_id = other504.segment_id;
+  __isset = other504.__isset;
 }
-ShowBlocksRequest& ShowBlocksRequest::operator=(const ShowBlocksRequest& other477) {
-  session_id = other477.session_id;
-  db_name = other477.db_name;
-  table_name = other477.table_name;
-  segment_id = other477.segment_id;
-  __isset = other477.__isset;
+ShowBlocksRequest& ShowBlocksRequest::operator=(const ShowBlocksRequest& other505) {
+  session_id = other505.session_id;
+  db_name = other505.db_name;
+  table_name = other505.table_name;
+  segment_id = other505.segment_id;
+  __isset = other505.__isset;
   return *this;
 }
 void ShowBlocksRequest::printTo(std::ostream& out) const {
@@ -12912,21 +13648,21 @@ void swap(ShowBlockRequest &a, ShowBlockRequest &b) {
   swap(a.__isset, b.__isset);
 }
 
-ShowBlockRequest::ShowBlockRequest(const ShowBlockRequest& other478) {
-  session_id = other478.session_id;
-  db_name = other478.db_name;
-  table_name = other478.table_name;
-  segment_id = other478.segment_id;
-  block_id = other478.block_id;
-  __isset = other478.__isset;
-}
-ShowBlockRequest& ShowBlockRequest::operator=(const ShowBlockRequest& other479) {
-  session_id = other479.session_id;
-  db_name = other479.db_name;
-  table_name = other479.table_name;
-  segment_id = other479.segment_id;
-  block_id = other479.block_id;
-  __isset = other479.__isset;
+ShowBlockRequest::ShowBlockRequest(const ShowBlockRequest& other506) {
+  session_id = other506.session_id;
+  db_name = other506.db_name;
+  table_name = other506.table_name;
+  segment_id = other506.segment_id;
+  block_id = other506.block_id;
+  __isset = other506.__isset;
+}
+ShowBlockRequest& ShowBlockRequest::operator=(const ShowBlockRequest& other507) {
+  session_id = other507.session_id;
+  db_name = other507.db_name;
+  table_name = other507.table_name;
+  segment_id = other507.segment_id;
+  block_id = other507.block_id;
+  __isset = other507.__isset;
   return *this;
 }
 void ShowBlockRequest::printTo(std::ostream& out) const {
@@ -13135,27 +13871,27 @@ void swap(ShowBlockResponse &a, ShowBlockResponse &b) {
   swap(a.__isset, b.__isset);
 }
 
-ShowBlockResponse::ShowBlockResponse(const ShowBlockResponse& other480) {
-  error_code = other480.error_code;
-  error_msg = other480.error_msg;
-  block_id = other480.block_id;
-  path = other480.path;
-  size = other480.size;
-  row_capacity = other480.row_capacity;
-  row_count = other480.row_count;
-  column_count = other480.column_count;
-  __isset = other480.__isset;
-}
-ShowBlockResponse& ShowBlockResponse::operator=(const ShowBlockResponse& other481) {
-  error_code = other481.error_code;
-  error_msg = other481.error_msg;
-  block_id = other481.block_id;
-  path = other481.path;
-  size = other481.size;
-  row_capacity = other481.row_capacity;
-  row_count = other481.row_count;
-  column_count = other481.column_count;
-  __isset = other481.__isset;
+ShowBlockResponse::ShowBlockResponse(const ShowBlockResponse& other508) {
+  error_code = other508.error_code;
+  error_msg = other508.error_msg;
+  block_id = other508.block_id;
+  path = other508.path;
+  size = other508.size;
+  row_capacity = other508.row_capacity;
+  row_count = other508.row_count;
+  column_count = other508.column_count;
+  __isset = other508.__isset;
+}
+ShowBlockResponse& ShowBlockResponse::operator=(const ShowBlockResponse& other509) {
+  error_code = other509.error_code;
+  error_msg = other509.error_msg;
+  block_id = other509.block_id;
+  path = other509.path;
+  size = other509.size;
+  row_capacity = other509.row_capacity;
+  row_count = other509.row_count;
+  column_count = other509.column_count;
+  __isset = other509.__isset;
   return *this;
 }
 void ShowBlockResponse::printTo(std::ostream& out) const {
@@ -13333,23 +14069,23 @@ void swap(ShowBlockColumnRequest &a, ShowBlockColumnRequest &b) {
   swap(a.__isset, b.__isset);
 }
 
-ShowBlockColumnRequest::ShowBlockColumnRequest(const ShowBlockColumnRequest& other482) {
-  session_id = other482.session_id;
-  db_name = other482.db_name;
-  table_name = other482.table_name;
-  segment_id = other482.segment_id;
-  block_id = other482.block_id;
-  column_id = other482.column_id;
-  __isset = other482.__isset;
-}
-ShowBlockColumnRequest& ShowBlockColumnRequest::operator=(const ShowBlockColumnRequest& other483) {
-  session_id = other483.session_id;
-  db_name = other483.db_name;
-  table_name = other483.table_name;
-  segment_id = other483.segment_id;
-  block_id = other483.block_id;
-  column_id = other483.column_id;
-  __isset = other483.__isset;
+ShowBlockColumnRequest::ShowBlockColumnRequest(const ShowBlockColumnRequest& other510) {
+  session_id = other510.session_id;
+  db_name = other510.db_name;
+  table_name = other510.table_name;
+  segment_id = other510.segment_id;
+  block_id = other510.block_id;
+  column_id = other510.column_id;
+  __isset = other510.__isset;
+}
+ShowBlockColumnRequest& ShowBlockColumnRequest::operator=(const ShowBlockColumnRequest& other511) {
+  session_id = other511.session_id;
+  db_name = other511.db_name;
+  table_name = other511.table_name;
+  segment_id = other511.segment_id;
+  block_id = other511.block_id;
+  column_id = other511.column_id;
+  __isset = other511.__isset;
   return *this;
 }
 void ShowBlockColumnRequest::printTo(std::ostream& out) const {
@@ -13559,27 +14295,27 @@ void swap(ShowBlockColumnResponse &a, ShowBlockColumnResponse &b) {
   swap(a.__isset, b.__isset);
 }
 
-ShowBlockColumnResponse::ShowBlockColumnResponse(const ShowBlockColumnResponse& other484) {
-  error_code = other484.error_code;
-  error_msg = other484.error_msg;
-  column_name = other484.column_name;
-  column_id = other484.column_id;
-  data_type = other484.data_type;
-  path = other484.path;
-  extra_file_count = other484.extra_file_count;
-  extra_file_names = other484.extra_file_names;
-  __isset = other484.__isset;
-}
-ShowBlockColumnResponse& ShowBlockColumnResponse::operator=(const ShowBlockColumnResponse& other485) {
-  error_code = other485.error_code;
-  error_msg = other485.error_msg;
-  column_name = other485.column_name;
-  column_id = other485.column_id;
-  data_type = other485.data_type;
-  path = other485.path;
-  extra_file_count = other485.extra_file_count;
-  extra_file_names = other485.extra_file_names;
-  __isset = other485.__isset;
+ShowBlockColumnResponse::ShowBlockColumnResponse(const ShowBlockColumnResponse& other512) {
+  error_code = other512.error_code;
+  error_msg = other512.error_msg;
+  column_name = other512.column_name;
+  column_id = other512.column_id;
+  data_type = other512.data_type;
+  path = other512.path;
+  extra_file_count = other512.extra_file_count;
+  extra_file_names = other512.extra_file_names;
+  __isset = other512.__isset;
+}
+ShowBlockColumnResponse& ShowBlockColumnResponse::operator=(const ShowBlockColumnResponse& other513) {
+  error_code = other513.error_code;
+  error_msg = other513.error_msg;
+  column_name = other513.column_name;
+  column_id = other513.column_id;
+  data_type = other513.data_type;
+  path = other513.path;
+  extra_file_count = other513.extra_file_count;
+  extra_file_names = other513.extra_file_names;
+  __isset = other513.__isset;
   return *this;
 }
 void ShowBlockColumnResponse::printTo(std::ostream& out) const {
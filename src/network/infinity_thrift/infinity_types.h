@@ -158,7 +158,8 @@ struct CopyFileType {
     JSONL = 2,
     FVECS = 3,
     CSR = 4,
-    BVECS = 5
+    BVECS = 5,
+    PARQUET = 6
   };
 };
 
@@ -289,6 +290,8 @@ class Field;
 
 class ColumnField;
 
+class InsertColumn;
+
 class ImportOption;
 
 class ExportOption;
@@ -351,6 +354,8 @@ class InsertRequest;
 
 class ImportRequest;
 
+class UploadFileChunkRequest;
+
 class ExportRequest;
 
 class ExplainRequest;
@@ -361,6 +366,10 @@ class SelectRequest;
 
 class SelectResponse;
 
+class SelectBatchRequest;
+
+class SelectBatchResponse;
+
 class DeleteRequest;
 
 class UpdateRequest;
@@ -1062,7 +1071,7 @@ void swap(ColumnExpr &a, ColumnExpr &b);
 std::ostream& operator<<(std::ostream& out, const ColumnExpr& obj);
 
 typedef struct _EmbeddingData__isset {
-  _EmbeddingData__isset() : bool_array_value(false), u8_array_value(false), i8_array_value(false), i16_array_value(false), i32_array_value(false), i64_array_value(false), f32_array_value(false), f64_array_value(false), f16_array_value(false), bf16_array_value(false) {}
+  _EmbeddingData__isset() : bool_array_value(false), u8_array_value(false), i8_array_value(false), i16_array_value(false), i32_array_value(false), i64_array_value(false), f32_array_value(false), f64_array_value(false), f16_array_value(false), bf16_array_value(false), packed_value(false) {}
   bool bool_array_value :1;
   bool u8_array_value :1;
   bool i8_array_value :1;
@@ -1073,6 +1082,7 @@ typedef struct _EmbeddingData__isset {
   bool f64_array_value :1;
   bool f16_array_value :1;
   bool bf16_array_value :1;
+  bool packed_value :1;
 } _EmbeddingData__isset;
 
 class EmbeddingData : public virtual ::apache::thrift::TBase {
@@ -1080,7 +1090,8 @@ class EmbeddingData : public virtual ::apache::thrift::TBase {
 
   EmbeddingData(const EmbeddingData&);
   EmbeddingData& operator=(const EmbeddingData&);
-  EmbeddingData() noexcept {
+  EmbeddingData() noexcept
+                : packed_value() {
   }
 
   virtual ~EmbeddingData() noexcept;
@@ -1094,6 +1105,7 @@ class EmbeddingData : public virtual ::apache::thrift::TBase {
   std::vector<double>  f64_array_value;
   std::vector<double>  f16_array_value;
   std::vector<double>  bf16_array_value;
+  std::string packed_value;
 
   _EmbeddingData__isset __isset;
 
@@ -1117,6 +1129,8 @@ class EmbeddingData : public virtual ::apache::thrift::TBase {
 
   void __set_bf16_array_value(const std::vector<double> & val);
 
+  void __set_packed_value(const std::string& val);
+
   bool operator == (const EmbeddingData & rhs) const
   {
     if (__isset.bool_array_value != rhs.__isset.bool_array_value)
@@ -1159,6 +1173,10 @@ class EmbeddingData : public virtual ::apache::thrift::TBase {
       return false;
     else if (__isset.bf16_array_value && !(bf16_array_value == rhs.bf16_array_value))
       return false;
+    if (__isset.packed_value != rhs.__isset.packed_value)
+      return false;
+    else if (__isset.packed_value && !(packed_value == rhs.packed_value))
+      return false;
     return true;
   }
   bool operator != (const EmbeddingData &rhs) const {
@@ -2205,6 +2223,85 @@ void swap(ColumnField &a, ColumnField &b);
 
 std::ostream& operator<<(std::ostream& out, const ColumnField& obj);
 
+typedef struct _InsertColumn__isset {
+  _InsertColumn__isset() : column_name(false), column_type(false), element_type(false), dimension(false), column_vector(false) {}
+  bool column_name :1;
+  bool column_type :1;
+  bool element_type :1;
+  bool dimension :1;
+  bool column_vector :1;
+} _InsertColumn__isset;
+
+class InsertColumn : public virtual ::apache::thrift::TBase {
+ public:
+
+  InsertColumn(const InsertColumn&);
+  InsertColumn& operator=(const InsertColumn&);
+  InsertColumn() noexcept
+               : column_name(),
+                 column_type(static_cast<ColumnType::type>(0)),
+                 element_type(static_cast<ElementType::type>(0)),
+                 dimension(0),
+                 column_vector() {
+  }
+
+  virtual ~InsertColumn() noexcept;
+  std::string column_name;
+  /**
+   * 
+   * @see ColumnType
+   */
+  ColumnType::type column_type;
+  /**
+   * 
+   * @see ElementType
+   */
+  ElementType::type element_type;
+  int32_t dimension;
+  std::string column_vector;
+
+  _InsertColumn__isset __isset;
+
+  void __set_column_name(const std::string& val);
+
+  void __set_column_type(const ColumnType::type val);
+
+  void __set_element_type(const ElementType::type val);
+
+  void __set_dimension(const int32_t val);
+
+  void __set_column_vector(const std::string& val);
+
+  bool operator == (const InsertColumn & rhs) const
+  {
+    if (!(column_name == rhs.column_name))
+      return false;
+    if (!(column_type == rhs.column_type))
+      return false;
+    if (!(element_type == rhs.element_type))
+      return false;
+    if (!(dimension == rhs.dimension))
+      return false;
+    if (!(column_vector == rhs.column_vector))
+      return false;
+    return true;
+  }
+  bool operator != (const InsertColumn &rhs) const {
+    return !(*this == rhs);
+  }
+
+  bool operator < (const InsertColumn & ) const;
+
+  uint32_t read(::apache::thrift::protocol::TProtocol* iprot) override;
+  uint32_t write(::apache::thrift::protocol::TProtocol* oprot) const override;
+
+  virtual void printTo(std::ostream& out) const;
+};
+
+void swap(InsertColumn &a, InsertColumn &b);
+
+std::ostream& operator<<(std::ostream& out, const InsertColumn& obj);
+
 typedef struct _ImportOption__isset {
   _ImportOption__isset() : delimiter(false), has_header(false), copy_file_type(false) {}
   bool delimiter :1;
@@ -3996,12 +4093,13 @@ void swap(DropTableRequest &a, DropTableRequest &b);
 std::ostream& operator<<(std::ostream& out, const DropTableRequest& obj);
 
 typedef struct _InsertRequest__isset {
-  _InsertRequest__isset() : db_name(false), table_name(false), column_names(true), fields(true), session_id(false) {}
+  _InsertRequest__isset() : db_name(false), table_name(false), column_names(true), fields(true), session_id(false), columns(true) {}
   bool db_name :1;
   bool table_name :1;
   bool column_names :1;
   bool fields :1;
   bool session_id :1;
+  bool columns :1;
 } _InsertRequest__isset;
 
 class InsertRequest : public virtual ::apache::thrift::TBase {
@@ -4015,6 +4113,7 @@ class InsertRequest : public virtual ::apache::thrift::TBase {
                   session_id(0) {
 
 
+
   }
 
   virtual ~InsertRequest() noexcept;
@@ -4023,6 +4122,7 @@ class InsertRequest : public virtual ::apache::thrift::TBase {
   std::vector<std::string>  column_names;
   std::vector<Field>  fields;
   int64_t session_id;
+  std::vector<InsertColumn>  columns;
 
   _InsertRequest__isset __isset;
 
@@ -4036,6 +4136,8 @@ class InsertRequest : public virtual ::apache::thrift::TBase {
 
   void __set_session_id(const int64_t val);
 
+  void __set_columns(const std::vector<InsertColumn> & val);
+
   bool operator == (const InsertRequest & rhs) const
   {
     if (!(db_name == rhs.db_name))
@@ -4048,6 +4150,8 @@ class InsertRequest : public virtual ::apache::thrift::TBase {
       return false;
     if (!(session_id == rhs.session_id))
       return false;
+    if (!(columns == rhs.columns))
+      return false;
     return true;
   }
   bool operator != (const InsertRequest &rhs) const {
@@ -4067,12 +4171,13 @@ void swap(InsertRequest &a, InsertRequest &b);
 std::ostream& operator<<(std::ostream& out, const InsertRequest& obj);
 
 typedef struct _ImportRequest__isset {
-  _ImportRequest__isset() : db_name(false), table_name(false), file_name(false), import_option(false), session_id(false) {}
+  _ImportRequest__isset() : db_name(false), table_name(false), file_name(false), import_option(false), session_id(false), uploaded(true) {}
   bool db_name :1;
   bool table_name :1;
   bool file_name :1;
   bool import_option :1;
   bool session_id :1;
+  bool uploaded :1;
 } _ImportRequest__isset;
 
 class ImportRequest : public virtual ::apache::thrift::TBase {
@@ -4084,7 +4189,8 @@ class ImportRequest : public virtual ::apache::thrift::TBase {
                 : db_name(),
                   table_name(),
                   file_name(),
-                  session_id(0) {
+                  session_id(0),
+                  uploaded(false) {
   }
 
   virtual ~ImportRequest() noexcept;
@@ -4093,6 +4199,7 @@ class ImportRequest : public virtual ::apache::thrift::TBase {
   std::string file_name;
   ImportOption import_option;
   int64_t session_id;
+  bool uploaded;
 
   _ImportRequest__isset __isset;
 
@@ -4106,6 +4213,8 @@ class ImportRequest : public virtual ::apache::thrift::TBase {
 
   void __set_session_id(const int64_t val);
 
+  void __set_uploaded(const bool val);
+
   bool operator == (const ImportRequest & rhs) const
   {
     if (!(db_name == rhs.db_name))
@@ -4118,6 +4227,8 @@ class ImportRequest : public virtual ::apache::thrift::TBase {
       return false;
     if (!(session_id == rhs.session_id))
       return false;
+    if (!(uploaded == rhs.uploaded))
+      return false;
     return true;
   }
   bool operator != (const ImportRequest &rhs) const {
@@ -4136,6 +4247,70 @@ void swap(ImportRequest &a, ImportRequest &b);
 
 std::ostream& operator<<(std::ostream& out, const ImportRequest& obj);
 
+typedef struct _UploadFileChunkRequest__isset {
+  _UploadFileChunkRequest__isset() : session_id(false), file_name(false), offset(false), data(false) {}
+  bool session_id :1;
+  bool file_name :1;
+  bool offset :1;
+  bool data :1;
+} _UploadFileChunkRequest__isset;
+
+class UploadFileChunkRequest : public virtual ::apache::thrift::TBase {
+ public:
+
+  UploadFileChunkRequest(const UploadFileChunkRequest&);
+  UploadFileChunkRequest& operator=(const UploadFileChunkRequest&);
+  UploadFileChunkRequest() noexcept
+                         : session_id(0),
+                           file_name(),
+                           offset(0),
+                           data() {
+  }
+
+  virtual ~UploadFileChunkRequest() noexcept;
+  int64_t session_id;
+  std::string file_name;
+  int64_t offset;
+  std::string data;
+
+  _UploadFileChunkRequest__isset __isset;
+
+  void __set_session_id(const int64_t val);
+
+  void __set_file_name(const std::string& val);
+
+  void __set_offset(const int64_t val);
+
+  void __set_data(const std::string& val);
+
+  bool operator == (const UploadFileChunkRequest & rhs) const
+  {
+    if (!(session_id == rhs.session_id))
+      return false;
+    if (!(file_name == rhs.file_name))
+      return false;
+    if (!(offset == rhs.offset))
+      return false;
+    if (!(data == rhs.data))
+      return false;
+    return true;
+  }
+  bool operator != (const UploadFileChunkRequest &rhs) const {
+    return !(*this == rhs);
+  }
+
+  bool operator < (const UploadFileChunkRequest & ) const;
+
+  uint32_t read(::apache::thrift::protocol::TProtocol* iprot) override;
+  uint32_t write(::apache::thrift::protocol::TProtocol* oprot) const override;
+
+  virtual void printTo(std::ostream& out) const;
+};
+
+void swap(UploadFileChunkRequest &a, UploadFileChunkRequest &b);
+
+std::ostream& operator<<(std::ostream& out, const UploadFileChunkRequest& obj);
+
 typedef struct _ExportRequest__isset {
   _ExportRequest__isset() : db_name(false), table_name(false), columns(false), file_name(false), export_option(false), session_id(false) {}
   bool db_name :1;
@@ -4595,6 +4770,126 @@ void swap(SelectResponse &a, SelectResponse &b);
 
 std::ostream& operator<<(std::ostream& out, const SelectResponse& obj);
 
+typedef struct _SelectBatchRequest__isset {
+  _SelectBatchRequest__isset() : session_id(false), query(false), match_index(false), embeddings(true) {}
+  bool session_id :1;
+  bool query :1;
+  bool match_index :1;
+  bool embeddings :1;
+} _SelectBatchRequest__isset;
+
+class SelectBatchRequest : public virtual ::apache::thrift::TBase {
+ public:
+
+  SelectBatchRequest(const SelectBatchRequest&);
+  SelectBatchRequest& operator=(const SelectBatchRequest&);
+  SelectBatchRequest() noexcept
+                     : session_id(0),
+                       match_index(0) {
+
+  }
+
+  virtual ~SelectBatchRequest() noexcept;
+  int64_t session_id;
+  SelectRequest query;
+  int32_t match_index;
+  std::vector<EmbeddingData>  embeddings;
+
+  _SelectBatchRequest__isset __isset;
+
+  void __set_session_id(const int64_t val);
+
+  void __set_query(const SelectRequest& val);
+
+  void __set_match_index(const int32_t val);
+
+  void __set_embeddings(const std::vector<EmbeddingData> & val);
+
+  bool operator == (const SelectBatchRequest & rhs) const
+  {
+    if (!(session_id == rhs.session_id))
+      return false;
+    if (!(query == rhs.query))
+      return false;
+    if (!(match_index == rhs.match_index))
+      return false;
+    if (!(embeddings == rhs.embeddings))
+      return false;
+    return true;
+  }
+  bool operator != (const SelectBatchRequest &rhs) const {
+    return !(*this == rhs);
+  }
+
+  bool operator < (const SelectBatchRequest & ) const;
+
+  uint32_t read(::apache::thrift::protocol::TProtocol* iprot) override;
+  uint32_t write(::apache::thrift::protocol::TProtocol* oprot) const override;
+
+  virtual void printTo(std::ostream& out) const;
+};
+
+void swap(SelectBatchRequest &a, SelectBatchRequest &b);
+
+std::ostream& operator<<(std::ostream& out, const SelectBatchRequest& obj);
+
+typedef struct _SelectBatchResponse__isset {
+  _SelectBatchResponse__isset() : error_code(false), error_msg(false), results(true) {}
+  bool error_code :1;
+  bool error_msg :1;
+  bool results :1;
+} _SelectBatchResponse__isset;
+
+class SelectBatchResponse : public virtual ::apache::thrift::TBase {
+ public:
+
+  SelectBatchResponse(const SelectBatchResponse&);
+  SelectBatchResponse& operator=(const SelectBatchResponse&);
+  SelectBatchResponse() noexcept
+                      : error_code(0),
+                        error_msg() {
+
+  }
+
+  virtual ~SelectBatchResponse() noexcept;
+  int64_t error_code;
+  std::string error_msg;
+  std::vector<SelectResponse>  results;
+
+  _SelectBatchResponse__isset __isset;
+
+  void __set_error_code(const int64_t val);
+
+  void __set_error_msg(const std::string& val);
+
+  void __set_results(const std::vector<SelectResponse> & val);
+
+  bool operator == (const SelectBatchResponse & rhs) const
+  {
+    if (!(error_code == rhs.error_code))
+      return false;
+    if (!(error_msg == rhs.error_msg))
+      return false;
+    if (!(results == rhs.results))
+      return false;
+    return true;
+  }
+  bool operator != (const SelectBatchResponse &rhs) const {
+    return !(*this == rhs);
+  }
+
+  bool operator < (const SelectBatchResponse & ) const;
+
+  uint32_t read(::apache::thrift::protocol::TProtocol* iprot) override;
+  uint32_t write(::apache::thrift::protocol::TProtocol* oprot) const override;
+
+  virtual void printTo(std::ostream& out) const;
+};
+
+void swap(SelectBatchResponse &a, SelectBatchResponse &b);
+
+std::ostream& operator<<(std::ostream& out, const SelectBatchResponse& obj);
+
 typedef struct _DeleteRequest__isset {
   _DeleteRequest__isset() : db_name(false), table_name(false), where_expr(false), session_id(false) {}
   bool db_name :1;
@@ -92,6 +92,9 @@ Pair<const char*, Status> ClientVersions::GetVersionByIndex(i64 version_index) {
 
 std::mutex InfinityThriftService::infinity_session_map_mutex_;
 HashMap<u64, SharedPtr<Infinity>> InfinityThriftService::infinity_session_map_;
+std::mutex InfinityThriftService::upload_mutex_;
+i64 InfinityThriftService::upload_bytes_ = 0;
+HashMap<i64, i64> InfinityThriftService::upload_session_bytes_;
 ClientVersions InfinityThriftService::client_version_;
 
 void InfinityThriftService::Connect(infinity_thrift_rpc::CommonResponse &response, const infinity_thrift_rpc::ConnectRequest& request) {
@@ -128,6 +131,13 @@ void InfinityThriftService::Connect(infinity_thrift_rpc::CommonResponse &respons
 void InfinityThriftService::Disconnect(infinity_thrift_rpc::CommonResponse &response, const infinity_thrift_rpc::CommonRequest &request) {
     auto status = GetAndRemoveSessionID(request.session_id);
     if (status.ok()) {
+        // files uploaded but never imported by this session
+        LocalFileSystem fs;
+        String upload_dir = GetUploadDir(request.session_id);
+        if (fs.Exists(upload_dir)) {
+            fs.DeleteDirectory(upload_dir);
+        }
+        ReleaseSessionUploads(request.session_id);
         response.__set_error_code((i64)(status.code()));
         LOG_TRACE(fmt::format("THRIFT: Disconnect session {} success", request.session_id));
     } else {
@@ -279,6 +289,18 @@ void InfinityThriftService::Insert(infinity_thrift_rpc::CommonResponse &response
         return;
     }
 
+    if (!request.columns.empty()) {
+        // columnar insert: every column arrives as one packed buffer
+        auto [columns, values, status] = GetInsertValuesFromColumns(request.columns);
+        if (!status.ok()) {
+            ProcessStatus(response, status);
+            return;
+        }
+        auto result = infinity->Insert(request.db_name, request.table_name, columns, values);
+        ProcessQueryResult(response, result);
+        return;
+    }
+
     if (request.fields.empty()) {
         ProcessStatus(response, Status::InsertWithoutValues());
         return;
@@ -354,6 +376,8 @@ Tuple<CopyFileType, Status> InfinityThriftService::GetCopyFileType(infinity_thri
             return {CopyFileType::kCSR, Status::OK()};
         case infinity_thrift_rpc::CopyFileType::BVECS:
             return {CopyFileType::kBVECS, Status::OK()};
+        case infinity_thrift_rpc::CopyFileType::PARQUET:
+            return {CopyFileType::kPARQUET, Status::OK()};
         default: {
             return {CopyFileType::kInvalid, Status::ImportFileFormatError("Not implemented yet")};
         }
@@ -380,10 +404,80 @@ void InfinityThriftService::Import(infinity_thrift_rpc::CommonResponse &response
     }
     import_options.delimiter_ = delimiter_string[0];
 
-    const QueryResult result = infinity->Import(request.db_name, request.table_name, request.file_name.c_str(), import_options);
+    String file_path = request.file_name;
+    if (request.uploaded) {
+        auto [upload_file_path, path_status] = GetUploadFilePath(request.session_id, request.file_name);
+        if (!path_status.ok()) {
+            ProcessStatus(response, path_status);
+            return;
+        }
+        file_path = upload_file_path;
+    }
+
+    const QueryResult result = infinity->Import(request.db_name, request.table_name, file_path.c_str(), import_options);
+    if (request.uploaded) {
+        // an uploaded file is imported once, whether the import succeeds or not
+        LocalFileSystem fs;
+        if (fs.Exists(file_path)) {
+            ReleaseUpload(request.session_id, LocalFileSystem::GetFileSizeByPath(file_path));
+            fs.DeleteFile(file_path);
+        }
+    }
     ProcessQueryResult(response, result);
 }
 
+void InfinityThriftService::UploadFileChunk(infinity_thrift_rpc::CommonResponse &response,
+                                            const infinity_thrift_rpc::UploadFileChunkRequest &request) {
+    auto [infinity, infinity_status] = GetInfinityBySessionID(request.session_id);
+    if (!infinity_status.ok()) {
+        ProcessStatus(response, infinity_status);
+        return;
+    }
+
+    auto [file_path, path_status] = GetUploadFilePath(request.session_id, request.file_name);
+    if (!path_status.ok()) {
+        ProcessStatus(response, path_status);
+        return;
+    }
+
+    LocalFileSystem fs;
+    if (request.offset == 0) {
+        // the first chunk starts the file over
+        fs.CreateDirectoryNoExp(GetUploadDir(request.session_id));
+        if (fs.Exists(file_path)) {
+            ReleaseUpload(request.session_id, LocalFileSystem::GetFileSizeByPath(file_path));
+            fs.DeleteFile(file_path);
+        }
+    } else if (!fs.Exists(file_path)) {
+        ProcessStatus(response, Status::FileNotFound(request.file_name));
+        return;
+    }
+
+    auto [file_handler, status] = fs.OpenFile(file_path, FileFlags::WRITE_FLAG | FileFlags::CREATE_FLAG, FileLockType::kWriteLock);
+    if (!status.ok()) {
+        ProcessStatus(response, status);
+        return;
+    }
+
+    // chunks are appended in order, so a chunk must start where the file ends
+    i64 file_size = fs.GetFileSize(*file_handler);
+    if (file_size != request.offset) {
+        fs.Close(*file_handler);
+        ProcessStatus(response, Status::InvalidParameterValue("offset", std::to_string(request.offset), std::to_string(file_size)));
+        return;
+    }
+    // counted before it is written, so that concurrent uploads can't go past the limit together
+    Status reserve_status = ReserveUpload(request.session_id, request.data.size());
+    if (!reserve_status.ok()) {
+        fs.Close(*file_handler);
+        ProcessStatus(response, reserve_status);
+        return;
+    }
+    fs.WriteAt(*file_handler, request.offset, request.data.data(), request.data.size());
+    fs.Close(*file_handler);
+    response.__set_error_code((i64)(ErrorCode::kOk));
+}
+
 void InfinityThriftService::Export(infinity_thrift_rpc::CommonResponse &response, const infinity_thrift_rpc::ExportRequest &request) {
     auto [infinity, infinity_status] = GetInfinityBySessionID(request.session_id);
     if (!infinity_status.ok()) {
@@ -613,6 +707,36 @@ void InfinityThriftService::Select(infinity_thrift_rpc::SelectResponse &response
     // }
 }
 
+void InfinityThriftService::SelectBatch(infinity_thrift_rpc::SelectBatchResponse &response,
+                                        const infinity_thrift_rpc::SelectBatchRequest &request) {
+    // the query is run once per embedding, as the one of its dense match expression at match_index, the first
+    // failed query fails the request. The queries run one after another, each with its own plan and scan.
+    const auto &match_exprs = request.query.search_expr.match_exprs;
+    if (!request.query.__isset.search_expr or request.match_index < 0 or (SizeT)request.match_index >= match_exprs.size() or
+        !match_exprs[request.match_index].__isset.match_vector_expr) {
+        ProcessStatus(response,
+                      Status::InvalidParameterValue("match_index", std::to_string(request.match_index), "the index of a match_dense expression"));
+        return;
+    }
+
+    infinity_thrift_rpc::SelectRequest query = request.query;
+    query.__set_session_id(request.session_id);
+    auto &knn_expr = query.search_expr.match_exprs[request.match_index].match_vector_expr;
+    response.results.resize(request.embeddings.size());
+    for (SizeT idx = 0; idx < request.embeddings.size(); ++idx) {
+        knn_expr.__set_embedding_data(request.embeddings[idx]);
+        auto &result = response.results[idx];
+        Select(result, query);
+        if (result.error_code != (i64)(ErrorCode::kOk)) {
+            response.__set_error_code(result.error_code);
+            response.__set_error_msg(result.error_msg);
+            response.results.clear();
+            return;
+        }
+    }
+    response.__set_error_code((i64)(ErrorCode::kOk));
+}
+
 void InfinityThriftService::Explain(infinity_thrift_rpc::SelectResponse &response, const infinity_thrift_rpc::ExplainRequest &request) {
     auto [infinity, infinity_status] = GetInfinityBySessionID(request.session_id);
     if (!infinity_status.ok()) {
@@ -1434,6 +1558,56 @@ Status InfinityThriftService::GetAndRemoveSessionID(i64 session_id) {
     return Status::OK();
 }
 
+String InfinityThriftService::GetUploadDir(i64 session_id) {
+    return fmt::format("{}/upload/{}", InfinityContext::instance().config()->TempDir(), session_id);
+}
+
+Tuple<String, Status> InfinityThriftService::GetUploadFilePath(i64 session_id, const String &file_name) {
+    // uploaded files live in a directory of their session, so the name can't contain a path
+    if (file_name.empty() || file_name == "." || file_name == ".." || file_name.find('/') != String::npos) {
+        return {String(), Status::InvalidParameterValue("file_name", file_name, "a file name without directories")};
+    }
+    return {fmt::format("{}/{}", GetUploadDir(session_id), file_name), Status::OK()};
+}
+
+Status InfinityThriftService::ReserveUpload(i64 session_id, i64 size) {
+    i64 upload_size_limit = InfinityContext::instance().config()->UploadSizeLimit();
+    std::lock_guard<std::mutex> lock(upload_mutex_);
+    if (upload_bytes_ + size > upload_size_limit) {
+        return Status::DiskFull(fmt::format("{} bytes of uploaded files aren't imported yet, {} more would exceed upload_size_limit: {}",
+                                            upload_bytes_,
+                                            size,
+                                            upload_size_limit));
+    }
+    upload_bytes_ += size;
+    upload_session_bytes_[session_id] += size;
+    return Status::OK();
+}
+
+void InfinityThriftService::ReleaseUpload(i64 session_id, i64 size) {
+    std::lock_guard<std::mutex> lock(upload_mutex_);
+    auto iter = upload_session_bytes_.find(session_id);
+    if (iter == upload_session_bytes_.end()) {
+        return;
+    }
+    size = std::min(size, iter->second);
+    iter->second -= size;
+    upload_bytes_ -= size;
+    if (iter->second == 0) {
+        upload_session_bytes_.erase(iter);
+    }
+}
+
+void InfinityThriftService::ReleaseSessionUploads(i64 session_id) {
+    std::lock_guard<std::mutex> lock(upload_mutex_);
+    auto iter = upload_session_bytes_.find(session_id);
+    if (iter == upload_session_bytes_.end()) {
+        return;
+    }
+    upload_bytes_ -= iter->second;
+    upload_session_bytes_.erase(iter);
+}
+
 Tuple<ColumnDef *, Status> InfinityThriftService::GetColumnDefFromProto(const infinity_thrift_rpc::ColumnDef &column_def) {
     auto column_def_data_type_ptr = GetColumnTypeFromProto(column_def.data_type);
     if (column_def_data_type_ptr->type() == infinity::LogicalType::kInvalid) {
@@ -1595,6 +1769,297 @@ IndexType InfinityThriftService::GetIndexTypeFromProto(const infinity_thrift_rpc
     return IndexType::kInvalid;
 }
 
+template <typename T>
+T ReadInsertValue(const String &column_vector, SizeT idx) {
+    T value;
+    std::memcpy(&value, column_vector.data() + idx * sizeof(T), sizeof(T));
+    return value;
+}
+
+template <typename T>
+ConstantExpr *GetIntegerArrayFromInsertColumn(const String &column_vector, SizeT begin, SizeT dimension) {
+    auto parsed_expr = new ConstantExpr(LiteralType::kIntegerArray);
+    parsed_expr->long_array_.reserve(dimension);
+    for (SizeT i = 0; i < dimension; ++i) {
+        parsed_expr->long_array_.emplace_back(ReadInsertValue<T>(column_vector, begin + i));
+    }
+    return parsed_expr;
+}
+
+template <typename T>
+ConstantExpr *GetDoubleArrayFromInsertColumn(const String &column_vector, SizeT begin, SizeT dimension) {
+    auto parsed_expr = new ConstantExpr(LiteralType::kDoubleArray);
+    parsed_expr->double_array_.reserve(dimension);
+    for (SizeT i = 0; i < dimension; ++i) {
+        parsed_expr->double_array_.emplace_back(ReadInsertValue<T>(column_vector, begin + i));
+    }
+    return parsed_expr;
+}
+
+// A sparse column is i64 row count, i64 indptr[row count + 1], i64 indices[nnz] and nnz values, the layout of a .csr file
+template <typename T, typename SparseArray>
+void ReadSparseRowFromInsertColumn(const String &column_vector, SizeT row_idx, SparseArray &sparse_array) {
+    const SizeT row_count = ReadInsertValue<i64>(column_vector, 0);
+    const SizeT begin = ReadInsertValue<i64>(column_vector, 1 + row_idx);
+    const SizeT end = ReadInsertValue<i64>(column_vector, 2 + row_idx);
+    const SizeT nnz = ReadInsertValue<i64>(column_vector, 1 + row_count);
+    const SizeT indices_idx = 2 + row_count;
+    const SizeT values_idx = (indices_idx + nnz) * sizeof(i64) / sizeof(T);
+    sparse_array.first.reserve(end - begin);
+    sparse_array.second.reserve(end - begin);
+    for (SizeT i = begin; i < end; ++i) {
+        sparse_array.first.emplace_back(ReadInsertValue<i64>(column_vector, indices_idx + i));
+        sparse_array.second.emplace_back(ReadInsertValue<T>(column_vector, values_idx + i));
+    }
+}
+
+SizeT InfinityThriftService::GetInsertColumnRowSize(const infinity_thrift_rpc::InsertColumn &insert_column) {
+    switch (insert_column.column_type) {
+        case infinity_thrift_rpc::ColumnType::ColumnBool:
+        case infinity_thrift_rpc::ColumnType::ColumnInt8:
+            return 1;
+        case infinity_thrift_rpc::ColumnType::ColumnInt16:
+            return 2;
+        case infinity_thrift_rpc::ColumnType::ColumnInt32:
+        case infinity_thrift_rpc::ColumnType::ColumnFloat32:
+            return 4;
+        case infinity_thrift_rpc::ColumnType::ColumnInt64:
+        case infinity_thrift_rpc::ColumnType::ColumnFloat64:
+            return 8;
+        case infinity_thrift_rpc::ColumnType::ColumnEmbedding: {
+            if (insert_column.dimension <= 0) {
+                return 0;
+            }
+            switch (insert_column.element_type) {
+                case infinity_thrift_rpc::ElementType::ElementInt8:
+                case infinity_thrift_rpc::ElementType::ElementUInt8:
+                    return insert_column.dimension;
+                case infinity_thrift_rpc::ElementType::ElementInt16:
+                    return 2 * insert_column.dimension;
+                case infinity_thrift_rpc::ElementType::ElementInt32:
+                case infinity_thrift_rpc::ElementType::ElementFloat32:
+                    return 4 * insert_column.dimension;
+                case infinity_thrift_rpc::ElementType::ElementInt64:
+                case infinity_thrift_rpc::ElementType::ElementFloat64:
+                    return 8 * insert_column.dimension;
+                default:
+                    return 0;
+            }
+        }
+        default:
+            return 0;
+    }
+}
+
+ConstantExpr *InfinityThriftService::GetConstantFromInsertColumn(const infinity_thrift_rpc::InsertColumn &insert_column, SizeT row_idx) {
+    const String &column_vector = insert_column.column_vector;
+    switch (insert_column.column_type) {
+        case infinity_thrift_rpc::ColumnType::ColumnBool: {
+            auto parsed_expr = new ConstantExpr(LiteralType::kBoolean);
+            parsed_expr->bool_value_ = ReadInsertValue<u8>(column_vector, row_idx) != 0;
+            return parsed_expr;
+        }
+        case infinity_thrift_rpc::ColumnType::ColumnInt8: {
+            auto parsed_expr = new ConstantExpr(LiteralType::kInteger);
+            parsed_expr->integer_value_ = ReadInsertValue<i8>(column_vector, row_idx);
+            return parsed_expr;
+        }
+        case infinity_thrift_rpc::ColumnType::ColumnInt16: {
+            auto parsed_expr = new ConstantExpr(LiteralType::kInteger);
+            parsed_expr->integer_value_ = ReadInsertValue<i16>(column_vector, row_idx);
+            return parsed_expr;
+        }
+        case infinity_thrift_rpc::ColumnType::ColumnInt32: {
+            auto parsed_expr = new ConstantExpr(LiteralType::kInteger);
+            parsed_expr->integer_value_ = ReadInsertValue<i32>(column_vector, row_idx);
+            return parsed_expr;
+        }
+        case infinity_thrift_rpc::ColumnType::ColumnInt64: {
+            auto parsed_expr = new ConstantExpr(LiteralType::kInteger);
+            parsed_expr->integer_value_ = ReadInsertValue<i64>(column_vector, row_idx);
+            return parsed_expr;
+        }
+        case infinity_thrift_rpc::ColumnType::ColumnFloat32: {
+            auto parsed_expr = new ConstantExpr(LiteralType::kDouble);
+            parsed_expr->double_value_ = ReadInsertValue<f32>(column_vector, row_idx);
+            return parsed_expr;
+        }
+        case infinity_thrift_rpc::ColumnType::ColumnFloat64: {
+            auto parsed_expr = new ConstantExpr(LiteralType::kDouble);
+            parsed_expr->double_value_ = ReadInsertValue<f64>(column_vector, row_idx);
+            return parsed_expr;
+        }
+        case infinity_thrift_rpc::ColumnType::ColumnEmbedding: {
+            const SizeT dimension = insert_column.dimension;
+            const SizeT begin = row_idx * dimension;
+            switch (insert_column.element_type) {
+                case infinity_thrift_rpc::ElementType::ElementInt8:
+                    return GetIntegerArrayFromInsertColumn<i8>(column_vector, begin, dimension);
+                case infinity_thrift_rpc::ElementType::ElementUInt8:
+                    return GetIntegerArrayFromInsertColumn<u8>(column_vector, begin, dimension);
+                case infinity_thrift_rpc::ElementType::ElementInt16:
+                    return GetIntegerArrayFromInsertColumn<i16>(column_vector, begin, dimension);
+                case infinity_thrift_rpc::ElementType::ElementInt32:
+                    return GetIntegerArrayFromInsertColumn<i32>(column_vector, begin, dimension);
+                case infinity_thrift_rpc::ElementType::ElementInt64:
+                    return GetIntegerArrayFromInsertColumn<i64>(column_vector, begin, dimension);
+                case infinity_thrift_rpc::ElementType::ElementFloat32:
+                    return GetDoubleArrayFromInsertColumn<f32>(column_vector, begin, dimension);
+                case infinity_thrift_rpc::ElementType::ElementFloat64:
+                    return GetDoubleArrayFromInsertColumn<f64>(column_vector, begin, dimension);
+                default:
+                    return nullptr;
+            }
+        }
+        case infinity_thrift_rpc::ColumnType::ColumnSparse: {
+            switch (insert_column.element_type) {
+                case infinity_thrift_rpc::ElementType::ElementInt64: {
+                    auto parsed_expr = new ConstantExpr(LiteralType::kLongSparseArray);
+                    ReadSparseRowFromInsertColumn<i64>(column_vector, row_idx, parsed_expr->long_sparse_array_);
+                    return parsed_expr;
+                }
+                case infinity_thrift_rpc::ElementType::ElementFloat32: {
+                    auto parsed_expr = new ConstantExpr(LiteralType::kDoubleSparseArray);
+                    ReadSparseRowFromInsertColumn<f32>(column_vector, row_idx, parsed_expr->double_sparse_array_);
+                    return parsed_expr;
+                }
+                case infinity_thrift_rpc::ElementType::ElementFloat64: {
+                    auto parsed_expr = new ConstantExpr(LiteralType::kDoubleSparseArray);
+                    ReadSparseRowFromInsertColumn<f64>(column_vector, row_idx, parsed_expr->double_sparse_array_);
+                    return parsed_expr;
+                }
+                default:
+                    return nullptr;
+            }
+        }
+        default:
+            return nullptr;
+    }
+}
+
+SizeT InfinityThriftService::GetInsertSparseRowCount(const infinity_thrift_rpc::InsertColumn &insert_column) {
+    SizeT value_size = 0;
+    switch (insert_column.element_type) {
+        case infinity_thrift_rpc::ElementType::ElementFloat32:
+            value_size = 4;
+            break;
+        case infinity_thrift_rpc::ElementType::ElementInt64:
+        case infinity_thrift_rpc::ElementType::ElementFloat64:
+            value_size = 8;
+            break;
+        default:
+            return std::numeric_limits<SizeT>::max();
+    }
+    // i64 row count, i64 indptr[row count + 1], i64 indices[nnz] and nnz values, the indptr starts at 0 and never decreases
+    const String &column_vector = insert_column.column_vector;
+    const SizeT i64_count = column_vector.size() / sizeof(i64);
+    if (i64_count < 2) {
+        return std::numeric_limits<SizeT>::max();
+    }
+    const i64 row_count = ReadInsertValue<i64>(column_vector, 0);
+    if (row_count < 0 || static_cast<SizeT>(row_count) + 2 > i64_count || ReadInsertValue<i64>(column_vector, 1) != 0) {
+        return std::numeric_limits<SizeT>::max();
+    }
+    i64 nnz = 0;
+    for (i64 row_idx = 0; row_idx < row_count; ++row_idx) {
+        const i64 end = ReadInsertValue<i64>(column_vector, 2 + row_idx);
+        if (end < nnz || static_cast<SizeT>(end) > i64_count) {
+            return std::numeric_limits<SizeT>::max();
+        }
+        nnz = end;
+    }
+    if (column_vector.size() != (row_count + 2 + nnz) * sizeof(i64) + nnz * value_size) {
+        return std::numeric_limits<SizeT>::max();
+    }
+    return row_count;
+}
+
+Tuple<Vector<String> *, Vector<Vector<ParsedExpr *> *> *, Status>
+InfinityThriftService::GetInsertValuesFromColumns(const Vector<infinity_thrift_rpc::InsertColumn> &insert_columns) {
+    // Validate every buffer and count its rows before any expression is allocated, so nothing needs to be freed on error.
+    SizeT row_count = 0;
+    Vector<Vector<Pair<SizeT, SizeT>>> varchar_spans(insert_columns.size());
+    for (SizeT column_idx = 0; column_idx < insert_columns.size(); ++column_idx) {
+        const auto &insert_column = insert_columns[column_idx];
+        const String &column_vector = insert_column.column_vector;
+        SizeT column_row_count = 0;
+        if (insert_column.column_type == infinity_thrift_rpc::ColumnType::ColumnVarchar) {
+            // u32 length prefixed strings, the same layout as the select response
+            SizeT offset = 0;
+            while (offset < column_vector.size()) {
+                if (offset + sizeof(u32) > column_vector.size()) {
+                    return {nullptr, nullptr, Status::InvalidParameterValue("InsertColumn", insert_column.column_name, "complete varchar buffer")};
+                }
+                u32 length = 0;
+                std::memcpy(&length, column_vector.data() + offset, sizeof(u32));
+                offset += sizeof(u32);
+                if (offset + length > column_vector.size()) {
+                    return {nullptr, nullptr, Status::InvalidParameterValue("InsertColumn", insert_column.column_name, "complete varchar buffer")};
+                }
+                varchar_spans[column_idx].emplace_back(offset, length);
+                offset += length;
+            }
+            column_row_count = varchar_spans[column_idx].size();
+        } else if (insert_column.column_type == infinity_thrift_rpc::ColumnType::ColumnSparse) {
+            column_row_count = GetInsertSparseRowCount(insert_column);
+            if (column_row_count == std::numeric_limits<SizeT>::max()) {
+                return {nullptr, nullptr, Status::InvalidParameterValue("InsertColumn", insert_column.column_name, "complete CSR buffer")};
+            }
+        } else {
+            SizeT row_size = GetInsertColumnRowSize(insert_column);
+            if (row_size == 0) {
+                return {nullptr, nullptr, Status::NotSupport(fmt::format("Columnar insert doesn't support the type of column {}", insert_column.column_name))};
+            }
+            if (column_vector.size() % row_size != 0) {
+                return {nullptr,
+                        nullptr,
+                        Status::InvalidParameterValue("InsertColumn", insert_column.column_name, fmt::format("buffer size divisible by {}", row_size))};
+            }
+            column_row_count = column_vector.size() / row_size;
+        }
+
+        if (column_idx == 0) {
+            row_count = column_row_count;
+        } else if (column_row_count != row_count) {
+            return {nullptr,
+                    nullptr,
+                    Status::InvalidParameterValue("InsertColumn", insert_column.column_name, fmt::format("{} rows like the first column", row_count))};
+        }
+    }
+    if (row_count == 0) {
+        return {nullptr, nullptr, Status::InsertWithoutValues()};
+    }
+
+    auto columns = new Vector<String>();
+    columns->reserve(insert_columns.size());
+    for (const auto &insert_column : insert_columns) {
+        columns->emplace_back(insert_column.column_name);
+    }
+
+    auto values = new Vector<Vector<ParsedExpr *> *>();
+    values->reserve(row_count);
+    for (SizeT row_idx = 0; row_idx < row_count; ++row_idx) {
+        auto value_list = new Vector<ParsedExpr *>();
+        value_list->reserve(insert_columns.size());
+        values->emplace_back(value_list);
+    }
+    for (SizeT column_idx = 0; column_idx < insert_columns.size(); ++column_idx) {
+        const auto &insert_column = insert_columns[column_idx];
+        for (SizeT row_idx = 0; row_idx < row_count; ++row_idx) {
+            ConstantExpr *parsed_expr = nullptr;
+            if (insert_column.column_type == infinity_thrift_rpc::ColumnType::ColumnVarchar) {
+                const auto [offset, length] = varchar_spans[column_idx][row_idx];
+                parsed_expr = new ConstantExpr(LiteralType::kString);
+                parsed_expr->str_value_ = strndup(insert_column.column_vector.data() + offset, length);
+            } else {
+                parsed_expr = GetConstantFromInsertColumn(insert_column, row_idx);
+            }
+            (*values)[row_idx]->emplace_back(parsed_expr);
+        }
+    }
+    return {columns, values, Status::OK()};
+}
+
 ConstantExpr *InfinityThriftService::GetConstantFromProto(Status &status, const infinity_thrift_rpc::ConstantExpr &expr) {
     switch (expr.literal_type) {
         case infinity_thrift_rpc::LiteralType::Boolean: {
@@ -1772,9 +2237,13 @@ KnnExpr *InfinityThriftService::GetKnnExprFromProto(Status &status, const infini
         return nullptr;
     }
 
-    auto [embedding_data_ptr, dimension, status2] = GetEmbeddingDataTypeDataPtrFromProto(expr.embedding_data);
+    auto [embedding_data_ptr, dimension, status2] = GetEmbeddingDataTypeDataPtrFromProto(expr.embedding_data, knn_expr->embedding_data_type_);
     knn_expr->embedding_data_ptr_ = embedding_data_ptr;
     knn_expr->dimension_ = dimension;
+    if (knn_expr->embedding_data_type_ == EmbeddingDataType::kElemBit) {
+        // bit queries arrive packed, 8 dimensions per byte
+        knn_expr->dimension_ *= 8;
+    }
     if (!status2.ok()) {
         if (knn_expr != nullptr) {
             delete knn_expr;
@@ -1844,13 +2313,18 @@ MatchTensorExpr *InfinityThriftService::GetMatchTensorExprFromProto(Status &stat
     match_tensor_expr->SetSearchMethodStr(expr.search_method);
     match_tensor_expr->column_expr_.reset(GetColumnExprFromProto(expr.column_expr));
     match_tensor_expr->embedding_data_type_ = GetEmbeddingDataTypeFromProto(expr.embedding_data_type);
-    auto [embedding_data_ptr, dimension, status2] = GetEmbeddingDataTypeDataPtrFromProto(expr.embedding_data);
+    auto [embedding_data_ptr, dimension, status2] =
+        GetEmbeddingDataTypeDataPtrFromProto(expr.embedding_data, match_tensor_expr->embedding_data_type_);
     if (!status2.ok()) {
         match_tensor_expr.reset();
         status = status2;
         return nullptr;
     }
     match_tensor_expr->dimension_ = dimension;
+    if (match_tensor_expr->embedding_data_type_ == EmbeddingDataType::kElemBit) {
+        // bit queries arrive packed, 8 dimensions per byte
+        match_tensor_expr->dimension_ *= 8;
+    }
     const auto copy_bytes = EmbeddingT::EmbeddingSize(match_tensor_expr->embedding_data_type_, match_tensor_expr->dimension_);
     match_tensor_expr->query_tensor_data_ptr_ = MakeUniqueForOverwrite<char[]>(copy_bytes);
     std::memcpy(match_tensor_expr->query_tensor_data_ptr_.get(), embedding_data_ptr, copy_bytes);
@@ -1963,8 +2437,20 @@ ExplainType InfinityThriftService::GetExplainTypeFromProto(const infinity_thrift
     }
 }
 
-Tuple<void *, i64, Status> InfinityThriftService::GetEmbeddingDataTypeDataPtrFromProto(const infinity_thrift_rpc::EmbeddingData &embedding_data) {
-    if (embedding_data.__isset.u8_array_value) {
+Tuple<void *, i64, Status> InfinityThriftService::GetEmbeddingDataTypeDataPtrFromProto(const infinity_thrift_rpc::EmbeddingData &embedding_data,
+                                                                                         EmbeddingDataType embedding_data_type) {
+    if (embedding_data.__isset.packed_value) {
+        // little-endian buffer in the layout of embedding_data_type, used as is
+        if (embedding_data_type == EmbeddingDataType::kElemInvalid) {
+            return {nullptr, 0, Status::InvalidEmbeddingDataType("invalid")};
+        }
+        const SizeT element_size = embedding_data_type == EmbeddingDataType::kElemBit ? 1 : EmbeddingT::EmbeddingDataWidth(embedding_data_type);
+        const auto &packed_value = embedding_data.packed_value;
+        if (packed_value.empty() || packed_value.size() % element_size != 0) {
+            return {nullptr, 0, Status::InvalidEmbeddingDataType(fmt::format("packed buffer of {} bytes", packed_value.size()))};
+        }
+        return {(void *)packed_value.data(), packed_value.size() / element_size, Status::OK()};
+    } else if (embedding_data.__isset.u8_array_value) {
         auto ptr_i16 = (int16_t *)(embedding_data.u8_array_value.data());
         auto ptr_u8 = (uint8_t *)(embedding_data.u8_array_value.data());
         for (size_t i = 0; i < embedding_data.u8_array_value.size(); ++i) {
@@ -2509,6 +2995,16 @@ void InfinityThriftService::ProcessStatus(infinity_thrift_rpc::SelectResponse &r
     }
 }
 
+void InfinityThriftService::ProcessStatus(infinity_thrift_rpc::SelectBatchResponse &response,
+                                          const Status &status,
+                                          const std::string_view error_header) {
+    response.__set_error_code((i64)(status.code()));
+    if (!status.ok()) {
+        response.__set_error_msg(status.message());
+        LOG_ERROR(fmt::format("{}: {}", error_header, status.message()));
+    }
+}
+
 void InfinityThriftService::ProcessStatus(infinity_thrift_rpc::ListDatabaseResponse &response, const Status &status, const std::string_view error_header) {
     response.__set_error_code((i64)(status.code()));
     if (!status.ok()) {
@@ -61,6 +61,10 @@ private:
 
     static std::mutex infinity_session_map_mutex_;
     static HashMap<u64, SharedPtr<Infinity>> infinity_session_map_;
+    // bytes of the uploaded files which aren't imported yet, in total and per session
+    static std::mutex upload_mutex_;
+    static i64 upload_bytes_;
+    static HashMap<i64, i64> upload_session_bytes_;
 
     static ClientVersions client_version_;
 
@@ -89,6 +93,8 @@ public:
 
     void Select(infinity_thrift_rpc::SelectResponse &response, const infinity_thrift_rpc::SelectRequest &request) final;
 
+    void SelectBatch(infinity_thrift_rpc::SelectBatchResponse &response, const infinity_thrift_rpc::SelectBatchRequest &request) final;
+
     void Explain(infinity_thrift_rpc::SelectResponse &response, const infinity_thrift_rpc::ExplainRequest &request) final;
 
     void Delete(infinity_thrift_rpc::CommonResponse &response, const infinity_thrift_rpc::DeleteRequest &request) final;
@@ -97,6 +103,8 @@ public:
 
     void Optimize(infinity_thrift_rpc::CommonResponse& response, const infinity_thrift_rpc::OptimizeRequest& request) final;
 
+    void UploadFileChunk(infinity_thrift_rpc::CommonResponse &response, const infinity_thrift_rpc::UploadFileChunkRequest &request) final;
+
     void ListDatabase(infinity_thrift_rpc::ListDatabaseResponse &response, const infinity_thrift_rpc::ListDatabaseRequest &request) final;
 
     void ListTable(infinity_thrift_rpc::ListTableResponse &response, const infinity_thrift_rpc::ListTableRequest &request) final;
@@ -136,6 +144,16 @@ private:
 
     Status GetAndRemoveSessionID(i64 session_id);
 
+    static String GetUploadDir(i64 session_id);
+
+    static Tuple<String, Status> GetUploadFilePath(i64 session_id, const String &file_name);
+
+    static Status ReserveUpload(i64 session_id, i64 size);
+
+    static void ReleaseUpload(i64 session_id, i64 size);
+
+    static void ReleaseSessionUploads(i64 session_id);
+
     static Tuple<ColumnDef *, Status> GetColumnDefFromProto(const infinity_thrift_rpc::ColumnDef &column_def);
 
     static SharedPtr<DataType> GetColumnTypeFromProto(const infinity_thrift_rpc::DataType &type);
@@ -148,6 +166,16 @@ private:
 
     static ConstantExpr *GetConstantFromProto(Status &status, const infinity_thrift_rpc::ConstantExpr &expr);
 
+    static SizeT GetInsertColumnRowSize(const infinity_thrift_rpc::InsertColumn &insert_column);
+
+    static ConstantExpr *GetConstantFromInsertColumn(const infinity_thrift_rpc::InsertColumn &insert_column, SizeT row_idx);
+
+    // the rows of a sparse insert column, SizeT max if the buffer or its element type is invalid
+    static SizeT GetInsertSparseRowCount(const infinity_thrift_rpc::InsertColumn &insert_column);
+
+    static Tuple<Vector<String> *, Vector<Vector<ParsedExpr *> *> *, Status>
+    GetInsertValuesFromColumns(const Vector<infinity_thrift_rpc::InsertColumn> &insert_columns);
+
     static ColumnExpr *GetColumnExprFromProto(const infinity_thrift_rpc::ColumnExpr &column_expr);
 
     static FunctionExpr *GetFunctionExprFromProto(Status &status, const infinity_thrift_rpc::FunctionExpr &function_expr);
@@ -170,7 +198,8 @@ private:
 
     static ExplainType GetExplainTypeFromProto(const infinity_thrift_rpc::ExplainType::type &type);
 
-    static Tuple<void *, i64, Status> GetEmbeddingDataTypeDataPtrFromProto(const infinity_thrift_rpc::EmbeddingData &embedding_data);
+    static Tuple<void *, i64, Status> GetEmbeddingDataTypeDataPtrFromProto(const infinity_thrift_rpc::EmbeddingData &embedding_data,
+                                                                          EmbeddingDataType embedding_data_type);
 
     static Tuple<UpdateExpr *, Status> GetUpdateExprFromProto(const infinity_thrift_rpc::UpdateExpr &update_expr);
 
@@ -226,6 +255,9 @@ private:
 
     static void ProcessStatus(infinity_thrift_rpc::SelectResponse &response, const Status &status, const std::string_view error_header = ErrorMsgHeader);
 
+    static void
+    ProcessStatus(infinity_thrift_rpc::SelectBatchResponse &response, const Status &status, const std::string_view error_header = ErrorMsgHeader);
+
     static void ProcessStatus(infinity_thrift_rpc::ListDatabaseResponse &response, const Status &status, const std::string_view error_header = ErrorMsgHeader);
 
     static void ProcessStatus(infinity_thrift_rpc::ListTableResponse &response, const Status &status, const std::string_view error_header = ErrorMsgHeader);
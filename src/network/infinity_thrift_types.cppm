@@ -84,6 +84,7 @@ export using infinity_thrift_rpc::ExplainType;
 export using infinity_thrift_rpc::EmbeddingData;
 export using infinity_thrift_rpc::UpdateExpr;
 export using infinity_thrift_rpc::ColumnField;
+export using infinity_thrift_rpc::InsertColumn;
 export using infinity_thrift_rpc::ColumnType;
 export using infinity_thrift_rpc::CreateConflict;
 export using infinity_thrift_rpc::DropConflict;
@@ -38,6 +38,8 @@ module thrift_server;
 
 import infinity_thrift_service;
 import infinity_thrift_types;
+import infinity_context;
+import config;
 import logger;
 import third_party;
 import stl;
@@ -61,17 +63,36 @@ public:
     void releaseHandler(infinity_thrift_rpc::InfinityServiceIf *handler) final { delete handler; }
 };
 
+// Protocol and transport of the thrift_protocol and thrift_transport configs, clients have to use the same ones
+static SharedPtr<TProtocolFactory> MakeProtocolFactory(bool strict_binary = false) {
+    String protocol = InfinityContext::instance().config()->ThriftProtocol();
+    if (protocol == "compact") {
+        return MakeShared<TCompactProtocolFactory>();
+    }
+    SharedPtr<TBinaryProtocolFactory> binary_protocol_factory = MakeShared<TBinaryProtocolFactory>();
+    if (strict_binary) {
+        binary_protocol_factory->setStrict(true, true);
+    }
+    return binary_protocol_factory;
+}
+
+static SharedPtr<TTransportFactory> MakeTransportFactory() {
+    String transport = InfinityContext::instance().config()->ThriftTransport();
+    if (transport == "framed") {
+        return MakeShared<TFramedTransportFactory>();
+    }
+    return MakeShared<TBufferedTransportFactory>();
+}
+
 // Thrift server
 
 void ThreadedThriftServer::Init(i32 port_no) {
 
     std::cout << "API server listen on: 0.0.0.0:" << port_no << std::endl;
-    SharedPtr<TBinaryProtocolFactory> binary_protocol_factory = MakeShared<TBinaryProtocolFactory>();
-    binary_protocol_factory->setStrict(true, true);
     server = MakeUnique<TThreadedServer>(MakeShared<infinity_thrift_rpc::InfinityServiceProcessorFactory>(MakeShared<InfinityServiceCloneFactory>()),
                                          MakeShared<TServerSocket>(port_no), // port
-                                         MakeShared<TBufferedTransportFactory>(),
-                                         binary_protocol_factory);
+                                         MakeTransportFactory(),
+                                         MakeProtocolFactory(true));
 }
 
 void ThreadedThriftServer::Start() { server->serve(); }
@@ -82,8 +103,7 @@ void PoolThriftServer::Init(i32 port_no, i32 pool_size) {
 
     SharedPtr<TServerSocket> server_socket = MakeShared<TServerSocket>(port_no);
 
-    SharedPtr<TBinaryProtocolFactory> protocol_factory = MakeShared<TBinaryProtocolFactory>();
-//    SharedPtr<TCompactProtocolFactory> protocol_factory = MakeShared<TCompactProtocolFactory>();
+    SharedPtr<TProtocolFactory> protocol_factory = MakeProtocolFactory();
 
     SharedPtr<ThreadFactory> threadFactory = MakeShared<ThreadFactory>();
 
@@ -91,12 +111,14 @@ void PoolThriftServer::Init(i32 port_no, i32 pool_size) {
     threadManager->threadFactory(threadFactory);
     threadManager->start();
 
-    std::cout << "API server listen on: 0.0.0.0:" << port_no << ", thread pool: " << pool_size << std::endl;
+    std::cout << "API server listen on: 0.0.0.0:" << port_no << ", thread pool: " << pool_size
+              << ", protocol: " << InfinityContext::instance().config()->ThriftProtocol()
+              << ", transport: " << InfinityContext::instance().config()->ThriftTransport() << std::endl;
 
     server =
         MakeUnique<TThreadPoolServer>(MakeShared<infinity_thrift_rpc::InfinityServiceProcessorFactory>(MakeShared<InfinityServiceCloneFactory>()),
                                       server_socket,
-                                      MakeShared<TBufferedTransportFactory>(),
+                                      MakeTransportFactory(),
                                       protocol_factory,
                                       threadManager);
 }
@@ -111,7 +133,8 @@ void NonBlockPoolThriftServer::Init(i32 port_no, i32 pool_size) {
     service_handler_ = MakeShared<InfinityThriftService>();
     SharedPtr<infinity_thrift_rpc::InfinityServiceProcessor> service_processor =
         MakeShared<infinity_thrift_rpc::InfinityServiceProcessor>(service_handler_);
-    SharedPtr<TProtocolFactory> protocol_factory = MakeShared<TBinaryProtocolFactory>();
+    // the non-blocking server always reads framed messages, only the protocol follows the config
+    SharedPtr<TProtocolFactory> protocol_factory = MakeProtocolFactory();
 
     SharedPtr<ThreadManager> threadManager = ThreadManager::newSimpleThreadManager(pool_size);
     threadManager->threadFactory(thread_factory);
@@ -45,6 +45,9 @@ TEST_F(ConfigTest, test1) {
     EXPECT_EQ(config.PostgresPort(), 5432);
     EXPECT_EQ(config.HTTPPort(), 23820u);
     EXPECT_EQ(config.ClientPort(), 23817u);
+    EXPECT_EQ(config.ThriftProtocol(), "binary");
+    EXPECT_EQ(config.ThriftTransport(), "buffered");
+    EXPECT_EQ(config.UploadSizeLimit(), 16 * 1024l * 1024l * 1024l);
 
     // Log
     EXPECT_EQ(config.LogFileName(), "infinity.log");
@@ -82,6 +85,9 @@ TEST_F(ConfigTest, test2) {
     EXPECT_EQ(config.PostgresPort(), 25432);
     EXPECT_EQ(config.HTTPPort(), 24821);
     EXPECT_EQ(config.ClientPort(), 24817);
+    EXPECT_EQ(config.ThriftProtocol(), "compact");
+    EXPECT_EQ(config.ThriftTransport(), "framed");
+    EXPECT_EQ(config.UploadSizeLimit(), 1024l * 1024l * 1024l);
 
     EXPECT_EQ(config.LogFileName(), "info.log");
     EXPECT_EQ(config.LogDir(), "/var/infinity/log");
@@ -152,6 +152,7 @@ union EmbeddingData {
 8: list<double> f64_array_value,
 9: list<double> f16_array_value,
 10: list<double> bf16_array_value,
+11: binary packed_value,
 }
 
 struct InitParameter {
@@ -265,6 +266,7 @@ JSONL,
 FVECS,
 CSR,
 BVECS,
+PARQUET,
 }
 
 enum ColumnType {
@@ -292,6 +294,15 @@ struct ColumnField {
 3: string column_name,
 }
 
+// a sparse column_vector is i64 row count, i64 indptr[row count + 1], i64 indices[nnz] and nnz values of element_type
+struct InsertColumn {
+1: string column_name,
+2: ColumnType column_type,
+3: ElementType element_type,
+4: i32 dimension,
+5: binary column_vector,
+}
+
 struct ImportOption {
 1:  string delimiter,
 2:  bool has_header,
@@ -501,6 +512,7 @@ struct InsertRequest {
 3:  list<string> column_names = [],
 4:  list<Field> fields = [],
 5:  i64 session_id,
+6:  list<InsertColumn> columns = [],
 }
 
 struct ImportRequest{
@@ -509,6 +521,14 @@ struct ImportRequest{
 3:  string file_name,
 4:  ImportOption import_option,
 5:  i64 session_id,
+6:  bool uploaded = false,
+}
+
+struct UploadFileChunkRequest {
+1:  i64 session_id,
+2:  string file_name,
+3:  i64 offset,
+4:  binary data,
 }
 
 struct ExportRequest{
@@ -573,6 +593,19 @@ struct SelectResponse {
 4: list<ColumnField> column_fields = [];
 }
 
+struct SelectBatchRequest {
+1: i64 session_id,
+2: SelectRequest query,
+3: i32 match_index,
+4: list<EmbeddingData> embeddings = [],
+}
+
+struct SelectBatchResponse {
+1: i64 error_code,
+2: string error_msg,
+3: list<SelectResponse> results = [],
+}
+
 struct DeleteRequest {
 1:  string db_name,
 2:  string table_name,
@@ -709,4 +742,8 @@ ShowIndexResponse ShowIndex(1:ShowIndexRequest request),
 
 CommonResponse Optimize(1:OptimizeRequest request),
 
+CommonResponse UploadFileChunk(1:UploadFileChunkRequest request),
+
+SelectBatchResponse SelectBatch(1:SelectBatchRequest request),
+
 }